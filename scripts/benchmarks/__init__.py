@@ -0,0 +1,11 @@
+"""
+バリデーターのベンチマーク
+
+  corpora.py:     バリデーターごとの合成コーパス（small / typical / pathological）
+  marketplace.py: スケールテスト用の合成マーケットプレイス（N件のプラグイン）
+  run.py:         コーパスを検証してfiles/s・p50/p99レイテンシ・ピークRSSを測定する
+                  （--scale でマーケットプレイス全体のツリーモードを測定する）
+  history.py:     計測の標本をコミットごとに記録し、2つの記録を比べて回帰を検出する
+  coldstart.py:   hookモードの起動時間とimportの内訳を測り、予算の超過を報告する
+  fuzz_perf.py:   敵対的な入力で解析処理の計算量の次数を推定し、線形より悪いものを報告する
+"""
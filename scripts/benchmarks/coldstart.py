@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+hookモードのコールドスタート計測
+
+hookはEdit/Writeのたびに validate_plugin.py を新しいプロセスで起動するため、
+インタプリタ起動とimportにかかる時間がそのまま利用者の待ち時間になる。
+ここでは対象外のパスと各バリデーターの対象ファイルについて、hookモードを
+`python -X importtime` 付きで起動し、壁時計時間とimportの内訳を取得する。
+
+importの内訳は入れ子の木として保持し、予算を超えたときに
+「どのimportが重いか」を validators.base -> yaml のような経路で示せるようにする。
+インタプリタ自体の起動で読み込まれるモジュール（site など）は内訳から除く。
+
+使用方法:
+  python3 scripts/benchmarks/coldstart.py [--runs N] [--budget-ms MS]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_scripts_dir = Path(__file__).resolve().parent.parent
+if str(_scripts_dir) not in sys.path:
+    sys.path.insert(0, str(_scripts_dir))
+
+from benchmarks.corpora import GENERATORS, write_corpus  # noqa: E402
+
+VALIDATE_PLUGIN = _scripts_dir / "validate_plugin.py"
+
+# hook1回あたりの壁時計時間の既定の予算（ミリ秒）。環境変数で上書きできる
+BUDGET_ENV = "HOOK_COLDSTART_BUDGET_MS"
+DEFAULT_BUDGET_MS = 500.0
+
+# 対象外のパスを表すケース名
+NON_PLUGIN = "non-plugin"
+
+
+class ImportNode:
+    """-X importtime の1行（子は自分より先に出力された1段深いimport）"""
+
+    __slots__ = ("name", "self_us", "cumulative_us", "children")
+
+    def __init__(self, name: str, self_us: int, cumulative_us: int):
+        self.name = name
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.children: list[ImportNode] = []
+
+
+class ColdStart:
+    """hookモード1回分の計測結果"""
+
+    __slots__ = ("wall_ms", "imports")
+
+    def __init__(self, wall_ms: float, imports: list[ImportNode]):
+        self.wall_ms = wall_ms
+        self.imports = imports
+
+    def modules(self) -> dict[str, int]:
+        """{モジュール名: 累積時間(us)}（入れ子も含めてすべて）"""
+        found: dict[str, int] = {}
+        stack = list(self.imports)
+        while stack:
+            node = stack.pop()
+            found[node.name] = node.cumulative_us
+            stack.extend(node.children)
+        return found
+
+    def import_ms(self) -> float:
+        """トップレベルのimportの累積時間の合計（ミリ秒）"""
+        return sum(node.cumulative_us for node in self.imports) / 1000
+
+
+def parse_importtime(stderr: str, exclude: frozenset[str] = frozenset()) -> list[ImportNode]:
+    """-X importtime の出力をトップレベルのimportの木にする
+
+    excludeに含まれるトップレベルのモジュール（インタプリタ起動時のものなど）は除く。
+    """
+    # (深さ, ノード)。子は親より先に出力されるため、親の行で自分より深いものを回収する
+    pending: list[tuple[int, ImportNode]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        node = ImportNode(name.strip(), int(self_us), int(cumulative_us))
+        while pending and pending[-1][0] > depth:
+            node.children.insert(0, pending.pop()[1])
+        pending.append((depth, node))
+    return [node for _, node in pending if node.name not in exclude]
+
+
+def heaviest_path(imports: list[ImportNode]) -> list[ImportNode]:
+    """最も重いトップレベルのimportから、時間の大半を占める子をたどった経路を返す
+
+    親の累積時間の半分以上を1つの子が占める間だけ下りるため、
+    経路の末尾が実際に時間を使っているimportになる。
+    """
+    if not imports:
+        return []
+    node = max(imports, key=lambda item: item.cumulative_us)
+    path = [node]
+    while node.children:
+        child = max(node.children, key=lambda item: item.cumulative_us)
+        if child.cumulative_us * 2 < node.cumulative_us:
+            break
+        path.append(child)
+        node = child
+    return path
+
+
+def describe_path(path: list[ImportNode]) -> str:
+    """heaviest_path() の結果を "a (20.0ms) -> b -> c (12.3ms)" の形にする"""
+    if not path:
+        return "（importなし）"
+    names = [node.name for node in path]
+    names[0] += f" ({path[0].cumulative_us / 1000:.1f}ms)"
+    if len(path) > 1:
+        names[-1] += f" ({path[-1].cumulative_us / 1000:.1f}ms)"
+    return " -> ".join(names)
+
+
+def startup_modules() -> frozenset[str]:
+    """何もしないインタプリタの起動で読み込まれるトップレベルのモジュール"""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "pass"], capture_output=True, text=True
+    )
+    return frozenset(node.name for node in parse_importtime(process.stderr))
+
+
+def run_hook(file_path: str, exclude: frozenset[str] = frozenset()) -> ColdStart:
+    """hookモードを -X importtime 付きで1回起動して計測する"""
+    payload = json.dumps({"tool_name": "Write", "tool_input": {"file_path": file_path}})
+    start = time.perf_counter_ns()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", str(VALIDATE_PLUGIN)],
+        input=payload,
+        capture_output=True,
+        text=True,
+        cwd=_scripts_dir,
+    )
+    wall_ms = (time.perf_counter_ns() - start) / 1e6
+    if process.returncode != 0:
+        raise RuntimeError(f"hookモードが失敗しました（終了コード {process.returncode}）")
+    return ColdStart(wall_ms, parse_importtime(process.stderr, exclude))
+
+
+def measure(file_path: str, runs: int = 3, exclude: frozenset[str] = frozenset()) -> ColdStart:
+    """runs回起動し、壁時計時間が最も短かった回を返す（他プロセスによる揺らぎを除くため）"""
+    return min((run_hook(file_path, exclude) for _ in range(runs)), key=lambda cs: cs.wall_ms)
+
+
+def budget_ms() -> float:
+    """hook1回あたりの予算（ミリ秒）。環境変数 HOOK_COLDSTART_BUDGET_MS で上書きできる"""
+    return float(os.environ.get(BUDGET_ENV, DEFAULT_BUDGET_MS))
+
+
+def over_budget_message(case: str, result: ColdStart, budget: float) -> str | None:
+    """予算を超えていれば、最も重いimportを示すメッセージを返す"""
+    if result.wall_ms <= budget:
+        return None
+    return (
+        f"{case}: hookモードのコールドスタートが予算超過 {result.wall_ms:.1f}ms"
+        f"（上限 {budget:.1f}ms、{BUDGET_ENV}で変更可）。"
+        f"最も重いimport: {describe_path(heaviest_path(result.imports))}"
+    )
+
+
+def case_files(directory: Path) -> dict[str, str]:
+    """{ケース名: 検証対象のパス}。対象外のパスと各バリデーターのsmallなファイル"""
+    corpus = write_corpus(directory, sizes=("small",), files_per_case=1)
+    cases = {NON_PLUGIN: "src/foo.py"}
+    for validator_id in GENERATORS:
+        cases[validator_id] = str(corpus[(validator_id, "small")][0])
+    return cases
+
+
+def main() -> int:
+    """メインエントリーポイント"""
+    parser = argparse.ArgumentParser(description="hookモードのコールドスタートを計測する")
+    parser.add_argument("--runs", type=int, default=3, help="ケースごとの起動回数（最短を採用）")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help=f"hook1回あたりの予算（省略時は{BUDGET_ENV}、未設定なら{DEFAULT_BUDGET_MS:.0f}ms）",
+    )
+    args = parser.parse_args()
+    budget = args.budget_ms if args.budget_ms is not None else budget_ms()
+
+    exclude = startup_modules()
+    failures = []
+    print(f"{'case':<18}{'wall ms':>10}{'import ms':>11}  heaviest import")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for case, file_path in case_files(Path(tmpdir)).items():
+            result = measure(file_path, args.runs, exclude)
+            print(
+                f"{case:<18}{result.wall_ms:>10.1f}{result.import_ms():>11.1f}  "
+                f"{describe_path(heaviest_path(result.imports))}"
+            )
+            message = over_budget_message(case, result, budget)
+            if message:
+                failures.append(message)
+    for message in failures:
+        print(message, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
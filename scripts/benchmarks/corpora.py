@@ -0,0 +1,282 @@
+"""
+ベンチマーク用の合成コーパス
+
+登録済みの各バリデーターについて、検証対象になるファイルを3段階の大きさで生成する。
+
+  small:        最小限の項目だけを持つファイル
+  typical:      実際のプラグインと同程度の項目数・本文量のファイル
+  pathological: 項目数・本文量を極端に増やし、正規表現の最悪ケースになり得る
+                文字列（閉じないブラケットの連続など）を含むファイル
+
+生成はシード付きの乱数だけに依存するため、同じ引数なら常に同じ内容になる。
+"""
+
+import json
+import random
+from collections.abc import Callable
+from pathlib import Path
+
+SIZES = ("small", "typical", "pathological")
+
+# 大きさごとの項目数（フロントマターのツール数、JSONのエントリ数、READMEのリンク数など）
+ITEM_COUNTS = {"small": 1, "typical": 8, "pathological": 2000}
+
+# 大きさごとの本文の行数
+BODY_LINES = {"small": 3, "typical": 80, "pathological": 5000}
+
+_WORDS = (
+    "plugin",
+    "review",
+    "commit",
+    "検証",
+    "テスト",
+    "設定",
+    "サーバー",
+    "フック",
+    "build",
+    "deploy",
+    "lint",
+    "format",
+)
+
+_TOOLS = ("Read", "Edit", "Write", "Grep", "Glob", "Bash(git status:*)", "Bash(npm test:*)")
+
+# 生成関数: (乱数, 大きさ, 通し番号) -> [(相対パス, 内容), ...]。先頭が検証対象のファイル
+Generator = Callable[[random.Random, str, int], list[tuple[str, str]]]
+
+
+def sentence(rng: random.Random, words: int = 8) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def body_text(rng: random.Random, size: str) -> str:
+    lines = []
+    for i in range(BODY_LINES[size]):
+        if i % 20 == 0:
+            lines.append(f"## {sentence(rng, 3)}")
+        else:
+            lines.append(sentence(rng, rng.randint(4, 16)))
+    return "\n".join(lines) + "\n"
+
+
+def _tools(rng: random.Random, size: str) -> list[str]:
+    return [rng.choice(_TOOLS) for _ in range(ITEM_COUNTS[size])]
+
+
+def _yaml_list(key: str, values: list[str]) -> str:
+    return f"{key}:\n" + "".join(f"  - {value}\n" for value in values)
+
+
+def _description(rng: random.Random, size: str) -> str:
+    # pathologicalは文字数上限付近の長い説明にする
+    return sentence(rng, 200 if size == "pathological" else 12)
+
+
+def _skill(rng: random.Random, size: str, index: int) -> list[tuple[str, str]]:
+    name = f"skill-{index}"
+    content = (
+        f"---\nname: {name}\ndescription: {_description(rng, size)}\n"
+        f"{_yaml_list('allowed-tools', _tools(rng, size))}---\n\n# {name}\n\n{body_text(rng, size)}"
+    )
+    return [(f"skills/{name}/SKILL.md", content)]
+
+
+def _agent(rng: random.Random, size: str, index: int) -> list[tuple[str, str]]:
+    name = f"agent-{index}"
+    tools = [*_tools(rng, size), "Task(reviewer)"]
+    content = (
+        f"---\nname: {name}\ndescription: {_description(rng, size)}\n"
+        f"{_yaml_list('tools', tools)}model: sonnet\n---\n\n{body_text(rng, size)}"
+    )
+    return [(f"agents/{name}.md", content)]
+
+
+def _slash_command(rng: random.Random, size: str, index: int) -> list[tuple[str, str]]:
+    tools = ", ".join(_tools(rng, size))
+    content = (
+        f"---\ndescription: {_description(rng, size)}\nallowed-tools: {tools}\n"
+        f"argument-hint: [target]\n---\n\n$ARGUMENTS を対象に実行する。\n\n{body_text(rng, size)}"
+    )
+    return [(f"commands/command-{index}.md", content)]
+
+
+def _output_style(rng: random.Random, size: str, index: int) -> list[tuple[str, str]]:
+    name = f"style-{index}"
+    content = (
+        f"---\nname: {name}\ndescription: {_description(rng, size)}\n"
+        f"keep-coding-instructions: true\n---\n\n{body_text(rng, size)}"
+    )
+    return [(f"output-styles/{name}.md", content)]
+
+
+def _hooks_json(rng: random.Random, size: str, index: int) -> list[tuple[str, str]]:
+    events = ("PreToolUse", "PostToolUse", "UserPromptSubmit", "Stop")
+    hooks: dict[str, list] = {}
+    for i in range(ITEM_COUNTS[size]):
+        hooks.setdefault(events[i % len(events)], []).append(
+            {
+                "matcher": rng.choice(("Edit|Write", "Bash", "*")),
+                "hooks": [
+                    {
+                        "type": "command",
+                        "command": f"${{CLAUDE_PLUGIN_ROOT}}/hooks/hook-{i}.sh",
+                        "timeout": rng.randint(5, 60),
+                    }
+                ],
+            }
+        )
+    return [("hooks/hooks.json", json.dumps({"hooks": hooks}, indent=2))]
+
+
+def _mcp_json(rng: random.Random, size: str, index: int) -> list[tuple[str, str]]:
+    servers = {}
+    for i in range(ITEM_COUNTS[size]):
+        if i % 2:
+            servers[f"server-{i}"] = {"type": "http", "url": f"https://mcp.example.com/{i}"}
+        else:
+            servers[f"server-{i}"] = {
+                "command": "npx",
+                "args": ["-y", f"@example/mcp-{i}"],
+                "env": {"API_KEY": "${API_KEY}"},
+            }
+    return [(".mcp.json", json.dumps({"mcpServers": servers}, indent=2))]
+
+
+def _lsp_json(rng: random.Random, size: str, index: int) -> list[tuple[str, str]]:
+    servers = {
+        f"lsp-{i}": {
+            "command": f"lsp-server-{i}",
+            "args": ["--stdio"],
+            "extensionToLanguage": {f".ext{i}": f"lang{i}", f".x{i}": f"lang{i}"},
+        }
+        for i in range(ITEM_COUNTS[size])
+    }
+    return [(".lsp.json", json.dumps(servers, indent=2))]
+
+
+def _monitors_json(rng: random.Random, size: str, index: int) -> list[tuple[str, str]]:
+    entries = [
+        {
+            "name": f"monitor-{i}",
+            "command": f"${{CLAUDE_PLUGIN_ROOT}}/scripts/watch-{i}.sh",
+            "description": sentence(rng, 6),
+            "when": rng.choice(("always", f"on-skill-invoke:skill-{i}")),
+        }
+        for i in range(ITEM_COUNTS[size])
+    ]
+    return [("monitors/monitors.json", json.dumps(entries, indent=2, ensure_ascii=False))]
+
+
+def _plugin_json(rng: random.Random, size: str, index: int) -> list[tuple[str, str]]:
+    count = ITEM_COUNTS[size]
+    manifest = {
+        "name": f"plugin-{index}",
+        "version": "1.0.0",
+        "description": _description(rng, size),
+        "author": {"name": "bench"},
+        "license": "MIT",
+        "keywords": [rng.choice(_WORDS) for _ in range(count)],
+        "userConfig": {
+            f"option{i}": {
+                "type": "number",
+                "title": f"オプション{i}",
+                "description": sentence(rng, 5),
+                "default": i,
+            }
+            for i in range(count)
+        },
+    }
+    return [(".claude-plugin/plugin.json", json.dumps(manifest, indent=2, ensure_ascii=False))]
+
+
+def _marketplace_json(rng: random.Random, size: str, index: int) -> list[tuple[str, str]]:
+    count = {"small": 1, "typical": 50, "pathological": 20000}[size]
+    marketplace = {
+        "name": f"bench-marketplace-{index}",
+        "owner": {"name": "bench"},
+        "plugins": [
+            {
+                "name": f"plugin-{i}",
+                "source": f"./plugins/plugin-{i}"
+                if i % 3
+                else {"source": "github", "repo": f"example/plugin-{i}"},
+                "description": sentence(rng, 8),
+                "version": "1.0.0",
+            }
+            for i in range(count)
+        ],
+    }
+    return [
+        (
+            ".claude-plugin/marketplace.json",
+            json.dumps(marketplace, indent=2, ensure_ascii=False),
+        )
+    ]
+
+
+def _readme(rng: random.Random, size: str, index: int) -> list[tuple[str, str]]:
+    count = ITEM_COUNTS[size]
+    lines = [f"# plugin-{index}", "", "## 概要", "", sentence(rng), ""]
+    extra = []
+    for i in range(count):
+        # リンク先は少数のファイルを使い回す（リンク数が多くてもファイル数は増やさない）
+        target = f"docs/page-{i % 16}.md"
+        lines.append(f"- [{sentence(rng, 2)}](./{target}#section) ![図](images/fig-{i % 4}.png)")
+    for i in range(min(count, 16)):
+        extra.append((f"plugins/plugin-{index}/docs/page-{i}.md", "# page\n"))
+    for i in range(min(count, 4)):
+        extra.append((f"plugins/plugin-{index}/images/fig-{i}.png", ""))
+    lines += ["", "## インストール", "", "```bash", "claude plugin install x", "```", ""]
+    lines += ["## 使い方", "", body_text(rng, size)]
+    if size == "pathological":
+        # 末尾の閉じないブラケットの連続（リンク抽出の正規表現が開始位置ごとに行末まで走査する）
+        lines.append("[" * 2000)
+        lines.append("![" * 1000)
+    readme = (f"plugins/plugin-{index}/README.md", "\n".join(lines) + "\n")
+    return [readme, *extra]
+
+
+# バリデーターID -> 生成関数
+GENERATORS: dict[str, Generator] = {
+    "skill": _skill,
+    "slash-command": _slash_command,
+    "agent": _agent,
+    "hooks-json": _hooks_json,
+    "mcp-json": _mcp_json,
+    "lsp-json": _lsp_json,
+    "monitors-json": _monitors_json,
+    "plugin-json": _plugin_json,
+    "marketplace-json": _marketplace_json,
+    "output-style": _output_style,
+    "readme": _readme,
+}
+
+
+def write_corpus(
+    directory: Path,
+    validator_ids: list[str] | None = None,
+    sizes: tuple[str, ...] = SIZES,
+    files_per_case: int = 20,
+    seed: int = 0,
+) -> dict[tuple[str, str], list[Path]]:
+    """コーパスをdirectory以下に書き出し、(バリデーターID, 大きさ) ごとの検証対象パスを返す
+
+    ファイルは directory/<バリデーターID>/<大きさ>/<通し番号>/ 以下に置くため、
+    ファイル名が固定の種類（hooks.jsonなど）も1ケースに複数置ける。
+    """
+    rng = random.Random(seed)
+    corpus: dict[tuple[str, str], list[Path]] = {}
+    for validator_id in validator_ids or list(GENERATORS):
+        generator = GENERATORS[validator_id]
+        for size in sizes:
+            paths = []
+            for index in range(files_per_case):
+                case_dir = directory / validator_id / size / f"{index:04d}"
+                files = generator(rng, size, index)
+                for relative_path, content in files:
+                    path = case_dir / relative_path
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path.write_text(content, encoding="utf-8")
+                paths.append(case_dir / files[0][0])
+            corpus[(validator_id, size)] = paths
+    return corpus
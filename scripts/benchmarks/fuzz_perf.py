@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+解析処理の計算量ファジング
+
+フロントマター・Markdownの解析処理は、プラグインのPRに含まれる任意の形のテキストを扱う。
+ここでは敵対的な入力（非常に長い行、入れ子のクォート、閉じない `[` の連続、
+閉じない巨大なフロントマターなど）と、構文上意味を持つトークンを乱数で組み合わせた
+パターンを繰り返した入力を生成し、入力の大きさを factor 倍にしたときの所要時間の
+増え方から計算量の次数を推定する。次数が MAX_EXPONENT を超える（線形より悪い）
+組み合わせを報告する。
+
+使用方法:
+  python3 scripts/benchmarks/fuzz_perf.py [--size N] [--factor K] [--random N] [--seed S]
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+_scripts_dir = Path(__file__).resolve().parent.parent
+if str(_scripts_dir) not in sys.path:
+    sys.path.insert(0, str(_scripts_dir))
+
+from validators import agent, base, readme, slash_command  # noqa: E402
+
+# これを超える次数を線形より悪いとみなす（線形なら1、二乗なら2に近い値になる）
+MAX_EXPONENT = 1.5
+
+# 大きい方の入力でもこれより速ければ報告しない（ナノ秒）。短すぎる計測の揺らぎを除くため
+MIN_REPORT_NS = 1_000_000
+
+
+def _parse_line(text: str) -> None:
+    base._FrontmatterParser().parse_line(text)
+
+
+# 対象名 -> 任意のテキストを受け取って解析処理を呼ぶ関数
+TARGETS: dict[str, Callable[[str], object]] = {
+    "strip_inline_comment": base._strip_inline_comment,
+    "frontmatter_parse_line": _parse_line,
+    "parse_frontmatter": lambda text: base.parse_frontmatter(f"---\n{text}\n---\nbody"),
+    "parse_frontmatter_unclosed": lambda text: base.parse_frontmatter(f"---\n{text}"),
+    "unquoted_bool_fields": lambda text: slash_command._find_unquoted_bool_fields(
+        base.parse_document(f"---\n{text}\n---\n")
+    ),
+    "suppressions": base.parse_suppressions,
+    "readme_links": lambda text: list(readme._iter_relative_links(text)),
+    "task_syntax": agent._validate_task_syntax,
+}
+
+
+def _repeat(unit: str) -> Callable[[int], str]:
+    """unitを繰り返しておよそn文字にする生成関数
+
+    途中で切ると大きさによって末尾の形が変わり（"|" で終わるかどうかなど）、
+    別の分岐を通って次数を見誤るため、unitの単位で繰り返す。
+    """
+    return lambda n: unit * max(1, n // len(unit))
+
+
+# 入力の系統名 -> n文字の入力を作る関数
+ADVERSARIAL: dict[str, Callable[[int], str]] = {
+    "long-line": _repeat("a"),
+    "spaces": lambda n: "description:" + " " * n + "x",
+    "nested-quotes": _repeat("\"'"),
+    "quoted-hashes": lambda n: 'key: a "' + _repeat(" #")(n),
+    "open-brackets": _repeat("["),
+    "open-images": _repeat("!["),
+    "open-links": _repeat("[a]("),
+    "open-parens": lambda n: "[a](" + "(" * n,
+    "open-tasks": _repeat("Task("),
+    "empty-tasks": _repeat("Task()"),
+    "open-comments": _repeat("<!-- validator-disable a "),
+    "suppression-lines": _repeat("<!-- validator-disable-start a -->\n"),
+    "frontmatter-lines": _repeat("key: value\n"),
+    "list-items": _repeat("- item # note\n"),
+    "bool-fields": _repeat("description: \t \n"),
+}
+
+# 乱数で組み合わせるトークン（いずれかの解析処理で意味を持つもの）
+TOKENS = (
+    "[", "]", "(", ")", "![", "](", '"', "'", "#", " #", " ", "\t", ":", "- ", "\n",
+    "---", "a", "Task(", "description:", "<!--", "-->", "|", ">",
+)  # fmt: skip
+
+
+def random_motifs(seed: int, count: int, max_tokens: int = 6) -> dict[str, Callable[[int], str]]:
+    """トークンを乱数で並べた短いパターンを繰り返す生成関数を返す"""
+    rng = random.Random(seed)
+    motifs = {}
+    for index in range(count):
+        unit = "".join(rng.choice(TOKENS) for _ in range(rng.randint(1, max_tokens)))
+        motifs[f"random-{index}:{unit!r}"] = _repeat(unit)
+    return motifs
+
+
+def best_time_ns(func: Callable[[str], object], text: str, repeat: int) -> int:
+    """repeat回呼び出したうちの最短時間（ナノ秒）"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        func(text)
+        elapsed = time.perf_counter_ns() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return max(best, 1)
+
+
+def growth(
+    func: Callable[[str], object],
+    make: Callable[[int], str],
+    size: int,
+    factor: int = 8,
+    repeat: int = 5,
+) -> dict:
+    """size文字とsize*factor文字の入力の所要時間から計算量の次数を推定する"""
+    small_ns = best_time_ns(func, make(size), repeat)
+    large_ns = best_time_ns(func, make(size * factor), repeat)
+    exponent = math.log(large_ns / small_ns, factor)
+    return {
+        "small_ns": small_ns,
+        "large_ns": large_ns,
+        "exponent": exponent,
+        "superlinear": exponent > MAX_EXPONENT and large_ns >= MIN_REPORT_NS,
+    }
+
+
+def fuzz(
+    targets: dict[str, Callable[[str], object]],
+    inputs: dict[str, Callable[[int], str]],
+    size: int = 2000,
+    factor: int = 8,
+    repeat: int = 5,
+) -> list[dict]:
+    """すべての (対象, 入力の系統) の組み合わせについて次数を推定する"""
+    rows = []
+    for target_name, func in targets.items():
+        for input_name, make in inputs.items():
+            stats = growth(func, make, size, factor, repeat)
+            rows.append({"target": target_name, "input": input_name, **stats})
+    return rows
+
+
+def format_table(rows: list[dict]) -> str:
+    """結果を表形式の文字列にする"""
+    header = f"{'target':<28}{'input':<24}{'small ms':>10}{'large ms':>10}{'exponent':>10}"
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        mark = "  ❌" if row["superlinear"] else ""
+        lines.append(
+            f"{row['target']:<28}{row['input'][:23]:<24}{row['small_ns'] / 1e6:>10.3f}"
+            f"{row['large_ns'] / 1e6:>10.3f}{row['exponent']:>10.2f}{mark}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """メインエントリーポイント"""
+    parser = argparse.ArgumentParser(description="解析処理の計算量をファジングで確認する")
+    parser.add_argument("--size", type=int, default=2000, help="小さい方の入力の文字数")
+    parser.add_argument("--factor", type=int, default=8, help="大きい方の入力の倍率")
+    parser.add_argument("--repeat", type=int, default=5, help="1入力あたりの計測回数（最短を採用）")
+    parser.add_argument("--random", type=int, default=50, help="乱数で生成するパターンの数")
+    parser.add_argument("--seed", type=int, default=0, help="パターン生成の乱数シード")
+    parser.add_argument("--targets", nargs="+", choices=list(TARGETS), metavar="NAME")
+    parser.add_argument("--all", action="store_true", help="線形のものも含めてすべて表示する")
+    args = parser.parse_args()
+
+    targets = {name: TARGETS[name] for name in args.targets or TARGETS}
+    inputs = {**ADVERSARIAL, **random_motifs(args.seed, args.random)}
+    rows = fuzz(targets, inputs, args.size, args.factor, args.repeat)
+    flagged = [row for row in rows if row["superlinear"]]
+    print(format_table(rows if args.all else flagged))
+    print(
+        f"{len(rows)}件中{len(flagged)}件で線形より悪い増え方を検出しました"
+        f"（次数 > {MAX_EXPONENT}）",
+        file=sys.stderr,
+    )
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+ベンチマーク結果の履歴と比較
+
+record: 合成コーパス（corpora.py）の (バリデーター, 大きさ) ごとに、ファイル群の検証を
+        繰り返して標本（ファイルあたり平均時間）を集め、gitのコミットをキーにしたJSONとして
+        .cache/benchmarks/<コミット>.json に保存する。作業ツリーに変更があるときは
+        <コミット>-dirty.json に保存する。
+compare: 2つの記録をケースごとに比較し、中央値の変化率が閾値以上で、かつ
+         Mann-WhitneyのU検定（片側）で有意なものを回帰として報告する（終了コード1）。
+         記録が見つからないときはそれを示して終了コード2で終わる。
+
+すべてローカルで完結し、同じシード・ファイル数で記録したもの同士を比較する。
+
+使用方法:
+  python3 scripts/benchmarks/history.py record [--repeat N] [--files N] [--validators ID ...]
+  python3 scripts/benchmarks/history.py compare BASE [HEAD] [--threshold R] [--alpha P]
+                                               [--case-threshold ID[:SIZE]=R ...]
+    BASE/HEAD はgitのリビジョン（HEADの省略時は現在の作業ツリー）か、記録したJSONのパス
+"""
+
+import argparse
+import json
+import math
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_scripts_dir = Path(__file__).resolve().parent.parent
+if str(_scripts_dir) not in sys.path:
+    sys.path.insert(0, str(_scripts_dir))
+
+from benchmarks.corpora import GENERATORS, SIZES, write_corpus  # noqa: E402
+from benchmarks.run import sample_in_worker  # noqa: E402
+
+DEFAULT_HISTORY_DIR = Path(".cache") / "benchmarks"
+
+# 中央値がこの割合以上遅くなったケースを回帰の候補とする
+DEFAULT_THRESHOLD = 0.10
+
+# U検定の有意水準
+DEFAULT_ALPHA = 0.05
+
+
+def current_key(cwd: Path | None = None) -> str:
+    """作業ツリーの記録キー（HEADのコミット。変更があれば末尾に -dirty）"""
+    commit = _git("rev-parse", "HEAD", cwd=cwd)
+    dirty = _git("status", "--porcelain", "--untracked-files=no", cwd=cwd)
+    return f"{commit}-dirty" if dirty else commit
+
+
+def _git(*args: str, cwd: Path | None = None) -> str:
+    completed = subprocess.run(["git", *args], capture_output=True, text=True, check=True, cwd=cwd)
+    return completed.stdout.strip()
+
+
+def record(
+    corpus_dir: Path,
+    validator_ids: list[str] | None = None,
+    sizes: tuple[str, ...] = SIZES,
+    files_per_case: int = 20,
+    repeat: int = 10,
+    seed: int = 0,
+) -> list[dict]:
+    """ケースごとに標本を集める（ケースごとに新しいワーカープロセスで計測する）"""
+    corpus = write_corpus(corpus_dir, validator_ids, sizes, files_per_case, seed)
+    return [
+        {
+            "validator": validator_id,
+            "size": size,
+            "samples_ns": sample_in_worker(paths, repeat),
+        }
+        for (validator_id, size), paths in corpus.items()
+    ]
+
+
+def median(values: list[float]) -> float:
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def mann_whitney_greater(base: list[float], head: list[float]) -> float:
+    """headがbaseより大きい（遅い）という片側検定のp値（正規近似・同順位補正あり）"""
+    n1, n2 = len(base), len(head)
+    ranked = sorted([(value, 0) for value in base] + [(value, 1) for value in head])
+    ranks = [0.0] * len(ranked)
+    tie_term = 0
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+    head_rank_sum = sum(rank for rank, (_, group) in zip(ranks, ranked, strict=True) if group)
+    u = head_rank_sum - n2 * (n2 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    # 連続性補正
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def parse_case_threshold(text: str) -> tuple[str, float]:
+    """ "skill=0.2" や "readme:pathological=0.3" を (ケース, 閾値) にする"""
+    case, separator, value = text.rpartition("=")
+    if not separator or not case:
+        raise argparse.ArgumentTypeError(f"ID[:SIZE]=R の形式で指定してください: {text}")
+    try:
+        return case, float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"閾値が数値ではありません: {text}") from None
+
+
+def compare_records(
+    base: dict,
+    head: dict,
+    threshold: float = DEFAULT_THRESHOLD,
+    alpha: float = DEFAULT_ALPHA,
+    case_thresholds: dict[str, float] | None = None,
+) -> list[dict]:
+    """両方の記録にあるケースを比較し、ケースごとの判定を返す
+
+    case_thresholds は "バリデーターID:大きさ" または "バリデーターID" ごとの閾値で、
+    より具体的な指定を優先する。verdict は regression（有意に閾値以上遅い）、
+    improvement（有意に閾値以上速い）、unchanged のいずれか。
+    """
+    case_thresholds = case_thresholds or {}
+    base_cases = {(case["validator"], case["size"]): case for case in base["cases"]}
+    rows = []
+    for case in head["cases"]:
+        base_case = base_cases.get((case["validator"], case["size"]))
+        if base_case is None:
+            continue
+        base_samples, head_samples = base_case["samples_ns"], case["samples_ns"]
+        base_median, head_median = median(base_samples), median(head_samples)
+        change = head_median / base_median - 1
+        limit = case_thresholds.get(
+            f"{case['validator']}:{case['size']}",
+            case_thresholds.get(case["validator"], threshold),
+        )
+        slower_p = mann_whitney_greater(base_samples, head_samples)
+        faster_p = mann_whitney_greater(head_samples, base_samples)
+        if change >= limit and slower_p < alpha:
+            verdict = "regression"
+        elif change <= -limit and faster_p < alpha:
+            verdict = "improvement"
+        else:
+            verdict = "unchanged"
+        rows.append(
+            {
+                "validator": case["validator"],
+                "size": case["size"],
+                "base_us": base_median / 1000,
+                "head_us": head_median / 1000,
+                "change": change,
+                "threshold": limit,
+                "p_value": slower_p if change >= 0 else faster_p,
+                "verdict": verdict,
+            }
+        )
+    return rows
+
+
+def format_comparison(rows: list[dict]) -> str:
+    """比較結果を表形式の文字列にする"""
+    header = (
+        f"{'validator':<18}{'size':<14}{'base us':>10}{'head us':>10}{'change':>9}{'p':>8}  verdict"
+    )
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        lines.append(
+            f"{row['validator']:<18}{row['size']:<14}{row['base_us']:>10.1f}{row['head_us']:>10.1f}"
+            f"{row['change']:>+9.1%}{row['p_value']:>8.3f}  {row['verdict']}"
+        )
+    return "\n".join(lines)
+
+
+class RecordNotFoundError(Exception):
+    """比較する記録が見つからない"""
+
+
+def load_record(ref: str, history_dir: Path) -> dict:
+    """記録を読み込む（JSONのパス、またはgitのリビジョン）
+
+    Raises:
+        RecordNotFoundError: JSONのパスでもリビジョンでもない、またはそのリビジョンの記録がない
+    """
+    path = Path(ref)
+    if not path.is_file():
+        try:
+            commit = _git("rev-parse", "--verify", f"{ref}^{{commit}}")
+        except subprocess.CalledProcessError:
+            raise RecordNotFoundError(
+                f"記録のJSONでもgitのリビジョンでもありません: {ref}"
+            ) from None
+        path = history_dir / f"{commit}.json"
+    return _read_record(path, ref)
+
+
+def _read_record(path: Path, ref: str) -> dict:
+    if not path.is_file():
+        raise RecordNotFoundError(
+            f"{ref} の記録がありません: {path}（先に record で記録してください）"
+        )
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def main() -> int:
+    """メインエントリーポイント"""
+    parser = argparse.ArgumentParser(description="ベンチマーク結果を記録・比較する")
+    parser.add_argument(
+        "--history-dir", type=Path, default=DEFAULT_HISTORY_DIR, help="記録を保存するディレクトリ"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="現在の作業ツリーで計測して記録する")
+    record_parser.add_argument("--validators", nargs="+", choices=list(GENERATORS), metavar="ID")
+    record_parser.add_argument("--sizes", nargs="+", choices=SIZES, default=list(SIZES))
+    record_parser.add_argument("--files", type=int, default=20, help="ケースあたりのファイル数")
+    record_parser.add_argument("--repeat", type=int, default=10, help="ケースあたりの標本数")
+    record_parser.add_argument("--seed", type=int, default=0, help="コーパス生成の乱数シード")
+
+    compare_parser = commands.add_parser("compare", help="2つの記録を比較する")
+    compare_parser.add_argument("base", help="比較元（リビジョンか記録のJSON）")
+    compare_parser.add_argument("head", nargs="?", help="比較先（省略時は現在の作業ツリーの記録）")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD, help="回帰とみなす中央値の変化率"
+    )
+    compare_parser.add_argument(
+        "--case-threshold",
+        type=parse_case_threshold,
+        action="append",
+        default=[],
+        metavar="ID[:SIZE]=R",
+        help="バリデーター（と大きさ）ごとの閾値（複数指定可）",
+    )
+    compare_parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA, help="有意水準")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        key = current_key()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cases = record(
+                Path(tmpdir),
+                args.validators,
+                tuple(args.sizes),
+                args.files,
+                args.repeat,
+                args.seed,
+            )
+        document = {
+            "key": key,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "files": args.files,
+            "repeat": args.repeat,
+            "seed": args.seed,
+            "cases": cases,
+        }
+        args.history_dir.mkdir(parents=True, exist_ok=True)
+        path = args.history_dir / f"{key}.json"
+        path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+        print(f"{len(cases)}ケースを{path}に記録しました")
+        return 0
+
+    try:
+        base = load_record(args.base, args.history_dir)
+        if args.head:
+            head = load_record(args.head, args.history_dir)
+        else:
+            head = _read_record(args.history_dir / f"{current_key()}.json", "現在の作業ツリー")
+    except RecordNotFoundError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    if (base["files"], base["seed"]) != (head["files"], head["seed"]):
+        print("⚠️  ファイル数またはシードが異なる記録を比較しています", file=sys.stderr)
+    rows = compare_records(base, head, args.threshold, args.alpha, dict(args.case_threshold))
+    print(format_comparison(rows))
+    regressions = [row for row in rows if row["verdict"] == "regression"]
+    for row in regressions:
+        print(
+            f"❌ {row['validator']} ({row['size']}): {row['change']:+.1%}（p={row['p_value']:.3f}）",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
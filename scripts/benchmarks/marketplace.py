@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+スケールテスト用の合成マーケットプレイス
+
+マーケットプレイスのチェックアウト全体（.claude-plugin/marketplace.json と
+plugins/<名前>/ 以下の plugin.json・スキル・エージェント・コマンド・hooks.json・README）を
+書き出す。N件のプラグインでのツリーモードや marketplace.json の検証コストを測るための
+標準フィクスチャで、シードが同じなら常に同じ内容になる。
+
+error_rate を指定すると、ファイルごとにその確率で既知のエラーを1つ埋め込む
+（不正な名前、必須フィールドの欠落、壊れたJSON、リンク切れなど）。
+error_rate が 0 のときは、生成したファイルはすべてエラーなしで検証を通る。
+
+使用方法:
+  python3 scripts/benchmarks/marketplace.py OUT_DIR [--plugins N] [--seed N] [--error-rate R]
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+
+_scripts_dir = Path(__file__).resolve().parent.parent
+if str(_scripts_dir) not in sys.path:
+    sys.path.insert(0, str(_scripts_dir))
+
+from benchmarks.corpora import body_text, sentence  # noqa: E402
+
+
+class _Writer:
+    """ファイルを書き出し、エラーを埋め込んだファイルを記録する"""
+
+    def __init__(self, root: Path, rng: random.Random, error_rate: float):
+        self.root = root
+        self.rng = rng
+        self.error_rate = error_rate
+        self.files = 0
+        self.invalid_files: list[str] = []
+
+    def inject(self) -> bool:
+        """このファイルにエラーを埋め込むかを決める"""
+        return self.error_rate > 0 and self.rng.random() < self.error_rate
+
+    def write(self, relative_path: str, content: str, invalid: bool = False) -> None:
+        path = self.root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+        self.files += 1
+        if invalid:
+            self.invalid_files.append(relative_path)
+
+
+def _write_plugin(writer: _Writer, name: str) -> dict:
+    """プラグイン1件を書き出し、marketplace.jsonのエントリを返す"""
+    rng = writer.rng
+    base = f"plugins/{name}"
+    description = sentence(rng, 10)
+
+    invalid = writer.inject()
+    manifest = {
+        "name": "Invalid_Name" if invalid else name,
+        "version": "1.0.0",
+        "description": description,
+        "author": {"name": "bench"},
+        "license": "MIT",
+        "keywords": [sentence(rng, 1) for _ in range(3)],
+    }
+    writer.write(
+        f"{base}/.claude-plugin/plugin.json",
+        json.dumps(manifest, indent=2, ensure_ascii=False),
+        invalid,
+    )
+
+    skills = [f"{name}-skill-{i}" for i in range(rng.randint(1, 3))]
+    for skill in skills:
+        invalid = writer.inject()
+        frontmatter = (
+            f"name: {skill}\n" if invalid else f"name: {skill}\ndescription: {sentence(rng)}\n"
+        )
+        writer.write(
+            f"{base}/skills/{skill}/SKILL.md",
+            f"---\n{frontmatter}---\n\n# {skill}\n\n{body_text(rng, 'typical')}",
+            invalid,
+        )
+
+    for i in range(rng.randint(0, 2)):
+        invalid = writer.inject()
+        agent = f"{name}-agent-{i}"
+        writer.write(
+            f"{base}/agents/{agent}.md",
+            f"---\nname: {'Agent_' if invalid else ''}{agent}\ndescription: {sentence(rng)}\n"
+            f"tools: Read, Grep, Glob\nmodel: sonnet\n---\n\n{body_text(rng, 'typical')}",
+            invalid,
+        )
+
+    for i in range(rng.randint(0, 2)):
+        invalid = writer.inject()
+        if invalid:
+            # descriptionも本文もないコマンド
+            content = "---\nallowed-tools: Read, Grep\n---\n"
+        else:
+            # descriptionは危険な操作の警告に当たらない固定文言にする
+            content = (
+                "---\ndescription: 指定したファイルの内容を確認する\nallowed-tools: Read, Grep\n"
+                "model: sonnet\n---\n\n$ARGUMENTS の内容を確認する。\n"
+            )
+        writer.write(f"{base}/commands/command-{i}.md", content, invalid)
+
+    if rng.random() < 0.5:
+        invalid = writer.inject()
+        hooks = {
+            "hooks": {
+                "PostToolUse": [
+                    {
+                        "matcher": "Edit|Write",
+                        "hooks": [
+                            {
+                                "type": "command",
+                                "command": "${CLAUDE_PLUGIN_ROOT}/hooks/format.sh",
+                                "timeout": 30,
+                            }
+                        ],
+                    }
+                ]
+            }
+        }
+        content = json.dumps(hooks, indent=2)
+        writer.write(f"{base}/hooks/hooks.json", content[:-1] if invalid else content, invalid)
+
+    writer.write(f"{base}/docs/guide.md", f"# {name}\n\n{sentence(rng)}\n")
+    invalid = writer.inject()
+    links = [f"- [{skill}](./skills/{skill}/SKILL.md)" for skill in skills]
+    links.append(
+        "- [ガイド](./docs/missing.md)" if invalid else "- [ガイド](./docs/guide.md#usage)"
+    )
+    readme = "\n".join(
+        [
+            f"# {name}",
+            "",
+            "## 概要",
+            "",
+            description,
+            "",
+            *links,
+            "",
+            "## インストール",
+            "",
+            "```bash",
+            f"claude plugin install {name}",
+            "```",
+            "",
+            "## 使い方",
+            "",
+            sentence(rng, 12),
+            "",
+        ]
+    )
+    writer.write(f"{base}/README.md", readme, invalid)
+
+    entry = {
+        "name": name,
+        "source": f"./{base}",
+        "description": description,
+        "version": "1.0.0",
+    }
+    if writer.inject():
+        del entry["source"]
+        writer.invalid_files.append(".claude-plugin/marketplace.json")
+    return entry
+
+
+def generate_marketplace(root: Path, plugins: int, seed: int = 0, error_rate: float = 0.0) -> dict:
+    """root以下にマーケットプレイスを書き出し、概要を返す
+
+    Returns:
+        plugins: プラグイン数
+        files: 書き出したファイル数（marketplace.jsonを含む）
+        invalid_files: エラーを埋め込んだファイルのrootからの相対パス（重複なし、名前順）
+    """
+    writer = _Writer(root, random.Random(seed), error_rate)
+    entries = [_write_plugin(writer, f"plugin-{i:05d}") for i in range(plugins)]
+    marketplace = {
+        "name": "bench-marketplace",
+        "owner": {"name": "bench"},
+        "plugins": entries,
+    }
+    writer.write(
+        ".claude-plugin/marketplace.json", json.dumps(marketplace, indent=2, ensure_ascii=False)
+    )
+    return {
+        "plugins": plugins,
+        "files": writer.files,
+        "invalid_files": sorted(set(writer.invalid_files)),
+    }
+
+
+def main() -> int:
+    """メインエントリーポイント"""
+    parser = argparse.ArgumentParser(description="スケールテスト用のマーケットプレイスを生成する")
+    parser.add_argument("out_dir", type=Path, help="書き出し先のディレクトリ")
+    parser.add_argument("--plugins", type=int, default=1000, help="プラグイン数")
+    parser.add_argument("--seed", type=int, default=0, help="乱数シード")
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="ファイルごとにエラーを埋め込む確率（0〜1）"
+    )
+    args = parser.parse_args()
+    if not 0 <= args.error_rate <= 1:
+        parser.error("--error-rateには0〜1の値を指定してください")
+
+    summary = generate_marketplace(args.out_dir, args.plugins, args.seed, args.error_rate)
+    print(
+        f"{summary['plugins']}件のプラグイン（{summary['files']}ファイル、"
+        f"エラーを埋め込んだファイル{len(summary['invalid_files'])}件）を"
+        f"{args.out_dir}に書き出しました"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+バリデーターのベンチマーク
+
+合成コーパス（corpora.py）を生成し、(バリデーター, 大きさ) ごとに次を測定する。
+
+  warm: 1つのプロセス内で validate_file() を繰り返し呼ぶ（importと初回呼び出しは計測外）。
+        純粋な検証コストを表す。
+  cold: ファイルごとに validate_plugin.py をhookモードで起動する。
+        インタプリタ起動とimportを含む、hook1回あたりの実コストを表す。
+
+どちらもケースごとに小さなワーカープロセスで実行し、ピークRSSがそのケースだけのもの
+（インタプリタ自体の分を含む）になるようにする。Linuxではvforkで起動した子プロセスの
+ru_maxrssに親のピークRSSが引き継がれるため、コーパスを生成した親プロセスから直接
+計測対象を起動すると値が親の大きさに引きずられる。
+
+出力はfiles/s、ファイルあたりレイテンシのp50/p99、ピークRSS。
+
+--scale N ... を指定すると、代わりにN件のプラグインを持つ合成マーケットプレイス
+（marketplace.py）を生成し、ツリーモード（validate_plugin.py --root）全体の
+所要時間・files/s・ピークRSSを測定する。
+
+使用方法:
+  python3 scripts/benchmarks/run.py [--mode warm|cold|both] [--validators ID ...]
+                                    [--sizes SIZE ...] [--files N] [--cold-files N]
+                                    [--seed N] [--corpus DIR] [--json PATH]
+  python3 scripts/benchmarks/run.py --scale 1000 10000 [--jobs N] [--error-rate R]
+"""
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_scripts_dir = Path(__file__).resolve().parent.parent
+if str(_scripts_dir) not in sys.path:
+    sys.path.insert(0, str(_scripts_dir))
+
+from benchmarks.corpora import GENERATORS, SIZES, write_corpus  # noqa: E402
+from benchmarks.marketplace import generate_marketplace  # noqa: E402
+
+VALIDATE_PLUGIN = _scripts_dir / "validate_plugin.py"
+
+
+def percentile(sorted_values: list[int], p: float) -> int:
+    """昇順に並んだ値のpパーセンタイル（最近順位法）を返す"""
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def peak_rss_kib(rusage) -> int:
+    """getrusage/wait4 の ru_maxrss をKiBに揃える（macOSはバイト単位）"""
+    if sys.platform == "darwin":
+        return rusage.ru_maxrss // 1024
+    return rusage.ru_maxrss
+
+
+def own_peak_rss_kib() -> int:
+    """このプロセス自身のピークRSS（KiB）を返す
+
+    Linuxでは起動元から引き継いだ分を含まない /proc/self/status の VmHWM を使う。
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+
+    return peak_rss_kib(resource.getrusage(resource.RUSAGE_SELF))
+
+
+def summarize(latencies_ns: list[int], peak_rss: int) -> dict:
+    """ファイルごとのレイテンシ（ナノ秒）から集計値を求める"""
+    values = sorted(latencies_ns)
+    total = sum(values)
+    return {
+        "files": len(values),
+        "files_per_sec": len(values) / (total / 1e9) if total else 0.0,
+        "p50_ms": percentile(values, 50) / 1e6,
+        "p99_ms": percentile(values, 99) / 1e6,
+        "peak_rss_kib": peak_rss,
+    }
+
+
+def measure_warm(paths: list[Path]) -> dict:
+    """プロセス内で各ファイルを検証してレイテンシを測る"""
+    import validate_plugin
+
+    # importとバリデーターモジュールの読み込みを計測から除く
+    validate_plugin.validate_file(paths[0])
+    latencies = []
+    for path in paths:
+        start = time.perf_counter_ns()
+        validate_plugin.validate_file(path)
+        latencies.append(time.perf_counter_ns() - start)
+    return summarize(latencies, own_peak_rss_kib())
+
+
+def measure_samples(paths: list[Path], repeat: int) -> list[float]:
+    """ファイル群の検証をrepeat回繰り返し、回ごとのファイルあたり平均時間（ナノ秒）を返す
+
+    履歴の比較（history.py）で有意差を判定するための繰り返し標本。
+    """
+    import validate_plugin
+
+    validate_plugin.validate_file(paths[0])
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for path in paths:
+            validate_plugin.validate_file(path)
+        samples.append((time.perf_counter_ns() - start) / len(paths))
+    return samples
+
+
+def measure_cold(paths: list[Path]) -> dict:
+    """ファイルごとにhookモードのプロセスを起動してレイテンシを測る"""
+    latencies = []
+    peak_rss = 0
+    for path in paths:
+        payload = json.dumps({"tool_name": "Write", "tool_input": {"file_path": str(path)}})
+        start = time.perf_counter_ns()
+        process = subprocess.Popen(
+            [sys.executable, str(VALIDATE_PLUGIN)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+        )
+        process.stdin.write(payload.encode("utf-8"))
+        process.stdin.close()
+        # wait4で子プロセス単体のリソース使用量を得る
+        _, status, rusage = os.wait4(process.pid, 0)
+        latencies.append(time.perf_counter_ns() - start)
+        process.returncode = os.waitstatus_to_exitcode(status)
+        peak_rss = max(peak_rss, peak_rss_kib(rusage))
+    return summarize(latencies, peak_rss)
+
+
+def measure_tree(root: Path, jobs: int) -> dict:
+    """ツリーモードでroot以下をすべて検証し、所要時間とピークRSSを測る
+
+    ピークRSSはCLIのメインプロセスのもの（--jobsのワーカープロセスは含まない）。
+    """
+    start = time.perf_counter_ns()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            str(VALIDATE_PLUGIN),
+            "--no-cache",
+            "--format",
+            "jsonl",
+            "--jobs",
+            str(jobs),
+            "--root",
+            str(root),
+        ],
+        stdout=subprocess.PIPE,
+    )
+    files = sum(1 for _ in process.stdout)
+    process.stdout.close()
+    _, status, rusage = os.wait4(process.pid, 0)
+    elapsed_ns = time.perf_counter_ns() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return {
+        "files": files,
+        "seconds": elapsed_ns / 1e9,
+        "files_per_sec": files / (elapsed_ns / 1e9),
+        "peak_rss_kib": peak_rss_kib(rusage),
+    }
+
+
+MEASURES = {"warm": measure_warm, "cold": measure_cold}
+
+
+def _run_worker(mode: str, arguments: list[str]) -> dict | list:
+    """計測をワーカープロセスで実行する（ケースごとのピークRSSを分けるため）"""
+    completed = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), "--worker", mode, *arguments],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout)
+
+
+def sample_in_worker(paths: list[Path], repeat: int) -> list[float]:
+    """measure_samples() を新しいワーカープロセスで実行する"""
+    return _run_worker("samples", [str(repeat), *map(str, paths)])
+
+
+def run_benchmarks(
+    corpus: dict[tuple[str, str], list[Path]], modes: list[str], cold_files: int
+) -> list[dict]:
+    """コーパスの各ケースを計測し、結果の行を返す"""
+    rows = []
+    for (validator_id, size), paths in corpus.items():
+        for mode in modes:
+            measured = paths if mode == "warm" else paths[:cold_files]
+            stats = _run_worker(mode, [str(path) for path in measured])
+            rows.append({"validator": validator_id, "size": size, "mode": mode, **stats})
+    return rows
+
+
+def run_scale_benchmarks(
+    directory: Path, plugin_counts: list[int], jobs: int, seed: int, error_rate: float
+) -> list[dict]:
+    """プラグイン数ごとに合成マーケットプレイスを生成し、ツリーモードを計測する"""
+    rows = []
+    for count in plugin_counts:
+        root = directory / f"marketplace-{count}"
+        generate_marketplace(root, count, seed=seed, error_rate=error_rate)
+        stats = _run_worker("tree", [str(root), str(jobs)])
+        rows.append({"plugins": count, "jobs": jobs, **stats})
+    return rows
+
+
+def format_scale_table(rows: list[dict]) -> str:
+    """ツリーモードの計測結果を表形式の文字列にする"""
+    header = (
+        f"{'plugins':>8}{'jobs':>6}{'files':>9}{'seconds':>10}{'files/s':>12}{'peak RSS MiB':>14}"
+    )
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        lines.append(
+            f"{row['plugins']:>8}{row['jobs']:>6}{row['files']:>9}{row['seconds']:>10.2f}"
+            f"{row['files_per_sec']:>12.1f}{row['peak_rss_kib'] / 1024:>14.1f}"
+        )
+    return "\n".join(lines)
+
+
+def format_table(rows: list[dict]) -> str:
+    """結果を表形式の文字列にする"""
+    header = (
+        f"{'validator':<18}{'size':<14}{'mode':<6}{'files':>6}"
+        f"{'files/s':>12}{'p50 ms':>10}{'p99 ms':>10}{'peak RSS MiB':>14}"
+    )
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        lines.append(
+            f"{row['validator']:<18}{row['size']:<14}{row['mode']:<6}{row['files']:>6}"
+            f"{row['files_per_sec']:>12.1f}{row['p50_ms']:>10.3f}{row['p99_ms']:>10.3f}"
+            f"{row['peak_rss_kib'] / 1024:>14.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """メインエントリーポイント"""
+    parser = argparse.ArgumentParser(description="バリデーターのベンチマークを実行する")
+    parser.add_argument("--mode", choices=("warm", "cold", "both"), default="warm")
+    parser.add_argument("--validators", nargs="+", choices=list(GENERATORS), metavar="ID")
+    parser.add_argument("--sizes", nargs="+", choices=SIZES, default=list(SIZES))
+    parser.add_argument("--files", type=int, default=20, help="ケースあたりのファイル数")
+    parser.add_argument(
+        "--cold-files", type=int, default=5, help="coldで計測するケースあたりのファイル数"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="コーパス生成の乱数シード")
+    parser.add_argument(
+        "--corpus", type=Path, help="コーパスを書き出すディレクトリ（省略時は一時ディレクトリ）"
+    )
+    parser.add_argument("--json", type=Path, help="結果をJSONで書き出すパス")
+    parser.add_argument(
+        "--scale",
+        nargs="+",
+        type=int,
+        metavar="N",
+        help="N件のプラグインを持つマーケットプレイスでツリーモードを計測する",
+    )
+    parser.add_argument("--jobs", type=int, default=1, help="--scaleでの並列実行数")
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="--scaleでエラーを埋め込む確率"
+    )
+    parser.add_argument("--worker", nargs="+", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        mode, *arguments = args.worker
+        if mode == "tree":
+            stats = measure_tree(Path(arguments[0]), int(arguments[1]))
+        elif mode == "samples":
+            stats = measure_samples([Path(path) for path in arguments[1:]], int(arguments[0]))
+        else:
+            stats = MEASURES[mode]([Path(path) for path in arguments])
+        print(json.dumps(stats))
+        return 0
+
+    if args.scale:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            rows = run_scale_benchmarks(
+                args.corpus or Path(tmpdir), args.scale, args.jobs, args.seed, args.error_rate
+            )
+        print(format_scale_table(rows))
+        if args.json:
+            args.json.write_text(json.dumps(rows, indent=2) + "\n", encoding="utf-8")
+        return 0
+
+    modes = ["warm", "cold"] if args.mode == "both" else [args.mode]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        corpus = write_corpus(
+            args.corpus or Path(tmpdir),
+            validator_ids=args.validators,
+            sizes=tuple(args.sizes),
+            files_per_case=args.files,
+            seed=args.seed,
+        )
+        rows = run_benchmarks(corpus, modes, args.cold_files)
+
+    print(format_table(rows))
+    if args.json:
+        args.json.write_text(json.dumps(rows, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -99,6 +99,19 @@ class TestValidateAgent:
         result = validate_agent(Path("agent.md"), content)
         assert not result.has_errors()
         assert any("短すぎ" in w for w in result.warnings)
+        [diagnostic] = result.diagnostics
+        assert (diagnostic.rule_id, diagnostic.line) == ("short-description", 3)
+
+    def test_short_description_suppressed_by_comment(self):
+        content = dedent("""
+            ---
+            name: test-agent
+            description: 短い
+            ---
+            <!-- validator-disable short-description -->
+            本文
+        """).strip()
+        assert validate_agent(Path("agent.md"), content).diagnostics == []
 
     def test_invalid_model(self):
         content = dedent("""
@@ -422,6 +435,32 @@ class TestValidateAgent:
         result = validate_agent(Path("agent.md"), content)
         assert any("Task()" in w for w in result.warnings)
 
+    def test_task_agent_type_syntax_unclosed_parenthesis(self):
+        """Task(の閉じ括弧がない場合に警告"""
+        content = dedent("""
+            ---
+            name: test-agent
+            description: これは十分に長い説明です
+            tools: Read, Task(code-reviewer
+            ---
+            本文
+        """).strip()
+        result = validate_agent(Path("agent.md"), content)
+        assert any("Task()" in w for w in result.warnings)
+
+    def test_task_agent_type_syntax_empty_then_valid(self):
+        """Task()の後に有効なTask(agent_type)があれば警告しない（従来の正規表現と同じ判定）"""
+        content = dedent("""
+            ---
+            name: test-agent
+            description: これは十分に長い説明です
+            tools: Task(), Task(code-reviewer)
+            ---
+            本文
+        """).strip()
+        result = validate_agent(Path("agent.md"), content)
+        assert not any("Task()" in w for w in result.warnings)
+
     def test_memory_valid_user_scope(self):
         """memory: userが有効であることを確認"""
         content = dedent("""
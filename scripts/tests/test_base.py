@@ -2,16 +2,38 @@
 base.py のテスト
 """
 
+import re
 from pathlib import Path
 from textwrap import dedent
 
+import pytest
+
+from scripts.validators import base
 from scripts.validators.base import (
     WARNING_BROAD_BASH_WILDCARD,
+    BodyView,
+    Diagnostic,
+    Metrics,
+    ParsedDocument,
+    Suppressions,
     ValidationResult,
     add_yaml_warnings,
+    collect_metrics,
+    count_regex_scans,
+    count_stat_call,
     is_valid_boolean_value,
+    load_suppression_config,
+    locate_frontmatter,
     normalize_path,
+    parse_document,
     parse_frontmatter,
+    parse_json_safe,
+    parse_suppressions,
+    repo_suppressions,
+    rule,
+    set_repo_suppressions,
+    set_rule_tracer,
+    suppressions_for,
     to_str,
     validate_agent_field,
     validate_allow_ask_glob_fields,
@@ -19,6 +41,7 @@ from scripts.validators.base import (
     validate_context_field,
     validate_effort_field,
     validate_string_or_list_field,
+    with_suppressions,
 )
 
 
@@ -51,6 +74,73 @@ class TestValidationResult:
         assert "エラー" in message
         assert "警告" in message
 
+    def test_message_rendered_with_file_name(self):
+        result = ValidationResult()
+        result.add_error("{}は必須です", "name", file=Path("a/SKILL.md"))
+        result.add_warning("{0}: {0!r}", "x")
+        assert result.errors == ["SKILL.md: nameは必須です"]
+        assert result.warnings == ["x: 'x'"]
+
+    def test_template_without_args_not_formatted(self):
+        result = ValidationResult()
+        result.add_error("${VAR}形式で参照", file=Path("x.json"))
+        assert result.errors == ["x.json: ${VAR}形式で参照"]
+
+    def test_message_rendered_lazily(self):
+        """メッセージは参照されるまで組み立てない"""
+
+        class Arg:
+            formatted = 0
+
+            def __format__(self, spec):
+                Arg.formatted += 1
+                return "arg"
+
+        result = ValidationResult()
+        result.add_warning("値: {}", Arg())
+        assert result.has_warnings()
+        assert not result.has_errors()
+        assert Arg.formatted == 0
+        assert result.warnings == ["値: arg"]
+        assert Arg.formatted == 1
+
+    def test_diagnostics_keep_order_and_location(self):
+        result = ValidationResult()
+        result.add_warning("w", line=3, column=5, rule="dangerous-operation")
+        result.add_error("e")
+        assert [d.severity for d in result.diagnostics] == ["warning", "error"]
+        assert result.diagnostics[0].to_dict() == {
+            "severity": "warning",
+            "message": "w",
+            "rule": "dangerous-operation",
+            "line": 3,
+            "column": 5,
+        }
+
+
+class TestDiagnostic:
+    """Diagnosticのテスト"""
+
+    def test_equal_by_key(self):
+        first = Diagnostic("error", "{}が必要", ("name",), Path("a.md"), line=1)
+        second = Diagnostic("error", "{}が必要", ("name",), Path("a.md"), line=1)
+        assert first == second
+        assert first != Diagnostic("error", "{}が必要", ("name",), Path("a.md"), line=2)
+        assert first != "a.md: nameが必要"
+
+    def test_unhashable(self):
+        with pytest.raises(TypeError):
+            hash(Diagnostic("error", "e"))
+
+    def test_round_trip_through_dict(self):
+        diagnostic = Diagnostic("warning", "{}行目", (4,), Path("README.md"), "r", 4, 1)
+        restored = Diagnostic.from_dict(diagnostic.to_dict())
+        assert restored.message() == "README.md: 4行目"
+        assert (restored.rule_id, restored.line, restored.column) == ("r", 4, 1)
+
+    def test_repr(self):
+        assert repr(Diagnostic("error", "{}", (1,))) == "Diagnostic('error', '1')"
+
 
 class TestParseFrontmatter:
     """parse_frontmatterのテスト"""
@@ -301,6 +391,99 @@ class TestParseFrontmatter:
         assert any("ネスト" in w for w in warnings)
 
 
+class TestLocateFrontmatter:
+    """フロントマターの位置検出のテスト"""
+
+    def test_offsets(self):
+        content = "---\nname: a\n---\n本文\n"
+        yaml_start, yaml_end, body_start = locate_frontmatter(content)
+        assert content[yaml_start:yaml_end] == "name: a"
+        assert content[body_start:] == "本文\n"
+
+    def test_closing_line_with_surrounding_whitespace(self):
+        content = "---\nname: a\n  ---\t\nbody"
+        yaml_start, yaml_end, body_start = locate_frontmatter(content)
+        assert content[yaml_start:yaml_end] == "name: a"
+        assert content[body_start:] == "body"
+
+    def test_skips_lines_containing_dashes(self):
+        """ "----" や "a --- b" の行は閉じ行にしない"""
+        content = "---\ntitle: a --- b\n----\n---\nbody"
+        yaml_start, yaml_end, body_start = locate_frontmatter(content)
+        assert content[yaml_start:yaml_end] == "title: a --- b\n----"
+        assert content[body_start:] == "body"
+
+    def test_empty_frontmatter_and_no_body(self):
+        content = "---\n---"
+        yaml_start, yaml_end, body_start = locate_frontmatter(content)
+        assert yaml_start == yaml_end
+        assert body_start == len(content)
+
+    @pytest.mark.parametrize("content", ["本文のみ", "---", "---\nname: a\n", "---\n----\n"])
+    def test_not_found(self, content):
+        assert locate_frontmatter(content) is None
+
+
+class TestBodyView:
+    """本文ビューのテスト"""
+
+    def test_view_matches_parse_frontmatter(self):
+        content = "---\nname: a\n---\n\n  一行目\n二行目\n\n"
+        fm, body, warnings = parse_frontmatter(content)
+        document = parse_document(content)
+        view = document.body
+        assert (document.frontmatter, str(view), document.yaml_warnings) == (fm, body, warnings)
+        assert len(view) == len(body)
+        assert not view.is_blank()
+        assert view.line_count() == len(body.strip().split("\n")) == 2
+
+    def test_blank_body(self):
+        view = BodyView("---\n---\n \n\t\n", 8)
+        assert view.is_blank()
+        assert view.line_count() == 1
+
+    def test_no_frontmatter_views_whole_content(self):
+        view = parse_document("本文のみ").body
+        assert view.start == 0
+        assert str(view) == "本文のみ"
+
+    def test_search_is_limited_to_body(self):
+        view = BodyView("deploy\nbody", len("deploy\n"))
+        assert view.search(re.compile("deploy")) is None
+        assert view.search(re.compile("body")).start() == len("deploy\n")
+
+
+class TestParsedDocument:
+    """1ファイル分の解析結果のテスト"""
+
+    def test_frontmatter_span(self):
+        content = "---\nname: a\ntools: Read\n---\n本文"
+        document = parse_document(content)
+        assert isinstance(document, ParsedDocument)
+        assert document.frontmatter == {"name": "a", "tools": "Read"}
+        assert content[slice(*document.frontmatter_span)] == "name: a\ntools: Read"
+        assert str(document.body) == "本文"
+
+    def test_without_frontmatter(self):
+        document = parse_document("本文のみ")
+        assert document.frontmatter_span is None
+        assert document.frontmatter == {}
+
+    def test_line_of(self):
+        document = parse_document("---\nname: a\n---\n本文\n")
+        assert document.line_of(0) == 1
+        assert document.line_of(document.content.index("name")) == 2
+        assert document.line_of(document.body.start) == 4
+        assert document.line_of(len(document.content)) == 5
+
+    def test_field_and_warning_lines(self):
+        content = "---\nname: a\n# コメント\ntools:\n  - Read\nhooks:\n  pre: x\n---\n本文"
+        document = parse_document(content)
+        assert document.field_lines == {"name": 2, "tools": 4, "hooks": 6}
+        assert document.yaml_warning_lines == [7]
+        assert parse_document("本文").field_lines == {}
+
+
 class TestToStr:
     """to_strのテスト"""
 
@@ -387,33 +570,36 @@ class TestValidateAllowedTools:
 
     def test_not_specified(self):
         result = ValidationResult()
-        validate_allowed_tools(result, Path("test.md"), {}, set())
+        validate_allowed_tools(result, Path("test.md"), {})
         assert not result.has_errors()
         assert len(result.warnings) == 0
 
     def test_list_format(self):
         result = ValidationResult()
         fm = {"allowed-tools": ["Read", "Write"]}
-        validate_allowed_tools(result, Path("test.md"), fm, set())
+        validate_allowed_tools(result, Path("test.md"), fm)
         assert len(result.warnings) == 0
 
     def test_bash_wildcard_warning(self):
         result = ValidationResult()
         fm = {"allowed-tools": "Bash(*)"}
-        validate_allowed_tools(result, Path("test.md"), fm, set())
+        validate_allowed_tools(result, Path("test.md"), fm)
         assert any("Bash(*)" in w for w in result.warnings)
 
     def test_bash_wildcard_disabled(self):
         result = ValidationResult()
         fm = {"allowed-tools": "Bash(*)"}
-        validate_allowed_tools(result, Path("test.md"), fm, {WARNING_BROAD_BASH_WILDCARD})
+        validate = with_suppressions(
+            lambda file_path, content: validate_allowed_tools(result, file_path, fm)
+        )
+        validate(Path("test.md"), f"<!-- validator-disable {WARNING_BROAD_BASH_WILDCARD} -->")
         assert len(result.warnings) == 0
 
     def test_param_value_syntax_accepted(self):
         """Tool(param:value)構文がエラーなしで受け入れられることを確認（v2.1.178以降）"""
         result = ValidationResult()
         fm = {"allowed-tools": ["Agent(model:opus)", "Bash(git:*)"]}
-        validate_allowed_tools(result, Path("test.md"), fm, set())
+        validate_allowed_tools(result, Path("test.md"), fm)
         assert not result.has_errors()
         assert len(result.warnings) == 0
 
@@ -555,3 +741,330 @@ class TestIsValidBooleanValue:
         assert not is_valid_boolean_value(None)
         assert not is_valid_boolean_value(1.5)
         assert not is_valid_boolean_value(["true"])
+
+
+class TestMetrics:
+    """Metricsと集計用ヘルパーのテスト"""
+
+    def test_not_collected_by_default(self):
+        result = ValidationResult()
+        assert result.metrics is None
+        # 集計中でなければ何もしない
+        count_regex_scans()
+        count_stat_call()
+        validate_context_field(result, Path("a.md"), {})
+
+    def test_collect_metrics(self):
+        metrics = Metrics()
+        with collect_metrics(metrics):
+            parse_frontmatter("---\nname: a\n---\n本文\n")
+            parse_json_safe("{}", Path("a.json"), ValidationResult())
+            parse_suppressions("<!-- validator-disable dangerous-operation -->")
+            count_regex_scans(2)
+            count_stat_call()
+            validate_context_field(ValidationResult(), Path("a.md"), {})
+            validate_agent_field(ValidationResult(), Path("a.md"), {})
+
+        assert metrics.parse_ns > 0
+        assert metrics.regex_scans == 3
+        assert metrics.stat_calls == 1
+        assert metrics.rules_evaluated == 2
+
+    def test_nested_collection_restores_previous(self):
+        outer, inner = Metrics(), Metrics()
+        with collect_metrics(outer):
+            with collect_metrics(inner):
+                count_stat_call()
+            count_stat_call()
+        count_stat_call()
+        assert inner.stat_calls == 1
+        assert outer.stat_calls == 1
+
+    def test_add_and_to_dict(self):
+        a, b = Metrics(), Metrics()
+        a.bytes_read, b.bytes_read = 10, 5
+        b.rules_evaluated = 3
+        a.add(b)
+        assert a.to_dict() == {
+            "bytes_read": 15,
+            "parse_ns": 0,
+            "rule_ns": 0,
+            "rules_evaluated": 3,
+            "regex_scans": 0,
+            "stat_calls": 0,
+        }
+
+    def test_rule_keeps_function_metadata(self):
+        @rule
+        def check_something(result):
+            """説明"""
+            result.add_error("x")
+
+        result = ValidationResult()
+        check_something(result)
+        assert check_something.__name__ == "check_something"
+        assert check_something.__doc__ == "説明"
+        assert result.errors == ["x"]
+
+    def test_rule_stamps_its_id_on_diagnostics(self):
+        @rule("inner-rule")
+        def inner(result):
+            result.add_warning("inner")
+
+        @rule("outer-rule")
+        def outer(result):
+            result.add_error("outer")
+            inner(result)
+            result.add_error("explicit", rule="explicit-rule")
+
+        result = ValidationResult()
+        result.add_error("before")
+        outer(result=result)
+        assert [d.rule_id for d in result.diagnostics] == [
+            None,
+            "outer-rule",
+            "inner-rule",
+            "explicit-rule",
+        ]
+
+
+class TestRuleTracer:
+    """set_rule_tracerによるルール評価のトレース"""
+
+    def _trace(self, func, *args, **kwargs) -> list[tuple]:
+        events = []
+        set_rule_tracer(lambda *event: events.append(event))
+        try:
+            func(*args, **kwargs)
+        finally:
+            set_rule_tracer(None)
+        return events
+
+    def test_outcomes(self):
+        path = Path("SKILL.md")
+        events = self._trace(validate_context_field, ValidationResult(), path, {})
+        events += self._trace(
+            validate_allowed_tools, ValidationResult(), path, {"allowed-tools": "Bash(*)"}
+        )
+        events += self._trace(
+            validate_context_field,
+            result=ValidationResult(),
+            file_path=path,
+            frontmatter={"context": "x"},
+        )
+        assert [(e[0], e[1], e[3]) for e in events] == [
+            (path, "context-value", "pass"),
+            (path, "broad-bash-wildcard", "warning"),
+            (path, "context-value", "error"),
+        ]
+        assert all(isinstance(e[2], int) and e[2] >= 0 for e in events)
+
+    def test_exception_outcome(self):
+        @rule
+        def broken(file_path):
+            raise ValueError("x")
+
+        events = []
+        set_rule_tracer(lambda *event: events.append(event))
+        try:
+            with pytest.raises(ValueError):
+                broken(Path("a.md"))
+        finally:
+            set_rule_tracer(None)
+        assert events[0][1] == "broken"
+        assert events[0][3] == "exception"
+
+    def test_rule_without_result_or_path(self):
+        @rule
+        def check(value):
+            return value * 2
+
+        events = self._trace(check, 3)
+        assert events[0][0] is None
+        assert events[0][3] == "pass"
+        assert check.rule_id == "check"
+
+    def test_no_tracer_by_default(self):
+        # トレーサーがなければ通知しない（例外にならない）
+        result = ValidationResult()
+        validate_context_field(result, Path("a.md"), {"context": "x"})
+        assert result.errors
+
+
+@rule("sample-check")
+def _sample_check(result: ValidationResult, lines: list[int | None]) -> None:
+    """抑制のテスト用ルール（指定した行ごとに警告を1件追加する）"""
+    _sample_check.calls += 1
+    for line in lines:
+        result.add_warning("問題", line=line)
+
+
+_sample_check.calls = 0
+
+
+def _validate_sample(lines: list[int | None]):
+    """_sample_check を呼ぶバリデーター関数を返す"""
+
+    @with_suppressions
+    def validate(file_path: Path, content: str) -> ValidationResult:
+        result = ValidationResult()
+        _sample_check(result, lines)
+        return result
+
+    return validate
+
+
+@pytest.fixture
+def repo_rules():
+    yield set_repo_suppressions
+    set_repo_suppressions(())
+
+
+class TestSuppressions:
+    """ルールの抑制のテスト"""
+
+    def test_parse_scopes(self):
+        content = dedent("""
+            <!-- validator-disable a -->
+            <!-- validator-disable-next-line b -->
+            3行目
+            <!-- validator-disable-start c -->
+            5行目
+            <!-- validator-disable-end c -->
+            <!-- validator-disable-end d -->
+            <!-- validator-disable-start
+                 e -->
+        """).strip()
+        suppressions = parse_suppressions(content)
+        assert suppressions.rules == {"a"}
+        assert suppressions.ranges["b"] == [(3, 3)]
+        assert suppressions.ranges["c"] == [(4, 6)]
+        assert "d" not in suppressions.ranges
+        assert suppressions.ranges["e"][0][0] == 8
+        assert suppressions.covers("e", 10_000)
+        assert not suppressions.covers("b", 4)
+        assert not suppressions.covers("x", 1)
+
+    def test_next_line_after_multiline_comment(self):
+        suppressions = parse_suppressions("<!-- validator-disable-next-line\n  a -->\nx")
+        assert suppressions.ranges["a"] == [(3, 3)]
+
+    def test_rule_id(self):
+        assert _sample_check.rule_id == "sample-check"
+
+    def test_file_scope_skips_rule_before_execution(self):
+        _sample_check.calls = 0
+        with collect_metrics(Metrics()) as metrics:
+            result = _validate_sample([None])(
+                Path("a.md"), "<!-- validator-disable sample-check -->"
+            )
+        assert result.diagnostics == []
+        assert _sample_check.calls == 0
+        assert metrics.rules_evaluated == 0
+
+    def test_other_rules_still_run(self):
+        _sample_check.calls = 0
+        content = "<!-- validator-disable relative-links -->"
+        result = _validate_sample([None])(Path("a.md"), content)
+        assert _sample_check.calls == 1
+        assert len(result.warnings) == 1
+
+    def test_line_range_filters_only_covered_lines(self):
+        content = "1\n<!-- validator-disable-next-line sample-check -->\n3\n4"
+        result = _validate_sample([1, 3, 4, None])(Path("a.md"), content)
+        assert [d.line for d in result.diagnostics] == [1, 4, None]
+
+    def test_rule_argument_ids_are_suppressed(self):
+        """@rule の外で rule= を指定した問題も、ファイルと行範囲で抑制できる"""
+
+        @with_suppressions
+        def validate(file_path: Path, content: str) -> ValidationResult:
+            result = ValidationResult()
+            result.add_warning("a", rule="model-value", line=2)
+            result.add_warning("b", rule="model-value", line=3)
+            result.add_warning("c", rule="name-value")
+            return result
+
+        content = "<!-- validator-disable-next-line model-value -->\nx\n"
+        assert [d.message() for d in validate(Path("a.md"), content).diagnostics] == ["b", "c"]
+        content = "<!-- validator-disable name-value -->"
+        assert [d.message() for d in validate(Path("a.md"), content).diagnostics] == ["a", "b"]
+
+    def test_unknown_directive_is_reported(self):
+        content = "1\n<!-- validator-disable-next-line no-such-rule -->\n3"
+        result = _validate_sample([])(Path("a.md"), content)
+        [diagnostic] = result.diagnostics
+        assert diagnostic.message() == "a.md: 未知のルールIDです: no-such-rule"
+        assert (diagnostic.rule_id, diagnostic.line) == ("unknown-rule-id", 2)
+
+    def test_document_carries_suppressions(self):
+        assert parse_document("本文").suppressions is None
+        document = parse_document("<!-- validator-disable sample-check -->")
+        assert document.suppressions.rules == {"sample-check"}
+
+    def test_repo_rules_do_not_change_document_suppressions(self, repo_rules):
+        repo_rules(["relative-links"])
+        content = "<!-- validator-disable sample-check -->"
+        with_suppressions(lambda file_path, content: None)(Path("a.md"), content)
+        document = parse_document(content)
+        assert suppressions_for(document).rules == {"sample-check", "relative-links"}
+        assert document.suppressions.rules == {"sample-check"}
+        assert suppressions_for(None).rules == {"relative-links"}
+
+    def test_markdown_is_parsed_once(self, monkeypatch):
+        """with_suppressions が解析した結果をバリデーターの parse_document() でも使う"""
+        calls = []
+        parse = base._parse_document_uncached
+        monkeypatch.setattr(base, "_parse_document_uncached", lambda c: calls.append(c) or parse(c))
+
+        @with_suppressions
+        def validate(file_path: Path, content: str) -> ValidationResult:
+            assert parse_document(content) is parse_document(content)
+            return ValidationResult()
+
+        validate(Path("a.md"), "---\nname: a\n---\n")
+        assert len(calls) == 1
+
+    def test_line_range_for_rule_without_result(self):
+        @rule("plain")
+        def plain(value):
+            return value * 2
+
+        validate = with_suppressions(lambda file_path, content: plain(3))
+        assert validate(Path("a.md"), "<!-- validator-disable-next-line plain -->") == 6
+
+    def test_repo_scope(self, repo_rules):
+        repo_rules(["sample-check"])
+        assert repo_suppressions() == {"sample-check"}
+        _sample_check.calls = 0
+        assert _validate_sample([None])(Path("a.json"), "{}").diagnostics == []
+        content = "<!-- validator-disable relative-links -->"
+        assert _validate_sample([None])(Path("a.md"), content).diagnostics == []
+        assert _sample_check.calls == 0
+
+    def test_suppression_ends_with_validator_call(self):
+        _validate_sample([None])(Path("a.md"), "<!-- validator-disable sample-check -->")
+        result = ValidationResult()
+        _sample_check(result, [None])
+        assert len(result.warnings) == 1
+
+    def test_load_config(self, tmp_path):
+        config = tmp_path / ".validate-plugin.json"
+        config.write_text('{"disable": ["relative-links"]}', encoding="utf-8")
+        assert load_suppression_config(config) == {"relative-links"}
+        config.write_text("{}", encoding="utf-8")
+        assert load_suppression_config(config) == frozenset()
+
+    @pytest.mark.parametrize("text", ["{", '{"disable": "a"}', '{"disable": [""]}', "[]"])
+    def test_load_invalid_config(self, tmp_path, text):
+        config = tmp_path / ".validate-plugin.json"
+        config.write_text(text, encoding="utf-8")
+        with pytest.raises(ValueError, match="validate-plugin.json"):
+            load_suppression_config(config)
+
+    def test_load_missing_config(self, tmp_path):
+        with pytest.raises(ValueError):
+            load_suppression_config(tmp_path / "missing.json")
+
+    def test_empty_suppressions(self):
+        assert Suppressions().ranges == {}
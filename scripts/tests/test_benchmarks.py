@@ -0,0 +1,232 @@
+"""
+ベンチマーク（benchmarks/）のテスト
+
+計測値そのものは環境に依存するため、コーパスの形と集計処理だけを確認する。
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import pytest
+
+_scripts_dir = Path(__file__).parent.parent
+if str(_scripts_dir) not in sys.path:
+    sys.path.insert(0, str(_scripts_dir))
+
+from benchmarks import history, run  # noqa: E402
+from benchmarks.corpora import GENERATORS, SIZES, write_corpus  # noqa: E402
+from benchmarks.marketplace import generate_marketplace  # noqa: E402
+
+from scripts.validators.registry import classify, registered_validators  # noqa: E402
+
+
+class TestCorpora:
+    """合成コーパスのテスト"""
+
+    def test_every_validator_has_generator(self):
+        assert set(GENERATORS) == {spec.id for spec in registered_validators()}
+
+    @pytest.mark.parametrize("size", SIZES)
+    def test_files_classify_to_their_validator(self, tmp_path, size):
+        corpus = write_corpus(tmp_path, sizes=(size,), files_per_case=2)
+        for (validator_id, _), paths in corpus.items():
+            assert len(paths) == 2
+            for path in paths:
+                assert path.is_file()
+                assert classify(path).id == validator_id
+
+    def test_same_seed_same_corpus(self, tmp_path):
+        first = write_corpus(tmp_path / "a", validator_ids=["skill"], seed=3)
+        second = write_corpus(tmp_path / "b", validator_ids=["skill"], seed=3)
+        for key, paths in first.items():
+            contents = [p.read_text(encoding="utf-8") for p in paths]
+            assert contents == [p.read_text(encoding="utf-8") for p in second[key]]
+
+    def test_typical_readme_links_resolve(self, tmp_path):
+        """typicalのREADMEはリンク切れのない正常なファイルにする"""
+        import validate_plugin
+
+        corpus = write_corpus(tmp_path, validator_ids=["readme"], sizes=("typical",))
+        for path in corpus[("readme", "typical")]:
+            assert not validate_plugin.validate_file(path).has_errors()
+
+
+class TestMarketplace:
+    """合成マーケットプレイスのテスト"""
+
+    def _validate_tree(self, root: Path) -> dict[str, bool]:
+        """root以下の対象ファイルごとにエラーがあるかを返す（rootからの相対パス）"""
+        import validate_plugin
+        from validators.walker import iter_target_files
+
+        return {
+            path.relative_to(root).as_posix(): validate_plugin.validate_file(path).has_errors()
+            for path in iter_target_files(root)
+        }
+
+    def test_without_errors_everything_is_valid(self, tmp_path):
+        summary = generate_marketplace(tmp_path, plugins=10)
+        results = self._validate_tree(tmp_path)
+
+        assert summary["plugins"] == 10
+        assert summary["invalid_files"] == []
+        assert ".claude-plugin/marketplace.json" in results
+        assert not any(results.values())
+
+    def test_injected_errors_are_reported(self, tmp_path):
+        summary = generate_marketplace(tmp_path, plugins=10, seed=1, error_rate=0.3)
+        results = self._validate_tree(tmp_path)
+
+        assert summary["invalid_files"]
+        reported = sorted(path for path, has_errors in results.items() if has_errors)
+        assert reported == summary["invalid_files"]
+
+    def test_same_seed_same_checkout(self, tmp_path):
+        first = generate_marketplace(tmp_path / "a", plugins=5, seed=2, error_rate=0.5)
+        second = generate_marketplace(tmp_path / "b", plugins=5, seed=2, error_rate=0.5)
+        assert first == second
+        marketplace = Path(".claude-plugin") / "marketplace.json"
+        assert (tmp_path / "a" / marketplace).read_bytes() == (
+            tmp_path / "b" / marketplace
+        ).read_bytes()
+
+
+class TestRun:
+    """計測・集計処理のテスト"""
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        assert run.percentile(values, 50) == 50
+        assert run.percentile(values, 99) == 99
+        assert run.percentile([7], 99) == 7
+
+    def test_summarize(self):
+        stats = run.summarize([1_000_000, 3_000_000], peak_rss=2048)
+        assert stats["files"] == 2
+        assert stats["files_per_sec"] == pytest.approx(500.0)
+        assert stats["p50_ms"] == 1.0
+        assert stats["peak_rss_kib"] == 2048
+
+    def test_measure_warm(self, tmp_path):
+        corpus = write_corpus(tmp_path, validator_ids=["hooks-json"], sizes=("small",))
+        stats = run.measure_warm(corpus[("hooks-json", "small")])
+        assert stats["files"] == 20
+        assert stats["peak_rss_kib"] > 0
+
+    def test_format_table(self):
+        row = {"validator": "skill", "size": "small", "mode": "warm"}
+        row.update(run.summarize([1_000_000], peak_rss=1024))
+        lines = run.format_table([row]).splitlines()
+        assert lines[0].split()[:3] == ["validator", "size", "mode"]
+        assert lines[2].split()[:4] == ["skill", "small", "warm", "1"]
+
+
+class TestHistory:
+    """履歴の記録と比較のテスト"""
+
+    def _record(self, **cases):
+        return {
+            "cases": [
+                {"validator": validator_id, "size": "small", "samples_ns": samples}
+                for validator_id, samples in cases.items()
+            ]
+        }
+
+    def test_mann_whitney_separated_samples(self):
+        base = [100.0, 101, 102, 103, 104, 105, 106, 107]
+        head = [150.0, 151, 152, 153, 154, 155, 156, 157]
+        assert history.mann_whitney_greater(base, head) < 0.001
+        assert history.mann_whitney_greater(head, base) > 0.999
+
+    def test_mann_whitney_identical_samples(self):
+        assert history.mann_whitney_greater([5.0] * 6, [5.0] * 6) == 1.0
+
+    def test_median(self):
+        assert history.median([3, 1, 2]) == 2
+        assert history.median([4, 1, 3, 2]) == 2.5
+
+    def test_compare_records_verdicts(self):
+        noise = [0, 3, -2, 1, -1, 2, -3, 4, 0, -4]
+        base = self._record(
+            skill=[1000 + n for n in noise],
+            agent=[1000 + n for n in noise],
+            readme=[1000 + n for n in noise],
+        )
+        head = self._record(
+            skill=[1300 + n for n in noise],
+            agent=[700 + n for n in noise],
+            readme=[1050 + n for n in noise],
+        )
+        rows = {row["validator"]: row for row in history.compare_records(base, head)}
+        assert rows["skill"]["verdict"] == "regression"
+        assert rows["skill"]["change"] == pytest.approx(0.3, abs=0.01)
+        assert rows["agent"]["verdict"] == "improvement"
+        # 有意でも閾値未満の変化は回帰としない
+        assert rows["readme"]["verdict"] == "unchanged"
+
+    def test_compare_records_noisy_samples_not_regression(self):
+        base = self._record(skill=[1000, 1500, 900, 1400, 1100])
+        head = self._record(skill=[1500, 950, 1600, 1000, 1250])
+        [row] = history.compare_records(base, head)
+        assert row["change"] >= 0.1
+        assert row["verdict"] == "unchanged"
+
+    def test_case_thresholds_prefer_specific(self):
+        base = self._record(skill=[1000.0 + n for n in range(10)])
+        head = self._record(skill=[1300.0 + n for n in range(10)])
+        [row] = history.compare_records(base, head, case_thresholds={"skill": 0.5})
+        assert row["verdict"] == "unchanged"
+        [row] = history.compare_records(
+            base, head, case_thresholds={"skill": 0.5, "skill:small": 0.2}
+        )
+        assert row["threshold"] == 0.2
+        assert row["verdict"] == "regression"
+
+    def test_parse_case_threshold(self):
+        assert history.parse_case_threshold("readme:pathological=0.3") == (
+            "readme:pathological",
+            0.3,
+        )
+        with pytest.raises(argparse.ArgumentTypeError):
+            history.parse_case_threshold("readme")
+        with pytest.raises(argparse.ArgumentTypeError):
+            history.parse_case_threshold("readme=fast")
+
+    def test_record_collects_samples(self, tmp_path):
+        cases = history.record(
+            tmp_path, validator_ids=["hooks-json"], sizes=("small",), files_per_case=2, repeat=3
+        )
+        assert [(case["validator"], case["size"]) for case in cases] == [("hooks-json", "small")]
+        assert len(cases[0]["samples_ns"]) == 3
+        assert all(sample > 0 for sample in cases[0]["samples_ns"])
+
+    def test_sample_in_worker(self, tmp_path):
+        [paths] = write_corpus(tmp_path, ["hooks-json"], ("small",), 2, 0).values()
+        samples = run.sample_in_worker(paths, 2)
+        assert len(samples) == 2
+        assert all(sample > 0 for sample in samples)
+
+    def test_load_record_missing_json_for_revision(self, tmp_path):
+        with pytest.raises(history.RecordNotFoundError, match="HEAD の記録がありません"):
+            history.load_record("HEAD", tmp_path)
+
+    def test_load_record_unknown_ref(self, tmp_path):
+        with pytest.raises(history.RecordNotFoundError, match="no-such-ref"):
+            history.load_record("no-such-ref", tmp_path)
+
+    def test_compare_missing_record_exits_with_error(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["history.py", "--history-dir", str(tmp_path), "compare", str(tmp_path / "a.json")],
+        )
+        assert history.main() == 2
+        assert "a.json" in capsys.readouterr().err
+
+    def test_format_comparison(self):
+        base = self._record(skill=[1000.0] * 3)
+        head = self._record(skill=[2000.0] * 3)
+        lines = history.format_comparison(history.compare_records(base, head)).splitlines()
+        assert lines[0].split()[:2] == ["validator", "size"]
+        assert lines[2].split()[:4] == ["skill", "small", "1.0", "2.0"]
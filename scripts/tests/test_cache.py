@@ -0,0 +1,252 @@
+"""
+cache.py のテスト
+"""
+
+import os
+from pathlib import Path
+
+from scripts.validators import cache as cache_module
+from scripts.validators.base import ValidationResult, set_repo_suppressions
+from scripts.validators.cache import ResultCache, code_version
+from scripts.validators.readme import validate_readme
+
+
+def _result(errors=(), warnings=()) -> ValidationResult:
+    result = ValidationResult()
+    for error in errors:
+        result.add_error(error)
+    for warning in warnings:
+        result.add_warning(warning)
+    return result
+
+
+class TestCacheKey:
+    """キャッシュキーのテスト"""
+
+    def test_same_inputs_same_key(self, tmp_path):
+        cache = ResultCache(tmp_path)
+        key = cache.key("skill", Path("a/SKILL.md"), "content")
+        assert key == cache.key("skill", Path("b/SKILL.md"), "content")
+
+    def test_key_depends_on_content_validator_and_name(self, tmp_path):
+        cache = ResultCache(tmp_path)
+        base = cache.key("skill", Path("SKILL.md"), "content")
+        assert base != cache.key("skill", Path("SKILL.md"), "content2")
+        assert base != cache.key("agent", Path("SKILL.md"), "content")
+        assert base != cache.key("skill", Path("OTHER.md"), "content")
+
+    def test_key_depends_on_repo_suppressions(self, tmp_path):
+        cache = ResultCache(tmp_path)
+        base = cache.key("skill", Path("SKILL.md"), "content")
+        set_repo_suppressions(["effort-value"])
+        try:
+            assert cache.key("skill", Path("SKILL.md"), "content") != base
+        finally:
+            set_repo_suppressions(())
+        assert cache.key("skill", Path("SKILL.md"), "content") == base
+
+    def test_code_version_is_stable(self):
+        assert code_version() == code_version()
+        assert len(code_version()) == 64
+
+
+class TestResultCache:
+    """ResultCacheの保存・取得のテスト"""
+
+    def test_miss_then_hit(self, tmp_path):
+        cache = ResultCache(tmp_path)
+        file_path = Path("SKILL.md")
+        key = cache.key("skill", file_path, "x")
+        assert cache.get(key, file_path) is None
+
+        cache.put(key, file_path, _result(["エラー"], ["警告"]))
+        cached = cache.get(key, file_path)
+        assert cached.errors == ["エラー"]
+        assert cached.warnings == ["警告"]
+
+    def test_diagnostic_location_survives(self, tmp_path):
+        cache = ResultCache(tmp_path)
+        file_path = Path("README.md")
+        key = cache.key("readme", file_path, "x")
+        result = ValidationResult()
+        result.add_warning("{}行目", 3, file=file_path, line=3)
+        cache.put(key, file_path, result)
+        cached = cache.get(key, file_path)
+        assert cached.warnings == ["README.md: 3行目"]
+        assert cached.diagnostics[0].line == 3
+
+    def test_hit_refreshes_mtime(self, tmp_path):
+        cache = ResultCache(tmp_path)
+        key = cache.key("skill", Path("SKILL.md"), "x")
+        cache.put(key, Path("SKILL.md"), _result())
+        entry_path = cache._entry_path(key)
+        os.utime(entry_path, ns=(0, 0))
+
+        cache.get(key, Path("SKILL.md"))
+        assert entry_path.stat().st_mtime_ns > 0
+
+    def test_hit_when_utime_fails(self, tmp_path, monkeypatch):
+        cache = ResultCache(tmp_path)
+        key = cache.key("skill", Path("SKILL.md"), "x")
+        cache.put(key, Path("SKILL.md"), _result(["e"]))
+
+        def failing_utime(*args, **kwargs):
+            raise PermissionError
+
+        monkeypatch.setattr(cache_module.os, "utime", failing_utime)
+        assert cache.get(key, Path("SKILL.md")).errors == ["e"]
+
+    def test_corrupted_entry_is_miss(self, tmp_path):
+        cache = ResultCache(tmp_path)
+        key = cache.key("skill", Path("SKILL.md"), "x")
+        entry_path = cache._entry_path(key)
+        entry_path.parent.mkdir(parents=True)
+        entry_path.write_text("{broken", encoding="utf-8")
+        assert cache.get(key, Path("SKILL.md")) is None
+
+    def test_put_failure_is_ignored(self, tmp_path):
+        blocker = tmp_path / "blocker"
+        blocker.write_text("", encoding="utf-8")
+        cache = ResultCache(blocker / "cache")
+        key = cache.key("skill", Path("SKILL.md"), "x")
+
+        cache.put(key, Path("SKILL.md"), _result())
+        assert cache.get(key, Path("SKILL.md")) is None
+
+    def test_put_failure_removes_temporary_file(self, tmp_path, monkeypatch):
+        cache = ResultCache(tmp_path)
+        key = cache.key("skill", Path("SKILL.md"), "x")
+
+        def failing_replace(src, dst):
+            raise PermissionError
+
+        monkeypatch.setattr(cache_module.os, "replace", failing_replace)
+        cache.put(key, Path("SKILL.md"), _result())
+        assert list(cache._entry_path(key).parent.iterdir()) == []
+
+
+class TestFilesystemDependentEntries:
+    """ファイルシステムの状態に依存する結果（READMEのリンク）のテスト"""
+
+    README = "## 概要\n\n[ガイド](./guide.md)\n\n## インストール\n\n## 使い方\n"
+
+    def _validate_and_store(self, cache: ResultCache, readme_path: Path) -> str:
+        result = validate_readme(readme_path, self.README)
+        key = cache.key("readme", readme_path, self.README)
+        cache.put(key, readme_path, result)
+        return key
+
+    def test_valid_while_link_targets_unchanged(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache")
+        readme_path = tmp_path / "plugin" / "README.md"
+        readme_path.parent.mkdir()
+        key = self._validate_and_store(cache, readme_path)
+
+        cached = cache.get(key, readme_path)
+        assert cached is not None
+        assert any("リンク切れ" in e for e in cached.errors)
+
+    def test_invalidated_when_link_target_created(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache")
+        readme_path = tmp_path / "plugin" / "README.md"
+        readme_path.parent.mkdir()
+        key = self._validate_and_store(cache, readme_path)
+
+        (readme_path.parent / "guide.md").write_text("", encoding="utf-8")
+        assert cache.get(key, readme_path) is None
+
+    def test_invalidated_when_link_target_deleted(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache")
+        readme_path = tmp_path / "plugin" / "README.md"
+        readme_path.parent.mkdir()
+        guide = readme_path.parent / "guide.md"
+        guide.write_text("", encoding="utf-8")
+        key = self._validate_and_store(cache, readme_path)
+        assert cache.get(key, readme_path).errors == []
+
+        guide.unlink()
+        assert cache.get(key, readme_path) is None
+
+    def test_invalidated_when_file_moves(self, tmp_path):
+        """同じ内容でも場所が違えばリンクの解決先が変わるためミスになる"""
+        cache = ResultCache(tmp_path / "cache")
+        readme_path = tmp_path / "plugin" / "README.md"
+        readme_path.parent.mkdir()
+        key = self._validate_and_store(cache, readme_path)
+
+        moved = tmp_path / "other" / "README.md"
+        assert cache.get(key, moved) is None
+
+
+class TestPrune:
+    """容量上限によるLRU削除のテスト"""
+
+    def _fill(self, cache: ResultCache, count: int) -> list[Path]:
+        entries = []
+        for i in range(count):
+            key = cache.key("skill", Path("SKILL.md"), str(i))
+            cache.put(key, Path("SKILL.md"), _result([f"エラー{i}" * 10]))
+            entry_path = cache._entry_path(key)
+            os.utime(entry_path, ns=(i * 10**9, i * 10**9))
+            entries.append(entry_path)
+        return entries
+
+    def test_within_limit_keeps_everything(self, tmp_path):
+        cache = ResultCache(tmp_path)
+        entries = self._fill(cache, 3)
+        assert cache.prune() == 0
+        assert all(p.exists() for p in entries)
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ResultCache(tmp_path)
+        entries = self._fill(cache, 4)
+        cache.max_bytes = entries[0].stat().st_size * 2
+
+        assert cache.prune() == 2
+        assert [p.exists() for p in entries] == [False, False, True, True]
+
+    def test_missing_directory(self, tmp_path):
+        assert ResultCache(tmp_path / "missing").prune() == 0
+
+    def test_ignores_stray_files_and_failures(self, tmp_path, monkeypatch):
+        cache = ResultCache(tmp_path, max_bytes=0)
+        entries = self._fill(cache, 2)
+        (tmp_path / "stray.txt").write_text("", encoding="utf-8")
+
+        def failing_unlink(path):
+            raise PermissionError
+
+        monkeypatch.setattr(cache_module.os, "unlink", failing_unlink)
+        assert cache.prune() == 0
+        assert all(p.exists() for p in entries)
+
+    def test_entry_vanishing_during_scan(self, tmp_path, monkeypatch):
+        """走査中に他プロセスが削除したエントリは無視する"""
+        cache = ResultCache(tmp_path, max_bytes=0)
+        self._fill(cache, 1)
+        real_scandir = os.scandir
+
+        class VanishingEntry:
+            def __init__(self, entry):
+                self.path = entry.path
+
+            def stat(self, follow_symlinks=True):
+                raise FileNotFoundError(self.path)
+
+        class FakeScandir:
+            def __init__(self, path):
+                self._it = real_scandir(path)
+                self._shard = Path(path) != tmp_path
+
+            def __iter__(self):
+                for entry in self._it:
+                    yield VanishingEntry(entry) if self._shard else entry
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                self._it.close()
+
+        monkeypatch.setattr(cache_module.os, "scandir", FakeScandir)
+        assert cache.prune() == 0
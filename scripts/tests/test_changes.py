@@ -0,0 +1,174 @@
+"""
+changes.py のテスト
+"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from scripts.validators import changes
+from scripts.validators.changes import GitDiffError, changed_files, parse_name_status
+
+README = "## 概要\n\n[ガイド](./guide.md)\n\n## インストール\n\n## 使い方\n"
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _write(path: Path, content: str = "") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """ベースコミットを1つ持つリポジトリ（カレントディレクトリをリポジトリに移す）"""
+    _git(tmp_path, "init", "-q", "-b", "main")
+    plugin = tmp_path / "plugins" / "p"
+    _write(plugin / "README.md", README)
+    _write(plugin / "guide.md", "# ガイド\n")
+    _write(plugin / "skills" / "s" / "SKILL.md", "---\nname: s\n---\n")
+    _write(plugin / "commands" / "old.md", "---\ndescription: x\n---\n")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "base")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestParseNameStatus:
+    """parse_name_statusのテスト"""
+
+    def test_statuses(self):
+        output = "M\0a.md\0A\0b.md\0D\0c.md\0R100\0old.md\0new.md\0C075\0src.md\0copy.md\0"
+        assert parse_name_status(output) == (
+            ["a.md", "b.md", "new.md", "copy.md"],
+            ["c.md", "old.md"],
+        )
+
+    def test_empty(self):
+        assert parse_name_status("") == ([], [])
+
+
+class TestChangedFiles:
+    """changed_filesのテスト"""
+
+    def test_no_changes(self, repo):
+        assert changed_files("main") == []
+
+    def test_modified_and_untracked(self, repo):
+        _write(repo / "plugins" / "p" / "skills" / "s" / "SKILL.md", "---\nname: t\n---\n")
+        _write(repo / "plugins" / "p" / "agents" / "new.md", "---\nname: a\n---\n")
+        _write(repo / "plugins" / "p" / "notes.md", "対象外\n")
+
+        assert changed_files("main") == [
+            Path("plugins/p/agents/new.md"),
+            Path("plugins/p/skills/s/SKILL.md"),
+        ]
+
+    def test_committed_changes_since_branch_point(self, repo):
+        _git(repo, "checkout", "-q", "-b", "feature")
+        _write(repo / "plugins" / "p" / "commands" / "new.md", "---\ndescription: y\n---\n")
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-q", "-m", "feature")
+
+        assert changed_files("main") == [Path("plugins/p/commands/new.md")]
+
+    def test_rename_reports_new_path(self, repo):
+        _git(repo, "mv", "plugins/p/commands/old.md", "plugins/p/commands/renamed.md")
+
+        assert changed_files("main") == [Path("plugins/p/commands/renamed.md")]
+
+    def test_deleted_link_target_revalidates_readme(self, repo):
+        _git(repo, "rm", "-q", "plugins/p/guide.md")
+        _write(repo / "plugins" / "q" / "README.md", "## 概要\n")
+
+        assert changed_files("main") == [
+            Path("plugins/p/README.md"),
+            Path("plugins/q/README.md"),
+        ]
+
+    def test_renamed_link_target_revalidates_readme(self, repo):
+        _git(repo, "mv", "plugins/p/guide.md", "plugins/p/docs.md")
+
+        assert changed_files("main") == [Path("plugins/p/README.md")]
+
+    def test_deleted_file_under_linked_directory_revalidates_readme(self, repo):
+        plugin = repo / "plugins" / "p"
+        _write(plugin / "docs" / "a.md", "# a\n")
+        _write(plugin / "README.md", README + "\n[docs](./docs/)\n")
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-q", "-m", "docs")
+        _git(repo, "rm", "-q", "-r", "plugins/p/docs")
+
+        assert changed_files("HEAD") == [Path("plugins/p/README.md")]
+
+    def test_scopes_limit_changed_files(self, repo):
+        _write(repo / "plugins" / "p" / "agents" / "new.md", "---\nname: a\n---\n")
+        _write(repo / "other" / "agents" / "new.md", "---\nname: a\n---\n")
+
+        assert changed_files("main", scopes=[Path("plugins")]) == [Path("plugins/p/agents/new.md")]
+
+    def test_scopes_still_see_removed_paths_outside(self, repo):
+        _write(repo / "docs" / "guide.md", "# ガイド\n")
+        _write(repo / "plugins" / "p" / "README.md", README + "\n[共通](../../docs/guide.md)\n")
+        _write(repo / "other" / "README.md", "[共通](../docs/guide.md)\n")
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-q", "-m", "docs")
+        _git(repo, "rm", "-q", "docs/guide.md")
+
+        assert changed_files("HEAD", scopes=[Path("plugins")]) == [Path("plugins/p/README.md")]
+
+    def test_deleted_validation_target_is_not_returned(self, repo):
+        _git(repo, "rm", "-q", "plugins/p/commands/old.md")
+
+        assert changed_files("main") == []
+
+    def test_unreadable_readme_is_skipped(self, repo):
+        (repo / "plugins" / "p" / "README.md").write_bytes(b"\xff\xfe")
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-q", "-m", "binary")
+        _git(repo, "rm", "-q", "plugins/p/guide.md")
+
+        assert changed_files("main") == []
+
+    def test_paths_relative_to_cwd(self, repo, monkeypatch):
+        monkeypatch.chdir(repo / "plugins")
+        _write(repo / "plugins" / "p" / "agents" / "new.md")
+
+        assert changed_files("main") == [Path("p/agents/new.md")]
+
+
+class TestGitErrors:
+    """gitが失敗した場合のテスト"""
+
+    def test_unknown_ref(self, repo):
+        with pytest.raises(GitDiffError, match="merge-base"):
+            changed_files("no-such-ref")
+
+    def test_not_a_repository(self, tmp_path):
+        with pytest.raises(GitDiffError, match="rev-parse"):
+            changed_files("main", cwd=tmp_path)
+
+    def test_failure_without_stderr(self, monkeypatch):
+        def failing_run(args, **kwargs):
+            raise subprocess.CalledProcessError(128, args, stderr="")
+
+        monkeypatch.setattr(changes.subprocess, "run", failing_run)
+        with pytest.raises(GitDiffError, match="終了コード 128"):
+            changed_files("main")
+
+    def test_git_not_installed(self, monkeypatch):
+        def missing_git(args, **kwargs):
+            raise FileNotFoundError("git")
+
+        monkeypatch.setattr(changes.subprocess, "run", missing_git)
+        with pytest.raises(GitDiffError, match="見つかりません"):
+            changed_files("main")
@@ -0,0 +1,159 @@
+"""
+import時間のテスト: hookモードが不要なバリデーターを読み込まないことを確認する
+
+`python -X importtime` の出力（stderr）から読み込まれたモジュールと累積時間を取得する
+（計測処理は benchmarks/coldstart.py と共通）。
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+_scripts_dir = Path(__file__).parent.parent
+if str(_scripts_dir) not in sys.path:
+    sys.path.insert(0, str(_scripts_dir))
+
+from benchmarks import coldstart  # noqa: E402
+from benchmarks.corpora import GENERATORS  # noqa: E402
+
+# validatorsパッケージ（読み込まれたサブモジュールを含む）の累積import時間の上限（マイクロ秒）
+# 実測は数ms程度。CI環境の揺らぎを見込んで余裕を持たせている
+VALIDATORS_IMPORT_BUDGET_US = 100_000
+
+
+def _run_hook_with_importtime(file_path: str) -> dict[str, int]:
+    """hookモードを -X importtime 付きで実行し、{モジュール名: 累積時間(us)} を返す"""
+    return coldstart.run_hook(file_path).modules()
+
+
+def _validator_modules(modules: dict[str, int]) -> set[str]:
+    return {name for name in modules if name.startswith("validators.")}
+
+
+class TestHookImportTime:
+    """hookモードのimport時間"""
+
+    def test_non_plugin_path_loads_no_validator_module(self):
+        """対象外ファイルではバリデーターモジュールを一切読み込まない（パス判定のみ）"""
+        modules = _run_hook_with_importtime("src/foo.py")
+        assert "validators" in modules
+        assert _validator_modules(modules) == {"validators.registry"}
+
+    def test_skill_loads_only_skill_validator(self, tmp_path):
+        """SKILL.mdではスキルのバリデーターと共通モジュールだけを読み込む"""
+        skill_path = tmp_path / "skills" / "demo" / "SKILL.md"
+        skill_path.parent.mkdir(parents=True)
+        skill_path.write_text("---\nname: demo\ndescription: デモ\n---\n本文\n", encoding="utf-8")
+
+        modules = _run_hook_with_importtime(str(skill_path))
+        assert _validator_modules(modules) == {
+            "validators.registry",
+            "validators.base",
+            "validators.skill",
+        }
+
+    def test_validators_import_within_budget(self, tmp_path):
+        """validatorsパッケージの累積import時間が予算内に収まる"""
+        skill_path = tmp_path / "skills" / "demo" / "SKILL.md"
+        skill_path.parent.mkdir(parents=True)
+        skill_path.write_text("---\nname: demo\ndescription: デモ\n---\n本文\n", encoding="utf-8")
+
+        modules = _run_hook_with_importtime(str(skill_path))
+        total = modules["validators"] + sum(
+            cumulative
+            for name, cumulative in modules.items()
+            if name.startswith("validators.") and name.count(".") == 1
+        )
+        assert total < VALIDATORS_IMPORT_BUDGET_US, (
+            f"validatorsのimportが予算超過: {total}us（上限 {VALIDATORS_IMPORT_BUDGET_US}us）"
+        )
+
+
+@pytest.fixture(scope="module")
+def coldstart_cases(tmp_path_factory):
+    """コールドスタートを計測するケース（対象外のパスと各バリデーターのファイル）"""
+    return coldstart.case_files(tmp_path_factory.mktemp("coldstart"))
+
+
+@pytest.fixture(scope="module")
+def startup_modules():
+    return coldstart.startup_modules()
+
+
+class TestHookColdStartBudget:
+    """hookモードのコールドスタート（起動からimport・検証・終了まで）の予算
+
+    予算は環境変数 HOOK_COLDSTART_BUDGET_MS で変更できる。
+    超過したときは最も重いimportの経路をメッセージに含める。
+    """
+
+    @pytest.mark.parametrize("case", [coldstart.NON_PLUGIN, *GENERATORS])
+    def test_within_budget(self, coldstart_cases, startup_modules, case):
+        result = coldstart.measure(coldstart_cases[case], exclude=startup_modules)
+        message = coldstart.over_budget_message(case, result, coldstart.budget_ms())
+        assert message is None, message
+
+
+_IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 | site
+import time:        50 |         50 |     _heavy_native
+import time:     20000 |      20050 |   yaml
+import time:       300 |      20350 | validators.base
+import time:       200 |        200 |   json.decoder
+import time:       400 |        600 | json
+"""
+
+
+class TestImportTimeParsing:
+    """-X importtime の解析と予算超過メッセージ"""
+
+    def test_builds_nested_tree(self):
+        imports = coldstart.parse_importtime(_IMPORTTIME_OUTPUT, exclude=frozenset({"site"}))
+        assert [node.name for node in imports] == ["validators.base", "json"]
+        assert [child.name for child in imports[0].children] == ["yaml"]
+        assert [child.name for child in imports[0].children[0].children] == ["_heavy_native"]
+
+    def test_heaviest_path_stops_at_dominant_import(self):
+        imports = coldstart.parse_importtime(_IMPORTTIME_OUTPUT)
+        path = coldstart.heaviest_path(imports)
+        # _heavy_nativeはyamlの時間の半分未満なので、yamlが原因として示される
+        assert [node.name for node in path] == ["validators.base", "yaml"]
+        assert coldstart.describe_path(path) == "validators.base (20.4ms) -> yaml (20.1ms)"
+        assert coldstart.describe_path([]) == "（importなし）"
+
+    def test_over_budget_message_names_import(self):
+        result = coldstart.ColdStart(120.0, coldstart.parse_importtime(_IMPORTTIME_OUTPUT))
+        assert coldstart.over_budget_message("skill", result, 200.0) is None
+        message = coldstart.over_budget_message("skill", result, 100.0)
+        assert "skill" in message
+        assert "120.0ms" in message
+        assert "validators.base (20.4ms) -> yaml (20.1ms)" in message
+        assert coldstart.BUDGET_ENV in message
+
+    def test_budget_from_environment(self, monkeypatch):
+        monkeypatch.delenv(coldstart.BUDGET_ENV, raising=False)
+        assert coldstart.budget_ms() == coldstart.DEFAULT_BUDGET_MS
+        monkeypatch.setenv(coldstart.BUDGET_ENV, "250")
+        assert coldstart.budget_ms() == 250.0
+
+
+class TestLazyPackageAttributes:
+    """validatorsパッケージの遅延属性"""
+
+    def test_from_import_still_works(self):
+        from validators import validate_skill
+
+        assert callable(validate_skill)
+
+    def test_unknown_attribute_raises(self):
+        import validators
+
+        with pytest.raises(AttributeError, match="validate_unknown"):
+            validators.validate_unknown  # noqa: B018
+
+    def test_dir_lists_lazy_attributes(self):
+        import validators
+
+        assert "validate_readme" in dir(validators)
@@ -6,10 +6,13 @@ import json
 import subprocess
 import sys
 import tempfile
+import threading
 from pathlib import Path
 from textwrap import dedent
 from unittest.mock import patch
 
+import pytest
+
 # validate_plugin.py を単体でインポートできるようにscriptsディレクトリをパスに追加
 _scripts_dir = Path(__file__).parent.parent
 if str(_scripts_dir) not in sys.path:
@@ -319,6 +322,491 @@ class TestCLIMode:
             assert "エラー" in result.stderr
 
 
+class TestRootMode:
+    """--rootによるツリー検証のテスト"""
+
+    def _run_cli(self, *args: str) -> subprocess.CompletedProcess:
+        scripts_dir = Path(__file__).parent.parent
+        return subprocess.run(
+            [sys.executable, str(scripts_dir / "validate_plugin.py"), *args],
+            capture_output=True,
+            text=True,
+            cwd=scripts_dir,
+        )
+
+    def test_root_validates_tree(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plugin_dir = Path(tmpdir) / "plugins" / "demo"
+            invalid = plugin_dir / "skills" / "bad" / "SKILL.md"
+            invalid.parent.mkdir(parents=True)
+            invalid.write_text("---\nname: Invalid_Name\n---\n本文\n", encoding="utf-8")
+            ignored = Path(tmpdir) / ".git" / "skills" / "x" / "SKILL.md"
+            ignored.parent.mkdir(parents=True)
+            ignored.write_text("---\nname: Also_Invalid\n---\n", encoding="utf-8")
+
+            result = self._run_cli("--root", tmpdir)
+            assert result.returncode == 1
+            assert str(invalid) in result.stderr
+            assert str(ignored) not in result.stderr
+
+    def test_root_combined_with_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tree = Path(tmpdir) / "tree"
+            tree.mkdir()
+            extra = Path(tmpdir) / "commands" / "x.md"
+            extra.parent.mkdir(parents=True)
+            extra.write_text("---\nallowed-tools: Read\n---\n本文\n", encoding="utf-8")
+
+            result = self._run_cli("--strict", "--root", str(tree), str(extra))
+            assert result.returncode == 1
+            assert str(extra) in result.stderr
+
+    def test_root_must_be_directory(self):
+        result = self._run_cli("--root", "does-not-exist")
+        assert result.returncode == 2
+        assert "ディレクトリ" in result.stderr
+
+
+class TestChangedSinceMode:
+    """--changed-sinceによる差分検証のテスト"""
+
+    def _git(self, cwd: str, *args: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+            cwd=cwd,
+            check=True,
+            capture_output=True,
+        )
+
+    def _run_cli(self, cwd: str, *args: str) -> subprocess.CompletedProcess:
+        scripts_dir = Path(__file__).parent.parent
+        return subprocess.run(
+            [sys.executable, str(scripts_dir / "validate_plugin.py"), "--no-cache", *args],
+            capture_output=True,
+            text=True,
+            cwd=cwd,
+        )
+
+    def test_deleted_link_target_fails_readme(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plugin_dir = Path(tmpdir) / "plugins" / "demo"
+            plugin_dir.mkdir(parents=True)
+            (plugin_dir / "README.md").write_text(
+                "## 概要\n\n[ガイド](./guide.md)\n\n## インストール\n\n## 使い方\n",
+                encoding="utf-8",
+            )
+            (plugin_dir / "guide.md").write_text("# ガイド\n", encoding="utf-8")
+            self._git(tmpdir, "init", "-q", "-b", "main")
+            self._git(tmpdir, "add", "-A")
+            self._git(tmpdir, "commit", "-q", "-m", "base")
+
+            assert self._run_cli(tmpdir, "--changed-since", "main").returncode == 0
+
+            self._git(tmpdir, "rm", "-q", "plugins/demo/guide.md")
+            result = self._run_cli(tmpdir, "--changed-since", "main")
+            assert result.returncode == 1
+            assert "plugins/demo/README.md" in result.stderr
+            assert "リンク切れ" in result.stderr
+
+    def test_deleted_linked_directory_fails_readme(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plugin_dir = Path(tmpdir) / "plugins" / "demo"
+            (plugin_dir / "docs").mkdir(parents=True)
+            (plugin_dir / "README.md").write_text(
+                "## 概要\n\n[docs](./docs/)\n\n## インストール\n\n## 使い方\n",
+                encoding="utf-8",
+            )
+            (plugin_dir / "docs" / "guide.md").write_text("# ガイド\n", encoding="utf-8")
+            self._git(tmpdir, "init", "-q", "-b", "main")
+            self._git(tmpdir, "add", "-A")
+            self._git(tmpdir, "commit", "-q", "-m", "base")
+
+            self._git(tmpdir, "rm", "-q", "-r", "plugins/demo/docs")
+            result = self._run_cli(tmpdir, "--changed-since", "main")
+            assert result.returncode == 1
+            assert "リンク切れ [docs](./docs/)" in result.stderr
+
+    def test_root_limits_changed_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._git(tmpdir, "init", "-q", "-b", "main")
+            self._git(tmpdir, "commit", "-q", "--allow-empty", "-m", "base")
+            for directory in ("plugins", "other"):
+                readme = Path(tmpdir) / directory / "README.md"
+                readme.parent.mkdir()
+                readme.write_text("# 見出しのみ\n", encoding="utf-8")
+
+            result = self._run_cli(tmpdir, "--changed-since", "main", "--root", "plugins")
+            assert result.returncode == 1
+            assert "plugins/README.md" in result.stderr
+            assert "other/README.md" not in result.stderr
+
+    def test_outside_repository_is_usage_error(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = self._run_cli(tmpdir, "--changed-since", "main")
+            assert result.returncode == 2
+            assert "--changed-since" in result.stderr
+
+
+class TestOutputFormats:
+    """--formatによる出力形式のテスト"""
+
+    def _run_cli(self, *args: str) -> subprocess.CompletedProcess:
+        scripts_dir = Path(__file__).parent.parent
+        return subprocess.run(
+            [sys.executable, str(scripts_dir / "validate_plugin.py"), "--no-cache", *args],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            cwd=scripts_dir,
+        )
+
+    def _write_skills(self, root: Path) -> tuple[Path, Path]:
+        invalid = root / "skills" / "bad" / "SKILL.md"
+        invalid.parent.mkdir(parents=True)
+        invalid.write_text("---\nname: Invalid_Name\n---\n本文\n", encoding="utf-8")
+        valid = root / "skills" / "good" / "SKILL.md"
+        valid.parent.mkdir(parents=True)
+        valid.write_text("---\nname: good\ndescription: 説明\n---\n本文\n", encoding="utf-8")
+        return invalid, valid
+
+    def test_jsonl(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            invalid, valid = self._write_skills(Path(tmpdir))
+            result = self._run_cli("--format", "jsonl", str(invalid), str(valid))
+
+        assert result.returncode == 1
+        assert result.stderr == ""
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [record["path"] for record in records] == [str(invalid), str(valid)]
+        assert records[0]["validator"] == "skill"
+        assert records[0]["errors"]
+        assert records[1]["errors"] == []
+
+    def test_sarif(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            invalid, valid = self._write_skills(Path(tmpdir))
+            result = self._run_cli("--format", "sarif", "--root", tmpdir)
+
+        assert result.returncode == 1
+        document = json.loads(result.stdout)
+        results = document["runs"][0]["results"]
+        assert results
+        assert {r["ruleId"] for r in results} == {"name-value", "description-value"}
+        name_result = next(r for r in results if r["ruleId"] == "name-value")
+        assert name_result["locations"][0]["physicalLocation"]["region"] == {"startLine": 2}
+        assert {
+            r["locations"][0]["physicalLocation"]["artifactLocation"]["uri"] for r in results
+        } == {invalid.as_uri()}
+
+    def test_unknown_format_rejected(self):
+        result = self._run_cli("--format", "xml", "README.md")
+        assert result.returncode == 2
+
+
+class TestProfileMode:
+    """--profileのテスト"""
+
+    def test_profile_report_and_outputs(self):
+        scripts_dir = Path(__file__).parent.parent
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            skill = root / "skills" / "good" / "SKILL.md"
+            skill.parent.mkdir(parents=True)
+            skill.write_text("---\nname: good\ndescription: 説明\n---\n本文\n", encoding="utf-8")
+            summary_path = root / "summary.json"
+            pstats_path = root / "out.pstats"
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    str(scripts_dir / "validate_plugin.py"),
+                    "--profile-json",
+                    str(summary_path),
+                    "--profile-pstats",
+                    str(pstats_path),
+                    "--format",
+                    "jsonl",
+                    "--root",
+                    tmpdir,
+                ],
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                cwd=scripts_dir,
+            )
+            summary = json.loads(summary_path.read_text(encoding="utf-8"))
+            assert pstats_path.stat().st_size > 0
+
+        assert result.returncode == 0
+        # 計測結果はstderrに出し、機械可読な出力を汚さない
+        assert [json.loads(line)["path"] for line in result.stdout.splitlines()] == [str(skill)]
+        assert "プロファイル: 1ファイル" in result.stderr
+        assert summary["validators"]["skill"]["calls"] == 1
+        assert summary["slowest_files"][0]["path"] == str(skill)
+        assert summary["phases_ms"]["read"] > 0
+        assert summary["phases_ms"]["output"] > 0
+
+    def test_profile_in_process(self):
+        from validators.profiling import Profiler
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            skill = Path(tmpdir) / "skills" / "bad" / "SKILL.md"
+            skill.parent.mkdir(parents=True)
+            skill.write_text("---\nname: bad\n---\n本文\n", encoding="utf-8")
+            profiler = Profiler()
+            validate_plugin.configure_profiler(profiler)
+            try:
+                result = validate_plugin.validate_file(skill)
+                missing = validate_plugin.validate_file(Path(tmpdir) / "agents" / "none.md")
+            finally:
+                validate_plugin.configure_profiler(None)
+
+        assert result.has_errors()
+        assert missing.has_errors()
+        assert profiler.files == 2
+        assert profiler.validator_stats["skill"][0] == 1
+
+
+class TestStatsMode:
+    """--statsのテスト"""
+
+    def _run_cli(self, *args: str) -> subprocess.CompletedProcess:
+        scripts_dir = Path(__file__).parent.parent
+        return subprocess.run(
+            [sys.executable, str(scripts_dir / "validate_plugin.py"), *args],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            cwd=scripts_dir,
+        )
+
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_stats_aggregates_metrics(self, tmp_path, jobs):
+        # 並列実行時もワーカーの集計結果が親プロセスに返ることを確認する（64件以上でプールを使う）
+        for i in range(validate_plugin.MIN_FILES_FOR_POOL):
+            skill = tmp_path / "skills" / f"s{i}" / "SKILL.md"
+            skill.parent.mkdir(parents=True)
+            skill.write_text(f"---\nname: s{i}\ndescription: 説明\n---\n本文\n", encoding="utf-8")
+        summary_path = tmp_path / "stats.json"
+        result = self._run_cli(
+            "--stats-json", str(summary_path), "--jobs", jobs, "--root", str(tmp_path / "skills")
+        )
+
+        assert result.returncode == 0
+        assert "検証統計: 64ファイル" in result.stderr
+        summary = json.loads(summary_path.read_text(encoding="utf-8"))
+        skill_stats = summary["validators"]["skill"]
+        assert skill_stats["files"] == 64
+        assert skill_stats["bytes_read"] > 0
+        assert skill_stats["parse_ns"] > 0
+        assert skill_stats["rules_evaluated"] > 0
+
+    def test_stats_with_profile(self, tmp_path):
+        skill = tmp_path / "skills" / "a" / "SKILL.md"
+        skill.parent.mkdir(parents=True)
+        skill.write_text("---\nname: a\ndescription: 説明\n---\n本文\n", encoding="utf-8")
+        result = self._run_cli("--stats", "--profile", str(skill))
+
+        assert result.returncode == 0
+        assert "検証統計: 1ファイル" in result.stderr
+        assert "プロファイル: 1ファイル" in result.stderr
+
+
+class TestTraceRulesMode:
+    """--trace-rulesのテスト"""
+
+    def test_writes_folded_stacks(self, tmp_path):
+        scripts_dir = Path(__file__).parent.parent
+        skill = tmp_path / "skills" / "a" / "SKILL.md"
+        skill.parent.mkdir(parents=True)
+        skill.write_text(
+            "---\nname: a\ndescription: 説明\nallowed-tools: Bash(*)\n---\n本文\n",
+            encoding="utf-8",
+        )
+        folded = tmp_path / "rules.folded"
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(scripts_dir / "validate_plugin.py"),
+                "--trace-rules",
+                str(folded),
+                str(skill),
+            ],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            cwd=scripts_dir,
+        )
+
+        assert result.returncode == 0
+        assert "ルール別の所要時間" in result.stderr
+        rules = {line.rsplit(" ", 1)[0] for line in folded.read_text(encoding="utf-8").splitlines()}
+        assert "skill;broad-bash-wildcard" in rules
+        assert "skill;tool-name-glob" in rules
+
+
+class TestMemprofileMode:
+    """--memprofileのテスト"""
+
+    def test_reports_peak_per_file(self, tmp_path):
+        scripts_dir = Path(__file__).parent.parent
+        skill = tmp_path / "skills" / "a" / "SKILL.md"
+        skill.parent.mkdir(parents=True)
+        body = "本文\n" * 5000
+        skill.write_text(f"---\nname: a\ndescription: 説明\n---\n{body}", encoding="utf-8")
+        summary_path = tmp_path / "memprofile.json"
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(scripts_dir / "validate_plugin.py"),
+                "--memprofile-json",
+                str(summary_path),
+                str(skill),
+            ],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            cwd=scripts_dir,
+        )
+
+        assert "メモリプロファイル: 1ファイル" in result.stderr
+        summary = json.loads(summary_path.read_text(encoding="utf-8"))
+        assert summary["largest_files"][0]["path"] == str(skill)
+        assert summary["largest_files"][0]["peak_bytes"] > skill.stat().st_size
+        assert summary["validators"]["skill"]["files"] == 1
+
+    def test_imports_not_charged_to_first_file(self, tmp_path):
+        """バリデーターのimportで確保したメモリは最初のファイルに計上しない"""
+        scripts_dir = Path(__file__).parent.parent
+        skill = tmp_path / "skills" / "a" / "SKILL.md"
+        skill.parent.mkdir(parents=True)
+        skill.write_text("---\nname: a\ndescription: 説明\n---\n本文\n", encoding="utf-8")
+        summary_path = tmp_path / "memprofile.json"
+        subprocess.run(
+            [
+                sys.executable,
+                str(scripts_dir / "validate_plugin.py"),
+                "--memprofile-json",
+                str(summary_path),
+                str(skill),
+            ],
+            capture_output=True,
+            cwd=scripts_dir,
+        )
+
+        summary = json.loads(summary_path.read_text(encoding="utf-8"))
+        sites = [site["site"] for site in summary["largest_files"][0]["top_sites"]]
+        assert sites
+        assert not any("importlib" in site for site in sites)
+
+
+class TestTraceMode:
+    """--traceのテスト"""
+
+    def _run_cli(self, *args: str) -> subprocess.CompletedProcess:
+        scripts_dir = Path(__file__).parent.parent
+        return subprocess.run(
+            [sys.executable, str(scripts_dir / "validate_plugin.py"), *args],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            cwd=scripts_dir,
+        )
+
+    def _write_skills(self, root: Path, count: int) -> None:
+        for i in range(count):
+            skill = root / "skills" / f"s{i}" / "SKILL.md"
+            skill.parent.mkdir(parents=True)
+            skill.write_text(f"---\nname: s{i}\ndescription: 説明\n---\n本文\n", encoding="utf-8")
+
+    def _events(self, path: Path) -> list[dict]:
+        return json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+
+    def test_sequential_spans(self, tmp_path):
+        self._write_skills(tmp_path, 2)
+        trace = tmp_path / "trace.json"
+        result = self._run_cli("--trace", str(trace), "--root", str(tmp_path / "skills"))
+
+        assert result.returncode == 0
+        events = [event for event in self._events(trace) if event["ph"] == "X"]
+        files = [event for event in events if event["cat"] == "file"]
+        assert [event["args"]["validator"] for event in files] == ["skill", "skill"]
+        names = {(event["cat"], event["name"]) for event in events}
+        assert {("phase", "read"), ("phase", "validate"), ("phase", "output")} <= names
+        assert ("rule", "broad-bash-wildcard") in names
+        assert ("parse", "parse") in names
+        # 逐次実行ではトラックは1つ
+        assert len({event["tid"] for event in events}) == 1
+
+    def test_parallel_track_per_worker(self, tmp_path):
+        self._write_skills(tmp_path, validate_plugin.MIN_FILES_FOR_POOL)
+        trace = tmp_path / "trace.json"
+        result = self._run_cli(
+            "--trace", str(trace), "--jobs", "2", "--root", str(tmp_path / "skills")
+        )
+
+        assert result.returncode == 0
+        events = self._events(trace)
+        tracks = {event["args"]["name"] for event in events if event["name"] == "thread_name"}
+        assert "main" in tracks
+        assert any(name.startswith("worker ") for name in tracks)
+        spans = [event for event in events if event["ph"] == "X"]
+        assert sum(event["cat"] == "file" for event in spans) == validate_plugin.MIN_FILES_FOR_POOL
+        assert any(event["cat"] == "chunk" for event in spans)
+        assert any(event["cat"] == "wait" for event in spans)
+
+    def test_rejects_profile(self, tmp_path):
+        result = self._run_cli("--trace", str(tmp_path / "t.json"), "--profile", "a.md")
+        assert result.returncode == 2
+        assert "--traceは--profile・--trace-rulesと同時に指定できません" in result.stderr
+
+
+class TestResultCacheCLI:
+    """CLIモードの検証結果キャッシュのテスト"""
+
+    def _run_cli(self, cwd: str, *args: str) -> subprocess.CompletedProcess:
+        scripts_dir = Path(__file__).parent.parent
+        return subprocess.run(
+            [sys.executable, str(scripts_dir / "validate_plugin.py"), *args],
+            capture_output=True,
+            text=True,
+            cwd=cwd,
+        )
+
+    def test_cached_run_gives_same_output(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            skill_path = Path(tmpdir) / "skills" / "bad" / "SKILL.md"
+            skill_path.parent.mkdir(parents=True)
+            skill_path.write_text("---\nname: Invalid_Name\n---\n本文\n", encoding="utf-8")
+
+            first = self._run_cli(tmpdir, str(skill_path))
+            assert (Path(tmpdir) / ".cache" / "validate-plugin").is_dir()
+            second = self._run_cli(tmpdir, str(skill_path))
+
+            assert first.returncode == second.returncode == 1
+            assert first.stderr == second.stderr
+
+    def test_changed_file_is_revalidated(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            skill_path = Path(tmpdir) / "skills" / "s" / "SKILL.md"
+            skill_path.parent.mkdir(parents=True)
+            skill_path.write_text("---\nname: Invalid_Name\n---\n本文\n", encoding="utf-8")
+            assert self._run_cli(tmpdir, str(skill_path)).returncode == 1
+
+            skill_path.write_text(
+                "---\nname: valid-name\ndescription: 説明\n---\n本文\n", encoding="utf-8"
+            )
+            assert self._run_cli(tmpdir, str(skill_path)).returncode == 0
+
+    def test_no_cache_does_not_write(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            skill_path = Path(tmpdir) / "skills" / "s" / "SKILL.md"
+            skill_path.parent.mkdir(parents=True)
+            skill_path.write_text("---\nname: Invalid_Name\n---\n本文\n", encoding="utf-8")
+
+            assert self._run_cli(tmpdir, "--no-cache", str(skill_path)).returncode == 1
+            assert not (Path(tmpdir) / ".cache").exists()
+
+
 class TestValidateFileExceptionIsolation:
     """validate_fileがバリデーター内部の例外を隔離することを確認する単体テスト"""
 
@@ -328,8 +816,9 @@ class TestValidateFileExceptionIsolation:
             hooks_path = Path(tmpdir) / "hooks.json"
             hooks_path.write_text(json.dumps({"hooks": {}}), encoding="utf-8")
 
+            # バリデーターはvalidatorsパッケージから遅延取得されるため、パッケージ側を差し替える
             with patch.object(
-                validate_plugin,
+                validate_plugin.validators,
                 "validate_hooks_json",
                 side_effect=AttributeError("'str' object has no attribute 'get'"),
             ):
@@ -337,3 +826,410 @@ class TestValidateFileExceptionIsolation:
 
             assert result.has_errors()
             assert any("予期しないエラー" in e for e in result.errors)
+
+
+class TestHookInMemoryContent:
+    """hookモードがhook入力の内容を検証することを確認する単体テスト"""
+
+    VALID_SKILL = "---\nname: valid-name\ndescription: 説明\n---\n本文\n"
+
+    def setup_method(self):
+        validate_plugin._hook_contents.clear()
+
+    def _hook(self, tool_name: str, **tool_input) -> dict | None:
+        return validate_plugin.handle_hook_input({"tool_name": tool_name, "tool_input": tool_input})
+
+    def test_write_uses_payload_content(self, tmp_path):
+        """Writeはディスクを読まずにtool_input.contentを検証する"""
+        skill_path = tmp_path / "skills" / "s" / "SKILL.md"
+        output = self._hook(
+            "Write", file_path=str(skill_path), content="---\nname: Bad_Name\n---\n"
+        )
+        assert "descriptionが必須" in output["systemMessage"]
+
+    def _write_and_hook(self, path: Path, content: str) -> dict | None:
+        """Writeツールと同じく、ファイルを書き込んでからhookを呼ぶ"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+        return self._hook("Write", file_path=str(path), content=content)
+
+    def _edit_and_hook(self, path: Path, **tool_input) -> dict | None:
+        """Editツールと同じく、ファイルを書き換えてからhookを呼ぶ"""
+        content = path.read_text(encoding="utf-8")
+        if tool_input.get("replace_all"):
+            content = content.replace(tool_input["old_string"], tool_input["new_string"])
+        else:
+            content = content.replace(tool_input["old_string"], tool_input["new_string"], 1)
+        path.write_text(content, encoding="utf-8")
+        return self._hook("Edit", file_path=str(path), **tool_input)
+
+    @pytest.fixture
+    def disk_reads(self, monkeypatch):
+        """_read_file の呼び出し（ディスクからの読み込み）を記録する"""
+        calls = []
+        read_file = validate_plugin._read_file
+
+        def recording_read_file(file_path, result):
+            calls.append(file_path)
+            return read_file(file_path, result)
+
+        monkeypatch.setattr(validate_plugin, "_read_file", recording_read_file)
+        return calls
+
+    def test_edit_applies_change_to_previous_content(self, tmp_path, disk_reads):
+        skill_path = tmp_path / "skills" / "s" / "SKILL.md"
+        assert self._write_and_hook(skill_path, self.VALID_SKILL) is None
+
+        output = self._edit_and_hook(skill_path, old_string="valid-name", new_string="Bad_Name")
+        assert "小文字" in output["systemMessage"]
+        assert disk_reads == []
+
+    def test_edit_replace_all(self, tmp_path, disk_reads):
+        skill_path = tmp_path / "skills" / "s" / "SKILL.md"
+        content = "---\nname: x-name\ndescription: x-name\n---\n"
+        self._write_and_hook(skill_path, content)
+
+        self._edit_and_hook(skill_path, old_string="x-name", new_string="y-name", replace_all=True)
+        assert validate_plugin._hook_contents[str(skill_path)][0] == content.replace("x-", "y-")
+        assert disk_reads == []
+
+    def test_edit_without_file_on_disk_is_not_applied(self, tmp_path):
+        """ディスクにファイルがなければ記録した内容に差分を適用しない"""
+        skill_path = tmp_path / "skills" / "s" / "SKILL.md"
+        assert self._hook("Write", file_path=str(skill_path), content=self.VALID_SKILL) is None
+
+        output = self._hook(
+            "Edit", file_path=str(skill_path), old_string="valid-name", new_string="Bad_Name"
+        )
+        assert "見つかりません" in output["systemMessage"]
+
+    def test_file_changed_outside_hook_reads_disk(self, tmp_path, disk_reads):
+        """hookの外でファイルが変わっていれば、記録した内容ではなくディスクを検証する"""
+        skill_path = tmp_path / "skills" / "s" / "SKILL.md"
+        self._write_and_hook(skill_path, self.VALID_SKILL)
+        # git checkoutなどで書き換えられた後のEdit（old_stringは記録した内容にも一意にある）
+        skill_path.write_text(
+            "---\nname: valid-name\ndescription: 説明\n---\n本文\n本文2\n", encoding="utf-8"
+        )
+
+        output = self._edit_and_hook(skill_path, old_string="valid-name", new_string="Disk_Name")
+        assert "小文字" in output["systemMessage"]
+        assert disk_reads == [skill_path]
+        assert validate_plugin._hook_contents[str(skill_path)][0].endswith("本文2\n")
+
+    def test_failed_edit_reads_disk(self, tmp_path, disk_reads):
+        """Editが失敗してファイルが変わっていなければ、差分を適用せずディスクを検証する"""
+        skill_path = tmp_path / "skills" / "s" / "SKILL.md"
+        self._write_and_hook(skill_path, self.VALID_SKILL)
+
+        output = self._hook(
+            "Edit", file_path=str(skill_path), old_string="valid-name", new_string="Bad_Name"
+        )
+        assert output is None
+        assert disk_reads == [skill_path]
+
+    def test_edit_without_previous_content_reads_disk(self, tmp_path):
+        skill_path = tmp_path / "skills" / "s" / "SKILL.md"
+        skill_path.parent.mkdir(parents=True)
+        skill_path.write_text("---\nname: Disk_Name\ndescription: d\n---\n", encoding="utf-8")
+
+        output = self._hook("Edit", file_path=str(skill_path), old_string="a", new_string="b")
+        assert "小文字" in output["systemMessage"]
+
+    def test_stale_previous_content_falls_back_to_disk(self, tmp_path):
+        """old_stringが記録した内容に一意に見つからなければディスクを読む"""
+        skill_path = tmp_path / "skills" / "s" / "SKILL.md"
+        skill_path.parent.mkdir(parents=True)
+        skill_path.write_text("---\nname: Disk_Name\ndescription: d\n---\n", encoding="utf-8")
+        self._hook("Write", file_path=str(skill_path), content=self.VALID_SKILL + "本文\n")
+
+        for old_string, replace_all in [("missing", False), ("本文", False), ("missing", True)]:
+            output = self._hook(
+                "Edit",
+                file_path=str(skill_path),
+                old_string=old_string,
+                new_string="x",
+                replace_all=replace_all,
+            )
+            assert "小文字" in output["systemMessage"]
+            self._hook("Write", file_path=str(skill_path), content=self.VALID_SKILL + "本文\n")
+
+    def test_malformed_tool_input_falls_back_to_disk(self, tmp_path):
+        skill_path = tmp_path / "skills" / "s" / "SKILL.md"
+        self._hook("Write", file_path=str(skill_path), content=self.VALID_SKILL)
+
+        output = self._hook("Edit", file_path=str(skill_path), old_string="", new_string="x")
+        assert "見つかりません" in output["systemMessage"]
+        output = self._hook("Write", file_path=str(skill_path), content=None)
+        assert "見つかりません" in output["systemMessage"]
+
+    def test_remembered_contents_are_bounded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(validate_plugin, "HOOK_CONTENT_CACHE_SIZE", 2)
+        paths = [str(tmp_path / f"s{i}" / "SKILL.md") for i in range(3)]
+        for path in paths:
+            self._hook("Write", file_path=path, content=self.VALID_SKILL)
+        # 最近使ったものは残る
+        self._hook("Write", file_path=paths[1], content=self.VALID_SKILL)
+
+        assert list(validate_plugin._hook_contents) == [paths[2], paths[1]]
+
+    def test_concurrent_remember_keeps_bound(self, monkeypatch):
+        """常駐サーバーの複数スレッドから同時に記録しても上限を超えない"""
+        monkeypatch.setattr(validate_plugin, "HOOK_CONTENT_CACHE_SIZE", 4)
+
+        def remember(thread: int) -> None:
+            for i in range(500):
+                validate_plugin._remember_hook_content(f"{thread}-{i % 10}", "x", None)
+
+        threads = [threading.Thread(target=remember, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(validate_plugin._hook_contents) == 4
+
+
+class TestStreamMode:
+    """--streamによるNDJSONストリームモードのテスト"""
+
+    def _run_stream(self, stdin: str, *args: str) -> subprocess.CompletedProcess:
+        scripts_dir = Path(__file__).parent.parent
+        return subprocess.run(
+            [sys.executable, str(scripts_dir / "validate_plugin.py"), "--stream", *args],
+            input=stdin.encode("utf-8"),
+            capture_output=True,
+        )
+
+    def test_one_response_line_per_payload(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            skill_path = Path(tmpdir) / "skills" / "s" / "SKILL.md"
+            skill_path.parent.mkdir(parents=True)
+            skill_path.write_text("---\nname: Invalid_Name\n---\n", encoding="utf-8")
+            payloads = [
+                {"tool_name": "Write", "tool_input": {"file_path": str(skill_path)}},
+                {"tool_name": "Read", "tool_input": {"file_path": str(skill_path)}},
+                "not json",
+                {"tool_name": "Write", "tool_input": "not a dict"},
+                {
+                    "tool_name": "Write",
+                    "tool_input": {"file_path": str(skill_path), "content": "---\nname: ok\n---\n"},
+                },
+            ]
+            stdin = "\n\n".join(p if isinstance(p, str) else json.dumps(p) for p in payloads)
+
+            result = self._run_stream(stdin)
+
+        assert result.returncode == 0
+        responses = [json.loads(line) for line in result.stdout.decode("utf-8").splitlines()]
+        assert len(responses) == len(payloads)
+        assert "エラー" in responses[0]["systemMessage"]
+        assert responses[1] == responses[2] == {}
+        assert "予期しないエラー" in responses[3]["systemMessage"]
+        assert "description" in responses[4]["systemMessage"]
+
+    def test_stats_reports_parse_memo(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            skill_path = Path(tmpdir) / "skills" / "s" / "SKILL.md"
+            payload = {
+                "tool_name": "Write",
+                "tool_input": {"file_path": str(skill_path), "content": "---\nname: ok\n---\n"},
+            }
+            stdin = "\n".join([json.dumps(payload)] * 3)
+
+            assert self._run_stream(stdin).stderr == b""
+            result = self._run_stream(stdin, "--stats")
+
+        assert result.returncode == 0
+        assert "ヒット 2（67%） ミス 1" in result.stderr.decode("utf-8")
+
+    def test_stream_rejects_files(self):
+        result = self._run_stream("", "README.md")
+        assert result.returncode == 2
+        assert "--stream" in result.stderr.decode("utf-8")
+
+
+class TestSuppressionConfigCLI:
+    """設定ファイルによるリポジトリ全体のルール抑制のテスト"""
+
+    COMMAND = "---\ndescription: 説明\nallowed-tools: Bash(*)\n---\n本文\n"
+
+    def _run_cli(self, cwd: str, *args: str) -> subprocess.CompletedProcess:
+        scripts_dir = Path(__file__).parent.parent
+        return subprocess.run(
+            [sys.executable, str(scripts_dir / "validate_plugin.py"), *args],
+            capture_output=True,
+            text=True,
+            cwd=cwd,
+        )
+
+    def _write_commands(self, root: Path, count: int) -> list[str]:
+        paths = []
+        for i in range(count):
+            cmd_path = root / "commands" / f"cmd-{i}.md"
+            cmd_path.parent.mkdir(parents=True, exist_ok=True)
+            cmd_path.write_text(self.COMMAND, encoding="utf-8")
+            paths.append(str(cmd_path))
+        return paths
+
+    def test_config_suppresses_rule(self):
+        """設定ファイルで抑制したルールの警告は出ない（キャッシュ済みの結果も使わない）"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (cmd_path,) = self._write_commands(Path(tmpdir), 1)
+            assert self._run_cli(tmpdir, "--strict", cmd_path).returncode == 1
+
+            config = Path(tmpdir) / ".validate-plugin.json"
+            config.write_text('{"disable": ["broad-bash-wildcard"]}', encoding="utf-8")
+            result = self._run_cli(tmpdir, "--strict", cmd_path)
+            assert result.returncode == 0
+            assert "Bash(*)" not in result.stderr
+
+    def test_config_applies_to_parallel_workers(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = self._write_commands(Path(tmpdir), validate_plugin.MIN_FILES_FOR_POOL + 1)
+            config = Path(tmpdir) / "suppress.json"
+            config.write_text('{"disable": ["broad-bash-wildcard"]}', encoding="utf-8")
+            args = ("--no-cache", "--jobs", "2", "--strict", *paths)
+            assert self._run_cli(tmpdir, *args).returncode == 1
+            assert self._run_cli(tmpdir, "--suppression-config", str(config), *args).returncode == 0
+
+    def test_invalid_config_is_rejected(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (cmd_path,) = self._write_commands(Path(tmpdir), 1)
+            (Path(tmpdir) / ".validate-plugin.json").write_text(
+                '{"disable": "x"}', encoding="utf-8"
+            )
+            result = self._run_cli(tmpdir, cmd_path)
+            assert result.returncode == 2
+            assert "disableはルールIDの配列" in result.stderr
+
+    def test_unknown_rule_id_is_rejected(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (cmd_path,) = self._write_commands(Path(tmpdir), 1)
+            (Path(tmpdir) / ".validate-plugin.json").write_text(
+                '{"disable": ["broad-bash-wildcard", "no-such-rule"]}', encoding="utf-8"
+            )
+            result = self._run_cli(tmpdir, cmd_path)
+            assert result.returncode == 2
+            assert "未知のルールIDです: no-such-rule" in result.stderr
+
+    def test_config_is_read_from_repository_root(self):
+        """サブディレクトリから起動してもgitリポジトリのルートの設定ファイルを使う"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / ".git").mkdir()
+            (root / ".validate-plugin.json").write_text(
+                '{"disable": ["broad-bash-wildcard"]}', encoding="utf-8"
+            )
+            (cmd_path,) = self._write_commands(root / "plugins" / "p", 1)
+
+            result = self._run_cli(str(root / "plugins"), "--strict", cmd_path)
+            assert result.returncode == 0
+            result = self._run_cli(tmpdir, "--strict", "--root", "plugins")
+            assert result.returncode == 0
+
+    def test_config_is_found_from_root_option(self):
+        """--root指定時はそのディレクトリを含むリポジトリの設定ファイルを使う"""
+        with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as cwd:
+            repo = Path(tmpdir)
+            (repo / ".git").mkdir()
+            (repo / ".validate-plugin.json").write_text(
+                '{"disable": ["broad-bash-wildcard"]}', encoding="utf-8"
+            )
+            self._write_commands(repo / "plugins", 1)
+
+            result = self._run_cli(cwd, "--strict", "--root", str(repo / "plugins"))
+            assert result.returncode == 0
+
+    def test_missing_explicit_config_is_rejected(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = self._run_cli(tmpdir, "--suppression-config", "missing.json", "x.md")
+            assert result.returncode == 2
+            assert "missing.json" in result.stderr
+
+
+class TestParallelCLIMode:
+    """--jobs指定時のCLIモードのテスト"""
+
+    def _run_cli(self, *args: str) -> subprocess.CompletedProcess:
+        scripts_dir = Path(__file__).parent.parent
+        return subprocess.run(
+            [sys.executable, str(scripts_dir / "validate_plugin.py"), *args],
+            capture_output=True,
+            text=True,
+            cwd=scripts_dir,
+        )
+
+    def _write_skills(self, root: Path, count: int) -> list[str]:
+        """エラーのあるスキルと正常なスキルを交互に作成する"""
+        paths = []
+        for i in range(count):
+            skill_path = root / "skills" / f"skill-{i:03d}" / "SKILL.md"
+            skill_path.parent.mkdir(parents=True)
+            name = f"Invalid_{i}" if i % 2 else f"valid-{i}"
+            skill_path.write_text(
+                f"---\nname: {name}\ndescription: テスト用のスキル\n---\n本文\n", encoding="utf-8"
+            )
+            paths.append(str(skill_path))
+        return paths
+
+    def test_parallel_output_matches_sequential_order(self):
+        """並列実行しても出力は引数の順序のまま"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            count = validate_plugin.MIN_FILES_FOR_POOL + 10
+            written = self._write_skills(Path(tmpdir), count)
+            # 引数の順序がパスのソート順と異なっていても引数の順序で出力される
+            paths = list(reversed(written))
+            invalid_paths = [p for i, p in enumerate(written) if i % 2][::-1]
+
+            sequential = self._run_cli("--jobs", "1", *paths)
+            parallel = self._run_cli("--jobs", "3", *paths)
+
+            assert sequential.returncode == parallel.returncode == 1
+            assert parallel.stderr == sequential.stderr
+            reported = [line[2:] for line in parallel.stderr.splitlines() if line.startswith("❌")]
+            assert reported == invalid_paths
+
+    def test_parallel_strict_exit_code(self):
+        """--strictの終了コードは並列実行でも変わらない"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = []
+            for i in range(validate_plugin.MIN_FILES_FOR_POOL + 1):
+                cmd_path = Path(tmpdir) / "commands" / f"cmd-{i}.md"
+                cmd_path.parent.mkdir(parents=True, exist_ok=True)
+                # descriptionがない（警告のみ）
+                cmd_path.write_text("---\nallowed-tools: Read\n---\n本文\n", encoding="utf-8")
+                paths.append(str(cmd_path))
+
+            assert self._run_cli("--jobs", "2", *paths).returncode == 0
+            assert self._run_cli("--jobs", "2", "--strict", *paths).returncode == 1
+
+    def test_invalid_jobs_rejected(self):
+        result = self._run_cli("--jobs", "0", "README.md")
+        assert result.returncode == 2
+        assert "1以上" in result.stderr
+
+    def test_iter_validation_results_in_process_pool(self):
+        """プロセスプール経由でも入力順に (パス, バリデーターID, 結果) が返る"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = [Path(p) for p in self._write_skills(Path(tmpdir), 70)]
+            results = list(validate_plugin.iter_validation_results(iter(paths), 2, chunk_size=4))
+            assert [path for path, _, _ in results] == paths
+            assert {validator_id for _, validator_id, _ in results} == {"skill"}
+            assert [result.has_errors() for _, _, result in results] == [
+                bool(i % 2) for i in range(70)
+            ]
+
+    def test_iter_validation_results_does_not_reclassify(self, monkeypatch, tmp_path):
+        """バリデーターの判定はファイルごとに1回だけ行う"""
+        paths = [Path(p) for p in self._write_skills(tmp_path, 3)] + [tmp_path / "notes.txt"]
+        calls = []
+        classify = validate_plugin.validators.classify
+        monkeypatch.setattr(
+            validate_plugin.validators,
+            "classify",
+            lambda path: calls.append(path) or classify(path),
+        )
+        results = list(validate_plugin.iter_validation_results(paths))
+        assert [validator_id for _, validator_id, _ in results] == ["skill"] * 3 + [None]
+        assert calls == paths
@@ -267,6 +267,23 @@ class TestValidateMcpJson:
         assert result.has_errors()
         assert any("機密情報" in e for e in result.errors)
 
+    def test_disable_comment_in_string_value_does_not_suppress_secret(self):
+        """文字列の値に書かれた validator-disable では機密情報の検出を止められない"""
+        content = json.dumps(
+            {
+                "_note": "<!-- validator-disable hardcoded-secrets -->",
+                "mcpServers": {
+                    "test-server": {
+                        "type": "stdio",
+                        "command": "node",
+                        "env": {"OPENAI_API_KEY": "sk-abcdefghijklmnopqrstuvwxyz123456"},
+                    }
+                },
+            }
+        )
+        result = validate_mcp_json(Path(".mcp.json"), content)
+        assert any(diagnostic.rule_id == "hardcoded-secrets" for diagnostic in result.diagnostics)
+
     def test_env_placeholder_not_flagged_as_secret(self):
         """${VAR}形式のプレースホルダーは機密情報として検出されない"""
         content = json.dumps(
@@ -0,0 +1,109 @@
+"""
+memprofile.py のテスト
+"""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from scripts.validators.memprofile import SNAPSHOT_MIN_GROWTH, MemoryProfiler
+from scripts.validators.readme import validate_readme
+
+
+@pytest.fixture
+def profiler():
+    profiler = MemoryProfiler(top_n=2)
+    profiler.start()
+    yield profiler
+    profiler.stop()
+
+
+def _large_readme(lines: int) -> str:
+    body = "\n".join(f"- [link {i}](./docs/page.md) テキスト" for i in range(lines))
+    return f"# p\n\n## 概要\n\n{body}\n\n## インストール\n\n## 使い方\n"
+
+
+class TestMemoryProfiler:
+    """MemoryProfilerのテスト"""
+
+    def test_records_peak_and_sites(self, profiler, tmp_path):
+        readme = tmp_path / "README.md"
+        content = _large_readme(5000)
+        readme.write_text(content, encoding="utf-8")
+        with profiler.track(readme, "readme"):
+            validate_readme(readme, readme.read_text(encoding="utf-8"))
+
+        summary = profiler.summary()
+        entry = summary["largest_files"][0]
+        assert entry["path"] == str(readme)
+        assert entry["file_bytes"] == readme.stat().st_size
+        # 内容の読み込みと行への分割で、少なくともファイルの大きさ以上は確保する
+        assert entry["peak_bytes"] > entry["file_bytes"]
+        assert any("readme.py" in site["site"] for site in entry["top_sites"])
+        stats = summary["validators"]["readme"]
+        assert stats["files"] == 1
+        assert stats["max_peak_bytes"] == entry["peak_bytes"]
+        assert stats["top_sites"]
+
+    def test_keeps_largest_files(self, profiler):
+        for i, lines in enumerate([10, 3000, 1000]):
+            content = _large_readme(lines)
+            with profiler.track(Path(f"missing-{i}/README.md"), "readme"):
+                validate_readme(Path(f"missing-{i}/README.md"), content)
+
+        summary = profiler.summary()
+        assert summary["files"] == 3
+        assert [entry["path"] for entry in summary["largest_files"]] == [
+            "missing-1/README.md",
+            "missing-2/README.md",
+        ]
+        # 存在しないファイルの大きさは0として扱う
+        assert summary["largest_files"][0]["file_bytes"] == 0
+
+    def test_small_allocation_has_no_snapshot(self, profiler):
+        with profiler.track(Path("none.md"), "agent"):
+            pass
+        entry = profiler.summary()["largest_files"][0]
+        assert entry["top_sites"] == []
+        assert profiler.summary()["validators"]["agent"]["top_sites"] == []
+
+    def test_report_and_summary_json(self, profiler, tmp_path):
+        readme = tmp_path / "README.md"
+        readme.write_text(_large_readme(2000), encoding="utf-8")
+        with profiler.track(readme, "readme"):
+            validate_readme(readme, readme.read_text(encoding="utf-8"))
+        with profiler.track(tmp_path / "empty.md", "readme"):
+            pass
+
+        stream = io.StringIO()
+        profiler.print_report(stream)
+        output = stream.getvalue()
+        assert "メモリプロファイル: 2ファイル" in output
+        assert "ファイルの" in output
+        assert "readme.py" in output
+
+        path = tmp_path / "memprofile.json"
+        profiler.write_summary(path)
+        assert json.loads(path.read_text(encoding="utf-8"))["validators"]["readme"]["files"] == 2
+
+    def test_snapshot_only_on_growth_in_validators(self, profiler):
+        # sys.setprofileのコールバックはカバレッジ計測の対象外になるため直接呼ぶ
+        validators_frame = type("Frame", (), {"f_code": validate_readme.__code__})()
+        other_frame = sys._getframe()
+
+        profiler._on_profile_event(validators_frame, "call", None)
+        profiler._on_profile_event(other_frame, "return", None)
+        assert profiler._snapshot is None
+
+        data = bytearray(SNAPSHOT_MIN_GROWTH * 4)
+        profiler._on_profile_event(validators_frame, "return", None)
+        assert profiler._snapshot is not None
+        assert profiler._high >= len(data)
+
+        first = profiler._snapshot
+        profiler._on_profile_event(validators_frame, "return", None)
+        # 最大値を更新していなければ取り直さない
+        assert profiler._snapshot is first
@@ -185,6 +185,7 @@ class TestValidateMonitorsJson:
         result = validate_monitors_json(Path("monitors.json"), content)
         assert not result.has_errors()
         assert any("unknownField" in w for w in result.warnings)
+        assert [d.rule_id for d in result.diagnostics] == ["unknown-field"]
 
     def test_on_skill_invoke_without_skill_name(self):
         """on-skill-invoke: の後にスキル名がない場合は警告（エラーではない）"""
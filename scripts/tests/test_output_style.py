@@ -58,6 +58,7 @@ class TestValidateOutputStyle:
         result = validate_output_style(Path("no-desc.md"), content)
         assert not result.has_errors()
         assert any("description" in w for w in result.warnings)
+        assert [d.rule_id for d in result.diagnostics] == ["missing-description"]
 
     def test_name_mismatch_warning(self):
         content = dedent("""
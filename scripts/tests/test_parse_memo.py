@@ -0,0 +1,188 @@
+"""
+parse_memo.py のテスト
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+import pytest
+
+from scripts.validators.base import (
+    ParsedDocument,
+    ValidationResult,
+    parse_document,
+    parse_json_safe,
+)
+from scripts.validators.parse_memo import FrozenDict, FrozenList, ParseMemo, freeze
+from scripts.validators.registry import classify
+
+_scripts_dir = Path(__file__).parent.parent
+if str(_scripts_dir) not in sys.path:
+    sys.path.insert(0, str(_scripts_dir))
+
+from benchmarks.corpora import write_corpus  # noqa: E402
+
+SKILL = "---\nname: a\ndescription: b\n---\n本文\n"
+
+
+@pytest.fixture
+def memo():
+    memo = ParseMemo()
+    memo.install()
+    yield memo
+    memo.uninstall()
+
+
+class TestParseMemo:
+    """解析結果のLRUのテスト"""
+
+    def test_hit_returns_same_document(self, memo):
+        first = parse_document(SKILL)
+        second = parse_document("".join(SKILL))
+        assert second is first
+        assert memo.stats()["hits"] == 1
+        assert memo.stats()["misses"] == 1
+
+    def test_kinds_are_separate(self, memo):
+        content = '{"name": "a"}'
+        parse_document(content)
+        assert parse_json_safe(content, Path("plugin.json"), ValidationResult()) == {"name": "a"}
+        assert memo.stats()["misses"] == 2
+
+    def test_json_error_rendered_per_file(self, memo):
+        first, second = ValidationResult(), ValidationResult()
+        assert parse_json_safe("{", Path("a.json"), first) is None
+        assert parse_json_safe("{", Path("b.json"), second) is None
+        assert first.errors[0].startswith("a.json: JSONパースエラー: ")
+        assert second.errors[0] == first.errors[0].replace("a.json", "b.json", 1)
+        assert memo.stats()["hits"] == 1
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        memo = ParseMemo(max_bytes=30)
+        parse = str.upper
+        memo.get_or_parse("t", "a" * 10, parse)
+        memo.get_or_parse("t", "b" * 10, parse)
+        memo.get_or_parse("t", "a" * 10, parse)
+        memo.get_or_parse("t", "c" * 15, parse)
+        stats = memo.stats()
+        assert stats["evictions"] == 1
+        assert stats["bytes"] == 25
+        # 直前に使った "a" は残り、"b" が追い出される
+        memo.get_or_parse("t", "a" * 10, parse)
+        memo.get_or_parse("t", "b" * 10, parse)
+        assert memo.stats()["hits"] == 2
+        assert memo.stats()["misses"] == 4
+
+    def test_bytes_counted_as_utf8(self):
+        memo = ParseMemo()
+        memo.get_or_parse("t", "本文", str.upper)
+        assert memo.stats()["bytes"] == len("本文".encode())
+
+    def test_content_larger_than_cap_not_stored(self):
+        memo = ParseMemo(max_bytes=4)
+        assert memo.get_or_parse("t", "abcdef", str.upper) == "ABCDEF"
+        assert memo.stats()["entries"] == 0
+        assert memo.stats()["evictions"] == 0
+
+    def test_format_stats(self):
+        memo = ParseMemo(max_bytes=1000)
+        memo.get_or_parse("t", "abc", str.upper)
+        memo.get_or_parse("t", "abc", str.upper)
+        assert memo.format_stats() == (
+            "解析結果のメモ: 1件 3/1,000バイト ヒット 1（50%） ミス 1 追い出し 0"
+        )
+        assert "ヒット 0（0%）" in ParseMemo().format_stats()
+
+    def test_uninstall(self):
+        memo = ParseMemo()
+        memo.install()
+        memo.uninstall()
+        parse_document(SKILL)
+        assert memo.stats()["misses"] == 0
+
+
+class TestReadOnlyResults:
+    """メモした解析結果が読み取り専用であることのテスト"""
+
+    def test_json_result_cannot_be_mutated(self, memo):
+        data = parse_json_safe('{"a": [1, {"b": 2}]}', Path("a.json"), ValidationResult())
+        with pytest.raises(TypeError, match="変更できません"):
+            data["c"] = 1
+        with pytest.raises(TypeError):
+            data["a"].append(3)
+        with pytest.raises(TypeError):
+            data["a"][1].pop("b")
+        # 書き換えようとしても次の検証には影響しない
+        again = parse_json_safe('{"a": [1, {"b": 2}]}', Path("b.json"), ValidationResult())
+        assert again == {"a": [1, {"b": 2}]}
+
+    def test_frontmatter_cannot_be_mutated(self, memo):
+        document = parse_document("---\nname: a\ntools:\n  - Read\n---\n")
+        assert isinstance(document.frontmatter, dict)
+        with pytest.raises(TypeError):
+            document.frontmatter["name"] = "b"
+        with pytest.raises(TypeError):
+            document.frontmatter["tools"] += ["Write"]
+        with pytest.raises(TypeError):
+            document.yaml_warnings.append("x")
+
+    def test_suppressions_cannot_be_mutated(self, memo):
+        document = parse_document("<!-- validator-disable-next-line relative-links -->\n")
+        with pytest.raises(TypeError):
+            document.suppressions.ranges["relative-links"].append((5, 5))
+        with pytest.raises(TypeError):
+            document.suppressions.directives.clear()
+
+    def test_copies_are_plain_and_mutable(self):
+        frozen = freeze({"a": [1, {"b": (2, [3])}]})
+        assert isinstance(frozen, FrozenDict)
+        assert isinstance(frozen["a"], FrozenList)
+        assert isinstance(frozen["a"][1]["b"][1], FrozenList)
+        for duplicate in (copy.deepcopy(frozen), copy.copy(frozen)):
+            assert type(duplicate) is dict
+            duplicate["c"] = 1
+        deep = copy.deepcopy(frozen)
+        assert type(deep["a"]) is list
+        deep["a"].append(2)
+        assert copy.copy(frozen["a"]) == [1, {"b": (2, [3])}]
+
+    def test_unmemoized_result_is_not_frozen(self):
+        memo = ParseMemo(max_bytes=4)
+        value = memo.get_or_parse("t", "abcdef", lambda content: {"k": content})
+        value["k"] = "x"
+
+
+def _snapshot(memo: ParseMemo) -> list:
+    """メモした解析結果の中身を比較できる形で複製する"""
+    values = []
+    for value, _ in memo._entries.values():
+        if isinstance(value, ParsedDocument):
+            value = (
+                value.frontmatter,
+                value.yaml_warnings,
+                value.frontmatter_span,
+                value.body.start,
+                value.suppressions and value.suppressions.ranges,
+            )
+        values.append(copy.deepcopy(value))
+    return values
+
+
+def test_validators_do_not_mutate_memoized_results(tmp_path):
+    """メモした解析結果を共有しても、2回目の検証結果は1回目と同じになる"""
+    corpus = write_corpus(tmp_path, files_per_case=1)
+    for paths in corpus.values():
+        for path in paths:
+            content = path.read_text(encoding="utf-8")
+            validator = classify(path)
+            memo = ParseMemo()
+            memo.install()
+            try:
+                first = validator(path, content)
+                snapshot = _snapshot(memo)
+                second = validator(path, content)
+            finally:
+                memo.uninstall()
+            assert (second.errors, second.warnings) == (first.errors, first.warnings)
+            assert _snapshot(memo) == snapshot, path
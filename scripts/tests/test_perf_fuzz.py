@@ -0,0 +1,56 @@
+"""
+解析処理の計算量ファジング（benchmarks/fuzz_perf.py）のテスト
+
+敵対的な入力と乱数で組み合わせたパターンのどれでも、解析処理の所要時間が
+入力の大きさに対して線形より悪く増えないことを確認する。
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+_scripts_dir = Path(__file__).parent.parent
+if str(_scripts_dir) not in sys.path:
+    sys.path.insert(0, str(_scripts_dir))
+
+from benchmarks import fuzz_perf  # noqa: E402
+
+# CIの時間を抑えるため、CLIの既定値より小さい入力と少ないパターンで確認する
+INPUTS = {**fuzz_perf.ADVERSARIAL, **fuzz_perf.random_motifs(seed=0, count=20)}
+
+
+@pytest.mark.parametrize("target", list(fuzz_perf.TARGETS))
+def test_no_superlinear_growth(target):
+    rows = fuzz_perf.fuzz({target: fuzz_perf.TARGETS[target]}, INPUTS, size=1000, repeat=3)
+    flagged = [row for row in rows if row["superlinear"]]
+    assert not flagged, fuzz_perf.format_table(flagged)
+
+
+class TestGrowth:
+    """次数の推定のテスト"""
+
+    def test_detects_quadratic(self):
+        def quadratic(text):
+            # 修正前のREADMEのリンク検出と同じ形の正規表現
+            re.findall(r"\[([^\]]*)\]\(", text)
+
+        stats = fuzz_perf.growth(quadratic, fuzz_perf._repeat("["), size=1000, repeat=3)
+        assert stats["exponent"] > fuzz_perf.MAX_EXPONENT
+        assert stats["superlinear"]
+
+    def test_linear_not_flagged(self):
+        stats = fuzz_perf.growth(str.upper, fuzz_perf._repeat("ab"), size=1000)
+        assert not stats["superlinear"]
+
+    def test_repeat_keeps_whole_units(self):
+        make = fuzz_perf._repeat("abc|")
+        assert make(10) == "abc|abc|"
+        assert make(1) == "abc|"
+
+    def test_random_motifs_deterministic(self):
+        first = fuzz_perf.random_motifs(seed=3, count=5)
+        second = fuzz_perf.random_motifs(seed=3, count=5)
+        assert list(first) == list(second)
+        assert [make(40) for make in first.values()] == [make(40) for make in second.values()]
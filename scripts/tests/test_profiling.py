@@ -0,0 +1,100 @@
+"""
+profiling.py のテスト
+"""
+
+import io
+import json
+import pstats
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from scripts.validators import base
+from scripts.validators.profiling import PHASES, Profiler
+
+
+class TestProfiler:
+    """Profilerのテスト"""
+
+    def test_validator_call_splits_parse_and_rules(self):
+        profiler = Profiler()
+        profiler.start()
+        with profiler.validator_call("skill"):
+            base.parse_frontmatter("---\nname: a\n---\n本文\n")
+        with profiler.validator_call(None):
+            pass
+        profiler.stop()
+
+        assert profiler.phase_ns["parse"] > 0
+        assert profiler.phase_ns["rules"] >= 0
+        assert profiler.validator_stats["skill"][0] == 1
+        assert profiler.validator_stats["-"][0] == 1
+        # 停止後は解析時間を通知しない
+        assert base._parse_observer is None
+
+    def test_validator_call_records_on_exception(self):
+        profiler = Profiler()
+        with pytest.raises(ValueError), profiler.validator_call("agent"):
+            raise ValueError("x")
+        assert profiler.validator_stats["agent"][0] == 1
+
+    def test_phase(self):
+        profiler = Profiler()
+        profiler.add_phase("read", 5)
+        profiler.add_phase("read", 7)
+        profiler.add_phase("output", 1)
+        assert set(profiler.phase_ns) == set(PHASES)
+        assert profiler.phase_ns["read"] == 12
+
+    def test_slowest_files_keeps_top_n(self):
+        profiler = Profiler(top_n=2)
+        for i, elapsed in enumerate([5_000_000, 1_000_000, 9_000_000, 3_000_000]):
+            profiler.record_file(Path(f"f{i}.md"), "skill", elapsed)
+
+        summary = profiler.summary()
+        assert summary["files"] == 4
+        assert [entry["path"] for entry in summary["slowest_files"]] == ["f2.md", "f0.md"]
+        assert summary["slowest_files"][0]["ms"] == 9.0
+
+    def test_summary_sorts_validators_by_total(self):
+        profiler = Profiler()
+        profiler.validator_stats = {"a": [2, 2_000_000, 1_500_000], "b": [1, 5_000_000, 5_000_000]}
+        summary = profiler.summary()
+        assert list(summary["validators"]) == ["b", "a"]
+        assert summary["validators"]["a"] == {
+            "calls": 2,
+            "total_ms": 2.0,
+            "mean_ms": 1.0,
+            "max_ms": 1.5,
+        }
+
+    def test_print_report(self):
+        profiler = Profiler(top_n=1)
+        profiler.validator_stats = {"readme": [1, 2_000_000, 2_000_000]}
+        profiler.record_file(Path("plugins/p/README.md"), "readme", 2_000_000)
+        stream = io.StringIO()
+        profiler.print_report(stream)
+
+        output = stream.getvalue()
+        assert "1ファイル" in output
+        assert "readme" in output
+        assert "遅いファイル（上位1件）" in output
+        assert "plugins/p/README.md" in output
+
+    def test_pstats_and_summary_json(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pstats_path = Path(tmpdir) / "out.pstats"
+            json_path = Path(tmpdir) / "summary.json"
+            profiler = Profiler(pstats_path=pstats_path)
+            profiler.start()
+            with profiler.validator_call("plugin-json"):
+                base.parse_json_safe('{"name": "a"}', Path("plugin.json"), base.ValidationResult())
+            profiler.stop()
+            profiler.write_summary(json_path)
+
+            stats = pstats.Stats(str(pstats_path))
+            assert stats.total_calls > 0
+            summary = json.loads(json_path.read_text(encoding="utf-8"))
+        assert summary["validators"]["plugin-json"]["calls"] == 1
+        assert summary["phases_ms"]["parse"] > 0
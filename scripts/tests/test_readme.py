@@ -2,10 +2,20 @@
 readme.py のテスト
 """
 
+import random
+import re
 from pathlib import Path
 from textwrap import dedent
 
-from scripts.validators.readme import _strip_code_blocks, validate_readme
+from scripts.validators.base import Metrics, collect_metrics
+from scripts.validators.readme import (
+    _IMAGE_OPEN,
+    _LINK_OPEN,
+    _scan_bracketed,
+    _strip_code_blocks,
+    linked_paths,
+    validate_readme,
+)
 
 
 class TestValidateReadme:
@@ -219,6 +229,41 @@ class TestRelativeLinkCheck:
         assert result.has_errors()
         assert any("リンク切れ" in e for e in result.errors)
 
+    def test_link_after_unclosed_brackets(self, tmp_path):
+        """閉じない [ の後ろにあるリンクも検出する"""
+        readme_path = tmp_path / "README.md"
+        content = dedent("""
+            ## 概要
+
+            [[[ 注意 [ガイド](docs/nonexistent.md) と [ ![図](images/missing.png)
+
+            ## インストール
+
+            ## 使い方
+        """).strip()
+
+        result = validate_readme(readme_path, content)
+        assert any("[ガイド](docs/nonexistent.md)" in e for e in result.errors)
+        assert any("![図](images/missing.png)" in e for e in result.errors)
+
+    def test_brackets_inside_link_text_and_path(self, tmp_path):
+        """テキストに [ 、パスに [ や ] を含むリンクも従来どおりチェックする"""
+        readme_path = tmp_path / "README.md"
+        content = dedent("""
+            ## 概要
+
+            [配列 [0 の説明](docs/array[0].md)
+            ![図 [1](images/fig[1].png)
+
+            ## インストール
+
+            ## 使い方
+        """).strip()
+
+        result = validate_readme(readme_path, content)
+        assert any("リンク切れ [配列 [0 の説明](docs/array[0].md)" in e for e in result.errors)
+        assert any("画像リンク切れ ![図 [1](images/fig[1].png)" in e for e in result.errors)
+
     def test_external_url_ignored(self):
         """外部URLはチェックしない"""
         content = dedent("""
@@ -662,3 +707,110 @@ class TestLinkWithEmptyPath:
         # 空パスはスキップされる
         link_errors = [e for e in result.errors if "リンク切れ" in e]
         assert len(link_errors) == 0
+
+
+class TestSuppressRules:
+    """validator-disableによるREADMEのルールの抑制"""
+
+    SECTIONS = "## 概要\n\n## インストール\n\n## 使い方\n"
+
+    def test_broken_links_report_lines(self, tmp_path):
+        content = self.SECTIONS + "[a](missing-a.md)\n![b](missing-b.png)\n[c](missing-c.md)\n"
+        result = validate_readme(tmp_path / "README.md", content)
+        assert sorted(d.line for d in result.diagnostics) == [6, 7, 8]
+
+    def test_disable_relative_links_skips_stat_calls(self, tmp_path):
+        content = self.SECTIONS + "<!-- validator-disable relative-links -->\n[a](missing.md)\n"
+        with collect_metrics(Metrics()) as metrics:
+            result = validate_readme(tmp_path / "README.md", content)
+        assert not result.has_errors()
+        assert metrics.stat_calls == 0
+
+    def test_disable_next_line(self, tmp_path):
+        content = self.SECTIONS + dedent("""
+            <!-- validator-disable-next-line relative-links -->
+            [サンプル](missing.md)
+            [本物](also-missing.md)
+            <!-- validator-disable-start code-block-language -->
+            ```
+            出力例
+            ```
+            <!-- validator-disable-end code-block-language -->
+            ```
+            x
+            ```
+        """)
+        result = validate_readme(tmp_path / "README.md", content)
+        assert result.errors == [
+            "README.md: リンク切れ [本物](also-missing.md) - ファイルが存在しません"
+        ]
+        assert result.warnings == ["README.md: 15行目のコードブロックに言語指定がありません"]
+
+
+class TestLinkedPaths:
+    """linked_pathsヘルパーのテスト"""
+
+    def test_collects_links_and_images(self, tmp_path):
+        content = dedent("""
+            [ガイド](./docs/guide.md#install)
+            ![図](images/arch.png)
+            [外部](https://example.com)
+            [アンカー](#usage)
+
+            ```markdown
+            [サンプル](./sample.md)
+            ```
+        """)
+        assert linked_paths(tmp_path / "README.md", content) == {
+            (tmp_path / "docs" / "guide.md").resolve(),
+            (tmp_path / "images" / "arch.png").resolve(),
+        }
+
+
+class TestReadmeMetrics:
+    """READMEの検証コストの集計"""
+
+    def test_counts_stat_call_per_link(self, tmp_path):
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "a.md").write_text("# a\n", encoding="utf-8")
+        content = dedent("""
+            # Plugin
+
+            ## 概要
+
+            [a](./docs/a.md) [b](./docs/b.md) ![図](./img.png)
+
+            ## インストール
+
+            ## 使い方
+        """).strip()
+        metrics = Metrics()
+        with collect_metrics(metrics):
+            result = validate_readme(tmp_path / "README.md", content)
+
+        assert len(result.errors) == 2
+        assert metrics.stat_calls == 3
+        # 必須セクション3件 + リンク・画像の抽出
+        assert metrics.regex_scans == 5
+        assert metrics.rules_evaluated == 3
+
+
+class TestScanBracketed:
+    """_scan_bracketedが従来のリンク・画像の正規表現と同じ結果を返すことのテスト"""
+
+    LINK_PATTERN = re.compile(r"(?<!!)\[([^\]]*)\]\(([^)]*)\)")
+    IMAGE_PATTERN = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
+
+    def _regex(self, pattern: re.Pattern[str], content: str) -> list[tuple[str, str, int]]:
+        return [(m.group(1), m.group(2), m.start()) for m in pattern.finditer(content)]
+
+    def test_matches_regex_on_random_inputs(self):
+        rng = random.Random(20)
+        for _ in range(5000):
+            content = "".join(rng.choice("[]()!a\n") for _ in range(rng.randint(0, 16)))
+            assert list(_scan_bracketed(content, _LINK_OPEN, True)) == self._regex(
+                self.LINK_PATTERN, content
+            ), content
+            assert list(_scan_bracketed(content, _IMAGE_OPEN, False)) == self._regex(
+                self.IMAGE_PATTERN, content
+            ), content
@@ -0,0 +1,194 @@
+"""
+registry.py のテスト
+"""
+
+import ast
+import importlib
+from pathlib import Path
+
+import pytest
+
+from scripts.validators import registry
+from scripts.validators.registry import ValidatorSpec, classify, register, registered_validators
+
+_scripts_dir = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def isolated_registry():
+    """テスト中の登録がほかのテストに影響しないよう、登録内容を退避・復元する"""
+    specs = list(registry._specs)
+    modules = dict(registry._modules_by_function)
+    yield
+    registry._specs[:] = specs
+    registry._modules_by_function.clear()
+    registry._modules_by_function.update(modules)
+    registry._compiled = False
+
+
+class TestClassify:
+    """classifyのテスト"""
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("plugins/p/skills/s/SKILL.md", "skill"),
+            ("plugins/p/commands/review.md", "slash-command"),
+            ("plugins/p/commands/sub/deep.md", "slash-command"),
+            ("plugins/p/agents/reviewer.md", "agent"),
+            ("plugins/p/hooks/hooks.json", "hooks-json"),
+            ("hooks.json", "hooks-json"),
+            ("plugins/p/.mcp.json", "mcp-json"),
+            ("plugins/p/.lsp.json", "lsp-json"),
+            ("plugins/p/monitors/monitors.json", "monitors-json"),
+            ("plugins/p/.claude-plugin/plugin.json", "plugin-json"),
+            (".claude-plugin/marketplace.json", "marketplace-json"),
+            ("plugins/p/output-styles/terse.md", "output-style"),
+            ("plugins/p/README.md", "readme"),
+        ],
+    )
+    def test_builtin_validators(self, path, expected):
+        spec = classify(Path(path))
+        assert spec is not None
+        assert spec.id == expected
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "src/foo.py",
+            "README.md",
+            "docs/guide.md",
+            "plugins/p/monitors.json",
+            "plugins/p/plugin.json",
+            "marketplace.json",
+            "plugins/p/commands/script.sh",
+            "plugins/p/commands/.md",
+        ],
+    )
+    def test_non_target_paths(self, path):
+        assert classify(Path(path)) is None
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            # ファイル名条件のSKILL.mdが拡張子条件より優先される
+            ("plugins/p/commands/SKILL.md", "skill"),
+            # commands と agents の両方を含む場合は先に登録されたcommandsが優先
+            ("plugins/p/agents/commands/x.md", "slash-command"),
+            # agents配下のREADME.mdはREADMEではなくエージェントとして扱う
+            ("plugins/p/agents/README.md", "agent"),
+            ("plugins/p/output-styles/README.md", "output-style"),
+        ],
+    )
+    def test_priority_follows_registration_order(self, path, expected):
+        assert classify(Path(path)).id == expected
+
+
+class TestRegister:
+    """registerのテスト"""
+
+    def test_builtin_registration_order(self):
+        ids = [spec.id for spec in registered_validators()]
+        assert ids[0] == "skill"
+        assert ids[-1] == "readme"
+        assert len(ids) == 11
+
+    def test_register_new_validator(self, isolated_registry):
+        spec = register("settings-json", "settings_json", "validate_settings", filename="x.json")
+        assert classify(Path("plugins/p/x.json")) is spec
+        assert registry.module_for_function("validate_settings") == "settings_json"
+
+    def test_later_registration_has_lower_priority(self, isolated_registry):
+        register("any-md", "any_md", "validate_any_md", suffix=".md")
+        assert classify(Path("plugins/p/commands/a.md")).id == "slash-command"
+        assert classify(Path("docs/guide.md")).id == "any-md"
+
+    def test_requires_filename_or_suffix(self, isolated_registry):
+        with pytest.raises(ValueError, match="filenameかsuffix"):
+            register("broken", "broken", "validate_broken", directory="plugins")
+
+    def test_duplicate_id_rejected(self, isolated_registry):
+        with pytest.raises(ValueError, match="既に登録"):
+            register("skill", "skill", "validate_skill", filename="OTHER.md")
+
+
+class TestValidatorSpec:
+    """ValidatorSpecのテスト"""
+
+    def test_repr(self):
+        assert repr(ValidatorSpec("demo", "demo", "validate_demo", suffix=".md")) == (
+            "ValidatorSpec('demo')"
+        )
+
+    def test_matches_checks_every_condition(self):
+        spec = ValidatorSpec("demo", "demo", "validate_demo", suffix=".md", directory="commands")
+        assert spec.matches(Path("commands/a.md"))
+        assert not spec.matches(Path("commands/a.txt"))
+        assert not spec.matches(Path("agents/a.md"))
+
+    def test_matches_filename(self):
+        spec = ValidatorSpec("demo", "demo", "validate_demo", filename="demo.json")
+        assert spec.matches(Path("x/demo.json"))
+        assert not spec.matches(Path("x/other.json"))
+
+    def test_call_runs_validator(self):
+        spec = classify(Path("plugins/p/skills/s/SKILL.md"))
+        result = spec(Path("SKILL.md"), "---\nname: Bad_Name\ndescription: x\n---\n")
+        assert result.has_errors()
+
+    def test_load_returns_validator_function(self):
+        from scripts.validators.skill import validate_skill
+
+        assert classify(Path("skills/s/SKILL.md")).load() is validate_skill
+
+
+def _rule_ids_in_source(path: Path) -> tuple[set[str], list[str]]:
+    """モジュールのソースから、ルールIDと、ルールIDを持たない問題を追加する呼び出しを集める
+
+    ルールIDは @rule("rule-id") と add_error / add_warning の rule= から集める
+    （値はモジュールの定数でもよい）。@rule の関数の中の呼び出しはルールのIDが付くので
+    rule= がなくてもよい。
+    """
+    module = importlib.import_module(f"scripts.validators.{path.stem}")
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+
+    def value_of(node: ast.expr) -> str:
+        return node.value if isinstance(node, ast.Constant) else getattr(module, node.id)
+
+    rule_ids: set[str] = set()
+    covered: set[ast.Call] = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.FunctionDef):
+            continue
+        for decorator in node.decorator_list:
+            if isinstance(decorator, ast.Call) and getattr(decorator.func, "id", None) == "rule":
+                rule_ids.add(value_of(decorator.args[0]))
+                covered.update(n for n in ast.walk(node) if isinstance(n, ast.Call))
+    missing = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or getattr(node.func, "attr", None) not in (
+            "add_error",
+            "add_warning",
+        ):
+            continue
+        keywords = {keyword.arg: keyword.value for keyword in node.keywords}
+        if "rule" in keywords:
+            rule_ids.add(value_of(keywords["rule"]))
+        elif node not in covered:
+            missing.append(f"{path.name}:{node.lineno}")
+    return rule_ids, missing
+
+
+class TestRuleIds:
+    """RULE_IDSのテスト"""
+
+    def test_matches_rule_ids_in_validators(self):
+        """RULE_IDSはバリデーターのルールIDと一致し、すべての問題がルールIDを持つ"""
+        rule_ids = set()
+        missing = []
+        for path in sorted((_scripts_dir / "validators").glob("*.py")):
+            ids, calls = _rule_ids_in_source(path)
+            rule_ids |= ids
+            missing += calls
+        assert missing == []
+        assert rule_ids == registry.RULE_IDS
@@ -0,0 +1,160 @@
+"""
+reporters.py のテスト
+"""
+
+import io
+import json
+from pathlib import Path
+
+from scripts.validators.base import ValidationResult
+from scripts.validators.reporters import JsonlReporter, SarifReporter, TextReporter
+
+
+def _result(errors=(), warnings=()) -> ValidationResult:
+    result = ValidationResult()
+    for error in errors:
+        result.add_error(error)
+    for warning in warnings:
+        result.add_warning(warning)
+    return result
+
+
+def _run(reporter_class, reports) -> str:
+    stream = io.StringIO()
+    reporter = reporter_class(stream)
+    reporter.start()
+    for report in reports:
+        reporter.report(*report)
+    reporter.finish()
+    return stream.getvalue()
+
+
+class TestTextReporter:
+    """TextReporterのテスト"""
+
+    def test_only_files_with_problems(self):
+        output = _run(
+            TextReporter,
+            [
+                (Path("a/SKILL.md"), "skill", _result(["e1"], ["w1"])),
+                (Path("b/SKILL.md"), "skill", _result()),
+                (Path("c/x.md"), "agent", _result(warnings=["w2"])),
+            ],
+        )
+        assert output.splitlines() == [
+            "❌ a/SKILL.md",
+            "   エラー: e1",
+            "   警告: w1",
+            "⚠️  c/x.md",
+            "   警告: w2",
+        ]
+
+
+class TestJsonlReporter:
+    """JsonlReporterのテスト"""
+
+    def test_one_record_per_file(self):
+        output = _run(
+            JsonlReporter,
+            [
+                (Path("a/SKILL.md"), "skill", _result(["エラー"])),
+                (Path("notes.txt"), None, _result()),
+            ],
+        )
+        records = [json.loads(line) for line in output.splitlines()]
+        assert records == [
+            {
+                "path": "a/SKILL.md",
+                "validator": "skill",
+                "errors": ["エラー"],
+                "warnings": [],
+                "diagnostics": [
+                    {
+                        "severity": "error",
+                        "message": "エラー",
+                        "rule": None,
+                        "line": None,
+                        "column": None,
+                    }
+                ],
+            },
+            {
+                "path": "notes.txt",
+                "validator": None,
+                "errors": [],
+                "warnings": [],
+                "diagnostics": [],
+            },
+        ]
+
+    def test_diagnostic_fields(self):
+        result = ValidationResult()
+        result.add_warning("{}行目", 3, file=Path("README.md"), rule="code-block", line=3)
+        output = _run(JsonlReporter, [(Path("README.md"), "readme", result)])
+        assert json.loads(output)["diagnostics"] == [
+            {
+                "severity": "warning",
+                "message": "README.md: 3行目",
+                "rule": "code-block",
+                "line": 3,
+                "column": None,
+            }
+        ]
+
+
+class TestSarifReporter:
+    """SarifReporterのテスト"""
+
+    def test_document_structure(self):
+        output = _run(
+            SarifReporter,
+            [
+                (Path("a/SKILL.md"), "skill", _result(["e1"], ["w1"])),
+                (Path("b/SKILL.md"), "skill", _result()),
+                (Path("/abs/x.md"), None, _result(["e2"])),
+            ],
+        )
+        document = json.loads(output)
+        assert document["version"] == "2.1.0"
+        run = document["runs"][0]
+        assert run["tool"]["driver"]["name"] == "validate-plugin"
+        assert {"id": "skill"} in run["tool"]["driver"]["rules"]
+
+        results = run["results"]
+        assert [(r.get("ruleId"), r["level"], r["message"]["text"]) for r in results] == [
+            ("skill", "error", "e1"),
+            ("skill", "warning", "w1"),
+            (None, "error", "e2"),
+        ]
+        uris = [r["locations"][0]["physicalLocation"]["artifactLocation"]["uri"] for r in results]
+        assert uris == ["a/SKILL.md", "a/SKILL.md", "file:///abs/x.md"]
+
+    def test_region_from_diagnostic_line(self):
+        result = ValidationResult()
+        result.add_warning("w", line=3)
+        result.add_warning("w", line=4, column=2)
+        result.add_error("e")
+        output = _run(SarifReporter, [(Path("README.md"), "readme", result)])
+        locations = [
+            r["locations"][0]["physicalLocation"] for r in json.loads(output)["runs"][0]["results"]
+        ]
+        assert [location.get("region") for location in locations] == [
+            None,
+            {"startLine": 3},
+            {"startLine": 4, "startColumn": 2},
+        ]
+
+    def test_rule_id_from_diagnostic(self):
+        result = ValidationResult()
+        result.add_error("e", rule="relative-links")
+        result.add_warning("w")
+        output = _run(SarifReporter, [(Path("README.md"), "readme", result)])
+        run = json.loads(output)["runs"][0]
+        assert [r["ruleId"] for r in run["results"]] == ["relative-links", "readme"]
+        rule_ids = [rule["id"] for rule in run["tool"]["driver"]["rules"]]
+        assert rule_ids.count("readme") == 1
+        assert rule_ids[-1] == "relative-links"
+
+    def test_no_results(self):
+        document = json.loads(_run(SarifReporter, [(Path("a.md"), "agent", _result())]))
+        assert document["runs"][0]["results"] == []
@@ -139,6 +139,8 @@ description: 説明
         result = validate_skill(Path("SKILL.md"), content)
         assert not result.has_errors()
         assert any("500行" in w for w in result.warnings)
+        content += "\n<!-- validator-disable body-length -->"
+        assert validate_skill(Path("SKILL.md"), content).diagnostics == []
 
     def test_yaml_warning_multiline(self):
         """YAMLの複数行構文で警告が出ることを確認"""
@@ -69,6 +69,17 @@ class TestValidateSlashCommand:
         assert not result.has_errors()
         assert any("disable-model-invocation" in w for w in result.warnings)
 
+    def test_dangerous_keyword_in_description_only(self):
+        """本文になくdescriptionだけにある危険そうなキーワードも大文字小文字を区別せず検知"""
+        content = dedent("""
+            ---
+            description: Deploy the app
+            ---
+            アプリを公開する
+        """).strip()
+        result = validate_slash_command(Path("test.md"), content)
+        assert any("disable-model-invocation" in w for w in result.warnings)
+
     def test_dangerous_command_with_disable(self):
         content = dedent("""
             ---
@@ -173,6 +184,46 @@ class TestValidateSlashCommand:
         # スキップコメントがないので警告が出る
         assert any("disable-model-invocation" in w for w in result.warnings)
 
+    def test_dangerous_operation_warning_points_to_first_keyword(self):
+        """警告はキーワードが最初に現れる行（descriptionならキーの行）を指す"""
+        content = "---\ndescription: API作成\n---\n\n説明\ndeployします\ndropします\n"
+        result = validate_slash_command(Path("api.md"), content)
+        [diagnostic] = result.diagnostics
+        assert (diagnostic.rule_id, diagnostic.line) == ("dangerous-operation", 6)
+        content = "---\nname: a\ndescription: deploy\n---\n\ndropします\n"
+        [diagnostic] = validate_slash_command(Path("api.md"), content).diagnostics
+        assert diagnostic.line == 3
+
+    def test_dangerous_operation_next_line_comment(self):
+        """validator-disable-next-lineでキーワードの行の警告を抑制"""
+        content = dedent("""
+            ---
+            description: API作成
+            ---
+
+            <!-- validator-disable-next-line dangerous-operation -->
+            本番環境へdeployを実行します
+        """).strip()
+        result = validate_slash_command(Path("api.md"), content)
+        assert result.diagnostics == []
+
+    def test_dangerous_operation_start_end_comment(self):
+        """validator-disable-start/-endで囲んだキーワードの警告を抑制"""
+        content = dedent("""
+            ---
+            description: API作成
+            ---
+
+            <!-- validator-disable-start dangerous-operation -->
+            本番環境へdeployを実行します
+            <!-- validator-disable-end dangerous-operation -->
+        """).strip()
+        result = validate_slash_command(Path("api.md"), content)
+        assert result.diagnostics == []
+        # 範囲の外（description）にもあるキーワードは警告する
+        content = content.replace("API作成", "deploy")
+        assert validate_slash_command(Path("api.md"), content).warnings
+
     def test_dangerous_keyword_word_boundary_dropdown_no_warning(self):
         """'drop'が'dropdown'の部分文字列である場合は警告が出ないことを確認（単語境界チェック）"""
         content = dedent("""
@@ -0,0 +1,60 @@
+"""
+stats.py のテスト
+"""
+
+import io
+import json
+
+from scripts.validators.base import Metrics
+from scripts.validators.stats import RunStats
+
+
+def _metrics(**values) -> Metrics:
+    metrics = Metrics()
+    for name, value in values.items():
+        setattr(metrics, name, value)
+    return metrics
+
+
+class TestRunStats:
+    """RunStatsのテスト"""
+
+    def test_aggregates_per_validator_and_total(self):
+        stats = RunStats()
+        stats.add("readme", _metrics(bytes_read=100, stat_calls=3, regex_scans=5))
+        stats.add("readme", _metrics(bytes_read=50, stat_calls=1, regex_scans=5))
+        stats.add("skill", _metrics(bytes_read=10, rules_evaluated=6, parse_ns=2_000))
+
+        summary = stats.summary()
+        assert summary["files"] == 3
+        assert summary["total"]["bytes_read"] == 160
+        assert summary["total"]["rules_evaluated"] == 6
+        assert summary["validators"]["readme"] == {
+            "files": 2,
+            "bytes_read": 150,
+            "parse_ns": 0,
+            "rule_ns": 0,
+            "rules_evaluated": 0,
+            "regex_scans": 10,
+            "stat_calls": 4,
+        }
+        assert list(summary["validators"]) == ["readme", "skill"]
+
+    def test_print_report(self):
+        stats = RunStats()
+        stats.add("readme", _metrics(bytes_read=2048, stat_calls=7))
+        stream = io.StringIO()
+        stats.print_report(stream)
+
+        lines = stream.getvalue().splitlines()
+        assert lines[0] == "📊 検証統計: 1ファイル"
+        assert "stat" in lines[1]
+        assert lines[2].split() == ["readme", "1", "2.0", "0.00", "0.00", "0", "0", "7"]
+        assert lines[3].split()[0] == "total"
+
+    def test_write_summary(self, tmp_path):
+        stats = RunStats()
+        stats.add("skill", _metrics(rules_evaluated=2))
+        path = tmp_path / "stats.json"
+        stats.write_summary(path)
+        assert json.loads(path.read_text(encoding="utf-8"))["validators"]["skill"]["files"] == 1
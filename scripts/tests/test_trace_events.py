@@ -0,0 +1,89 @@
+"""
+trace_events.py のテスト
+"""
+
+import json
+import os
+from pathlib import Path
+
+from scripts.validators import base
+from scripts.validators.skill import validate_skill
+from scripts.validators.trace_events import TRACE_PID, TraceRecorder
+
+
+class TestTraceRecorder:
+    """TraceRecorderのテスト"""
+
+    def test_complete_event_relative_to_origin(self):
+        recorder = TraceRecorder(origin_ns=1_000_000)
+        recorder.complete("read", "phase", 3_000_000, 500_000)
+        recorder.complete("a.md", "file", 1_000_000, 10, {"path": "a.md"})
+
+        assert recorder.events == [
+            {
+                "name": "read",
+                "cat": "phase",
+                "ph": "X",
+                "ts": 2000.0,
+                "dur": 500.0,
+                "pid": TRACE_PID,
+                "tid": os.getpid(),
+            },
+            {
+                "name": "a.md",
+                "cat": "file",
+                "ph": "X",
+                "ts": 0.0,
+                "dur": 0.01,
+                "pid": TRACE_PID,
+                "tid": os.getpid(),
+                "args": {"path": "a.md"},
+            },
+        ]
+
+    def test_span(self):
+        recorder = TraceRecorder()
+        with recorder.span("chunk", "chunk", files=3):
+            pass
+        (event,) = recorder.events
+        assert event["name"] == "chunk"
+        assert event["args"] == {"files": 3}
+        assert event["ts"] >= 0
+
+    def test_install_records_parse_and_rules(self):
+        recorder = TraceRecorder()
+        recorder.install()
+        try:
+            validate_skill(Path("skills/a/SKILL.md"), "---\nname: a\ndescription: x\n---\n本文\n")
+        finally:
+            recorder.uninstall()
+
+        categories = {event["cat"] for event in recorder.events}
+        assert categories == {"parse", "rule"}
+        rules = {event["name"]: event for event in recorder.events if event["cat"] == "rule"}
+        assert rules["broad-bash-wildcard"]["args"] == {"outcome": "pass"}
+        assert base._rule_tracer is None
+        assert base._parse_observer is None
+
+    def test_drain(self):
+        recorder = TraceRecorder()
+        recorder.complete("a", "file", 0, 1)
+        assert len(recorder.drain()) == 1
+        assert recorder.events == []
+
+    def test_write_names_tracks(self, tmp_path):
+        recorder = TraceRecorder(origin_ns=0)
+        recorder.complete("wait", "wait", 0, 1)
+        recorder.events.append({**recorder.events[0], "name": "chunk", "tid": 99999999})
+        path = tmp_path / "trace.json"
+        recorder.write(path)
+
+        document = json.loads(path.read_text(encoding="utf-8"))
+        assert document["displayTimeUnit"] == "ms"
+        names = {
+            event["tid"]: event["args"]["name"]
+            for event in document["traceEvents"]
+            if event["name"] == "thread_name"
+        }
+        assert names == {os.getpid(): "main", 99999999: "worker 99999999"}
+        assert sum(event["ph"] == "X" for event in document["traceEvents"]) == 2
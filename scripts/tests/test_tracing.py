@@ -0,0 +1,68 @@
+"""
+tracing.py のテスト
+"""
+
+import io
+from pathlib import Path
+
+from scripts.validators import base
+from scripts.validators.readme import validate_readme
+from scripts.validators.tracing import RuleTraceReport
+
+
+class TestRuleTraceReport:
+    """RuleTraceReportのテスト"""
+
+    def test_collects_rules_of_validator(self, tmp_path):
+        report = RuleTraceReport()
+        base.set_rule_tracer(report)
+        try:
+            validate_readme(tmp_path / "plugins" / "p" / "README.md", "# p\n[x](./none.md)\n")
+        finally:
+            base.set_rule_tracer(None)
+
+        by_rule = {entry["rule"]: entry for entry in report.hot_rules()}
+        assert set(by_rule) == {
+            "required-sections",
+            "relative-links",
+            "code-block-language",
+        }
+        assert all(entry["validator"] == "readme" for entry in by_rule.values())
+        assert by_rule["relative-links"]["outcomes"]["error"] == 1
+        assert by_rule["code-block-language"]["outcomes"]["pass"] == 1
+
+    def test_aggregates_and_sorts_by_total(self):
+        report = RuleTraceReport()
+        report(Path("a/SKILL.md"), "fast", 10, "pass")
+        report(Path("a/SKILL.md"), "slow", 500, "warning")
+        report(Path("b/SKILL.md"), "slow", 300, "pass")
+        report(None, "orphan", 1, "pass")
+
+        hot = report.hot_rules()
+        assert [(entry["validator"], entry["rule"]) for entry in hot] == [
+            ("skill", "slow"),
+            ("skill", "fast"),
+            ("-", "orphan"),
+        ]
+        assert hot[0]["calls"] == 2
+        assert hot[0]["max_ns"] == 500
+        assert hot[0]["outcomes"] == {"pass": 1, "warning": 1, "error": 0, "exception": 0}
+
+    def test_folded_output(self, tmp_path):
+        report = RuleTraceReport()
+        report(Path("a/SKILL.md"), "slow", 500, "pass")
+        report(Path("a/README.md"), "other", 7, "pass")
+        path = tmp_path / "rules.folded"
+        report.write_folded(path)
+        assert path.read_text(encoding="utf-8") == "-;other 7\nskill;slow 500\n"
+
+    def test_print_report(self):
+        report = RuleTraceReport()
+        for i in range(3):
+            report(Path("a/SKILL.md"), f"rule{i}", 1_000_000 * (i + 1), "error")
+        stream = io.StringIO()
+        report.print_report(stream, top_n=2)
+        lines = stream.getvalue().splitlines()
+        assert lines[0] == "🔥 ルール別の所要時間（上位2件）:"
+        assert len(lines) == 3
+        assert lines[1].endswith("skill:rule2")
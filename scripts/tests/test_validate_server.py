@@ -0,0 +1,247 @@
+"""
+常駐サーバー（validate_server.py）と軽量クライアント（validate_client.py）のテスト
+"""
+
+import json
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from textwrap import dedent
+
+import pytest
+
+_scripts_dir = Path(__file__).parent.parent
+if str(_scripts_dir) not in sys.path:
+    sys.path.insert(0, str(_scripts_dir))
+
+import validate_client  # noqa: E402
+import validate_server  # noqa: E402
+
+INVALID_SKILL = dedent("""
+    ---
+    name: Invalid_Name
+    ---
+    本文
+""").strip()
+
+
+@pytest.fixture
+def short_tmpdir():
+    """Unixドメインソケットのパス長制限（約104文字）に収まる一時ディレクトリ"""
+    with tempfile.TemporaryDirectory(dir="/tmp") as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def running_server(short_tmpdir):
+    """バックグラウンドスレッドで検証サーバーを起動する"""
+    server = validate_server.ValidationServer(short_tmpdir / "v.sock")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def _write_invalid_skill(root: Path) -> Path:
+    skill_path = root / "skills" / "test" / "SKILL.md"
+    skill_path.parent.mkdir(parents=True)
+    skill_path.write_text(INVALID_SKILL, encoding="utf-8")
+    return skill_path
+
+
+def _hook_payload(file_path: Path, tool_name: str = "Write") -> bytes:
+    return json.dumps(
+        {"tool_name": tool_name, "tool_input": {"file_path": str(file_path)}}
+    ).encode()
+
+
+class TestValidationServer:
+    """サーバー経由の検証"""
+
+    def test_invalid_file_returns_system_message(self, running_server, short_tmpdir):
+        skill_path = _write_invalid_skill(short_tmpdir)
+        response = validate_client.request(running_server.socket_path, _hook_payload(skill_path))
+        assert response is not None
+        output = json.loads(response)
+        assert output["continue"] is True
+        assert "エラー" in output["systemMessage"]
+
+    def test_non_target_tool_returns_empty(self, running_server, short_tmpdir):
+        skill_path = _write_invalid_skill(short_tmpdir)
+        response = validate_client.request(
+            running_server.socket_path, _hook_payload(skill_path, tool_name="Read")
+        )
+        assert response == validate_client.EMPTY_RESPONSE
+
+    def test_invalid_json_returns_empty(self, running_server):
+        response = validate_client.request(running_server.socket_path, b"not json")
+        assert response == validate_client.EMPTY_RESPONSE
+
+    def test_multiline_payload_is_sent_as_one_line(self, running_server, short_tmpdir):
+        """整形されたJSONも1件のhook入力として扱われる"""
+        skill_path = _write_invalid_skill(short_tmpdir)
+        payload = json.dumps(json.loads(_hook_payload(skill_path)), indent=2).encode()
+        response = validate_client.request(running_server.socket_path, payload)
+        assert "エラー" in json.loads(response)["systemMessage"]
+
+    def test_multiple_requests_per_connection(self, running_server, short_tmpdir):
+        """1接続で複数件を送ると、入力順に1行ずつ応答が返る"""
+        skill_path = _write_invalid_skill(short_tmpdir)
+        lines = [
+            _hook_payload(skill_path),
+            b"",
+            _hook_payload(skill_path, tool_name="Read"),
+            _hook_payload(skill_path),
+        ]
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(running_server.socket_path))
+            sock.sendall(b"\n".join(lines) + b"\n")
+            sock.shutdown(socket.SHUT_WR)
+            responses = sock.makefile("rb").read().splitlines()
+
+        assert len(responses) == 3
+        assert responses[1] == validate_client.EMPTY_RESPONSE
+        assert responses[0] == responses[2] != validate_client.EMPTY_RESPONSE
+
+    def test_handler_exception_returns_system_message(self, running_server, monkeypatch):
+        def broken(payload):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(validate_server.validate_plugin, "handle_hook_payload", broken)
+        response = validate_client.request(running_server.socket_path, b"{}")
+        output = json.loads(response)
+        assert output["continue"] is True
+        assert "RuntimeError: boom" in output["systemMessage"]
+
+    def test_server_matches_in_process_output(self, running_server, short_tmpdir):
+        """サーバー経由でもプロセス内検証と同じ出力になる"""
+        skill_path = _write_invalid_skill(short_tmpdir)
+        payload = _hook_payload(skill_path)
+        response = validate_client.request(running_server.socket_path, payload)
+        expected = validate_client._validate_in_process(payload)
+        assert response.decode("utf-8") == expected
+
+    def test_repeated_content_uses_parse_memo(self, running_server, short_tmpdir):
+        """同じ内容の再検証ではフロントマターの解析結果を使い回す"""
+        skill_path = _write_invalid_skill(short_tmpdir)
+        for _ in range(2):
+            validate_client.request(running_server.socket_path, _hook_payload(skill_path))
+        stats = running_server.parse_memo.stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+
+    def test_parse_memo_can_be_disabled(self, short_tmpdir):
+        server = validate_server.ValidationServer(short_tmpdir / "v.sock", parse_memo_bytes=0)
+        assert server.parse_memo is None
+        server.server_close()
+
+    def test_refuses_to_start_twice(self, running_server):
+        with pytest.raises(FileExistsError):
+            validate_server.ValidationServer(running_server.socket_path)
+
+    def test_stale_socket_is_replaced(self, short_tmpdir):
+        """応答しないソケットファイルが残っていても起動できる"""
+        socket_path = short_tmpdir / "stale.sock"
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_path))
+        stale.close()
+
+        server = validate_server.ValidationServer(socket_path)
+        server.server_close()
+        assert not socket_path.exists()
+
+    def test_idle_timeout_stops_server(self, short_tmpdir):
+        server = validate_server.ValidationServer(short_tmpdir / "idle.sock", idle_timeout=0.05)
+        server.serve()
+        server.server_close()
+        assert server.timed_out
+
+    def test_parse_memo_stats_logged_on_shutdown(self, short_tmpdir):
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(_scripts_dir / "validate_server.py"),
+                "--socket",
+                str(short_tmpdir / "log.sock"),
+                "--idle-timeout",
+                "0.05",
+            ],
+            capture_output=True,
+            text=True,
+            cwd=short_tmpdir,
+        )
+        assert result.returncode == 0
+        assert "解析結果のメモ: 0件" in result.stderr
+        assert "追い出し 0" in result.stderr
+
+
+class TestValidationClient:
+    """クライアントのフォールバック動作"""
+
+    def test_request_without_server_returns_none(self, short_tmpdir):
+        assert validate_client.request(short_tmpdir / "missing.sock", b"{}") is None
+
+    def test_default_socket_path_uses_plugin_data(self, monkeypatch, short_tmpdir):
+        monkeypatch.setenv("CLAUDE_PLUGIN_DATA", str(short_tmpdir))
+        assert validate_client.default_socket_path() == short_tmpdir / "validate-plugin.sock"
+
+    def test_default_socket_path_without_plugin_data(self, monkeypatch):
+        monkeypatch.delenv("CLAUDE_PLUGIN_DATA", raising=False)
+        path = validate_client.default_socket_path()
+        assert path.name == "validate-plugin.sock"
+        assert path.parent.name == "validate-plugin"
+
+    def test_client_falls_back_to_in_process(self, short_tmpdir):
+        """サーバー未起動時もhookモードと同じ出力を返す"""
+        skill_path = _write_invalid_skill(short_tmpdir)
+        process = subprocess.run(
+            [sys.executable, str(_scripts_dir / "validate_client.py")],
+            input=_hook_payload(skill_path),
+            capture_output=True,
+            env={"CLAUDE_PLUGIN_DATA": str(short_tmpdir / "no-server"), "PATH": ""},
+        )
+        assert process.returncode == 0
+        output = json.loads(process.stdout)
+        assert "エラー" in output["systemMessage"]
+
+    def test_client_forwards_to_server(self, short_tmpdir):
+        server = validate_server.ValidationServer(short_tmpdir / "validate-plugin.sock")
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            skill_path = _write_invalid_skill(short_tmpdir)
+            process = subprocess.run(
+                [sys.executable, str(_scripts_dir / "validate_client.py")],
+                input=_hook_payload(skill_path),
+                capture_output=True,
+                env={"CLAUDE_PLUGIN_DATA": str(short_tmpdir), "PATH": ""},
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+        assert process.returncode == 0
+        assert "エラー" in json.loads(process.stdout)["systemMessage"]
+
+    def test_client_prints_nothing_for_empty_response(self, short_tmpdir):
+        server = validate_server.ValidationServer(short_tmpdir / "validate-plugin.sock")
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            process = subprocess.run(
+                [sys.executable, str(_scripts_dir / "validate_client.py")],
+                input=_hook_payload(short_tmpdir / "SKILL.md", tool_name="Read"),
+                capture_output=True,
+                env={"CLAUDE_PLUGIN_DATA": str(short_tmpdir), "PATH": ""},
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+        assert process.returncode == 0
+        assert process.stdout == b""
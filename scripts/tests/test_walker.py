@@ -0,0 +1,112 @@
+"""
+walker.py のテスト
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from scripts.validators import registry, walker
+from scripts.validators.walker import iter_target_files
+
+
+def _touch(path: Path, content: str = "") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+class TestIterTargetFiles:
+    """iter_target_filesのテスト"""
+
+    def test_yields_only_classified_files(self, tmp_path):
+        skill = _touch(tmp_path / "plugins" / "p" / "skills" / "s" / "SKILL.md")
+        readme = _touch(tmp_path / "plugins" / "p" / "README.md")
+        _touch(tmp_path / "plugins" / "p" / "scripts" / "run.sh")
+        _touch(tmp_path / "plugins" / "p" / "notes.md")
+        _touch(tmp_path / "plugins" / "p" / "plugin.json")
+
+        assert set(iter_target_files(tmp_path)) == {skill, readme}
+
+    def test_order_is_deterministic(self, tmp_path):
+        """ディレクトリ内は名前順、ファイルを返してからサブディレクトリへ降りる"""
+        base = tmp_path / "plugins" / "p"
+        hooks = _touch(base / "hooks" / "hooks.json")
+        readme = _touch(base / "README.md")
+        cmd_b = _touch(base / "commands" / "b.md")
+        cmd_a = _touch(base / "commands" / "a.md")
+        nested = _touch(base / "commands" / "sub" / "c.md")
+        agent = _touch(base / "agents" / "x.md")
+
+        assert list(iter_target_files(tmp_path)) == [readme, agent, cmd_a, cmd_b, nested, hooks]
+
+    def test_ignored_dirs_are_pruned(self, tmp_path):
+        kept = _touch(tmp_path / "plugins" / "p" / "hooks" / "hooks.json")
+        _touch(tmp_path / ".git" / "hooks" / "hooks.json")
+        _touch(tmp_path / "plugins" / "p" / "node_modules" / "x" / "hooks" / "hooks.json")
+
+        assert list(iter_target_files(tmp_path)) == [kept]
+
+    def test_custom_ignored_dirs(self, tmp_path):
+        _touch(tmp_path / "vendor" / "hooks.json")
+        kept = _touch(tmp_path / "hooks.json")
+
+        assert list(iter_target_files(tmp_path, ignored_dirs=frozenset({"vendor"}))) == [kept]
+
+    def test_paths_keep_root_prefix(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        _touch(tmp_path / "plugins" / "p" / "README.md")
+
+        assert list(iter_target_files(Path("plugins"))) == [Path("plugins/p/README.md")]
+
+    def test_directory_symlinks_are_not_followed(self, tmp_path):
+        target = _touch(tmp_path / "real" / "hooks.json")
+        (tmp_path / "real" / "loop").symlink_to(tmp_path / "real", target_is_directory=True)
+
+        assert list(iter_target_files(tmp_path)) == [target]
+
+    def test_candidate_named_directory_is_not_yielded(self, tmp_path):
+        """ファイル名条件に一致するディレクトリは対象にしない"""
+        (tmp_path / "hooks.json").mkdir()
+        assert list(iter_target_files(tmp_path)) == []
+
+    def test_unreadable_directory_is_skipped(self, tmp_path, monkeypatch):
+        kept = _touch(tmp_path / "a" / "hooks.json")
+        blocked = tmp_path / "b"
+        _touch(blocked / "hooks.json")
+        real_scandir = os.scandir
+
+        def fake_scandir(path):
+            if Path(path) == blocked:
+                raise PermissionError(path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(walker.os, "scandir", fake_scandir)
+        assert list(iter_target_files(tmp_path)) == [kept]
+
+    def test_missing_root_yields_nothing(self, tmp_path):
+        assert list(iter_target_files(tmp_path / "missing")) == []
+
+
+class TestIsCandidateName:
+    """registry.is_candidate_nameのテスト"""
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("SKILL.md", True),
+            ("hooks.json", True),
+            ("anything.md", True),
+            ("run.sh", False),
+            ("settings.json", False),
+            (".md", False),
+            ("README", False),
+        ],
+    )
+    def test_candidate_names(self, name, expected):
+        assert registry.is_candidate_name(name) is expected
+
+    def test_compiles_tables_on_first_use(self, monkeypatch):
+        monkeypatch.setattr(registry, "_compiled", False)
+        assert registry.is_candidate_name("SKILL.md")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+プラグイン検証hookの軽量クライアント
+
+hook入力（stdinのJSON）を常駐サーバー（validate_server.py）へ転送し、
+返ってきた結果をそのままstdoutに出力する。バリデーターをimportしないため、
+hook実行ごとのコストはインタプリタ起動とソケット往復だけになる。
+
+サーバーが起動していない場合は validate_plugin.py を読み込み、
+同じ処理をプロセス内で実行する（フォールバック）。
+
+使用方法:
+  python3 validate_client.py < hook_input.json
+"""
+
+import os
+import socket
+import sys
+from pathlib import Path
+
+# サーバー応答待ちの上限（秒）。超えた場合はプロセス内検証にフォールバックする
+RESPONSE_TIMEOUT = 10.0
+
+# ソケットファイル名
+SOCKET_NAME = "validate-plugin.sock"
+
+
+def default_socket_path() -> Path:
+    """常駐サーバーのUnixドメインソケットのパスを返す
+
+    ${CLAUDE_PLUGIN_DATA}（未設定時は ~/.claude/plugins/data/validate-plugin）配下に置く。
+    """
+    data_dir = os.environ.get("CLAUDE_PLUGIN_DATA")
+    if data_dir:
+        return Path(data_dir) / SOCKET_NAME
+    return Path.home() / ".claude" / "plugins" / "data" / "validate-plugin" / SOCKET_NAME
+
+
+# 「出力なし」を表す応答行（validate_plugin.EMPTY_RESPONSE と同じ）
+EMPTY_RESPONSE = b"{}"
+
+
+def request(socket_path: Path, payload: bytes, timeout: float = RESPONSE_TIMEOUT) -> bytes | None:
+    """サーバーにhook入力を1件送り、応答行（改行なし）を返す。接続できない場合はNoneを返す"""
+    # JSONの文字列中の改行は必ずエスケープされているため、生の改行は空白に置き換えて1行にできる
+    line = payload.replace(b"\r", b" ").replace(b"\n", b" ") + b"\n"
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path))
+            sock.sendall(line)
+            sock.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except OSError:
+        return None
+    return b"".join(chunks).rstrip(b"\n")
+
+
+def _validate_in_process(payload: bytes) -> str:
+    """サーバーが使えない場合にプロセス内で検証する"""
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    import validate_plugin
+
+    return validate_plugin.handle_hook_payload(payload.decode("utf-8", errors="replace"))
+
+
+def main() -> int:
+    """メインエントリーポイント"""
+    payload = sys.stdin.buffer.read()
+
+    response = request(default_socket_path(), payload)
+    if response is None:
+        output = _validate_in_process(payload)
+        if output:
+            print(output)
+        return 0
+
+    if response and response != EMPTY_RESPONSE:
+        sys.stdout.buffer.write(response + b"\n")
+        sys.stdout.buffer.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
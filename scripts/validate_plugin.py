@@ -7,143 +7,523 @@
   2. CLIモード: コマンドライン引数でファイルパスを指定
      python validate_plugin.py path/to/file1 path/to/file2 ...
      --strict: 警告もエラーとして扱う
+     --jobs N: N並列で検証する（省略時はCPU数。出力順は引数の順序のまま）
+     --root DIR: DIR以下の対象ファイルをすべて検証する（複数指定可）
+     --changed-since REF: REFとの差分で変更された対象ファイルと、
+         削除・リネームされたファイルへリンクしているREADMEを検証する
+         （--rootと併用するとDIR以下の変更だけに絞り込む。省略時はリポジトリ全体）
+     --no-cache: 検証結果キャッシュ（.cache/validate-plugin/）を使わない
+     --format text|jsonl|sarif: 出力形式（textはstderr、jsonl/sarifはstdoutに出力）
+     --profile: バリデーター別・フェーズ別の所要時間と遅いファイルをstderrに出力する
+         （--profile-pstats PATH でcProfileの結果、--profile-json PATH で集計を保存）
+     --memprofile: ファイルごと・バリデーターごとのメモリ確保量のピークと確保元を
+         stderrに出力する（--memprofile-json PATH で集計を保存）
+     --trace PATH: ファイル・フェーズ・検証ルールごとのスパンをChrome/Perfettoの
+         トレースイベント形式（並列実行時はワーカーごとのトラック）でPATHに保存する
+     --trace-rules PATH: 検証ルールごとの所要時間をfolded stacks形式でPATHに保存し、
+         所要時間の大きいルールをstderrに出力する
+     --stats: 読み込みバイト数・解析時間・ルール評価回数などの検証コストを集計して
+         stderrに出力する（--stats-json PATH で集計を保存）
+  3. ストリームモード（--stream）: stdinから1行1件のhook入力（NDJSON）を読み、
+     1件ごとに応答を1行出力する（出力不要の場合は {} ）。常駐サーバーと同じ形式
+     --stats: 終了時に解析結果のメモのヒット・ミス・追い出しの回数をstderrに出力する
+
+hookモードは validate_client.py 経由で常駐サーバー（validate_server.py）に
+転送することもできる。詳細は README.md を参照。
 """
 
 import argparse
 import json
+import os
 import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator
+from itertools import chain, islice
 from pathlib import Path
 
-from validators import (
-    ValidationResult,
-    validate_agent,
-    validate_hooks_json,
-    validate_lsp_json,
-    validate_marketplace_json,
-    validate_mcp_json,
-    validate_monitors_json,
-    validate_output_style,
-    validate_plugin_json,
-    validate_readme,
-    validate_skill,
-    validate_slash_command,
-)
+import validators
+
+# CLIモードで使う検証結果キャッシュ（validators.cache.ResultCache）。Noneなら使わない
+_result_cache = None
+
+
+def configure_result_cache(cache) -> None:
+    """validate_file() が使う検証結果キャッシュを設定する（Noneで無効化）"""
+    global _result_cache
+    _result_cache = cache
+
+
+# リポジトリ全体でルールを抑制する設定ファイル（リポジトリのルートからの相対パス）
+DEFAULT_SUPPRESSION_CONFIG = Path(".validate-plugin.json")
+
+# 設定ファイルで抑制したルールID（並列実行のワーカーにも引き継ぐ）
+_suppressed_rules: frozenset[str] = frozenset()
+
+
+def find_suppression_config(start: Path) -> Path:
+    """start を含むgitリポジトリのルートにある設定ファイルのパスを返す
+
+    start から親へさかのぼって .git のあるディレクトリを探す（gitコマンドは起動しない）。
+    リポジトリの外なら start 直下のパスを返す。起動したディレクトリによらず、
+    CLI・hook・常駐サーバーが同じ設定ファイルを使うようにするため。
+    """
+    start = start.resolve()
+    for directory in (start, *start.parents):
+        if (directory / ".git").exists():
+            return directory / DEFAULT_SUPPRESSION_CONFIG
+    return start / DEFAULT_SUPPRESSION_CONFIG
+
+
+def configure_suppressions(config_path: Path) -> None:
+    """設定ファイルの "disable" のルールをリポジトリ全体で抑制する（ファイルがなければ何もしない）
+
+    対象外のファイルしか扱わないhookモードの起動時間に影響しないよう、
+    設定ファイルがある場合だけ validators.base を読み込む。
+
+    Raises:
+        ValueError: 設定ファイルの形式が不正な場合、または未知のルールIDがある場合
+    """
+    global _suppressed_rules
+    if not config_path.is_file():
+        return
+    from validators.base import load_suppression_config, set_repo_suppressions
+    from validators.registry import RULE_IDS
+
+    rules = load_suppression_config(config_path)
+    unknown = sorted(rules - RULE_IDS)
+    if unknown:
+        raise ValueError(f"{config_path}: 未知のルールIDです: {', '.join(unknown)}")
+    _suppressed_rules = rules
+    set_repo_suppressions(_suppressed_rules)
+
+
+# --profile 指定時の計測器（validators.profiling.Profiler）。Noneなら計測しない
+_profiler = None
+
+
+def configure_profiler(profiler) -> None:
+    """validate_file() と _safe_validate() が使う計測器を設定する（Noneで無効化）"""
+    global _profiler
+    _profiler = profiler
+
+
+def preload_validators() -> None:
+    """全バリデーターを読み込む（以降の検証でimportが発生しないようにする）"""
+    for name in validators.__all__:
+        getattr(validators, name)
+
+
+# --memprofile 指定時のメモリ計測器（validators.memprofile.MemoryProfiler）。Noneなら計測しない
+_memory_profiler = None
+
+
+def configure_memory_profiler(memory_profiler) -> None:
+    """validate_file() が使うメモリ計測器を設定する（Noneで無効化）"""
+    global _memory_profiler
+    _memory_profiler = memory_profiler
+
+
+# --stats 指定時はTrue。validate_file() が結果に検証コスト（Metrics）を付ける
+_collect_stats = False
+
+
+def configure_stats(enabled: bool) -> None:
+    """validate_file() が検証コストを集計するかを設定する"""
+    global _collect_stats
+    _collect_stats = enabled
+
+
+# --trace 指定時のトレース記録（validators.trace_events.TraceRecorder）。Noneなら記録しない
+_trace_recorder = None
+
+
+def configure_trace_recorder(recorder) -> None:
+    """validate_file() と iter_validation_results() が使うトレース記録を設定する（Noneで無効化）"""
+    global _trace_recorder
+    _trace_recorder = recorder
+
+
+def _init_worker(
+    cache, collect_stats: bool, trace_origin_ns: int | None, suppressed_rules: frozenset[str]
+) -> None:
+    """ワーカープロセスに親プロセスの設定を引き継ぐ"""
+    configure_result_cache(cache)
+    configure_stats(collect_stats)
+    if suppressed_rules:
+        from validators.base import set_repo_suppressions
+
+        set_repo_suppressions(suppressed_rules)
+    if trace_origin_ns is not None:
+        from validators.trace_events import TraceRecorder
+
+        recorder = TraceRecorder(trace_origin_ns)
+        recorder.install()
+        configure_trace_recorder(recorder)
 
 
 def _safe_validate(
-    validator_func, file_path: Path, content: str, result: ValidationResult
-) -> ValidationResult:
-    """バリデーター関数を例外から保護して実行する"""
+    validator_func, file_path: Path, content: str, result: "validators.ValidationResult"
+) -> "validators.ValidationResult":
+    """バリデーター関数を例外から保護して実行する（--profile 時は所要時間も計測する）"""
+    profiler = _profiler
     try:
-        return validator_func(file_path, content)
+        if profiler is None:
+            return validator_func(file_path, content)
+        with profiler.validator_call(getattr(validator_func, "id", None)):
+            return validator_func(file_path, content)
     except Exception as e:
         result.add_error(
-            f"{file_path.name}: バリデーター実行中に予期しないエラーが発生しました: "
-            f"{type(e).__name__}: {e}"
+            "バリデーター実行中に予期しないエラーが発生しました: {}: {}",
+            type(e).__name__,
+            e,
+            file=file_path,
         )
         return result
 
 
-def validate_file(file_path: Path) -> ValidationResult:
+def _read_file(file_path: Path, result: "validators.ValidationResult") -> str | None:
+    """ファイルを読み込む（失敗した場合はresultにエラーを追加してNoneを返す）"""
+    try:
+        return file_path.read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+        result.add_error("ファイルがUTF-8でエンコードされていません", file=file_path)
+    except FileNotFoundError:
+        result.add_error("ファイルが見つかりません", file=file_path)
+    except Exception as e:
+        result.add_error("ファイル読み込みエラー: {}", e, file=file_path)
+    return None
+
+
+def validate_content(
+    file_path: Path, content: str, validator: "validators.ValidatorSpec | None" = None
+) -> "validators.ValidationResult":
+    """読み込み済みの内容を検証し、結果を返す（ディスクは読まない）"""
+    result = validators.ValidationResult()
+
+    if validator is None:
+        validator = validators.classify(file_path)
+        if validator is None:
+            return result
+
+    cache = _result_cache
+    if cache is not None:
+        cache_key = cache.key(validator.id, file_path, content)
+        cached = cache.get(cache_key, file_path)
+        if cached is not None:
+            return cached
+
+    # バリデーターモジュールはここで初めて読み込まれる
+    result = _safe_validate(validator, file_path, content, result)
+    if cache is not None:
+        cache.put(cache_key, file_path, result)
+    return result
+
+
+def _validate_with_metrics(
+    file_path: Path, content: str, validator: "validators.ValidatorSpec"
+) -> "validators.ValidationResult":
+    """検証コストを集計しながら検証し、結果の metrics に設定する"""
+    metrics = validators.Metrics()
+    metrics.bytes_read = len(content.encode("utf-8"))
+    start = time.perf_counter_ns()
+    with validators.collect_metrics(metrics):
+        result = validate_content(file_path, content, validator)
+    metrics.rule_ns = time.perf_counter_ns() - start - metrics.parse_ns
+    result.metrics = metrics
+    return result
+
+
+def validate_file(file_path: Path) -> "validators.ValidationResult":
     """単一ファイルを検証し、結果を返す"""
-    result = ValidationResult()
+    return _classify_and_validate(file_path)[1]
 
-    def read_file_content(path: Path) -> str | None:
-        """ファイルをUTF-8で読み込む。エラー時はNoneを返す"""
-        try:
-            return path.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            result.add_error(f"{path.name}: ファイルがUTF-8でエンコードされていません")
-            return None
-        except FileNotFoundError:
-            result.add_error(f"{path.name}: ファイルが見つかりません")
-            return None
-        except Exception as e:
-            result.add_error(f"{path.name}: ファイル読み込みエラー: {e}")
-            return None
-
-    path_parts = file_path.parts
-
-    if file_path.name == "SKILL.md":
-        # スキルファイル
-        content = read_file_content(file_path)
-        if content is not None:
-            result = _safe_validate(validate_skill, file_path, content, result)
-    elif "commands" in path_parts and file_path.suffix == ".md":
-        # スラッシュコマンド
-        content = read_file_content(file_path)
-        if content is not None:
-            result = _safe_validate(validate_slash_command, file_path, content, result)
-    elif "agents" in path_parts and file_path.suffix == ".md":
-        # サブエージェント
-        content = read_file_content(file_path)
-        if content is not None:
-            result = _safe_validate(validate_agent, file_path, content, result)
-    elif file_path.name == "hooks.json":
-        # hooks設定
-        content = read_file_content(file_path)
-        if content is not None:
-            result = _safe_validate(validate_hooks_json, file_path, content, result)
-    elif file_path.name == ".mcp.json":
-        # MCP設定
-        content = read_file_content(file_path)
-        if content is not None:
-            result = _safe_validate(validate_mcp_json, file_path, content, result)
-    elif file_path.name == ".lsp.json":
-        # LSP設定
-        content = read_file_content(file_path)
-        if content is not None:
-            result = _safe_validate(validate_lsp_json, file_path, content, result)
-    elif file_path.name == "monitors.json" and "monitors" in path_parts:
-        # バックグラウンドモニター設定
-        content = read_file_content(file_path)
-        if content is not None:
-            result = _safe_validate(validate_monitors_json, file_path, content, result)
-    elif file_path.name == "plugin.json" and ".claude-plugin" in path_parts:
-        # プラグインマニフェスト
-        content = read_file_content(file_path)
-        if content is not None:
-            result = _safe_validate(validate_plugin_json, file_path, content, result)
-    elif file_path.name == "marketplace.json" and ".claude-plugin" in path_parts:
-        # マーケットプレイス設定
-        content = read_file_content(file_path)
-        if content is not None:
-            result = _safe_validate(validate_marketplace_json, file_path, content, result)
-    elif "output-styles" in path_parts and file_path.suffix == ".md":
-        # 出力スタイル
-        content = read_file_content(file_path)
-        if content is not None:
-            result = _safe_validate(validate_output_style, file_path, content, result)
-    elif file_path.name == "README.md" and "plugins" in path_parts:
-        # プラグインREADME
-        content = read_file_content(file_path)
-        if content is not None:
-            result = _safe_validate(validate_readme, file_path, content, result)
 
+def _classify_and_validate(
+    file_path: Path,
+) -> tuple[str | None, "validators.ValidationResult"]:
+    """単一ファイルを検証し、(バリデーターID, 結果) を返す（対象外ならIDはNone）"""
+    result = validators.ValidationResult()
+
+    validator = validators.classify(file_path)
+    if validator is None:
+        return None, result
+
+    if _memory_profiler is not None:
+        with _memory_profiler.track(file_path, validator.id):
+            return validator.id, _validate_file(file_path, validator, result)
+    return validator.id, _validate_file(file_path, validator, result)
+
+
+def _validate_file(
+    file_path: Path, validator: "validators.ValidatorSpec", result: "validators.ValidationResult"
+) -> "validators.ValidationResult":
+    """validate_file() の本体（読み込みから検証まで）"""
+    validate = _validate_with_metrics if _collect_stats else validate_content
+    profiler = _profiler
+    recorder = _trace_recorder
+    if profiler is None and recorder is None:
+        content = _read_file(file_path, result)
+        if content is None:
+            return result
+        return validate(file_path, content, validator)
+
+    start = time.perf_counter_ns()
+    content = _read_file(file_path, result)
+    read_end = time.perf_counter_ns()
+    if content is not None:
+        result = validate(file_path, content, validator)
+    end = time.perf_counter_ns()
+    if profiler is not None:
+        profiler.add_phase("read", read_end - start)
+        profiler.record_file(file_path, validator.id, end - start)
+    if recorder is not None:
+        recorder.complete("read", "phase", start, read_end - start)
+        if content is not None:
+            recorder.complete("validate", "phase", read_end, end - read_end)
+        recorder.complete(
+            file_path.name,
+            "file",
+            start,
+            end - start,
+            {
+                "path": str(file_path),
+                "validator": validator.id,
+                "errors": len(result.by_severity("error")),
+            },
+        )
     return result
 
 
+# 並列実行時に1回でワーカーへ渡すファイル数の上限
+MAX_CHUNK_SIZE = 64
+
+# 件数が事前にわからない入力（--root）でのチャンクサイズ
+STREAM_CHUNK_SIZE = 16
+
+# これより少ないファイル数ではプロセスプールの起動コストが上回るため逐次検証する
+MIN_FILES_FOR_POOL = 64
+
+# ワーカー1つあたりに先行投入しておくチャンク数（結果待ちで遊ばないようにする）
+CHUNKS_IN_FLIGHT_PER_JOB = 2
+
+
+# (バリデーターID, 検証結果)。ワーカーから親プロセスへ返す単位
+ValidatedFile = tuple[str | None, "validators.ValidationResult"]
+
+
+def _validate_chunk(file_paths: list[Path]) -> list[ValidatedFile]:
+    """ワーカープロセスで複数ファイルを検証する"""
+    return [_classify_and_validate(file_path) for file_path in file_paths]
+
+
+def _validate_chunk_traced(
+    file_paths: list[Path],
+) -> tuple[list[ValidatedFile], list[dict]]:
+    """--trace 時の _validate_chunk()。ワーカーで記録したトレースイベントも返す"""
+    with _trace_recorder.span("chunk", "chunk", files=len(file_paths)):
+        results = _validate_chunk(file_paths)
+    return results, _trace_recorder.drain()
+
+
+def _chunk_size_for(file_count: int, jobs: int) -> int:
+    """ワーカーあたり4チャンク程度に分かれるチャンクサイズを返す"""
+    return max(1, min(MAX_CHUNK_SIZE, file_count // (jobs * 4)))
+
+
+def iter_validation_results(
+    file_paths: Iterable[Path], jobs: int = 1, chunk_size: int = MAX_CHUNK_SIZE
+) -> Iterator[tuple[Path, str | None, "validators.ValidationResult"]]:
+    """ファイルを検証し、(パス, バリデーターID, 結果) を入力と同じ順序で返す
+
+    バリデーターIDは検証時に判定したもの（対象外ならNone）で、呼び出し側で
+    パスを判定し直さなくてよい。
+
+    jobsが2以上の場合はプロセスプールにチャンク単位で投入する。入力はイテレーターのまま
+    読み進め、投入済みで未回収のチャンクは jobs * CHUNKS_IN_FLIGHT_PER_JOB 個までに抑える。
+    入力が MIN_FILES_FOR_POOL 未満で尽きる場合はプールを起動せずに逐次検証する。
+    """
+    file_iter = iter(file_paths)
+    head = list(islice(file_iter, MIN_FILES_FOR_POOL))
+    if jobs <= 1 or len(head) < MIN_FILES_FOR_POOL:
+        for file_path in chain(head, file_iter):
+            yield file_path, *_classify_and_validate(file_path)
+        return
+
+    # hookモードの起動時間に影響しないよう、並列実行時のみimportする
+    from concurrent.futures import ProcessPoolExecutor
+
+    def chunks() -> Iterator[list[Path]]:
+        remaining = chain(head, file_iter)
+        while chunk := list(islice(remaining, chunk_size)):
+            yield chunk
+
+    recorder = _trace_recorder
+
+    def collect(future) -> list[ValidatedFile]:
+        if recorder is None:
+            return future.result()
+        # 親プロセスのトラックには結果待ちの時間を記録し、ワーカーのイベントを取り込む
+        with recorder.span("wait", "wait"):
+            results, events = future.result()
+        recorder.events.extend(events)
+        return results
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(
+            _result_cache,
+            _collect_stats,
+            recorder.origin_ns if recorder else None,
+            _suppressed_rules,
+        ),
+    ) as executor:
+        validate_chunk = _validate_chunk if recorder is None else _validate_chunk_traced
+        pending: deque = deque()
+        for chunk in chunks():
+            pending.append((chunk, executor.submit(validate_chunk, chunk)))
+            if len(pending) >= jobs * CHUNKS_IN_FLIGHT_PER_JOB:
+                done_chunk, future = pending.popleft()
+                for file_path, validated in zip(done_chunk, collect(future), strict=True):
+                    yield file_path, *validated
+        while pending:
+            done_chunk, future = pending.popleft()
+            for file_path, validated in zip(done_chunk, collect(future), strict=True):
+                yield file_path, *validated
+
+
 def run_cli_mode(args: argparse.Namespace) -> int:
     """CLIモードで複数ファイルを検証"""
     has_errors = False
     has_warnings = False
 
-    for file_path_str in args.files:
-        file_path = Path(file_path_str)
-        result = validate_file(file_path)
+    file_paths: Iterable[Path] = [Path(file_path_str) for file_path_str in args.files]
+    if args.root:
+        # ツリーは走査しながら検証に流し込む（全パスのリストは作らない）
+        from validators.walker import iter_target_files
+
+        file_paths = chain(file_paths, *(iter_target_files(root) for root in args.root))
+        chunk_size = STREAM_CHUNK_SIZE
+    else:
+        chunk_size = _chunk_size_for(len(file_paths), args.jobs)
+
+    jobs = args.jobs
+    profiler = None
+    if args.profile:
+        from validators.profiling import Profiler
+
+        # 計測値を1つのプロセスに集める
+        profiler = Profiler(top_n=args.profile_top, pstats_path=args.profile_pstats)
+        jobs = 1
+    configure_profiler(profiler)
+
+    recorder = None
+    if args.trace:
+        from validators.trace_events import TraceRecorder
+
+        recorder = TraceRecorder()
+        recorder.install()
+    configure_trace_recorder(recorder)
+
+    memory_profiler = None
+    if args.memprofile:
+        from validators.memprofile import MemoryProfiler
+
+        memory_profiler = MemoryProfiler(top_n=args.profile_top)
+        jobs = 1
+    configure_memory_profiler(memory_profiler)
+
+    rule_trace = None
+    if args.trace_rules:
+        from validators.base import set_rule_tracer
+        from validators.tracing import RuleTraceReport
+
+        # トレーサーはプロセス内の呼び出ししか受け取れないため逐次実行にする
+        rule_trace = RuleTraceReport()
+        set_rule_tracer(rule_trace)
+        jobs = 1
+
+    stats = None
+    if args.stats:
+        from validators.stats import RunStats
 
+        stats = RunStats()
+    configure_stats(stats is not None)
+
+    cache = None
+    # 計測中はキャッシュヒットで検証が省かれないようにする
+    measuring = any(m is not None for m in (profiler, recorder, memory_profiler, rule_trace, stats))
+    if not args.no_cache and not measuring:
+        from validators.cache import ResultCache
+
+        cache = ResultCache()
+    configure_result_cache(cache)
+
+    from validators.reporters import REPORTERS
+
+    # textは従来どおりstderr、機械可読な形式はstdoutに出力する
+    reporter = REPORTERS[args.format](sys.stderr if args.format == "text" else sys.stdout)
+    if profiler is not None:
+        profiler.start()
+    if memory_profiler is not None:
+        # バリデーターの初回importで確保したメモリが最初のファイルに計上されないよう、
+        # 計測を始める前に読み込んでおく
+        preload_validators()
+        memory_profiler.start()
+    reporter.start()
+    for file_path, validator_id, result in iter_validation_results(file_paths, jobs, chunk_size):
         if result.has_errors():
             has_errors = True
-            print(f"❌ {file_path}", file=sys.stderr)
-            for error in result.errors:
-                print(f"   エラー: {error}", file=sys.stderr)
-
-        if result.warnings:
+        if result.has_warnings():
             has_warnings = True
-            if not result.has_errors():
-                print(f"⚠️  {file_path}", file=sys.stderr)
-            for warning in result.warnings:
-                print(f"   警告: {warning}", file=sys.stderr)
+        if stats is not None and result.metrics is not None:
+            stats.add(validator_id, result.metrics)
+        if profiler is None and recorder is None:
+            reporter.report(file_path, validator_id, result)
+            continue
+        start = time.perf_counter_ns()
+        reporter.report(file_path, validator_id, result)
+        elapsed = time.perf_counter_ns() - start
+        if profiler is not None:
+            profiler.add_phase("output", elapsed)
+        if recorder is not None:
+            recorder.complete("output", "phase", start, elapsed)
+    reporter.finish()
+
+    if recorder is not None:
+        recorder.uninstall()
+        configure_trace_recorder(None)
+        recorder.write(args.trace)
+
+    if profiler is not None:
+        profiler.stop()
+        configure_profiler(None)
+        profiler.print_report(sys.stderr)
+        if args.profile_json:
+            profiler.write_summary(args.profile_json)
+
+    if memory_profiler is not None:
+        memory_profiler.stop()
+        configure_memory_profiler(None)
+        memory_profiler.print_report(sys.stderr)
+        if args.memprofile_json:
+            memory_profiler.write_summary(args.memprofile_json)
+
+    if rule_trace is not None:
+        set_rule_tracer(None)
+        rule_trace.print_report(sys.stderr)
+        rule_trace.write_folded(args.trace_rules)
+
+    if stats is not None:
+        configure_stats(False)
+        stats.print_report(sys.stderr)
+        if args.stats_json:
+            stats.write_summary(args.stats_json)
+
+    if cache is not None:
+        cache.prune()
 
     if has_errors:
         return 1
@@ -152,37 +532,210 @@ def run_cli_mode(args: argparse.Namespace) -> int:
     return 0
 
 
-def run_hook_mode() -> int:
-    """hookモードでstdinからJSON入力を処理"""
-    # stdinからhook入力を取得
+# hookモードで最後に検証した内容を覚えておくファイル数
+HOOK_CONTENT_CACHE_SIZE = 128
+
+# ファイルのサイズと更新時刻（ナノ秒）。記録した内容がディスクと食い違っていないかの判定に使う
+FileStamp = tuple[int, int]
+
+# ファイルパス → hookモードで最後に検証した内容と、その時点のディスク上のFileStamp（古い順）。
+# 常駐サーバーではEditの変更を直前の内容に適用して、ディスクを読まずに編集後の内容を得るのに使う。
+# 常駐サーバーはリクエストを複数のスレッドで処理するため、読み書きは_hook_contents_lockの下で行う
+_hook_contents: OrderedDict[str, tuple[str, FileStamp | None]] = OrderedDict()
+_hook_contents_lock = threading.Lock()
+
+
+def _file_stamp(file_path: Path) -> FileStamp | None:
+    """ファイルのサイズと更新時刻を返す（statできなければNone）"""
     try:
-        input_data = json.load(sys.stdin)
-    except json.JSONDecodeError:
-        # JSONでない場合はスキップ
-        return 0
+        st = file_path.stat()
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _remember_hook_content(key: str, content: str, stamp: FileStamp | None) -> None:
+    """hookモードで検証した内容を記録する（上限を超えたら古いものから捨てる）"""
+    with _hook_contents_lock:
+        _hook_contents[key] = (content, stamp)
+        _hook_contents.move_to_end(key)
+        while len(_hook_contents) > HOOK_CONTENT_CACHE_SIZE:
+            _hook_contents.popitem(last=False)
+
+
+def _apply_edit(previous: str, tool_input: dict) -> str | None:
+    """previous に old_string → new_string を適用する（一意に適用できなければNone）"""
+    old_string = tool_input.get("old_string")
+    new_string = tool_input.get("new_string")
+    if not isinstance(new_string, str):
+        return None
+    if not isinstance(old_string, str) or not old_string:
+        return None
+
+    count = previous.count(old_string)
+    if tool_input.get("replace_all") is True:
+        return previous.replace(old_string, new_string) if count else None
+    if count != 1:
+        return None
+    return previous.replace(old_string, new_string, 1)
+
+
+def _content_from_tool_input(
+    tool_name: str, tool_input: dict, key: str, stamp: FileStamp | None
+) -> str | None:
+    """hook入力から編集後のファイル内容を求める（求められなければNone）
+
+    Writeは書き込んだ内容そのものを使う。Editは直前に検証した内容に
+    old_string → new_string を適用する。stamp は現在のディスク上のファイルのもので、
+    次の場合は記録した内容が古い可能性があるとして諦めてNoneを返す。
+
+    - old_stringが見つからない、replace_allなしで複数見つかる
+    - ファイルがない、または記録した時点から変わっていない（Editが失敗した）
+    - 適用後の内容のサイズがディスク上のファイルと合わない（hookの外で変更された）
+    """
+    if tool_name == "Write":
+        content = tool_input.get("content")
+        return content if isinstance(content, str) else None
+
+    with _hook_contents_lock:
+        entry = _hook_contents.get(key)
+    if entry is None or stamp is None:
+        return None
+    previous, previous_stamp = entry
+    if previous_stamp is None or stamp == previous_stamp:
+        return None
+
+    content = _apply_edit(previous, tool_input)
+    if content is None or len(content.encode("utf-8")) != stamp[0]:
+        return None
+    return content
+
+
+def handle_hook_input(input_data: dict) -> dict | None:
+    """hook入力を検証し、出力すべきJSONオブジェクトを返す（出力不要ならNone）
+
+    ファイル内容はできるだけhook入力から求め、求められない場合だけディスクから読む。
+    """
+    if not isinstance(input_data, dict):
+        return None
 
     tool_name = input_data.get("tool_name", "")
     tool_input = input_data.get("tool_input", {})
 
     # Edit/Writeツールのみ処理
     if tool_name not in ["Edit", "Write"]:
-        return 0
+        return None
 
     file_path_str = tool_input.get("file_path", "")
     if not file_path_str:
-        return 0
+        return None
 
     file_path = Path(file_path_str)
-    result = validate_file(file_path)
+    validator = validators.classify(file_path)
+    if validator is None:
+        # 対象外ファイルはバリデーターを一切読み込まずに終了する
+        return None
+
+    stamp = _file_stamp(file_path)
+    content = _content_from_tool_input(tool_name, tool_input, file_path_str, stamp)
+    if content is None:
+        result = validators.ValidationResult()
+        content = _read_file(file_path, result)
+    if content is not None:
+        _remember_hook_content(file_path_str, content, stamp)
+        result = validate_content(file_path, content, validator)
+
+    if result.diagnostics:
+        return {"continue": True, "systemMessage": result.to_message()}
+    return None
+
+
+def handle_hook_payload(payload: str) -> str:
+    """hook入力のJSON文字列を検証し、stdoutに書く文字列を返す（出力不要なら空文字列）
+
+    validate_server.py（常駐サーバー）とvalidate_client.py（フォールバック時）からも
+    同じ処理を共有するため、入出力を文字列で受け渡す。
+    """
+    try:
+        input_data = json.loads(payload)
+    except json.JSONDecodeError:
+        # JSONでない場合はスキップ
+        return ""
+
+    output = handle_hook_input(input_data)
+    if output is None:
+        return ""
+    return json.dumps(output, ensure_ascii=False)
+
+
+def run_hook_mode() -> int:
+    """hookモードでstdinからJSON入力を処理"""
+    output = handle_hook_payload(sys.stdin.read())
 
     # 結果を出力
-    if result.has_errors() or result.warnings:
-        output = {"continue": True, "systemMessage": result.to_message()}
-        print(json.dumps(output, ensure_ascii=False))
+    if output:
+        print(output)
+
+    return 0
+
+
+# ストリームモード・常駐サーバーで「出力なし」を表す応答行
+EMPTY_RESPONSE = "{}"
+
 
+def handle_hook_line(line: str) -> str:
+    """NDJSONの1行（hook入力1件）を処理し、応答行（改行なし）を返す
+
+    ストリームモードと常駐サーバーで共通の形式。入力1行に必ず応答1行が対応するよう、
+    出力不要の場合は EMPTY_RESPONSE を返し、予期しない例外もsystemMessageにして返す。
+    """
+    try:
+        output = handle_hook_payload(line)
+    except Exception as e:
+        output = json.dumps(
+            {
+                "continue": True,
+                "systemMessage": f"検証中に予期しないエラーが発生しました: {type(e).__name__}: {e}",
+            },
+            ensure_ascii=False,
+        )
+    return output or EMPTY_RESPONSE
+
+
+def run_stream_mode(report_memo_stats: bool = False) -> int:
+    """ストリームモードでstdinのNDJSONを1行ずつ処理する（空行は無視する）
+
+    同じファイルを繰り返し検証するため、解析結果のメモを使う。report_memo_stats が
+    真なら、終了時にメモのヒット・ミス・追い出しの回数をstderrに出力する。
+    """
+    from validators.parse_memo import ParseMemo
+
+    memo = ParseMemo()
+    memo.install()
+    stdout = sys.stdout.buffer
+    try:
+        for raw_line in sys.stdin.buffer:
+            line = raw_line.decode("utf-8", errors="replace")
+            if not line.strip():
+                continue
+            stdout.write(handle_hook_line(line).encode("utf-8") + b"\n")
+            # 応答を待ちながら次の入力を送る相手とやり取りできるよう、1行ごとに書き出す
+            stdout.flush()
+    finally:
+        memo.uninstall()
+    if report_memo_stats:
+        print(memo.format_stats(), file=sys.stderr)
     return 0
 
 
+def _positive_int(value: str) -> int:
+    """1以上の整数を受け付けるargparse用の型"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1以上の整数を指定してください: {value}")
+    return number
+
+
 def main():
     """メインエントリーポイント"""
     parser = argparse.ArgumentParser(description="プラグインファイルを検証する")
@@ -190,10 +743,141 @@ def main():
         "files", nargs="*", help="検証するファイルのパス（指定しない場合はhookモード）"
     )
     parser.add_argument("--strict", action="store_true", help="警告もエラーとして扱う")
+    parser.add_argument(
+        "--root",
+        type=Path,
+        action="append",
+        metavar="DIR",
+        help="DIR以下の検証対象ファイルをすべて検証する（複数指定可）",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="stdinから1行1件のhook入力（NDJSON）を読み、1件ごとに応答を1行出力する",
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="REF",
+        help="REF（とHEADの分岐点）からの変更で影響を受けるファイルを検証する"
+        "（--rootを併用するとDIR以下に絞り込む）",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="検証結果キャッシュ（.cache/validate-plugin/）を使わない",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("text", "jsonl", "sarif"),
+        default="text",
+        help="CLIモードの出力形式（textはstderr、jsonl/sarifはstdoutに出力）",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="所要時間をバリデーター別・フェーズ別に計測して出力する（並列実行・キャッシュは無効）",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=_positive_int,
+        default=10,
+        metavar="N",
+        help="--profile・--memprofileで表示するファイルの件数",
+    )
+    parser.add_argument(
+        "--profile-pstats", type=Path, metavar="PATH", help="cProfileの結果を.pstatsで保存する"
+    )
+    parser.add_argument(
+        "--profile-json", type=Path, metavar="PATH", help="--profileの集計結果をJSONで保存する"
+    )
+    parser.add_argument(
+        "--memprofile",
+        action="store_true",
+        help="ファイルごと・バリデーターごとのメモリ確保量のピークと確保元を出力する"
+        "（並列実行・キャッシュは無効）",
+    )
+    parser.add_argument(
+        "--memprofile-json",
+        type=Path,
+        metavar="PATH",
+        help="--memprofileの集計結果をJSONで保存する",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        metavar="PATH",
+        help="ファイル・フェーズ・検証ルールごとのスパンをChrome/Perfettoのトレース形式で保存する",
+    )
+    parser.add_argument(
+        "--trace-rules",
+        type=Path,
+        metavar="PATH",
+        help="検証ルールごとの所要時間をfolded stacks形式で保存する（並列実行・キャッシュは無効）",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="読み込みバイト数・解析時間・ルール評価回数などの検証コストを集計して出力する",
+    )
+    parser.add_argument(
+        "--stats-json", type=Path, metavar="PATH", help="--statsの集計結果をJSONで保存する"
+    )
+    parser.add_argument(
+        "--suppression-config",
+        type=Path,
+        metavar="PATH",
+        help="抑制するルールIDを書いた設定ファイル（省略時は--rootの最初のディレクトリ、"
+        f"なければカレントディレクトリを含むgitリポジトリのルートの{DEFAULT_SUPPRESSION_CONFIG}"
+        "があれば使う）",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=os.cpu_count() or 1,
+        help="CLIモードの並列実行数（省略時はCPU数）",
+    )
 
     args = parser.parse_args()
+    if args.profile_pstats or args.profile_json:
+        args.profile = True
+    if args.stats_json:
+        args.stats = True
+    if args.memprofile_json:
+        args.memprofile = True
+    if args.trace and (args.profile or args.trace_rules):
+        # 解析・検証ルールの通知先は1つずつしか設定できない
+        parser.error("--traceは--profile・--trace-rulesと同時に指定できません")
+    if args.stream and (args.files or args.root or args.changed_since is not None):
+        parser.error("--streamはファイル指定・--root・--changed-sinceと同時に指定できません")
+    for root in args.root or []:
+        if not root.is_dir():
+            parser.error(f"--rootにはディレクトリを指定してください: {root}")
+    if args.suppression_config is not None and not args.suppression_config.is_file():
+        parser.error(f"--suppression-configのファイルがありません: {args.suppression_config}")
+    try:
+        configure_suppressions(
+            args.suppression_config
+            or find_suppression_config(args.root[0] if args.root else Path.cwd())
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.changed_since is not None:
+        from validators.changes import GitDiffError, changed_files
+
+        try:
+            changed = changed_files(args.changed_since, scopes=args.root or ())
+        except GitDiffError as e:
+            parser.error(f"--changed-sinceの差分を取得できません: {e}")
+        args.files.extend(str(path) for path in changed)
+        # --rootは差分を絞り込む範囲として使ったので、ツリー全体の検証はしない
+        args.root = None
+
+    if args.stream:
+        sys.exit(run_stream_mode(report_memo_stats=args.stats))
 
-    if args.files:
+    if args.files or args.root or args.changed_since is not None:
         # CLIモード
         sys.exit(run_cli_mode(args))
     else:
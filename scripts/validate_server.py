@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+プラグイン検証の常駐サーバー
+
+バリデーターをimport済みの状態で待ち受け、validate_client.py から転送された
+hook入力を検証する。hookごとのインタプリタ起動とimportのコストを省くためのもの。
+
+プロトコル:
+  validate_plugin.py --stream と同じNDJSON。クライアントはhook入力を1行1件で送り、
+  サーバーは1件ごとに応答を1行返す（出力なしの場合は {} ）。1接続で複数件を送ってよく、
+  クライアントが書き込み側をshutdownするとサーバーは残りに応答してから切断する。
+
+使用方法:
+  python3 validate_server.py [--socket PATH] [--idle-timeout SECONDS] [--parse-memo-mb MB]
+                             [--suppression-config PATH]
+
+同じ内容のフロントマター・JSONの解析結果は validators/parse_memo.py のLRUで使い回す。
+終了時にメモのヒット・ミス・追い出しの回数をstderrに出力する。
+
+バリデーターのコードを変更した場合はサーバーを再起動すること。
+"""
+
+import argparse
+import os
+import socket
+import socketserver
+import sys
+from pathlib import Path
+
+import validate_plugin
+from validate_client import default_socket_path
+from validators.parse_memo import DEFAULT_MAX_BYTES, ParseMemo
+
+
+class _HookRequestHandler(socketserver.StreamRequestHandler):
+    """1行1件のhook入力を順に処理するハンドラー"""
+
+    def handle(self):
+        for raw_line in self.rfile:
+            line = raw_line.decode("utf-8", errors="replace")
+            if not line.strip():
+                continue
+            response = validate_plugin.handle_hook_line(line)
+            self.wfile.write(response.encode("utf-8") + b"\n")
+
+
+class ValidationServer(socketserver.ThreadingUnixStreamServer):
+    """検証サーバー本体"""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: Path,
+        idle_timeout: float | None = None,
+        parse_memo_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.timed_out = False
+        _prepare_socket_path(socket_path)
+        # 初回リクエストでimportが発生しないようにする
+        validate_plugin.preload_validators()
+        # 編集中に繰り返し検証される内容の解析結果を使い回す（0なら使わない）
+        self.parse_memo = ParseMemo(parse_memo_bytes) if parse_memo_bytes > 0 else None
+        if self.parse_memo is not None:
+            self.parse_memo.install()
+        super().__init__(str(socket_path), _HookRequestHandler)
+        os.chmod(socket_path, 0o600)
+        if idle_timeout:
+            self.timeout = idle_timeout
+
+    def handle_timeout(self):
+        self.timed_out = True
+
+    def serve(self):
+        """リクエストを処理し続ける（idle_timeout指定時は無通信が続くと終了する）"""
+        if not self.idle_timeout:
+            self.serve_forever()
+            return
+        while not self.timed_out:
+            self.handle_request()
+
+    def server_close(self):
+        super().server_close()
+        if self.parse_memo is not None:
+            self.parse_memo.uninstall()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _prepare_socket_path(socket_path: Path) -> None:
+    """ソケットの親ディレクトリを作成し、残骸のソケットファイルを削除する
+
+    既に別のサーバーが応答している場合はFileExistsErrorを送出する。
+    """
+    socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    if not socket_path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            # 応答しないソケットは前回の異常終了の残骸
+            socket_path.unlink()
+            return
+    raise FileExistsError(f"検証サーバーは既に起動しています: {socket_path}")
+
+
+def main():
+    """メインエントリーポイント"""
+    parser = argparse.ArgumentParser(description="プラグイン検証の常駐サーバーを起動する")
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        help="Unixドメインソケットのパス（省略時は${CLAUDE_PLUGIN_DATA}/validate-plugin.sock）",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=0,
+        help="指定秒数リクエストがなければ終了する（0は無期限）",
+    )
+    parser.add_argument(
+        "--parse-memo-mb",
+        type=float,
+        default=DEFAULT_MAX_BYTES / (1024 * 1024),
+        help="解析結果のメモの容量（MB、0で無効）",
+    )
+    parser.add_argument(
+        "--suppression-config",
+        type=Path,
+        metavar="PATH",
+        help="抑制するルールIDを書いた設定ファイル（validate_plugin.pyと同じ形式。"
+        "省略時はカレントディレクトリを含むgitリポジトリのルートのものを使う）",
+    )
+    args = parser.parse_args()
+    try:
+        validate_plugin.configure_suppressions(
+            args.suppression_config or validate_plugin.find_suppression_config(Path.cwd())
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    socket_path = args.socket or default_socket_path()
+    try:
+        server = ValidationServer(
+            socket_path,
+            idle_timeout=args.idle_timeout,
+            parse_memo_bytes=int(args.parse_memo_mb * 1024 * 1024),
+        )
+    except FileExistsError as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
+
+    with server:
+        try:
+            server.serve()
+        except KeyboardInterrupt:
+            pass
+    if server.parse_memo is not None:
+        print(server.parse_memo.format_stats(), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
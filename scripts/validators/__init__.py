@@ -1,33 +1,52 @@
 """
 プラグイン検証バリデーター
+
+各バリデーターモジュールは属性に初めてアクセスした時点で読み込む（遅延import）。
+hookは1回の実行で1ファイルしか検証しないため、使わないバリデーターの
+import時間を払わずに済む。`from validators import validate_skill` のような
+従来のimportはモジュールレベルの __getattr__ によりそのまま動作する。
+
+どのファイルをどのバリデーターで検証するかは registry.py の登録内容で決まる。
 """
 
-from .agent import validate_agent
-from .base import ValidationResult, parse_frontmatter, parse_json_safe
-from .hooks_json import validate_hooks_json
-from .lsp_json import validate_lsp_json
-from .marketplace_json import validate_marketplace_json
-from .mcp_json import validate_mcp_json
-from .monitors_json import validate_monitors_json
-from .output_style import validate_output_style
-from .plugin_json import validate_plugin_json
-from .readme import validate_readme
-from .skill import validate_skill
-from .slash_command import validate_slash_command
+from .registry import ValidatorSpec, classify, module_for_function, register, registered_validators
 
+# 公開名 -> 定義元モジュール（このパッケージ内のモジュール名）
+_LAZY_ATTRIBUTES = {
+    "ValidationResult": "base",
+    "Diagnostic": "base",
+    "BodyView": "base",
+    "ParsedDocument": "base",
+    "Metrics": "base",
+    "collect_metrics": "base",
+    "parse_frontmatter": "base",
+    "parse_document": "base",
+    "parse_json_safe": "base",
+}
+
+# バリデーター関数はregistryへの登録内容から公開する
 __all__ = [
-    "ValidationResult",
-    "parse_frontmatter",
-    "parse_json_safe",
-    "validate_slash_command",
-    "validate_agent",
-    "validate_skill",
-    "validate_hooks_json",
-    "validate_mcp_json",
-    "validate_lsp_json",
-    "validate_marketplace_json",
-    "validate_monitors_json",
-    "validate_output_style",
-    "validate_plugin_json",
-    "validate_readme",
+    "ValidatorSpec",
+    "classify",
+    "register",
+    "registered_validators",
+    *_LAZY_ATTRIBUTES,
+    *(spec.function for spec in registered_validators()),
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name) or module_for_function(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # `from .module import name` と同じ相対import。importlib.import_module と違い
+    # -X importtime の計測対象にもなる
+    module = __import__(module_name, globals(), fromlist=(name,), level=1)
+    value = getattr(module, name)
+    # 2回目以降は通常の属性参照で解決されるようにキャッシュする
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
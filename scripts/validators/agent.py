@@ -8,35 +8,47 @@ from pathlib import Path
 from .base import (
     ValidationResult,
     add_yaml_warnings,
-    parse_frontmatter,
+    parse_document,
     to_str,
     validate_allow_ask_glob_fields,
     validate_effort_field,
     validate_kebab_case,
     validate_string_or_list_field,
+    with_suppressions,
 )
 
 
 def _validate_task_syntax(tools_str: str) -> bool:
     """Task(agent_type)構文の妥当性を検証する"""
-    # Task(xxx) の形式をチェック（xxxは空でない）
-    pattern = r"Task\([^)]+\)"
-    matches = re.findall(pattern, tools_str)
-    if not matches:
-        return False
-    # すべてのマッチが有効な形式かチェック
-    for match in matches:
-        # Task() の中身が空でないことを確認
-        inner = match[5:-1]  # "Task(" と ")" を除去
-        if not inner.strip():
+    # Task(xxx) の形式をチェック（xxxは空でない）。正規表現 Task\([^)]+\) と同じ箇所を
+    # 探すが、閉じない "Task(" が大量に続く入力でも線形時間で終わるようにfindで走査する
+    found = False
+    start = tools_str.find("Task(")
+    while start != -1:
+        inner_start = start + len("Task(")
+        close = tools_str.find(")", inner_start)
+        if close == -1:
+            # 以降の "Task(" にも閉じ括弧はない
+            break
+        if close == inner_start:
+            # "Task()" は一致しない（次の位置から探し直す）
+            start = tools_str.find("Task(", start + 1)
+            continue
+        # Task() の中身が空白だけでないことを確認
+        if not tools_str[inner_start:close].strip():
             return False
-    return True
+        found = True
+        start = tools_str.find("Task(", close + 1)
+    return found
 
 
+@with_suppressions
 def validate_agent(file_path: Path, content: str) -> ValidationResult:
     """サブエージェントを検証する"""
     result = ValidationResult()
-    frontmatter, body, yaml_warnings = parse_frontmatter(content)
+    document = parse_document(content)
+    frontmatter = document.frontmatter
+    lines = document.field_lines
 
     # nameフィールドを持たない.mdはエージェント定義として扱わない
     # （agents/配下のREADME.md等のドキュメント用ファイルには警告を一切出さない。
@@ -46,21 +58,29 @@ def validate_agent(file_path: Path, content: str) -> ValidationResult:
     if not name_str:
         return result
 
-    add_yaml_warnings(result, file_path, yaml_warnings)
+    add_yaml_warnings(result, file_path, document.yaml_warnings, document.yaml_warning_lines)
 
     # kebab-case（小文字とハイフンのみ）チェック
     kebab_error = validate_kebab_case(name_str)
     if kebab_error:
-        result.add_error(f"{file_path.name}: {kebab_error}")
+        result.add_error(kebab_error, file=file_path, rule="name-value", line=lines.get("name"))
 
     # descriptionの確認
     description = frontmatter.get("description", "")
     description_str = to_str(description)
     if not description_str:
-        result.add_error(f"{file_path.name}: descriptionが必須です")
+        result.add_error(
+            "descriptionが必須です",
+            file=file_path,
+            rule="description-value",
+            line=lines.get("description"),
+        )
     elif len(description_str) < 20:
         result.add_warning(
-            f"{file_path.name}: descriptionが短すぎます。いつ使うべきかを明確に記述してください"
+            "descriptionが短すぎます。いつ使うべきかを明確に記述してください",
+            file=file_path,
+            rule="short-description",
+            line=lines.get("description"),
         )
 
     # modelの値チェック（v2.1.74以降: フルモデルIDも使用可能）
@@ -75,8 +95,11 @@ def validate_agent(file_path: Path, content: str) -> ValidationResult:
         and not full_model_id_pattern.match(model_str)
     ):
         result.add_warning(
-            f"{file_path.name}: modelが不正: {model_str}"
-            f"（sonnet/opus/haiku/inherit またはフルモデルID例: claude-sonnet-4-6）"
+            "modelが不正: {}（sonnet/opus/haiku/inherit またはフルモデルID例: claude-sonnet-4-6）",
+            model_str,
+            file=file_path,
+            rule="model-value",
+            line=lines.get("model"),
         )
 
     # permissionModeの値チェック
@@ -84,7 +107,13 @@ def validate_agent(file_path: Path, content: str) -> ValidationResult:
     permission_mode_str = to_str(permission_mode)
     valid_modes = ["default", "manual", "acceptEdits", "bypassPermissions", "plan", "dontAsk", ""]
     if permission_mode_str and permission_mode_str not in valid_modes:
-        result.add_error(f"{file_path.name}: permissionModeの値が不正です: {permission_mode_str}")
+        result.add_error(
+            "permissionModeの値が不正です: {}",
+            permission_mode_str,
+            file=file_path,
+            rule="permission-mode-value",
+            line=lines.get("permissionMode"),
+        )
 
     # memoryの値チェック（v2.1.33以降）
     memory = frontmatter.get("memory", "")
@@ -92,7 +121,11 @@ def validate_agent(file_path: Path, content: str) -> ValidationResult:
     valid_memory_scopes = ["user", "project", "local", ""]
     if memory_str and memory_str not in valid_memory_scopes:
         result.add_error(
-            f"{file_path.name}: memoryの値が不正です: {memory_str}（user/project/local）"
+            "memoryの値が不正です: {}（user/project/local）",
+            memory_str,
+            file=file_path,
+            rule="memory-value",
+            line=lines.get("memory"),
         )
 
     # isolationの値チェック（v2.1.50以降）
@@ -100,7 +133,13 @@ def validate_agent(file_path: Path, content: str) -> ValidationResult:
     isolation_str = to_str(isolation)
     valid_isolation_modes = ["worktree", ""]
     if isolation_str and isolation_str not in valid_isolation_modes:
-        result.add_error(f"{file_path.name}: isolationの値が不正です: {isolation_str}（worktree）")
+        result.add_error(
+            "isolationの値が不正です: {}（worktree）",
+            isolation_str,
+            file=file_path,
+            rule="isolation-value",
+            line=lines.get("isolation"),
+        )
 
     # effortの値チェック（v2.1.78以降、xhighはv2.1.111以降）
     validate_effort_field(
@@ -110,26 +149,37 @@ def validate_agent(file_path: Path, content: str) -> ValidationResult:
         ["low", "medium", "high", "xhigh", "max"],
         level="error",
         hint="low/medium/high/xhigh/max",
+        lines=lines,
     )
 
     # backgroundの値チェック（v2.1.49以降）
     background = frontmatter.get("background")
     if background is not None and not isinstance(background, bool):
         result.add_error(
-            f"{file_path.name}: backgroundはブール値（true/false）が必要です: {background}"
+            "backgroundはブール値（true/false）が必要です: {}",
+            background,
+            file=file_path,
+            rule="background-value",
+            line=lines.get("background"),
         )
 
     # initialPromptの値チェック（v2.1.83以降）
     initial_prompt = frontmatter.get("initialPrompt")
     if initial_prompt is not None and not isinstance(initial_prompt, str):
-        result.add_error(f"{file_path.name}: initialPromptは文字列が必要です: {initial_prompt}")
+        result.add_error(
+            "initialPromptは文字列が必要です: {}",
+            initial_prompt,
+            file=file_path,
+            rule="initial-prompt-value",
+            line=lines.get("initialPrompt"),
+        )
 
     # allow/askのツール名位置グロブを検証（v2.1.166以降）
-    validate_allow_ask_glob_fields(result, file_path, frontmatter)
+    validate_allow_ask_glob_fields(result, file_path, frontmatter, lines=lines)
 
     # toolsの確認（リスト形式検証）
     tools = frontmatter.get("tools")
-    validate_string_or_list_field(result, file_path, "tools", tools)
+    validate_string_or_list_field(result, file_path, "tools", tools, lines=lines)
     # Task(agent_type) 構文の検証
     if tools is not None:
         tools_str = (
@@ -137,19 +187,24 @@ def validate_agent(file_path: Path, content: str) -> ValidationResult:
         )
         if "Task(" in tools_str and not _validate_task_syntax(tools_str):
             result.add_warning(
-                f"{file_path.name}: Task()構文の形式を確認してください（例: Task(agent-name)）"
+                "Task()構文の形式を確認してください（例: Task(agent-name)）",
+                file=file_path,
+                rule="task-syntax",
+                line=lines.get("tools"),
             )
 
     # disallowedToolsの確認（リスト形式検証）
     validate_string_or_list_field(
-        result, file_path, "disallowedTools", frontmatter.get("disallowedTools")
+        result, file_path, "disallowedTools", frontmatter.get("disallowedTools"), lines=lines
     )
 
     # skillsの確認（リスト形式検証）
-    validate_string_or_list_field(result, file_path, "skills", frontmatter.get("skills"))
+    validate_string_or_list_field(
+        result, file_path, "skills", frontmatter.get("skills"), lines=lines
+    )
 
     # 本文（システムプロンプト）の確認
-    if not body.strip():
-        result.add_warning(f"{file_path.name}: システムプロンプト（本文）が空です")
+    if document.body.is_blank():
+        result.add_warning("システムプロンプト（本文）が空です", file=file_path, rule="empty-body")
 
     return result
@@ -2,51 +2,541 @@
 共通ユーティリティ: ValidationResult と parse_frontmatter
 """
 
+import bisect
+import functools
 import json
 import re
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Any
 
 # kebab-case検証用の正規表現（プリコンパイル）
 KEBAB_CASE_PATTERN = re.compile(r"^[a-z0-9]+(-[a-z0-9]+)*$")
 
-# 警告スキップコメントの正規表現
-# 形式: <!-- validator-disable warning-id -->
-DISABLE_PATTERN = re.compile(r"<!--\s*validator-disable\s+([\w-]+)\s*-->")
+# ルールを抑制するコメントの正規表現
+# 形式: <!-- validator-disable rule-id -->（ファイル全体）
+#       <!-- validator-disable-next-line rule-id -->（次の1行）
+#       <!-- validator-disable-start rule-id --> 〜 <!-- validator-disable-end rule-id -->
+SUPPRESSION_PATTERN = re.compile(
+    r"<!--\s*validator-disable(-next-line|-start|-end)?\s+([\w-]+)\s*-->"
+)
 
-# 警告ID定数
+# 行範囲の抑制で終わりの指定がない場合の終端行
+_END_OF_FILE = sys.maxsize
+
+# ルールID定数（validator-disable で抑制できる）
 WARNING_DANGEROUS_OPERATION = "dangerous-operation"
 WARNING_BROAD_BASH_WILDCARD = "broad-bash-wildcard"
 
+# Diagnostic の重要度（SARIFのlevelと同じ値）
+SEVERITY_ERROR = "error"
+SEVERITY_WARNING = "warning"
+
 # ブール値として有効な文字列表現（true/false に加え、大文字小文字区別なしで許可）
 BOOLEAN_LIKE_STRINGS = {"true", "false", "yes", "no", "on", "off", "1", "0"}
 
+# 解析（フロントマター・JSON）1回ごとの所要時間（ナノ秒）を受け取るコールバック。
+# --profile 実行時だけ設定され、通常はNone
+_parse_observer: Callable[[int], None] | None = None
 
-class ValidationResult:
-    """検証結果を管理するクラス"""
+
+def set_parse_observer(observer: Callable[[int], None] | None) -> None:
+    """解析処理の所要時間を受け取るコールバックを設定する（Noneで解除）"""
+    global _parse_observer
+    _parse_observer = observer
+
+
+# 常駐サーバー・ストリームモードで設定される解析結果のメモ（parse_memo.ParseMemo）。
+# 通常はNone
+_parse_memo = None
+
+
+def set_parse_memo(memo) -> None:
+    """parse_document() などが使う解析結果のメモを設定する（Noneで解除）"""
+    global _parse_memo
+    _parse_memo = memo
+
+
+def _observed_parse(func):
+    """解析関数の所要時間を _parse_observer と集計中の Metrics に通知するデコレーター"""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        observer = _parse_observer
+        metrics = _active_metrics
+        if observer is None and metrics is None:
+            return func(*args, **kwargs)
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            if observer is not None:
+                observer(elapsed)
+            if metrics is not None:
+                metrics.parse_ns += elapsed
+
+    return wrapper
+
+
+class Metrics:
+    """ファイル1件の検証コストの内訳（--stats 実行時だけ集計する）
+
+    bytes_read: 読み込んだ内容のバイト数（UTF-8）
+    parse_ns: フロントマター・JSONの解析時間
+    rule_ns: バリデーター呼び出しのうち解析以外の時間
+    rules_evaluated: @rule を付けた検証ルールの評価回数
+    regex_scans: 内容全体に対する正規表現の走査回数
+    stat_calls: ファイルシステムへの問い合わせ回数（READMEのリンク先の存在確認など）
+    """
+
+    __slots__ = (
+        "bytes_read",
+        "parse_ns",
+        "rule_ns",
+        "rules_evaluated",
+        "regex_scans",
+        "stat_calls",
+    )
 
     def __init__(self):
-        self.errors: list[str] = []
-        self.warnings: list[str] = []
+        for name in self.__slots__:
+            setattr(self, name, 0)
 
-    def add_error(self, message: str):
-        self.errors.append(message)
+    def add(self, other: "Metrics") -> None:
+        """otherの値を加算する"""
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
 
-    def add_warning(self, message: str):
-        self.warnings.append(message)
+    def to_dict(self) -> dict[str, int]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+# 集計中の Metrics。collect_metrics() の中だけ設定され、通常はNone
+_active_metrics: Metrics | None = None
+
+
+@contextmanager
+def collect_metrics(metrics: Metrics) -> Iterator[Metrics]:
+    """withブロック内の解析時間・ルール評価・正規表現の走査・stat呼び出しをmetricsに集計する"""
+    global _active_metrics
+    previous = _active_metrics
+    _active_metrics = metrics
+    try:
+        yield metrics
+    finally:
+        _active_metrics = previous
+
+
+def count_regex_scans(count: int = 1) -> None:
+    """内容全体に対する正規表現の走査を集計する（集計中でなければ何もしない）"""
+    metrics = _active_metrics
+    if metrics is not None:
+        metrics.regex_scans += count
+
+
+def count_stat_call() -> None:
+    """ファイルシステムへの問い合わせを集計する（集計中でなければ何もしない）"""
+    metrics = _active_metrics
+    if metrics is not None:
+        metrics.stat_calls += 1
+
+
+# ルール評価ごとに (ファイル, ルールID, 所要時間(ns), 結果) を受け取るコールバック。
+# 結果は RULE_OUTCOMES のいずれか。通常はNone
+RuleTracer = Callable[["Path | None", str, int, str], None]
+_rule_tracer: RuleTracer | None = None
+
+# pass: 問題なし / warning: 警告を追加 / error: エラーを追加 / exception: 例外で中断
+RULE_OUTCOMES = ("pass", "warning", "error", "exception")
+
+
+def set_rule_tracer(tracer: RuleTracer | None) -> None:
+    """ルール評価を受け取るトレーサーを設定する（Noneで解除）"""
+    global _rule_tracer
+    _rule_tracer = tracer
+
+
+class Suppressions:
+    """1ファイルの検証に適用するルールの抑制
+
+    rules のルールIDの問題はすべて取り除く（@rule のルールは実行もしない）。
+    ranges（ルールID -> (開始行, 終了行) のリスト）のルールIDの問題は、範囲内の行を
+    指すものだけを取り除く。directives は内容中の指定の (ルールID, 行) で、
+    未知のルールIDの警告に使う。
+    """
+
+    __slots__ = ("rules", "ranges", "directives")
+
+    def __init__(
+        self,
+        rules: frozenset[str] = frozenset(),
+        ranges: dict[str, list[tuple[int, int]]] | None = None,
+        directives: list[tuple[str, int]] | None = None,
+    ):
+        self.rules = rules
+        self.ranges = ranges or {}
+        self.directives = directives or []
+
+    def covers(self, rule_id: str, line: int) -> bool:
+        """ルールの問題がその行で抑制されているか"""
+        return any(start <= line <= end for start, end in self.ranges.get(rule_id, ()))
+
+    def suppresses(self, diagnostic: "Diagnostic") -> bool:
+        """問題が抑制されているか（行を持たない問題は行範囲では抑制されない）"""
+        rule_id = diagnostic.rule_id
+        if rule_id in self.rules:
+            return True
+        return diagnostic.line is not None and self.covers(rule_id, diagnostic.line)
+
+
+# リポジトリ全体で抑制するルールID（設定ファイルの "disable"）
+_repo_suppressed_rules: frozenset[str] = frozenset()
+
+# 検証中のファイルに適用する抑制。常駐サーバーは複数のスレッドで検証するため
+# ContextVar でスレッドごとに持つ。抑制がなければNone
+_active_suppressions: ContextVar[Suppressions | None] = ContextVar(
+    "active_suppressions", default=None
+)
+
+# 検証中のMarkdownの (内容, 解析結果)。with_suppressions が抑制を読むために解析したものを
+# バリデーター本体の parse_document() でも使い、1ファイルを1回だけ解析する
+# （解析結果のメモから返った解析結果の content は別の文字列のことがあるため、内容も持つ）
+_active_document: ContextVar[tuple[str, "ParsedDocument"] | None] = ContextVar(
+    "active_document", default=None
+)
+
+
+# @rule で定義されたルールID。内容中の指定が既知のルールIDかの判定に使う
+_defined_rule_ids: set[str] = set()
+
+
+def set_repo_suppressions(rule_ids: Iterable[str]) -> None:
+    """リポジトリ全体で抑制するルールIDを設定する"""
+    global _repo_suppressed_rules
+    _repo_suppressed_rules = frozenset(rule_ids)
+
+
+def repo_suppressions() -> frozenset[str]:
+    """リポジトリ全体で抑制しているルールID"""
+    return _repo_suppressed_rules
+
+
+def load_suppression_config(path: Path) -> frozenset[str]:
+    """設定ファイル（{"disable": ["rule-id", ...]}）から抑制するルールIDを読み込む
+
+    Raises:
+        ValueError: JSONとして読めない、または形式が不正な場合
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"{path}: 設定ファイルを読み込めません: {e}") from e
+    disable = data.get("disable", []) if isinstance(data, dict) else None
+    if not isinstance(disable, list) or not all(isinstance(i, str) and i for i in disable):
+        raise ValueError(f"{path}: disableはルールIDの配列で指定してください")
+    return frozenset(disable)
+
+
+def suppressions_for(document: "ParsedDocument | None") -> Suppressions | None:
+    """リポジトリ全体の抑制と文書中の validator-disable 指定を合わせる（なければNone）
+
+    documentがNoneの場合はリポジトリ全体の抑制だけを返す。文書の Suppressions は
+    解析結果のメモで共有されうるため書き換えない。
+    """
+    repo_rules = _repo_suppressed_rules
+    suppressions = document.suppressions if document is not None else None
+    if suppressions is None:
+        return Suppressions(repo_rules) if repo_rules else None
+    if not repo_rules:
+        return suppressions
+    return Suppressions(
+        suppressions.rules | repo_rules, suppressions.ranges, suppressions.directives
+    )
+
+
+def with_suppressions(func=None, *, comments: bool = True):
+    """バリデーター関数（file_path, content を受け取る）に抑制を適用するデコレーター
+
+    Markdownは parse_document() の解析結果が持つ validator-disable 指定を使い、
+    関数の中の parse_document() には同じ解析結果を返す。関数の実行中に呼ばれた
+    @rule のルールが、抑制の指定に従って省かれる。関数が返した結果からは
+    抑制されたルールIDの問題を取り除き、指定にある未知のルールIDを警告する。
+    JSONのバリデーターは @with_suppressions(comments=False) とし、設定ファイルによる
+    リポジトリ全体の抑制だけを適用する（JSONにはコメントがなく、文字列の値に書かれた
+    validator-disable で秘密情報の検出などを止められないようにする）。
+    """
+    if func is None:
+        return functools.partial(with_suppressions, comments=comments)
+
+    @functools.wraps(func)
+    def wrapper(file_path: Path, content: str):
+        document = parse_document(content) if comments else None
+        suppressions = suppressions_for(document)
+        document_token = _active_document.set(None if document is None else (content, document))
+        token = _active_suppressions.set(suppressions)
+        try:
+            result = func(file_path, content)
+        finally:
+            _active_suppressions.reset(token)
+            _active_document.reset(document_token)
+        if suppressions is not None and isinstance(result, ValidationResult):
+            _warn_unknown_directives(result, file_path, suppressions)
+            result.diagnostics = [
+                diagnostic
+                for diagnostic in result.diagnostics
+                if not suppressions.suppresses(diagnostic)
+            ]
+        return result
+
+    return wrapper
+
+
+def _warn_unknown_directives(
+    result: "ValidationResult", file_path: Path, suppressions: Suppressions
+) -> None:
+    """内容中の指定にある未知のルールIDを警告する（設定ファイルの未知のルールIDと同じ扱い）"""
+    from .registry import RULE_IDS
+
+    for rule_id, line in suppressions.directives:
+        if rule_id not in RULE_IDS and rule_id not in _defined_rule_ids:
+            result.add_warning(
+                "未知のルールIDです: {}", rule_id, file=file_path, rule="unknown-rule-id", line=line
+            )
+
+
+def rule(func_or_id):
+    """検証ルール（結果に問題を追加する関数）であることを示すデコレーター
+
+    @rule("rule-id") でルールIDを指定する（@rule だけの場合は関数名）。ルールIDで
+    抑制されていれば関数を呼ばずに戻る。ルールが追加した問題のうちルールIDを
+    持たないものにはこのルールIDを付ける（add_error / add_warning の rule= や、
+    ルールの中で呼んだ別のルールのIDが優先される）。集計中は評価回数を Metrics.rules_evaluated に加算し、
+    トレーサーが設定されていれば評価ごとに通知する。
+    """
+    if isinstance(func_or_id, str):
+        return functools.partial(_make_rule, rule_id=func_or_id)
+    return _make_rule(func_or_id, func_or_id.__name__)
+
+
+def _make_rule(func, rule_id: str):
+    def evaluate(args: tuple, kwargs: dict):
+        metrics = _active_metrics
+        if metrics is not None:
+            metrics.rules_evaluated += 1
+        if _rule_tracer is None:
+            return func(*args, **kwargs)
+        return _traced_call(func, rule_id, args, kwargs)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        suppressions = _active_suppressions.get()
+        if suppressions is not None and rule_id in suppressions.rules:
+            return None
+        result = _find_argument(ValidationResult, args, kwargs)
+        if result is None:
+            return evaluate(args, kwargs)
+        diagnostics = result.diagnostics
+        before = len(diagnostics)
+        value = evaluate(args, kwargs)
+        for i in range(before, len(diagnostics)):
+            if diagnostics[i].rule_id is None:
+                diagnostics[i].rule_id = rule_id
+        return value
+
+    wrapper.rule_id = rule_id
+    _defined_rule_ids.add(rule_id)
+    return wrapper
+
+
+def _find_argument(cls: type, args: tuple, kwargs: dict):
+    """引数の中から最初の cls のインスタンスを返す（なければNone）"""
+    for value in args:
+        if isinstance(value, cls):
+            return value
+    for value in kwargs.values():
+        if isinstance(value, cls):
+            return value
+    return None
+
+
+def _traced_call(func, rule_id: str, args: tuple, kwargs: dict):
+    """ルールを実行し、所要時間と結果をトレーサーに通知する
+
+    ファイルと検証結果は引数の中の Path と ValidationResult から取得する。
+    """
+    tracer = _rule_tracer
+    file_path = _find_argument(Path, args, kwargs)
+    result = _find_argument(ValidationResult, args, kwargs)
+    before = len(result.diagnostics) if result is not None else 0
+    outcome = "exception"
+    start = time.perf_counter_ns()
+    try:
+        value = func(*args, **kwargs)
+        added = result.diagnostics[before:] if result is not None else []
+        if any(diagnostic.severity == SEVERITY_ERROR for diagnostic in added):
+            outcome = "error"
+        elif added:
+            outcome = "warning"
+        else:
+            outcome = "pass"
+        return value
+    finally:
+        tracer(file_path, rule_id, time.perf_counter_ns() - start, outcome)
+
+
+class Diagnostic:
+    """検証で見つかった問題1件
+
+    メッセージは書式テンプレートと引数のまま保持し、出力する時点（message()）で
+    初めて文字列にする。問題のないファイルや件数だけを数える処理では
+    文字列の組み立てを行わない。fileを指定した場合は「ファイル名: 」を先頭に付ける。
+    引数がない場合はテンプレートをそのままメッセージとして使う（書式化しない）。
+    """
+
+    __slots__ = ("severity", "template", "args", "file", "rule_id", "line", "column")
+
+    def __init__(
+        self,
+        severity: str,
+        template: str,
+        args: tuple = (),
+        file: Path | None = None,
+        rule_id: str | None = None,
+        line: int | None = None,
+        column: int | None = None,
+    ):
+        self.severity = severity
+        self.template = template
+        self.args = args
+        self.file = file
+        self.rule_id = rule_id
+        self.line = line
+        self.column = column
+
+    def message(self) -> str:
+        """表示用のメッセージを組み立てる"""
+        text = self.template.format(*self.args) if self.args else self.template
+        if self.file is None:
+            return text
+        return f"{self.file.name}: {text}"
+
+    def key(self) -> tuple:
+        """同じ問題かどうかの判定（重複の除去）に使うキー"""
+        return (
+            self.severity,
+            self.rule_id,
+            self.file,
+            self.line,
+            self.column,
+            self.template,
+            self.args,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Diagnostic):
+            return NotImplemented
+        return self.key() == other.key()
+
+    __hash__ = None  # type: ignore[assignment]  # argsにリストなどを含みうるため
+
+    def __repr__(self) -> str:
+        return f"Diagnostic({self.severity!r}, {self.message()!r})"
+
+    def to_dict(self) -> dict:
+        """機械可読な形式（メッセージは組み立て済み）に変換する"""
+        return {
+            "severity": self.severity,
+            "message": self.message(),
+            "rule": self.rule_id,
+            "line": self.line,
+            "column": self.column,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Diagnostic":
+        """to_dict() の結果から復元する（メッセージは組み立て済みのものを使う）"""
+        return cls(
+            data["severity"],
+            data["message"],
+            rule_id=data["rule"],
+            line=data["line"],
+            column=data["column"],
+        )
+
+
+class ValidationResult:
+    """検証結果を管理するクラス
+
+    問題は Diagnostic として diagnostics に発生順で保持する。errors / warnings は
+    参照されるたびにメッセージを組み立てて返す。
+    """
+
+    def __init__(self):
+        self.diagnostics: list[Diagnostic] = []
+        # 結果が依存するファイルシステムの状態（パス -> 存在したか）。結果キャッシュの有効性判定に使う
+        self.path_checks: dict[str, bool] = {}
+        # --stats 実行時の検証コスト。集計しない場合はNone
+        self.metrics: Metrics | None = None
+
+    def add_error(
+        self,
+        template: str,
+        *args: Any,
+        file: Path | None = None,
+        rule: str | None = None,
+        line: int | None = None,
+        column: int | None = None,
+    ):
+        self.diagnostics.append(
+            Diagnostic(SEVERITY_ERROR, template, args, file, rule, line, column)
+        )
+
+    def add_warning(
+        self,
+        template: str,
+        *args: Any,
+        file: Path | None = None,
+        rule: str | None = None,
+        line: int | None = None,
+        column: int | None = None,
+    ):
+        self.diagnostics.append(
+            Diagnostic(SEVERITY_WARNING, template, args, file, rule, line, column)
+        )
+
+    def by_severity(self, severity: str) -> list[Diagnostic]:
+        return [diagnostic for diagnostic in self.diagnostics if diagnostic.severity == severity]
+
+    @property
+    def errors(self) -> list[str]:
+        return [diagnostic.message() for diagnostic in self.by_severity(SEVERITY_ERROR)]
+
+    @property
+    def warnings(self) -> list[str]:
+        return [diagnostic.message() for diagnostic in self.by_severity(SEVERITY_WARNING)]
 
     def has_errors(self) -> bool:
-        return bool(self.errors)
+        return any(diagnostic.severity == SEVERITY_ERROR for diagnostic in self.diagnostics)
+
+    def has_warnings(self) -> bool:
+        return any(diagnostic.severity == SEVERITY_WARNING for diagnostic in self.diagnostics)
 
     def to_message(self) -> str:
         lines = []
-        if self.errors:
+        errors = self.errors
+        if errors:
             lines.append("❌ エラー:")
-            for e in self.errors:
+            for e in errors:
                 lines.append(f"  - {e}")
-        if self.warnings:
+        warnings = self.warnings
+        if warnings:
             lines.append("⚠️ 警告:")
-            for w in self.warnings:
+            for w in warnings:
                 lines.append(f"  - {w}")
         return "\n".join(lines)
 
@@ -113,12 +603,80 @@ def _convert_yaml_value(value: str) -> Any:
     return value
 
 
-def _find_frontmatter_boundary(lines: list[str]) -> int:
-    """フロントマターの終了行インデックスを返す。見つからなければ-1"""
-    for i, line in enumerate(lines[1:], 1):
-        if line.strip() == "---":
-            return i
-    return -1
+def locate_frontmatter(content: str) -> tuple[int, int, int] | None:
+    """
+    フロントマターの位置をオフセットで返す（文書全体を行に分割しない）
+
+    1行目が "---" で始まり、2行目以降に前後の空白を除くと "---" だけの行がある場合に、
+    (YAMLの開始, YAMLの終了, 本文の開始) を返す。YAMLの範囲は閉じ行の直前の改行を含まない。
+    フロントマターがなければNone。
+
+    閉じ行の候補は str.find で "---" を探して飛ぶため、本文がどれだけ長くても
+    走査するのはフロントマターの範囲だけになる。
+    """
+    if not content.startswith("---"):
+        return None
+    yaml_start = content.find("\n") + 1
+    if yaml_start == 0:
+        return None
+
+    pos = yaml_start
+    while True:
+        marker = content.find("---", pos)
+        if marker == -1:
+            return None
+        newline = content.rfind("\n", pos, marker)
+        line_start = pos if newline == -1 else newline + 1
+        line_end = content.find("\n", marker)
+        if line_end == -1:
+            line_end = len(content)
+        if content[line_start:line_end].strip() == "---":
+            yaml_end = max(yaml_start, line_start - 1)
+            return yaml_start, yaml_end, min(line_end + 1, len(content))
+        # 同じ行にある "---" はどれも閉じ行にならないので次の行から探す
+        pos = line_end + 1
+
+
+class BodyView:
+    """
+    フロントマターの後ろの本文
+
+    元の文字列と本文の開始オフセットだけを持ち、str() するまで本文を複製しない。
+    長いSKILL.mdなどでも、空かどうか・行数・正規表現の検索は元の文字列の上で行う。
+    """
+
+    __slots__ = ("content", "start")
+
+    # 空白以外の文字
+    _NON_SPACE = re.compile(r"\S")
+
+    def __init__(self, content: str, start: int = 0):
+        self.content = content
+        self.start = start
+
+    def __str__(self) -> str:
+        return self.content[self.start :]
+
+    def __len__(self) -> int:
+        return len(self.content) - self.start
+
+    def is_blank(self) -> bool:
+        """本文が空か空白だけか（not body.strip() と同じ）"""
+        return self._NON_SPACE.search(self.content, self.start) is None
+
+    def line_count(self) -> int:
+        """前後の空白を除いた本文の行数（len(body.strip().split("\n")) と同じ）"""
+        first = self._NON_SPACE.search(self.content, self.start)
+        if first is None:
+            return 1
+        end = len(self.content)
+        while self.content[end - 1].isspace():
+            end -= 1
+        return self.content.count("\n", first.start(), end) + 1
+
+    def search(self, pattern: re.Pattern[str]) -> re.Match[str] | None:
+        """本文の範囲を正規表現で検索する"""
+        return pattern.search(self.content, self.start)
 
 
 class _FrontmatterParser:
@@ -127,9 +685,18 @@ class _FrontmatterParser:
     def __init__(self):
         self.frontmatter: dict[str, Any] = {}
         self.warnings: list[str] = []
+        # キー -> キーがある行、warnings と同じ順の警告の行（どちらも1始まり）
+        self.field_lines: dict[str, int] = {}
+        self.warning_lines: list[int] = []
+        self._line = 0
         self._list_key: str | None = None
         self._list_items: list[str] = []
 
+    def _warn(self, message: str):
+        """解析中の行の警告を追加する"""
+        self.warnings.append(message)
+        self.warning_lines.append(self._line)
+
     def _save_pending_list(self):
         """収集中のリストを保存する"""
         if self._list_key:
@@ -140,7 +707,7 @@ class _FrontmatterParser:
     def _handle_list_item(self, stripped: str):
         """リストアイテムを処理する"""
         if not self._list_key:
-            self.warnings.append("リスト/配列はキーの後に続く必要があります")
+            self._warn("リスト/配列はキーの後に続く必要があります")
             return
         item = "" if stripped == "-" else _strip_quotes(_strip_inline_comment(stripped[2:].strip()))
         self._list_items.append(item)
@@ -151,6 +718,7 @@ class _FrontmatterParser:
         key, value = line.split(":", 1)
         key = key.strip()
         value = _strip_inline_comment(value.strip())
+        self.field_lines[key] = self._line
 
         if not value:
             self._list_key = key
@@ -158,14 +726,15 @@ class _FrontmatterParser:
         else:
             self.frontmatter[key] = _convert_yaml_value(value)
 
-    def parse_line(self, line: str):
-        """1行を解析する"""
+    def parse_line(self, line: str, number: int = 0):
+        """1行を解析する（numberは文書の中の行番号）"""
+        self._line = number
         stripped = line.strip()
         if not stripped or stripped.startswith("#"):
             return
 
         if stripped in ("|", ">") or stripped.endswith("|") or stripped.endswith(">"):
-            self.warnings.append("複数行の値（|, >）はサポートされていません")
+            self._warn("複数行の値（|, >）はサポートされていません")
             self._save_pending_list()
             return
 
@@ -174,7 +743,7 @@ class _FrontmatterParser:
             return
 
         if line.startswith("  ") and ":" in line:
-            self.warnings.append("ネストされたオブジェクトはサポートされていません")
+            self._warn("ネストされたオブジェクトはサポートされていません")
             self._save_pending_list()
             return
 
@@ -186,6 +755,111 @@ class _FrontmatterParser:
         self._save_pending_list()
 
 
+class ParsedDocument:
+    """
+    フロントマター付きMarkdown 1ファイル分の解析結果
+
+    1ファイルにつき1回だけ作り、スキル・エージェント・スラッシュコマンド・出力スタイルの
+    検証ルールで共有する。フロントマターの範囲と解析結果、キーと警告の行、
+    validator-disable 指定、本文のビュー、行番号の索引を持つ。行番号の索引は、
+    最初に参照されたときに作る。
+    """
+
+    __slots__ = (
+        "content",
+        "frontmatter",
+        "yaml_warnings",
+        "yaml_warning_lines",
+        "field_lines",
+        "suppressions",
+        "frontmatter_span",
+        "body",
+        "_line_starts",
+    )
+
+    def __init__(
+        self,
+        content: str,
+        frontmatter: dict[str, Any],
+        yaml_warnings: list[str],
+        frontmatter_span: tuple[int, int] | None,
+        body: BodyView,
+        yaml_warning_lines: list[int] | None = None,
+        field_lines: dict[str, int] | None = None,
+        suppressions: Suppressions | None = None,
+    ):
+        self.content = content
+        self.frontmatter = frontmatter
+        self.yaml_warnings = yaml_warnings
+        # yaml_warnings と同じ順の、警告の対象の行
+        self.yaml_warning_lines = yaml_warning_lines or []
+        # フロントマターのキー -> キーがある行（1始まり）
+        self.field_lines = field_lines or {}
+        # 文書中の validator-disable 指定。指定がなければNone
+        self.suppressions = suppressions
+        # 生のYAMLの範囲（閉じ行の直前の改行を含まない）。フロントマターがなければNone
+        self.frontmatter_span = frontmatter_span
+        self.body = body
+        self._line_starts: list[int] | None = None
+
+    def line_of(self, offset: int) -> int:
+        """オフセットが何行目か（1始まり）"""
+        if self._line_starts is None:
+            starts = [0]
+            newline = self.content.find("\n")
+            while newline != -1:
+                starts.append(newline + 1)
+                newline = self.content.find("\n", newline + 1)
+            self._line_starts = starts
+        return bisect.bisect_right(self._line_starts, offset)
+
+
+def _parse_document(content: str) -> ParsedDocument:
+    active = _active_document.get()
+    if active is not None and active[0] is content:
+        return active[1]
+    memo = _parse_memo
+    if memo is not None:
+        return memo.get_or_parse("document", content, _parse_document_uncached)
+    return _parse_document_uncached(content)
+
+
+def _parse_document_uncached(content: str) -> ParsedDocument:
+    suppressions = parse_suppressions(content) if "validator-disable" in content else None
+    span = locate_frontmatter(content)
+    if span is None:
+        return ParsedDocument(content, {}, [], None, BodyView(content), suppressions=suppressions)
+
+    yaml_start, yaml_end, body_start = span
+    parser = _FrontmatterParser()
+    if yaml_end > yaml_start:
+        # YAMLは "---" の次の2行目から始まる
+        for number, line in enumerate(content[yaml_start:yaml_end].split("\n"), 2):
+            parser.parse_line(line, number)
+    parser.finalize()
+    return ParsedDocument(
+        content,
+        parser.frontmatter,
+        parser.warnings,
+        (yaml_start, yaml_end),
+        BodyView(content, body_start),
+        parser.warning_lines,
+        parser.field_lines,
+        suppressions,
+    )
+
+
+@_observed_parse
+def parse_document(content: str) -> ParsedDocument:
+    """
+    フロントマター付きMarkdownを解析する（フロントマターの扱いは parse_frontmatter() と同じ）
+
+    フロントマターの範囲だけを行に分割して解析し、本文は複製せず BodyView で持つ。
+    """
+    return _parse_document(content)
+
+
+@_observed_parse
 def parse_frontmatter(content: str) -> tuple[dict[str, Any], str, list[str]]:
     """
     YAMLフロントマターを解析する
@@ -201,21 +875,8 @@ def parse_frontmatter(content: str) -> tuple[dict[str, Any], str, list[str]]:
     Returns:
         tuple: (frontmatter辞書, 本文, 警告リスト)
     """
-    if not content.startswith("---"):
-        return {}, content, []
-
-    lines = content.split("\n")
-    end_idx = _find_frontmatter_boundary(lines)
-    if end_idx == -1:
-        return {}, content, []
-
-    body = "\n".join(lines[end_idx + 1 :])
-    parser = _FrontmatterParser()
-    for line in lines[1:end_idx]:
-        parser.parse_line(line)
-    parser.finalize()
-
-    return parser.frontmatter, body, parser.warnings
+    document = _parse_document(content)
+    return document.frontmatter, str(document.body), document.yaml_warnings
 
 
 def validate_kebab_case(name: str) -> str | None:
@@ -233,6 +894,7 @@ def validate_kebab_case(name: str) -> str | None:
     return None
 
 
+@_observed_parse
 def parse_json_safe(content: str, file_path: Path, result: ValidationResult) -> dict | None:
     """
     JSON文字列を安全にパースする
@@ -245,11 +907,23 @@ def parse_json_safe(content: str, file_path: Path, result: ValidationResult) ->
     Returns:
         パース成功時はdict、失敗時はNone（resultにエラーを追加）
     """
+    memo = _parse_memo
+    if memo is None:
+        data, error = _load_json(content)
+    else:
+        data, error = memo.get_or_parse("json", content, _load_json)
+    if error is not None:
+        result.add_error("JSONパースエラー: {}", error, file=file_path, rule="json-syntax")
+        return None
+    return data
+
+
+def _load_json(content: str) -> tuple[Any, str | None]:
+    """(JSONの値, None) または (None, パースエラーのメッセージ) を返す"""
     try:
-        return json.loads(content)
+        return json.loads(content), None
     except json.JSONDecodeError as e:
-        result.add_error(f"{file_path.name}: JSONパースエラー: {e}")
-        return None
+        return None, str(e)
 
 
 def normalize_path(path: str) -> str:
@@ -270,19 +944,36 @@ def normalize_path(path: str) -> str:
     return normalized.strip("/")
 
 
-def get_disabled_warnings(content: str) -> set[str]:
-    """
-    ファイル内容から無効化された警告IDを取得する
-
-    形式: <!-- validator-disable warning-id -->
+def parse_suppressions(content: str) -> Suppressions:
+    """ファイル内容の validator-disable 指定を読み取る
 
-    Args:
-        content: ファイル全体の内容
-
-    Returns:
-        無効化されている警告IDのset
+    <!-- validator-disable rule-id --> はファイル全体、-next-line は次の1行、
+    -start から -end まではその間の行でルールを抑制する（-end がなければファイル末尾まで）。
     """
-    return set(DISABLE_PATTERN.findall(content))
+    rules: set[str] = set()
+    ranges: dict[str, list[tuple[int, int]]] = {}
+    directives: list[tuple[str, int]] = []
+    open_ranges: dict[str, int] = {}
+    line = 1
+    position = 0
+    count_regex_scans()
+    for match in SUPPRESSION_PATTERN.finditer(content):
+        line += content.count("\n", position, match.start())
+        position = match.start()
+        scope, rule_id = match.groups()
+        directives.append((rule_id, line))
+        if scope is None:
+            rules.add(rule_id)
+        elif scope == "-next-line":
+            next_line = line + content.count("\n", match.start(), match.end()) + 1
+            ranges.setdefault(rule_id, []).append((next_line, next_line))
+        elif scope == "-start":
+            open_ranges.setdefault(rule_id, line)
+        elif rule_id in open_ranges:
+            ranges.setdefault(rule_id, []).append((open_ranges.pop(rule_id), line))
+    for rule_id, start in open_ranges.items():
+        ranges.setdefault(rule_id, []).append((start, _END_OF_FILE))
+    return Suppressions(frozenset(rules), ranges, directives)
 
 
 # ---------------------------------------------------------------------------
@@ -295,10 +986,21 @@ def to_str(value: Any) -> str:
     return str(value) if value else ""
 
 
-def add_yaml_warnings(result: ValidationResult, file_path: Path, yaml_warnings: list[str]) -> None:
-    """YAML警告をValidationResultに追加する"""
-    for w in yaml_warnings:
-        result.add_warning(f"{file_path.name}: {w}")
+def add_yaml_warnings(
+    result: ValidationResult,
+    file_path: Path,
+    yaml_warnings: list[str],
+    lines: list[int] | None = None,
+) -> None:
+    """YAML警告をValidationResultに追加する（linesは警告ごとの行）"""
+    for i, w in enumerate(yaml_warnings):
+        line = lines[i] if lines else None
+        result.add_warning(w, file=file_path, rule="yaml-syntax", line=line)
+
+
+def _field_line(lines: dict[str, int] | None, key: str) -> int | None:
+    """フロントマターのキーがある行（分からなければNone）"""
+    return lines.get(key) if lines else None
 
 
 def is_valid_boolean_value(value: Any) -> bool:
@@ -326,36 +1028,53 @@ def is_valid_boolean_value(value: Any) -> bool:
     return False
 
 
+@rule("context-value")
 def validate_context_field(
-    result: ValidationResult, file_path: Path, frontmatter: dict[str, Any]
+    result: ValidationResult,
+    file_path: Path,
+    frontmatter: dict[str, Any],
+    *,
+    lines: dict[str, int] | None = None,
 ) -> None:
-    """contextフィールドを検証する（forkのみ有効）"""
+    """contextフィールドを検証する（forkのみ有効。linesはキーがある行）"""
     context = frontmatter.get("context")
     if context is not None:
         context_str = to_str(context)
         if context_str and context_str != "fork":
             result.add_error(
-                f"{file_path.name}: contextの値が不正です: {context_str}（forkのみ有効）"
+                "contextの値が不正です: {}（forkのみ有効）",
+                context_str,
+                file=file_path,
+                line=_field_line(lines, "context"),
             )
 
 
+@rule("agent-value")
 def validate_agent_field(
-    result: ValidationResult, file_path: Path, frontmatter: dict[str, Any]
+    result: ValidationResult,
+    file_path: Path,
+    frontmatter: dict[str, Any],
+    *,
+    lines: dict[str, int] | None = None,
 ) -> None:
-    """agentフィールドを検証する（空でない文字列が必要）"""
+    """agentフィールドを検証する（空でない文字列が必要。linesはキーがある行）"""
     agent = frontmatter.get("agent")
     if agent is not None:
         if not to_str(agent):
-            result.add_error(f"{file_path.name}: agentは空でない文字列が必要です")
+            result.add_error(
+                "agentは空でない文字列が必要です", file=file_path, line=_field_line(lines, "agent")
+            )
 
 
+@rule(WARNING_BROAD_BASH_WILDCARD)
 def validate_allowed_tools(
     result: ValidationResult,
     file_path: Path,
     frontmatter: dict[str, Any],
-    disabled_warnings: set[str],
+    *,
+    lines: dict[str, int] | None = None,
 ) -> None:
-    """allowed-toolsフィールドを検証する（Bash(*)の広範なワイルドカードを警告）"""
+    """allowed-toolsフィールドを検証する（Bash(*)の広範なワイルドカードを警告。linesはキーがある行）"""
     allowed_tools = frontmatter.get("allowed-tools")
     if allowed_tools is not None:
         tools_str = ""
@@ -365,13 +1084,16 @@ def validate_allowed_tools(
             tools_str = str(allowed_tools)
 
         if "Bash(*)" in tools_str:
-            if WARNING_BROAD_BASH_WILDCARD not in disabled_warnings:
-                result.add_warning(
-                    f"{file_path.name}: allowed-toolsにBash(*)が指定。"
-                    "v2.1.20以降Bash(*)はBashと同等に扱われますが、具体的なパターンを推奨"
-                )
+            result.add_warning(
+                "allowed-toolsにBash(*)が指定。"
+                "v2.1.20以降Bash(*)はBashと同等に扱われますが、具体的なパターンを推奨",
+                file=file_path,
+                rule=WARNING_BROAD_BASH_WILDCARD,
+                line=_field_line(lines, "allowed-tools"),
+            )
 
 
+@rule("effort-value")
 def validate_effort_field(
     result: ValidationResult,
     file_path: Path,
@@ -380,34 +1102,45 @@ def validate_effort_field(
     *,
     level: str = "warning",
     hint: str = "",
+    lines: dict[str, int] | None = None,
 ) -> None:
-    """effortフィールドを検証する"""
+    """effortフィールドを検証する（linesはキーがある行）"""
     effort = frontmatter.get("effort")
     if effort is not None:
         effort_str = to_str(effort)
         display = hint or "/".join(valid_values)
+        line = _field_line(lines, "effort")
         if effort_str and effort_str not in valid_values:
             if level == "error":
                 result.add_error(
-                    f"{file_path.name}: effortの値が不正です: {effort_str}（{display}）"
+                    "effortの値が不正です: {}（{}）", effort_str, display, file=file_path, line=line
                 )
             else:
-                result.add_warning(f"{file_path.name}: effortが不正: {effort_str}（{display}）")
+                result.add_warning(
+                    "effortが不正: {}（{}）", effort_str, display, file=file_path, line=line
+                )
 
 
+@rule("string-or-list")
 def validate_string_or_list_field(
-    result: ValidationResult, file_path: Path, field_name: str, value: Any
+    result: ValidationResult,
+    file_path: Path,
+    field_name: str,
+    value: Any,
+    *,
+    lines: dict[str, int] | None = None,
 ) -> None:
-    """文字列またはリスト形式のフィールドを検証する"""
+    """文字列またはリスト形式のフィールドを検証する（linesはキーがある行）"""
     if value is None:
         return
+    line = _field_line(lines, field_name)
     if not isinstance(value, (str, list)):
-        result.add_error(f"{file_path.name}: {field_name}は文字列またはリストが必要です")
+        result.add_error("{}は文字列またはリストが必要です", field_name, file=file_path, line=line)
     elif isinstance(value, list):
         for item in value:
             if not isinstance(item, str) or not item:
                 result.add_error(
-                    f"{file_path.name}: {field_name}の各要素は空でない文字列が必要です"
+                    "{}の各要素は空でない文字列が必要です", field_name, file=file_path, line=line
                 )
                 break
 
@@ -425,12 +1158,15 @@ def _is_non_mcp_tool_name_glob(tool_str: str) -> bool:
     return True
 
 
+@rule("tool-name-glob")
 def validate_allow_ask_glob_fields(
     result: ValidationResult,
     file_path: Path,
     frontmatter: dict[str, Any],
+    *,
+    lines: dict[str, int] | None = None,
 ) -> None:
-    """allow/askフィールドのツール名位置の非MCPグロブを検証する（v2.1.166以降）"""
+    """allow/askフィールドのツール名位置の非MCPグロブを検証する（v2.1.166以降。linesはキーがある行）"""
     for field_name in ("allow", "ask"):
         value = frontmatter.get(field_name)
         if value is None:
@@ -445,7 +1181,11 @@ def validate_allow_ask_glob_fields(
             tool_str = tool.strip()
             if _is_non_mcp_tool_name_glob(tool_str):
                 result.add_error(
-                    f"{file_path.name}: {field_name}のツール名位置にグロブパターンは使用不可: "
-                    f'"{tool_str}"（v2.1.166以降、非MCPツール。'
-                    f"Bash(rm *)のようなコンテンツパターンは有効）"
+                    "{}のツール名位置にグロブパターンは使用不可: "
+                    '"{}"（v2.1.166以降、非MCPツール。'
+                    "Bash(rm *)のようなコンテンツパターンは有効）",
+                    field_name,
+                    tool_str,
+                    file=file_path,
+                    line=_field_line(lines, field_name),
                 )
@@ -0,0 +1,160 @@
+"""
+検証結果のキャッシュ
+
+(ファイル内容のsha256, バリデーターID, バリデーターのコードバージョン, ファイル名) を
+キーにして検証結果をディスクに保存する。内容が変わっていないファイルは
+次回以降の実行でバリデーターを呼ばずに結果を再利用できる。
+
+README のリンク切れチェックのように結果がファイルシステムの状態に依存する場合は、
+ValidationResult.path_checks に記録された各パスの存在有無とファイルの場所も保存し、
+取り出す時点で一致しなければキャッシュミスとして扱う。
+
+容量が上限を超えた場合は最終使用時刻（mtime）の古いエントリから削除する（LRU）。
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from .base import Diagnostic, ValidationResult, repo_suppressions
+
+# 既定のキャッシュディレクトリ（カレントディレクトリからの相対パス）
+DEFAULT_CACHE_DIR = Path(".cache") / "validate-plugin"
+
+# 既定の容量上限（バイト）
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# キャッシュエントリの形式バージョン（保存形式を変えたら上げる）
+_FORMAT_VERSION = "2"
+
+_code_version: str | None = None
+
+
+def code_version() -> str:
+    """validatorsパッケージのソースコードから計算したバージョン文字列を返す
+
+    どのバリデーターもbase.pyなど他モジュールのヘルパーに依存するため、
+    パッケージ内の .py ファイルをすべてハッシュに含める。
+    """
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256(_FORMAT_VERSION.encode())
+        for source in sorted(Path(__file__).parent.glob("*.py")):
+            digest.update(source.name.encode())
+            digest.update(source.read_bytes())
+        _code_version = digest.hexdigest()
+    return _code_version
+
+
+class ResultCache:
+    """ディスク上の検証結果キャッシュ"""
+
+    def __init__(self, directory: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, validator_id: str, file_path: Path, content: str) -> str:
+        """キャッシュキーを返す
+
+        メッセージにファイル名が含まれ、出力スタイルはファイル名自体も検証するため、
+        ファイル名もキーに含める。リポジトリ全体で抑制したルールも結果を変えるため含める。
+        """
+        digest = hashlib.sha256()
+        suppressed = ",".join(sorted(repo_suppressions()))
+        for part in (code_version(), validator_id, file_path.name, suppressed):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        digest.update(hashlib.sha256(content.encode("utf-8", "surrogatepass")).digest())
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str, file_path: Path) -> ValidationResult | None:
+        """キャッシュ済みの結果を返す（なければ、または無効ならNone）"""
+        entry_path = self._entry_path(key)
+        try:
+            entry = json.loads(entry_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        path_checks = entry.get("path_checks", {})
+        if path_checks:
+            if entry.get("location") != _location_of(file_path):
+                return None
+            for path, existed in path_checks.items():
+                if os.path.exists(path) != existed:
+                    return None
+
+        # 使用時刻を更新してLRUの対象から遠ざける
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        result = ValidationResult()
+        result.diagnostics = [Diagnostic.from_dict(data) for data in entry["diagnostics"]]
+        result.path_checks = path_checks
+        return result
+
+    def put(self, key: str, file_path: Path, result: ValidationResult) -> None:
+        """結果を保存する（書き込みに失敗しても検証自体は続行できるよう例外は送出しない）"""
+        entry = {
+            "diagnostics": [diagnostic.to_dict() for diagnostic in result.diagnostics],
+            "path_checks": result.path_checks,
+        }
+        if result.path_checks:
+            entry["location"] = _location_of(file_path)
+
+        entry_path = self._entry_path(key)
+        # 並列実行時に他プロセスが読みかけのファイルを壊さないよう、一時ファイルから置き換える
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def prune(self) -> int:
+        """容量上限を超えている分を使用時刻の古い順に削除し、削除した件数を返す"""
+        entries = []
+        total = 0
+        try:
+            shards = list(os.scandir(self.directory))
+        except OSError:
+            return 0
+        for shard in shards:
+            if not shard.is_dir(follow_symlinks=False):
+                continue
+            with os.scandir(shard.path) as it:
+                for entry in it:
+                    try:
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+
+        removed = 0
+        if total <= self.max_bytes:
+            return removed
+        for _, size, path in sorted(entries):
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            removed += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+        return removed
+
+
+def _location_of(file_path: Path) -> str:
+    """相対リンクの解決基準になるディレクトリ（ファイルの親ディレクトリの絶対パス）"""
+    return os.path.abspath(file_path.parent)
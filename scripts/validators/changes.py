@@ -0,0 +1,124 @@
+"""
+gitの差分から検証対象ファイルを求める
+
+`git diff --name-status -z -M` を直接読み、追加・変更・リネーム後のファイルに加えて、
+削除・リネームで参照先を失ったREADME（リンク切れチェックの結果が変わるもの）も
+再検証の対象にする。
+"""
+
+import os
+import subprocess
+from collections.abc import Sequence
+from pathlib import Path
+
+from .registry import classify
+from .walker import iter_target_files
+
+
+class GitDiffError(RuntimeError):
+    """gitコマンドの実行に失敗した"""
+
+
+def _git(*args: str, cwd: Path | None = None) -> str:
+    try:
+        completed = subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+        )
+    except FileNotFoundError as e:
+        raise GitDiffError("gitコマンドが見つかりません") from e
+    except subprocess.CalledProcessError as e:
+        message = e.stderr.strip() or f"終了コード {e.returncode}"
+        raise GitDiffError(f"git {args[0]} に失敗しました: {message}") from e
+    return completed.stdout
+
+
+def parse_name_status(output: str) -> tuple[list[str], list[str]]:
+    """`git diff --name-status -z` の出力を (現存するパス, 消えたパス) に分ける
+
+    リネーム・コピー（R/C）は旧パスと新パスの2つが続く。リネームの旧パスは
+    削除と同じく参照先が消えたものとして扱う。
+    """
+    present: list[str] = []
+    removed: list[str] = []
+    fields = output.split("\0")
+    i = 0
+    while i < len(fields) - 1:
+        status = fields[i]
+        if status[0] in "RC":
+            old_path, new_path = fields[i + 1], fields[i + 2]
+            if status[0] == "R":
+                removed.append(old_path)
+            present.append(new_path)
+            i += 3
+        else:
+            path = fields[i + 1]
+            (removed if status[0] == "D" else present).append(path)
+            i += 2
+    return present, removed
+
+
+def _links_removed_path(links: set[Path], removed: set[Path]) -> bool:
+    """links のいずれかが removed のパス自身か、その親ディレクトリかを返す
+
+    ディレクトリへのリンク（[docs](./docs/)）は、その配下のファイルが
+    すべて削除されるとリンク切れになるため、配下の削除も影響ありとみなす。
+    """
+    if not removed.isdisjoint(links):
+        return True
+    return any(path.is_relative_to(link) for link in links for path in removed)
+
+
+def _dependent_readmes(roots: Sequence[Path], removed: set[Path]) -> list[Path]:
+    """roots以下で、removed のいずれか（またはその親ディレクトリ）へ相対リンクしているREADMEを返す"""
+    from .readme import linked_paths
+
+    readmes = []
+    for root in roots:
+        for path in iter_target_files(root):
+            spec = classify(path)
+            if spec is None or spec.id != "readme":
+                continue
+            try:
+                content = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
+            if _links_removed_path(linked_paths(path, content), removed):
+                readmes.append(path)
+    return readmes
+
+
+def changed_files(ref: str, cwd: Path | None = None, scopes: Sequence[Path] = ()) -> list[Path]:
+    """ref（とHEADの分岐点）から作業ツリーまでに変更された検証対象ファイルを返す
+
+    未追跡のファイルも含める。返すパスはカレントディレクトリからの相対パスで、
+    名前順に並べる。
+
+    scopes を指定すると、そのディレクトリ以下のファイルだけを返す（省略時は
+    リポジトリ全体）。削除されたファイルはscopesの外にあっても、scopes内の
+    READMEからのリンク切れの判定に使う。
+
+    Raises:
+        GitDiffError: gitリポジトリでない、refが存在しないなどでgitが失敗した場合
+    """
+    toplevel = Path(_git("rev-parse", "--show-toplevel", cwd=cwd).strip()).resolve()
+    base = _git("merge-base", ref, "HEAD", cwd=toplevel).strip()
+    present, removed = parse_name_status(
+        _git("diff", "--name-status", "-z", "-M", base, cwd=toplevel)
+    )
+    untracked = _git("ls-files", "-z", "--others", "--exclude-standard", cwd=toplevel)
+    present.extend(filter(None, untracked.split("\0")))
+
+    roots = [Path(scope).resolve() for scope in scopes] or [toplevel]
+    targets = set()
+    for name in present:
+        path = toplevel / name
+        if (
+            classify(path) is not None
+            and any(path.is_relative_to(root) for root in roots)
+            and path.is_file()
+        ):
+            targets.add(path)
+    if removed:
+        targets.update(_dependent_readmes(roots, {toplevel / name for name in removed}))
+
+    return [Path(os.path.relpath(path)) for path in sorted(targets)]
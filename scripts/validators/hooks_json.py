@@ -5,7 +5,7 @@ hooks.json のバリデーター
 import re
 from pathlib import Path
 
-from .base import ValidationResult, parse_json_safe
+from .base import ValidationResult, parse_json_safe, rule, with_suppressions
 
 # httpタイプのheaders値内の環境変数プレースホルダー（${VAR_NAME}形式）を抽出する正規表現
 ENV_VAR_PLACEHOLDER_PATTERN = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
@@ -18,6 +18,7 @@ DISALLOWED_HOOK_TYPES_BY_EVENT = {
 }
 
 
+@rule("http-allowed-env-vars")
 def _validate_http_allowed_env_vars(h: dict, file_path: Path, result: ValidationResult) -> None:
     """httpタイプのheadersで使用される環境変数プレースホルダーが
     allowedEnvVarsにホワイトリスト登録されているかを検証する"""
@@ -35,19 +36,20 @@ def _validate_http_allowed_env_vars(h: dict, file_path: Path, result: Validation
 
     allowed_env_vars = h.get("allowedEnvVars")
     if allowed_env_vars is not None and not isinstance(allowed_env_vars, list):
-        result.add_error(f"{file_path.name}: httpタイプのallowedEnvVarsは配列が必要です")
+        result.add_error("httpタイプのallowedEnvVarsは配列が必要です", file=file_path)
         return
 
     missing_env_vars = sorted(used_env_vars - set(allowed_env_vars or []))
     if missing_env_vars:
         missing_str = ", ".join(missing_env_vars)
         result.add_error(
-            f"{file_path.name}: httpタイプのheadersで環境変数 "
-            f"{missing_str} を使用していますが"
-            f"allowedEnvVarsに含まれていません"
+            "httpタイプのheadersで環境変数 {} を使用していますがallowedEnvVarsに含まれていません",
+            missing_str,
+            file=file_path,
         )
 
 
+@with_suppressions(comments=False)
 def validate_hooks_json(file_path: Path, content: str) -> ValidationResult:
     """hooks.jsonを検証する"""
     result = ValidationResult()
@@ -58,10 +60,10 @@ def validate_hooks_json(file_path: Path, content: str) -> ValidationResult:
 
     hooks = data.get("hooks", {})
     if not isinstance(hooks, dict):
-        result.add_error(f"{file_path.name}: hooksはオブジェクトが必要です")
+        result.add_error("hooksはオブジェクトが必要です", file=file_path, rule="root-type")
         return result
     if not hooks:
-        result.add_warning(f"{file_path.name}: hooksが空です")
+        result.add_warning("hooksが空です", file=file_path, rule="empty-config")
         return result
 
     # 有効なイベント名
@@ -99,17 +101,22 @@ def validate_hooks_json(file_path: Path, content: str) -> ValidationResult:
 
     for event_name, event_hooks in hooks.items():
         if event_name not in valid_events:
-            result.add_error(f"{file_path.name}: 無効なイベント名: {event_name}")
+            result.add_error("無効なイベント名: {}", event_name, file=file_path, rule="hook-event")
             continue
 
         if not isinstance(event_hooks, list):
-            result.add_error(f"{file_path.name}: {event_name}のフック設定は配列が必要です")
+            result.add_error(
+                "{}のフック設定は配列が必要です", event_name, file=file_path, rule="hook-entries"
+            )
             continue
 
         for hook_config in event_hooks:
             if not isinstance(hook_config, dict):
                 result.add_error(
-                    f"{file_path.name}: {event_name}のフック設定はオブジェクトが必要です"
+                    "{}のフック設定はオブジェクトが必要です",
+                    event_name,
+                    file=file_path,
+                    rule="hook-entries",
                 )
                 continue
 
@@ -136,31 +143,43 @@ def validate_hooks_json(file_path: Path, content: str) -> ValidationResult:
                 matcher = hook_config.get("matcher")
                 if not matcher:
                     result.add_warning(
-                        f"{file_path.name}: {event_name}のmatcherが未設定（全ツールにマッチ）"
+                        "{}のmatcherが未設定（全ツールにマッチ）",
+                        event_name,
+                        file=file_path,
+                        rule="hook-matcher",
                     )
 
             # ifフィールドの確認（v2.1.85以降）
             if_field = hook_config.get("if")
             if if_field is not None and not isinstance(if_field, str):
                 result.add_error(
-                    f"{file_path.name}: ifフィールドは文字列が必要です（パーミッションルール構文）"
+                    "ifフィールドは文字列が必要です（パーミッションルール構文）",
+                    file=file_path,
+                    rule="hook-fields",
                 )
 
             # continueOnBlockフィールドの確認（v2.1.139以降、PostToolUse向け）
             continue_on_block = hook_config.get("continueOnBlock")
             if continue_on_block is not None and not isinstance(continue_on_block, bool):
-                result.add_error(f"{file_path.name}: continueOnBlockはブール値が必要です")
+                result.add_error(
+                    "continueOnBlockはブール値が必要です", file=file_path, rule="hook-fields"
+                )
 
             # hooksの確認
             inner_hooks = hook_config.get("hooks", [])
             if not isinstance(inner_hooks, list):
-                result.add_error(f"{file_path.name}: {event_name}のhooksは配列が必要です")
+                result.add_error(
+                    "{}のhooksは配列が必要です", event_name, file=file_path, rule="hook-entries"
+                )
                 continue
 
             for h in inner_hooks:
                 if not isinstance(h, dict):
                     result.add_error(
-                        f"{file_path.name}: {event_name}のhooks要素はオブジェクトが必要です"
+                        "{}のhooks要素はオブジェクトが必要です",
+                        event_name,
+                        file=file_path,
+                        rule="hook-entries",
                     )
                     continue
 
@@ -169,7 +188,11 @@ def validate_hooks_json(file_path: Path, content: str) -> ValidationResult:
                 if hook_type not in valid_types:
                     types_str = "/".join(valid_types)
                     result.add_error(
-                        f"{file_path.name}: 無効なhook type: {hook_type}（{types_str}）"
+                        "無効なhook type: {}（{}）",
+                        hook_type,
+                        types_str,
+                        file=file_path,
+                        rule="hook-type",
                     )
 
                 # PostCompactはcommandタイプのみ対応
@@ -179,7 +202,9 @@ def validate_hooks_json(file_path: Path, content: str) -> ValidationResult:
                     and hook_type in valid_types
                 ):
                     result.add_error(
-                        f"{file_path.name}: PostCompactイベントはcommandタイプのみ対応しています"
+                        "PostCompactイベントはcommandタイプのみ対応しています",
+                        file=file_path,
+                        rule="hook-type",
                     )
 
                 # イベントごとに使用できないhookタイプの確認
@@ -187,14 +212,19 @@ def validate_hooks_json(file_path: Path, content: str) -> ValidationResult:
                 if disallowed and hook_type in disallowed[0]:
                     allowed_types_str = disallowed[1]
                     result.add_error(
-                        f"{file_path.name}: {event_name}イベントには"
-                        f"{hook_type}タイプは使用できません。"
-                        f"{allowed_types_str}を使用してください"
+                        "{}イベントには{}タイプは使用できません。{}を使用してください",
+                        event_name,
+                        hook_type,
+                        allowed_types_str,
+                        file=file_path,
+                        rule="hook-type",
                     )
 
                 if hook_type == "command" and not h.get("command"):
                     result.add_error(
-                        f"{file_path.name}: commandタイプにcommandフィールドがありません"
+                        "commandタイプにcommandフィールドがありません",
+                        file=file_path,
+                        rule="hook-fields",
                     )
 
                 # argsフィールドの確認（commandタイプ、v2.1.139以降）
@@ -205,42 +235,58 @@ def validate_hooks_json(file_path: Path, content: str) -> ValidationResult:
                             isinstance(a, str) for a in args_field
                         ):
                             result.add_error(
-                                f"{file_path.name}: commandタイプのargsは文字列の配列が必要です"
+                                "commandタイプのargsは文字列の配列が必要です",
+                                file=file_path,
+                                rule="hook-fields",
                             )
 
                 if hook_type == "prompt" and not h.get("prompt"):
                     result.add_error(
-                        f"{file_path.name}: promptタイプにpromptフィールドがありません"
+                        "promptタイプにpromptフィールドがありません",
+                        file=file_path,
+                        rule="hook-fields",
                     )
 
                 if hook_type == "agent":
                     if not h.get("agent"):
                         result.add_error(
-                            f"{file_path.name}: agentタイプにagentフィールドがありません"
+                            "agentタイプにagentフィールドがありません",
+                            file=file_path,
+                            rule="hook-fields",
                         )
                     if not h.get("prompt"):
                         result.add_error(
-                            f"{file_path.name}: agentタイプにpromptフィールドがありません"
+                            "agentタイプにpromptフィールドがありません",
+                            file=file_path,
+                            rule="hook-fields",
                         )
 
                 if hook_type == "http":
                     if not h.get("url"):
-                        result.add_error(f"{file_path.name}: httpタイプにurlフィールドがありません")
+                        result.add_error(
+                            "httpタイプにurlフィールドがありません",
+                            file=file_path,
+                            rule="hook-fields",
+                        )
                     _validate_http_allowed_env_vars(h, file_path, result)
 
                 if hook_type == "mcp_tool":
                     if not h.get("server"):
                         result.add_error(
-                            f"{file_path.name}: mcp_toolタイプにserverフィールドがありません"
+                            "mcp_toolタイプにserverフィールドがありません",
+                            file=file_path,
+                            rule="hook-fields",
                         )
                     if not h.get("tool"):
                         result.add_error(
-                            f"{file_path.name}: mcp_toolタイプにtoolフィールドがありません"
+                            "mcp_toolタイプにtoolフィールドがありません",
+                            file=file_path,
+                            rule="hook-fields",
                         )
 
                 # onceの確認（boolean型）
                 once = h.get("once")
                 if once is not None and not isinstance(once, bool):
-                    result.add_error(f"{file_path.name}: onceはブール値が必要です")
+                    result.add_error("onceはブール値が必要です", file=file_path, rule="hook-fields")
 
     return result
@@ -4,13 +4,14 @@
 
 from pathlib import Path
 
-from .base import ValidationResult, parse_json_safe
+from .base import ValidationResult, parse_json_safe, with_suppressions
 from .secret_detection import detect_hardcoded_secrets
 
 # 有効なtransport値
 VALID_TRANSPORTS = {"stdio", "socket"}
 
 
+@with_suppressions(comments=False)
 def validate_lsp_json(file_path: Path, content: str) -> ValidationResult:
     """LSPサーバー設定を検証する"""
     result = ValidationResult()
@@ -22,70 +23,108 @@ def validate_lsp_json(file_path: Path, content: str) -> ValidationResult:
     detect_hardcoded_secrets(result, file_path, content)
 
     if not data:
-        result.add_warning(f"{file_path.name}: LSPサーバー設定が空です")
+        result.add_warning("LSPサーバー設定が空です", file=file_path, rule="empty-config")
         return result
 
     if not isinstance(data, dict):
-        result.add_error(f"{file_path.name}: ルートはオブジェクトである必要があります")
+        result.add_error(
+            "ルートはオブジェクトである必要があります", file=file_path, rule="root-type"
+        )
         return result
 
     for server_name, config in data.items():
         if not isinstance(config, dict):
-            result.add_error(f"{file_path.name}: {server_name}: 設定はオブジェクトが必要")
+            result.add_error(
+                "{}: 設定はオブジェクトが必要", server_name, file=file_path, rule="lsp-servers"
+            )
             continue
 
         # 必須フィールド: command
         if not config.get("command"):
-            result.add_error(f"{file_path.name}: {server_name}: commandは必須です")
+            result.add_error(
+                "{}: commandは必須です", server_name, file=file_path, rule="lsp-servers"
+            )
 
         # 必須フィールド: extensionToLanguage
         ext_to_lang = config.get("extensionToLanguage")
         if not ext_to_lang:
-            result.add_error(f"{file_path.name}: {server_name}: extensionToLanguageは必須です")
+            result.add_error(
+                "{}: extensionToLanguageは必須です", server_name, file=file_path, rule="lsp-servers"
+            )
         elif not isinstance(ext_to_lang, dict):
             result.add_error(
-                f"{file_path.name}: {server_name}: extensionToLanguageはオブジェクトが必要"
+                "{}: extensionToLanguageはオブジェクトが必要",
+                server_name,
+                file=file_path,
+                rule="lsp-servers",
             )
         else:
             # 拡張子の形式をチェック
             for ext, lang_id in ext_to_lang.items():
                 if not ext.startswith("."):
-                    result.add_warning(f"{file_path.name}: {server_name}: 拡張子は.で開始: {ext}")
+                    result.add_warning(
+                        "{}: 拡張子は.で開始: {}",
+                        server_name,
+                        ext,
+                        file=file_path,
+                        rule="extension-format",
+                    )
                 if not isinstance(lang_id, str) or not lang_id:
                     result.add_error(
-                        f"{file_path.name}: {server_name}: 言語IDは空でない文字列: {ext}"
+                        "{}: 言語IDは空でない文字列: {}",
+                        server_name,
+                        ext,
+                        file=file_path,
+                        rule="lsp-servers",
                     )
 
         # transport のバリデーション
         transport = config.get("transport")
         if transport and transport not in VALID_TRANSPORTS:
             result.add_warning(
-                f"{file_path.name}: {server_name}: 不明なtransport: {transport}（stdio/socket）"
+                "{}: 不明なtransport: {}（stdio/socket）",
+                server_name,
+                transport,
+                file=file_path,
+                rule="lsp-servers",
             )
 
         # args のバリデーション
         args = config.get("args")
         if args is not None and not isinstance(args, list):
-            result.add_error(f"{file_path.name}: {server_name}: argsは配列が必要")
+            result.add_error(
+                "{}: argsは配列が必要", server_name, file=file_path, rule="lsp-servers"
+            )
 
         # 数値フィールドのバリデーション
         for field in ["startupTimeout", "shutdownTimeout", "maxRestarts"]:
             value = config.get(field)
             if value is not None and not isinstance(value, int | float):
-                result.add_error(f"{file_path.name}: {server_name}: {field}は数値が必要")
+                result.add_error(
+                    "{}: {}は数値が必要", server_name, field, file=file_path, rule="lsp-servers"
+                )
 
         # ブールフィールドのバリデーション
         restart_on_crash = config.get("restartOnCrash")
         if restart_on_crash is not None and not isinstance(restart_on_crash, bool):
-            result.add_error(f"{file_path.name}: {server_name}: restartOnCrashはブール値が必要")
+            result.add_error(
+                "{}: restartOnCrashはブール値が必要",
+                server_name,
+                file=file_path,
+                rule="lsp-servers",
+            )
 
         diagnostics = config.get("diagnostics")
         if diagnostics is not None and not isinstance(diagnostics, bool):
-            result.add_error(f"{file_path.name}: {server_name}: diagnosticsはブール値が必要")
+            result.add_error(
+                "{}: diagnosticsはブール値が必要", server_name, file=file_path, rule="lsp-servers"
+            )
 
         # envのバリデーション
         env = config.get("env")
         if env is not None and not isinstance(env, dict):
-            result.add_error(f"{file_path.name}: {server_name}: envはオブジェクトが必要")
+            result.add_error(
+                "{}: envはオブジェクトが必要", server_name, file=file_path, rule="lsp-servers"
+            )
 
     return result
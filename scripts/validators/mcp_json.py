@@ -4,12 +4,13 @@
 
 from pathlib import Path
 
-from .base import ValidationResult, parse_json_safe
+from .base import ValidationResult, parse_json_safe, with_suppressions
 from .secret_detection import detect_hardcoded_secrets
 
 RESERVED_SERVER_NAMES = {"workspace", "Claude Browser", "Claude Preview"}
 
 
+@with_suppressions(comments=False)
 def validate_mcp_json(file_path: Path, content: str) -> ValidationResult:
     """MCPサーバー設定を検証する"""
     result = ValidationResult()
@@ -22,21 +23,25 @@ def validate_mcp_json(file_path: Path, content: str) -> ValidationResult:
 
     servers = data.get("mcpServers", {})
     if not isinstance(servers, dict):
-        result.add_error(f"{file_path.name}: mcpServersはオブジェクトが必要です")
+        result.add_error("mcpServersはオブジェクトが必要です", file=file_path, rule="root-type")
         return result
     if not servers:
-        result.add_warning(f"{file_path.name}: mcpServersが空です")
+        result.add_warning("mcpServersが空です", file=file_path, rule="empty-config")
         return result
 
     for server_name, config in servers.items():
         if server_name in RESERVED_SERVER_NAMES:
             result.add_error(
-                f"{file_path.name}: '{server_name}' は予約済みサーバー名です。"
-                "使用すると警告とともにスキップされます"
+                "'{}' は予約済みサーバー名です。使用すると警告とともにスキップされます",
+                server_name,
+                file=file_path,
+                rule="reserved-server-name",
             )
 
         if not isinstance(config, dict):
-            result.add_error(f"{file_path.name}: {server_name}: 設定はオブジェクトが必要")
+            result.add_error(
+                "{}: 設定はオブジェクトが必要", server_name, file=file_path, rule="mcp-servers"
+            )
             continue
 
         server_type = config.get("type", "stdio")
@@ -44,21 +49,37 @@ def validate_mcp_json(file_path: Path, content: str) -> ValidationResult:
         if server_type == "stdio":
             if not config.get("command"):
                 result.add_error(
-                    f"{file_path.name}: {server_name}: stdioタイプにはcommandが必須です"
+                    "{}: stdioタイプにはcommandが必須です",
+                    server_name,
+                    file=file_path,
+                    rule="mcp-servers",
                 )
         elif server_type in ["http", "sse", "ws"]:
             if not config.get("url"):
                 result.add_error(
-                    f"{file_path.name}: {server_name}: {server_type}タイプにはurlが必須です"
+                    "{}: {}タイプにはurlが必須です",
+                    server_name,
+                    server_type,
+                    file=file_path,
+                    rule="mcp-servers",
                 )
         else:
             result.add_warning(
-                f"{file_path.name}: {server_name}: 不明なサーバータイプ: {server_type}"
+                "{}: 不明なサーバータイプ: {}",
+                server_name,
+                server_type,
+                file=file_path,
+                rule="mcp-servers",
             )
 
         # alwaysLoad はブール値のみ有効（v2.1.121以降）
         always_load = config.get("alwaysLoad")
         if always_load is not None and not isinstance(always_load, bool):
-            result.add_error(f"{file_path.name}: {server_name}: alwaysLoadはブール値が必要です")
+            result.add_error(
+                "{}: alwaysLoadはブール値が必要です",
+                server_name,
+                file=file_path,
+                rule="mcp-servers",
+            )
 
     return result
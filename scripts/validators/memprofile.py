@@ -0,0 +1,181 @@
+"""
+メモリプロファイル（--memprofile）
+
+tracemalloc でファイルごとの確保量のピークを測り、ピーク付近で生きていた
+メモリの確保元（ファイル:行）を集計する。大きなREADMEやmarketplace.jsonで
+内容を何度も複製している箇所（split("\n")、join、json.loads など）を探すためのもの。
+
+ファイルごとに確保の記録を消去してから読み込み・検証を行うため、ピークは
+そのファイルの処理で新たに確保したメモリだけを表す。確保元は、validators 配下の
+関数から戻る時点（ローカル変数がまだ生きている時点）で確保量がそれまでの最大値を
+一定以上上回ったときにスナップショットを取り、ピークに最も近いものを使う。
+"""
+
+import heapq
+import json
+import sys
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TextIO
+
+# スナップショットを取り直すのは、確保量がそれまでの最大値をこの割合以上上回ったとき
+# （1行ごとに確保量が増えるような処理でスナップショットを取りすぎないため）
+SNAPSHOT_GROWTH = 1.1
+
+# 小さな増加ではスナップショットを取り直さない（バイト）
+SNAPSHOT_MIN_GROWTH = 4096
+
+_VALIDATORS_DIR = str(Path(__file__).resolve().parent)
+
+# スナップショットから除く確保元（計測処理自身）
+_EXCLUDE_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+)
+
+
+class MemoryProfiler:
+    """ファイルごと・バリデーターごとのメモリ確保量のピークを集計する"""
+
+    def __init__(self, top_n: int = 10):
+        self.top_n = top_n
+        # ピークの大きいファイル上位top_n件（最小ヒープ）:
+        # (ピーク, 通し番号, パス, バリデーターID, 内容のバイト数, 確保元の上位)
+        self._largest: list[tuple[int, int, str, str, int, list[tuple[str, int]]]] = []
+        # バリデーターID -> [ファイル数, ピークの合計, ピークの最大]
+        self.validator_peaks: dict[str, list[int]] = {}
+        # バリデーターID -> {確保元: ピーク時点の確保量の合計}
+        self.validator_sites: dict[str, dict[str, int]] = {}
+        self.files = 0
+        self._high = 0
+        self._snapshot: tracemalloc.Snapshot | None = None
+
+    def start(self) -> None:
+        tracemalloc.start()
+
+    def stop(self) -> None:
+        tracemalloc.stop()
+
+    def _on_profile_event(self, frame, event: str, arg) -> None:
+        """validators 配下の関数から戻るときに、確保量が最大を更新していればスナップショットを取る"""
+        if event != "return" or not frame.f_code.co_filename.startswith(_VALIDATORS_DIR):
+            return
+        current = tracemalloc.get_traced_memory()[0]
+        if current > self._high * SNAPSHOT_GROWTH and current - self._high > SNAPSHOT_MIN_GROWTH:
+            self._high = current
+            self._snapshot = tracemalloc.take_snapshot()
+
+    @contextmanager
+    def track(self, file_path: Path, validator_id: str) -> Iterator[None]:
+        """withブロック（1ファイルの読み込みと検証）のピークと確保元を記録する"""
+        tracemalloc.clear_traces()
+        self._high = 0
+        self._snapshot = None
+        previous = sys.getprofile()
+        sys.setprofile(self._on_profile_event)
+        try:
+            yield
+        finally:
+            sys.setprofile(previous)
+            peak = tracemalloc.get_traced_memory()[1]
+            snapshot, self._snapshot = self._snapshot, None
+            self._record(file_path, validator_id, peak, snapshot)
+
+    def _record(
+        self,
+        file_path: Path,
+        validator_id: str,
+        peak: int,
+        snapshot: tracemalloc.Snapshot | None,
+    ) -> None:
+        self.files += 1
+        sites: list[tuple[str, int]] = []
+        if snapshot is not None:
+            statistics = snapshot.filter_traces(_EXCLUDE_FILTERS).statistics("lineno")
+            sites = [(_site(stat), stat.size) for stat in statistics[: self.top_n]]
+
+        peaks = self.validator_peaks.setdefault(validator_id, [0, 0, 0])
+        peaks[0] += 1
+        peaks[1] += peak
+        peaks[2] = max(peaks[2], peak)
+        validator_sites = self.validator_sites.setdefault(validator_id, {})
+        for site, size in sites:
+            validator_sites[site] = validator_sites.get(site, 0) + size
+
+        try:
+            size = file_path.stat().st_size
+        except OSError:
+            size = 0
+        entry = (peak, self.files, str(file_path), validator_id, size, sites)
+        if len(self._largest) < self.top_n:
+            heapq.heappush(self._largest, entry)
+        elif self._largest and entry > self._largest[0]:
+            heapq.heapreplace(self._largest, entry)
+
+    def summary(self) -> dict:
+        """集計結果をJSONに書き出せる形で返す"""
+        validators = {}
+        for validator_id, (files, total, largest) in sorted(
+            self.validator_peaks.items(), key=lambda item: -item[1][2]
+        ):
+            sites = sorted(self.validator_sites[validator_id].items(), key=lambda item: -item[1])
+            validators[validator_id] = {
+                "files": files,
+                "mean_peak_bytes": total // files,
+                "max_peak_bytes": largest,
+                "top_sites": [{"site": site, "bytes": size} for site, size in sites[: self.top_n]],
+            }
+        return {
+            "files": self.files,
+            "validators": validators,
+            "largest_files": [
+                {
+                    "path": path,
+                    "validator": validator_id,
+                    "file_bytes": size,
+                    "peak_bytes": peak,
+                    "top_sites": [{"site": site, "bytes": site_size} for site, site_size in sites],
+                }
+                for peak, _, path, validator_id, size, sites in sorted(self._largest, reverse=True)
+            ],
+        }
+
+    def write_summary(self, path: Path) -> None:
+        """集計結果をJSONファイルに書き出す"""
+        path.write_text(
+            json.dumps(self.summary(), ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+        )
+
+    def print_report(self, stream: TextIO) -> None:
+        """集計結果を人が読む形式で出力する"""
+        summary = self.summary()
+        print(f"🧠 メモリプロファイル: {summary['files']}ファイル", file=stream)
+        print("   バリデーター別のピーク:", file=stream)
+        for validator_id, stats in summary["validators"].items():
+            print(
+                f"     {validator_id:<18} {stats['files']:>6}件  平均 {_kib(stats['mean_peak_bytes'])}"
+                f"  最大 {_kib(stats['max_peak_bytes'])}",
+                file=stream,
+            )
+            for site in stats["top_sites"][:3]:
+                print(f"         {_kib(site['bytes'])}  {site['site']}", file=stream)
+        print(f"   ピークの大きいファイル（上位{self.top_n}件）:", file=stream)
+        for entry in summary["largest_files"]:
+            ratio = entry["peak_bytes"] / entry["file_bytes"] if entry["file_bytes"] else 0.0
+            print(
+                f"     {_kib(entry['peak_bytes'])}（ファイルの{ratio:.1f}倍）  {entry['path']}",
+                file=stream,
+            )
+            for site in entry["top_sites"][:3]:
+                print(f"         {_kib(site['bytes'])}  {site['site']}", file=stream)
+
+
+def _site(stat: tracemalloc.Statistic) -> str:
+    frame = stat.traceback[0]
+    return f"{frame.filename}:{frame.lineno}"
+
+
+def _kib(size: int) -> str:
+    return f"{size / 1024:>9.1f}KiB"
@@ -5,7 +5,7 @@ monitors/monitors.json のバリデーター
 import re
 from pathlib import Path
 
-from .base import ValidationResult, parse_json_safe
+from .base import ValidationResult, parse_json_safe, rule, with_suppressions
 
 # when フィールドの有効値
 VALID_WHEN_ALWAYS = "always"
@@ -28,6 +28,7 @@ def _validate_when_value(when: str) -> bool:
     return bool(ON_SKILL_INVOKE_PATTERN.match(when))
 
 
+@rule("monitor-entries")
 def validate_monitors_entries(
     entries: list,
     file_path: Path,
@@ -38,27 +39,27 @@ def validate_monitors_entries(
     seen_names: set[str] = set()
 
     for i, entry in enumerate(entries):
-        prefix = f"{file_path.name}: {label}[{i}]"
-
         if not isinstance(entry, dict):
-            result.add_error(f"{prefix}: エントリはオブジェクトが必要です")
+            result.add_error("{}[{}]: エントリはオブジェクトが必要です", label, i, file=file_path)
             continue
 
         # 必須フィールド（string）
         for field in REQUIRED_STRING_FIELDS:
             value = entry.get(field)
             if value is None:
-                result.add_error(f"{prefix}: {field}は必須です")
+                result.add_error("{}[{}]: {}は必須です", label, i, field, file=file_path)
             elif not isinstance(value, str):
-                result.add_error(f"{prefix}: {field}は文字列が必要です")
+                result.add_error("{}[{}]: {}は文字列が必要です", label, i, field, file=file_path)
             elif not value:
-                result.add_error(f"{prefix}: {field}は空文字列にできません")
+                result.add_error(
+                    "{}[{}]: {}は空文字列にできません", label, i, field, file=file_path
+                )
 
         # name の重複チェック
         name = entry.get("name")
         if isinstance(name, str) and name:
             if name in seen_names:
-                result.add_error(f"{prefix}: nameが重複しています: {name}")
+                result.add_error("{}[{}]: nameが重複しています: {}", label, i, name, file=file_path)
             else:
                 seen_names.add(name)
 
@@ -70,21 +71,33 @@ def validate_monitors_entries(
         when = entry.get("when")
         if when is not None:
             if not isinstance(when, str):
-                result.add_error(f"{prefix}: whenは文字列が必要です")
+                result.add_error("{}[{}]: whenは文字列が必要です", label, i, file=file_path)
             elif not when:
-                result.add_error(f"{prefix}: whenは空文字列にできません")
+                result.add_error("{}[{}]: whenは空文字列にできません", label, i, file=file_path)
             elif not _validate_when_value(when):
                 result.add_warning(
-                    f"{prefix}: whenの値が公式仕様に一致しません: {when}"
-                    '（"always" または "on-skill-invoke:<skill-name>"）'
+                    "{}[{}]: whenの値が公式仕様に一致しません: {}"
+                    '（"always" または "on-skill-invoke:<skill-name>"）',
+                    label,
+                    i,
+                    when,
+                    file=file_path,
                 )
 
         # 未知のフィールド警告
         for key in entry:
             if key not in KNOWN_FIELDS:
-                result.add_warning(f"{prefix}: 未知のフィールド: {key}")
+                result.add_warning(
+                    "{}[{}]: 未知のフィールド: {}",
+                    label,
+                    i,
+                    key,
+                    file=file_path,
+                    rule="unknown-field",
+                )
 
 
+@with_suppressions(comments=False)
 def validate_monitors_json(file_path: Path, content: str) -> ValidationResult:
     """バックグラウンドモニター設定（monitors.json）を検証する"""
     result = ValidationResult()
@@ -95,11 +108,11 @@ def validate_monitors_json(file_path: Path, content: str) -> ValidationResult:
 
     # トップレベルは配列
     if not isinstance(data, list):
-        result.add_error(f"{file_path.name}: ルートは配列が必要です")
+        result.add_error("ルートは配列が必要です", file=file_path, rule="root-type")
         return result
 
     if not data:
-        result.add_warning(f"{file_path.name}: monitors設定が空です")
+        result.add_warning("monitors設定が空です", file=file_path, rule="empty-config")
         return result
 
     validate_monitors_entries(data, file_path, result)
@@ -4,49 +4,72 @@
 
 from pathlib import Path
 
-from .base import ValidationResult, add_yaml_warnings, parse_frontmatter
+from .base import ValidationResult, add_yaml_warnings, parse_document, with_suppressions
 
 
+@with_suppressions
 def validate_output_style(file_path: Path, content: str) -> ValidationResult:
     """出力スタイルを検証する"""
     result = ValidationResult()
-    frontmatter, body, yaml_warnings = parse_frontmatter(content)
+    document = parse_document(content)
+    frontmatter = document.frontmatter
+    lines = document.field_lines
 
-    add_yaml_warnings(result, file_path, yaml_warnings)
+    add_yaml_warnings(result, file_path, document.yaml_warnings, document.yaml_warning_lines)
 
     # nameフィールドの検証（オプション、指定時はファイル名と一致推奨）
     name = frontmatter.get("name", "")
     if name:
         if not isinstance(name, str):
-            result.add_error(f"{file_path.name}: nameは文字列で指定してください")
+            result.add_error(
+                "nameは文字列で指定してください",
+                file=file_path,
+                rule="name-value",
+                line=lines.get("name"),
+            )
         else:
             # ファイル名（拡張子除く）と異なる場合は警告
             stem = file_path.stem
             if name != stem:
-                msg = (
-                    f"{file_path.name}: nameとファイル名が異なります"
-                    f"（name: {name}, ファイル: {stem}）"
+                result.add_warning(
+                    "nameとファイル名が異なります（name: {}, ファイル: {}）",
+                    name,
+                    stem,
+                    file=file_path,
+                    rule="name-value",
+                    line=lines.get("name"),
                 )
-                result.add_warning(msg)
 
     # descriptionフィールドの検証（オプション、推奨）
     description = frontmatter.get("description", "")
     if description:
         if not isinstance(description, str):
-            result.add_error(f"{file_path.name}: descriptionは文字列で指定してください")
+            result.add_error(
+                "descriptionは文字列で指定してください",
+                file=file_path,
+                rule="description-value",
+                line=lines.get("description"),
+            )
     else:
         # description がない場合は推奨
-        result.add_warning(f"{file_path.name}: descriptionの指定を推奨します（UIに表示されます）")
+        result.add_warning(
+            "descriptionの指定を推奨します（UIに表示されます）",
+            file=file_path,
+            rule="missing-description",
+        )
 
     # keep-coding-instructionsフィールドの検証（オプション、boolean）
     keep_coding = frontmatter.get("keep-coding-instructions")
     if keep_coding is not None and not isinstance(keep_coding, bool):
         result.add_error(
-            f"{file_path.name}: keep-coding-instructionsはtrue/falseで指定してください"
+            "keep-coding-instructionsはtrue/falseで指定してください",
+            file=file_path,
+            rule="keep-coding-instructions-value",
+            line=lines.get("keep-coding-instructions"),
         )
 
     # 本文（スタイル指示）の確認
-    if not body.strip():
-        result.add_error(f"{file_path.name}: スタイル指示（本文）が必須です")
+    if document.body.is_blank():
+        result.add_error("スタイル指示（本文）が必須です", file=file_path, rule="empty-body")
 
     return result
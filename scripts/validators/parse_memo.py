@@ -0,0 +1,149 @@
+"""
+解析結果のメモ（常駐サーバー・ストリームモード用）
+
+編集中は同じファイルが何度も検証されるため、フロントマター（parse_document /
+parse_frontmatter）とJSON（parse_json_safe）の解析結果を、内容のダイジェストを
+キーにしたLRUで使い回す。容量は解析した内容のバイト数の合計で制限する。
+
+メモした結果は複数の検証で共有されるため、読み取り専用にする。解析結果の辞書・リストは
+変更するとTypeErrorになる FrozenDict / FrozenList に置き換えてから渡す（isinstance の
+判定は dict / list のまま通る）。バリデーターが誤って書き換えても、後の検証結果を
+黙って壊さずに例外として表に出る。置き換えはメモに入れるときに1回だけ行う。
+
+常駐サーバーは複数のスレッドから呼び出すので、LRUの更新はロックで保護する。
+解析自体はロックの外で行う。
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from . import base
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError("メモした解析結果は変更できません（複製してから変更してください）")
+
+
+class FrozenDict(dict):
+    """変更できない dict（copy.deepcopy() や pickle では通常の dict になる）"""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce_ex__(self, protocol):
+        return dict, (dict(self),)
+
+
+class FrozenList(list):
+    """変更できない list（copy.deepcopy() や pickle では通常の list になる）"""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce_ex__(self, protocol):
+        return list, (list(self),)
+
+
+def freeze(value: Any) -> Any:
+    """解析結果の中の dict / list を FrozenDict / FrozenList に置き換えたものを返す
+
+    ParsedDocument と Suppressions は持っている dict / list を置き換える（その場で書き換える）。
+    """
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    if isinstance(value, tuple):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, base.ParsedDocument):
+        value.frontmatter = freeze(value.frontmatter)
+        value.yaml_warnings = freeze(value.yaml_warnings)
+        value.yaml_warning_lines = freeze(value.yaml_warning_lines)
+        value.field_lines = freeze(value.field_lines)
+        value.suppressions = freeze(value.suppressions)
+    elif isinstance(value, base.Suppressions):
+        value.ranges = freeze(value.ranges)
+        value.directives = freeze(value.directives)
+    return value
+
+
+# 既定の容量上限（解析した内容のバイト数の合計）
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+class ParseMemo:
+    """内容のダイジェストをキーにした解析結果のLRU"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # (解析の種類, ダイジェスト) -> (解析結果, バイト数)。古い順
+        self._entries: OrderedDict[tuple[str, bytes], tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_parse(self, kind: str, content: str, parse: Callable[[str], Any]) -> Any:
+        """メモした解析結果を返す（なければparse(content)の結果をメモして返す）"""
+        encoded = content.encode("utf-8", "surrogatepass")
+        key = (kind, hashlib.blake2b(encoded, digest_size=16).digest())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        value = parse(content)
+        size = len(encoded)
+        if size > self.max_bytes:
+            # メモしない結果は共有されないので、そのまま返す
+            return value
+        value = freeze(value)
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (value, size)
+                self.bytes += size
+                while self.bytes > self.max_bytes:
+                    _, (_, evicted_size) = self._entries.popitem(last=False)
+                    self.bytes -= evicted_size
+                    self.evictions += 1
+        return value
+
+    def stats(self) -> dict:
+        """件数・バイト数とヒット・ミス・追い出しの回数を返す"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def format_stats(self) -> str:
+        """stats() を1行の文字列にする（常駐サーバーの終了時・--stream --stats で出力する）"""
+        stats = self.stats()
+        hit_rate = stats["hits"] / max(stats["hits"] + stats["misses"], 1)
+        return (
+            f"解析結果のメモ: {stats['entries']}件 {stats['bytes']:,}/{stats['max_bytes']:,}バイト"
+            f" ヒット {stats['hits']}（{hit_rate:.0%}） ミス {stats['misses']}"
+            f" 追い出し {stats['evictions']}"
+        )
+
+    def install(self) -> None:
+        """解析関数がこのメモを使うようにする"""
+        base.set_parse_memo(self)
+
+    def uninstall(self) -> None:
+        base.set_parse_memo(None)
@@ -6,12 +6,13 @@ import re
 from pathlib import Path
 from typing import Any
 
-from .base import ValidationResult, parse_json_safe, validate_kebab_case
+from .base import ValidationResult, parse_json_safe, rule, validate_kebab_case, with_suppressions
 from .monitors_json import validate_monitors_entries
 
 USER_CONFIG_TYPES = {"string", "number", "boolean", "directory", "file"}
 
 
+@rule("user-config")
 def _validate_user_config_mapping(
     result: ValidationResult,
     file_path: Path,
@@ -21,36 +22,38 @@ def _validate_user_config_mapping(
     """userConfig のスキーマを検証する（トップレベルと per-channel で共通使用）"""
     if not isinstance(user_config, dict):
         result.add_error(
-            f"{file_path.name}: {label}はオブジェクト（キーと設定項目のマッピング）が必要です"
+            "{}はオブジェクト（キーと設定項目のマッピング）が必要です", label, file=file_path
         )
         return
     for config_key, config_value in user_config.items():
         if not isinstance(config_value, dict):
-            result.add_error(f"{file_path.name}: {label}.{config_key}はオブジェクトが必要です")
+            result.add_error("{}.{}はオブジェクトが必要です", label, config_key, file=file_path)
             continue
         config_type = config_value.get("type")
         if "type" not in config_value:
-            result.add_error(f"{file_path.name}: {label}.{config_key}.typeが必須です")
+            result.add_error("{}.{}.typeが必須です", label, config_key, file=file_path)
         elif config_type not in USER_CONFIG_TYPES:
             result.add_error(
-                f"{file_path.name}: {label}.{config_key}.typeは"
-                "string/number/boolean/directory/fileのいずれかが必要です"
+                "{}.{}.typeはstring/number/boolean/directory/fileのいずれかが必要です",
+                label,
+                config_key,
+                file=file_path,
             )
         if "title" not in config_value:
-            result.add_error(f"{file_path.name}: {label}.{config_key}.titleが必須です")
+            result.add_error("{}.{}.titleが必須です", label, config_key, file=file_path)
         elif not isinstance(config_value["title"], str) or not config_value["title"]:
-            result.add_error(f"{file_path.name}: {label}.{config_key}.titleは文字列が必要です")
+            result.add_error("{}.{}.titleは文字列が必要です", label, config_key, file=file_path)
         if "description" not in config_value:
-            result.add_error(f"{file_path.name}: {label}.{config_key}.descriptionが必須です")
+            result.add_error("{}.{}.descriptionが必須です", label, config_key, file=file_path)
         elif not isinstance(config_value["description"], str) or not config_value["description"]:
             result.add_error(
-                f"{file_path.name}: {label}.{config_key}.descriptionは文字列が必要です"
+                "{}.{}.descriptionは文字列が必要です", label, config_key, file=file_path
             )
         # sensitiveはブール値のみ
         sensitive = config_value.get("sensitive")
         if sensitive is not None and not isinstance(sensitive, bool):
             result.add_error(
-                f"{file_path.name}: {label}.{config_key}.sensitiveはブール値が必要です"
+                "{}.{}.sensitiveはブール値が必要です", label, config_key, file=file_path
             )
         # defaultの型がtypeと整合するかをチェック
         if "default" in config_value and config_type in USER_CONFIG_TYPES:
@@ -59,23 +62,31 @@ def _validate_user_config_mapping(
                 # boolはintのサブクラスなので除外
                 if isinstance(default_value, bool) or not isinstance(default_value, (int, float)):
                     result.add_error(
-                        f"{file_path.name}: {label}.{config_key}.defaultは"
-                        "数値（type: number）が必要です"
+                        "{}.{}.defaultは数値（type: number）が必要です",
+                        label,
+                        config_key,
+                        file=file_path,
                     )
             elif config_type == "boolean":
                 if not isinstance(default_value, bool):
                     result.add_error(
-                        f"{file_path.name}: {label}.{config_key}.defaultは"
-                        "真偽値（type: boolean）が必要です"
+                        "{}.{}.defaultは真偽値（type: boolean）が必要です",
+                        label,
+                        config_key,
+                        file=file_path,
                     )
             elif config_type in {"string", "directory", "file"}:
                 if not isinstance(default_value, str):
                     result.add_error(
-                        f"{file_path.name}: {label}.{config_key}.defaultは"
-                        f"文字列（type: {config_type}）が必要です"
+                        "{}.{}.defaultは文字列（type: {}）が必要です",
+                        label,
+                        config_key,
+                        config_type,
+                        file=file_path,
                     )
 
 
+@with_suppressions(comments=False)
 def validate_plugin_json(file_path: Path, content: str) -> ValidationResult:
     """plugin.jsonを検証する"""
     result = ValidationResult()
@@ -86,21 +97,24 @@ def validate_plugin_json(file_path: Path, content: str) -> ValidationResult:
 
     # 必須フィールド
     if not data.get("name"):
-        result.add_error(f"{file_path.name}: nameが必須です")
+        result.add_error("nameが必須です", file=file_path, rule="name-value")
     else:
         name = data["name"]
         # kebab-caseチェック
         kebab_error = validate_kebab_case(name)
         if kebab_error:
-            result.add_error(f"{file_path.name}: {kebab_error}")
+            result.add_error(kebab_error, file=file_path, rule="name-value")
         if " " in name:
-            result.add_error(f"{file_path.name}: nameにスペースは使用できません")
+            result.add_error("nameにスペースは使用できません", file=file_path, rule="name-value")
 
     # バージョン形式
     version = data.get("version", "")
     if version and not re.match(r"^\d+\.\d+\.\d+", version):
         result.add_warning(
-            f"{file_path.name}: versionはセマンティックバージョニング（x.y.z）を推奨: {version}"
+            "versionはセマンティックバージョニング（x.y.z）を推奨: {}",
+            version,
+            file=file_path,
+            rule="version-format",
         )
 
     # userConfigの確認（v2.1.83以降）
@@ -112,31 +126,52 @@ def validate_plugin_json(file_path: Path, content: str) -> ValidationResult:
     channels = data.get("channels")
     if channels is not None:
         if not isinstance(channels, list):
-            result.add_error(f"{file_path.name}: channelsは配列が必要です")
+            result.add_error("channelsは配列が必要です", file=file_path, rule="channel-entries")
         else:
             mcp_servers = data.get("mcpServers")
             # mcp_keys が空 set のままなら mcpServers が未宣言。
             # mcpServers: {} と未宣言は動作上どちらも整合性チェックの根拠が無いため同一扱い。
             mcp_keys: set[str] = set(mcp_servers.keys()) if isinstance(mcp_servers, dict) else set()
             for i, entry in enumerate(channels):
-                prefix = f"{file_path.name}: channels[{i}]"
                 if not isinstance(entry, dict):
-                    result.add_error(f"{prefix}: エントリはオブジェクトが必要です")
+                    result.add_error(
+                        "channels[{}]: エントリはオブジェクトが必要です",
+                        i,
+                        file=file_path,
+                        rule="channel-entries",
+                    )
                     continue
 
                 # serverの検証: 存在→型→値の順
                 server = entry.get("server")
                 if server is None:
-                    result.add_error(f"{prefix}: serverは必須です")
+                    result.add_error(
+                        "channels[{}]: serverは必須です", i, file=file_path, rule="channel-entries"
+                    )
                 elif not isinstance(server, str):
-                    result.add_error(f"{prefix}: serverは文字列が必要です")
+                    result.add_error(
+                        "channels[{}]: serverは文字列が必要です",
+                        i,
+                        file=file_path,
+                        rule="channel-entries",
+                    )
                 elif not server:
-                    result.add_error(f"{prefix}: serverは空文字列にできません")
+                    result.add_error(
+                        "channels[{}]: serverは空文字列にできません",
+                        i,
+                        file=file_path,
+                        rule="channel-entries",
+                    )
                 elif mcp_keys and server not in mcp_keys:
                     # mcpServers が同じ plugin.json 内に宣言されている場合のみ整合性チェック
                     result.add_warning(
-                        f"{prefix}: server '{server}' が mcpServers のキーと一致しません"
-                        f"（mcpServers: {sorted(mcp_keys)}）"
+                        "channels[{}]: server '{}' が mcpServers のキーと一致しません"
+                        "（mcpServers: {}）",
+                        i,
+                        server,
+                        sorted(mcp_keys),
+                        file=file_path,
+                        rule="channel-entries",
                     )
 
                 # per-channel userConfig はトップレベル userConfig と同じスキーマ
@@ -152,33 +187,51 @@ def validate_plugin_json(file_path: Path, content: str) -> ValidationResult:
     # defaultEnabled の確認（v2.1.154以降）
     default_enabled = data.get("defaultEnabled")
     if default_enabled is not None and not isinstance(default_enabled, bool):
-        result.add_error(f"{file_path.name}: defaultEnabledはブール値（true/false）が必要です")
+        result.add_error(
+            "defaultEnabledはブール値（true/false）が必要です",
+            file=file_path,
+            rule="default-enabled-value",
+        )
 
     # 公式スキーマに存在しないフィールドを警告
     # settings は plugin.json のフィールドではなく、settings.json はプラグインルート
     # 直下に配置すれば自動検出される。誤って指定された場合にサイレント無視を防ぐ。
     if "settings" in data:
         result.add_warning(
-            f"{file_path.name}: settingsはplugin.jsonの公式フィールドではありません。"
-            f"settings.jsonはプラグインルート直下に配置すれば自動検出されます"
+            "settingsはplugin.jsonの公式フィールドではありません。"
+            "settings.jsonはプラグインルート直下に配置すれば自動検出されます",
+            file=file_path,
+            rule="unknown-field",
         )
 
     # dependenciesの確認（v2.1.110以降）
     dependencies = data.get("dependencies")
     if dependencies is not None:
         if not isinstance(dependencies, list):
-            result.add_error(f"{file_path.name}: dependenciesは配列が必要です")
+            result.add_error(
+                "dependenciesは配列が必要です", file=file_path, rule="dependency-entries"
+            )
         else:
             for i, dep in enumerate(dependencies):
                 if not isinstance(dep, str):
-                    result.add_error(f"{file_path.name}: dependencies[{i}]は文字列が必要です")
+                    result.add_error(
+                        "dependencies[{}]は文字列が必要です",
+                        i,
+                        file=file_path,
+                        rule="dependency-entries",
+                    )
                 elif not dep:
-                    result.add_error(f"{file_path.name}: dependencies[{i}]は空文字列です")
+                    result.add_error(
+                        "dependencies[{}]は空文字列です",
+                        i,
+                        file=file_path,
+                        rule="dependency-entries",
+                    )
                 else:
                     dep_error = validate_kebab_case(dep)
                     if dep_error:
                         msg = f"dependencies[{i}]はkebab-case（小文字とハイフン）のみ: {dep}"
-                        result.add_warning(f"{file_path.name}: {msg}")
+                        result.add_warning(msg, file=file_path, rule="dependency-entries")
 
     # monitors がインライン配列の場合はエントリを検証（v2.1.105以降）
     monitors = data.get("monitors")
@@ -189,7 +242,9 @@ def validate_plugin_json(file_path: Path, content: str) -> ValidationResult:
     experimental = data.get("experimental")
     if experimental is not None:
         if not isinstance(experimental, dict):
-            result.add_error(f"{file_path.name}: experimentalはオブジェクトが必要です")
+            result.add_error(
+                "experimentalはオブジェクトが必要です", file=file_path, rule="experimental-value"
+            )
         else:
             # experimental.monitors がインライン配列の場合はエントリを検証
             exp_monitors = experimental.get("monitors")
@@ -200,8 +255,11 @@ def validate_plugin_json(file_path: Path, content: str) -> ValidationResult:
                 value = experimental.get(field)
                 if value and isinstance(value, str) and not value.startswith("./"):
                     result.add_warning(
-                        f"{file_path.name}: experimental.{field}"
-                        f"のパスは./で始めることを推奨: {value}"
+                        "experimental.{}のパスは./で始めることを推奨: {}",
+                        field,
+                        value,
+                        file=file_path,
+                        rule="path-prefix",
                     )
             # experimental 内デフォルトパスの冗長チェック
             exp_default_paths = {
@@ -212,8 +270,12 @@ def validate_plugin_json(file_path: Path, content: str) -> ValidationResult:
                 value = experimental.get(field)
                 if isinstance(value, str) and value in defaults:
                     result.add_warning(
-                        f"{file_path.name}: experimental.{field}"
-                        f"はデフォルトパス（{value}）と同一のため指定不要です。削除してください"
+                        "experimental.{}"
+                        "はデフォルトパス（{}）と同一のため指定不要です。削除してください",
+                        field,
+                        value,
+                        file=file_path,
+                        rule="default-path",
                     )
 
     # パスの確認
@@ -231,7 +293,13 @@ def validate_plugin_json(file_path: Path, content: str) -> ValidationResult:
     for field in path_fields:
         value = data.get(field)
         if value and isinstance(value, str) and not value.startswith("./"):
-            result.add_warning(f"{file_path.name}: {field}のパスは./で始めることを推奨: {value}")
+            result.add_warning(
+                "{}のパスは./で始めることを推奨: {}",
+                field,
+                value,
+                file=file_path,
+                rule="path-prefix",
+            )
 
     # skills フィールドはディレクトリパスのみ有効（ファイルパス指定はエラー、v2.1.145以降）
     skills_value = data.get("skills")
@@ -241,8 +309,11 @@ def validate_plugin_json(file_path: Path, content: str) -> ValidationResult:
             for skill_path in skills_paths:
                 if isinstance(skill_path, str) and Path(skill_path).suffix:
                     result.add_error(
-                        f"{file_path.name}: skillsにはディレクトリパスを指定してください。"
-                        f"ファイルパス（{skill_path}）を指定するとエラーになります"
+                        "skillsにはディレクトリパスを指定してください。"
+                        "ファイルパス（{}）を指定するとエラーになります",
+                        skill_path,
+                        file=file_path,
+                        rule="skills-path",
                     )
 
     # デフォルトパスと同一のコンポーネント参照は冗長
@@ -260,16 +331,22 @@ def validate_plugin_json(file_path: Path, content: str) -> ValidationResult:
         value = data.get(field)
         if isinstance(value, str) and value in defaults:
             result.add_warning(
-                f"{file_path.name}: {field}はデフォルトパス（{value}）と同一のため"
-                f"指定不要です。削除してください"
+                "{}はデフォルトパス（{}）と同一のため指定不要です。削除してください",
+                field,
+                value,
+                file=file_path,
+                rule="default-path",
             )
 
     # v2.1.129以降: monitors, themes はトップレベルではなく experimental ブロック配下を推奨
     for field in ["monitors", "themes"]:
         if field in data:
             result.add_warning(
-                f"{file_path.name}: {field}はトップレベルではなくexperimentalブロック配下に"
-                f"宣言することを推奨します（v2.1.129以降）。トップレベル宣言も引き続き動作します"
+                "{}はトップレベルではなくexperimentalブロック配下に"
+                "宣言することを推奨します（v2.1.129以降）。トップレベル宣言も引き続き動作します",
+                field,
+                file=file_path,
+                rule="experimental-placement",
             )
 
     return result
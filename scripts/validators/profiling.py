@@ -0,0 +1,146 @@
+"""
+CLIモードのプロファイル（--profile）
+
+ファイルごと・バリデーターごとの所要時間と、フェーズ別の内訳を集計する。
+
+  read:   ファイルの読み込み
+  parse:  フロントマター・JSONの解析（base の解析関数が通知する時間）
+  rules:  バリデーター呼び出しのうち解析以外の時間
+  output: 結果の出力
+
+バリデーター呼び出しは validate_plugin._safe_validate() で計測するため、
+各バリデーターのモジュールには手を入れずに全バリデーターが対象になる。
+cProfileによる関数単位のプロファイルも同時に取得して .pstats に保存できる。
+"""
+
+import heapq
+import json
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TextIO
+
+from . import base
+
+PHASES = ("read", "parse", "rules", "output")
+
+
+class Profiler:
+    """検証処理の所要時間を集計する"""
+
+    def __init__(self, top_n: int = 10, pstats_path: Path | None = None):
+        self.top_n = top_n
+        self.pstats_path = pstats_path
+        self.phase_ns = dict.fromkeys(PHASES, 0)
+        # バリデーターID -> [呼び出し回数, 合計時間, 最大時間]
+        self.validator_stats: dict[str, list[int]] = {}
+        self.files = 0
+        self.total_ns = 0
+        # 所要時間の大きいファイル上位top_n件（最小ヒープ）
+        self._slowest: list[tuple[int, int, str, str | None]] = []
+        self._parse_ns = 0
+        self._cprofile = None
+        self._started_ns = 0
+
+    def _observe_parse(self, elapsed_ns: int) -> None:
+        self._parse_ns += elapsed_ns
+
+    def start(self) -> None:
+        """計測を開始する（解析時間の通知とcProfileを有効にする）"""
+        base.set_parse_observer(self._observe_parse)
+        if self.pstats_path is not None:
+            import cProfile
+
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self._started_ns = time.perf_counter_ns()
+
+    def stop(self) -> None:
+        """計測を終了する（.pstatsの保存を含む）"""
+        self.total_ns = time.perf_counter_ns() - self._started_ns
+        base.set_parse_observer(None)
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.pstats_path)
+            self._cprofile = None
+
+    def add_phase(self, name: str, elapsed_ns: int) -> None:
+        """フェーズnameの所要時間を加算する"""
+        self.phase_ns[name] += elapsed_ns
+
+    @contextmanager
+    def validator_call(self, validator_id: str | None) -> Iterator[None]:
+        """バリデーター1回の呼び出しを計測し、解析とそれ以外（rules）に分けて加算する"""
+        parse_before = self._parse_ns
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            parse_ns = self._parse_ns - parse_before
+            self.phase_ns["parse"] += parse_ns
+            self.phase_ns["rules"] += elapsed - parse_ns
+            stats = self.validator_stats.setdefault(validator_id or "-", [0, 0, 0])
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] = max(stats[2], elapsed)
+
+    def record_file(self, file_path: Path, validator_id: str | None, elapsed_ns: int) -> None:
+        """ファイル1件の所要時間（読み込みから検証まで）を記録する"""
+        self.files += 1
+        entry = (elapsed_ns, self.files, str(file_path), validator_id)
+        if len(self._slowest) < self.top_n:
+            heapq.heappush(self._slowest, entry)
+        elif self._slowest and entry > self._slowest[0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def summary(self) -> dict:
+        """集計結果をJSONに書き出せる形で返す"""
+        validators = {
+            validator_id: {
+                "calls": calls,
+                "total_ms": total / 1e6,
+                "mean_ms": total / calls / 1e6,
+                "max_ms": longest / 1e6,
+            }
+            for validator_id, (calls, total, longest) in sorted(
+                self.validator_stats.items(), key=lambda item: -item[1][1]
+            )
+        }
+        return {
+            "files": self.files,
+            "total_ms": self.total_ns / 1e6,
+            "phases_ms": {name: ns / 1e6 for name, ns in self.phase_ns.items()},
+            "validators": validators,
+            "slowest_files": [
+                {"path": path, "validator": validator_id, "ms": elapsed / 1e6}
+                for elapsed, _, path, validator_id in sorted(self._slowest, reverse=True)
+            ],
+        }
+
+    def write_summary(self, path: Path) -> None:
+        """集計結果をJSONファイルに書き出す"""
+        path.write_text(
+            json.dumps(self.summary(), ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+        )
+
+    def print_report(self, stream: TextIO) -> None:
+        """集計結果を人が読む形式で出力する"""
+        summary = self.summary()
+        print(
+            f"⏱  プロファイル: {summary['files']}ファイル / {summary['total_ms']:.1f}ms",
+            file=stream,
+        )
+        phases = "  ".join(f"{name} {ms:.1f}ms" for name, ms in summary["phases_ms"].items())
+        print(f"   フェーズ別: {phases}", file=stream)
+        print("   バリデーター別:", file=stream)
+        for validator_id, stats in summary["validators"].items():
+            print(
+                f"     {validator_id:<18} {stats['calls']:>6}回  合計 {stats['total_ms']:.1f}ms"
+                f"  平均 {stats['mean_ms']:.3f}ms  最大 {stats['max_ms']:.3f}ms",
+                file=stream,
+            )
+        print(f"   遅いファイル（上位{self.top_n}件）:", file=stream)
+        for entry in summary["slowest_files"]:
+            print(f"     {entry['ms']:>9.3f}ms  {entry['path']}", file=stream)
@@ -3,9 +3,10 @@ README.mdのバリデーター
 """
 
 import re
+from collections.abc import Iterator
 from pathlib import Path
 
-from .base import ValidationResult
+from .base import ValidationResult, count_regex_scans, count_stat_call, rule, with_suppressions
 
 # 必須セクション（日本語/英語の両方に対応）
 REQUIRED_SECTIONS = [
@@ -15,14 +16,13 @@ REQUIRED_SECTIONS = [
 ]
 
 
+@with_suppressions
 def validate_readme(file_path: Path, content: str) -> ValidationResult:
     """README.mdを検証する"""
     result = ValidationResult()
 
     # 必須セクションの存在確認
-    for pattern, section_name in REQUIRED_SECTIONS:
-        if not re.search(pattern, content, re.IGNORECASE):
-            result.add_error(f"{file_path.name}: 必須セクション「{section_name}」がありません")
+    _check_required_sections(file_path, content, result)
 
     # 相対パスリンクのチェック（コードブロック内のサンプルリンクは対象外にする）
     _check_relative_links(file_path, _strip_code_blocks(content), result)
@@ -33,6 +33,15 @@ def validate_readme(file_path: Path, content: str) -> ValidationResult:
     return result
 
 
+@rule("required-sections")
+def _check_required_sections(file_path: Path, content: str, result: ValidationResult) -> None:
+    """必須セクションの見出しがあるかをチェックする"""
+    count_regex_scans(len(REQUIRED_SECTIONS))
+    for pattern, section_name in REQUIRED_SECTIONS:
+        if not re.search(pattern, content, re.IGNORECASE):
+            result.add_error("必須セクション「{}」がありません", section_name, file=file_path)
+
+
 def _strip_code_blocks(content: str) -> str:
     """フェンス付きコードブロックの中身を空行に置き換えた文字列を返す
 
@@ -58,18 +67,52 @@ def _strip_code_blocks(content: str) -> str:
     return "\n".join(stripped_lines)
 
 
-def _check_relative_links(file_path: Path, content: str, result: ValidationResult) -> None:
-    """相対パスのリンク切れをチェックする"""
-    # Markdownリンク: [text](path) 形式
-    # 外部URL（http://, https://）は除外
-    # 画像記法 ![alt](path) の [alt](path) 部分は除外（直前の!を否定先読み）
-    link_pattern = r"(?<!!)\[([^\]]*)\]\(([^)]*)\)"
-    base_dir = file_path.parent
+# リンク・画像の開始位置（リンクは画像記法 ![alt](path) の [alt](path) 部分を除くため、直前の!を否定先読み）
+_LINK_OPEN = re.compile(r"(?<!!)\[")
+_IMAGE_OPEN = re.compile(r"!\[")
 
-    for match in re.finditer(link_pattern, content):
-        link_text = match.group(1)
-        link_path = match.group(2)
 
+def _scan_bracketed(
+    content: str, opener: re.Pattern[str], allow_empty_path: bool
+) -> Iterator[tuple[str, str, int]]:
+    r"""[text](path) 形式を (テキスト, パス, 位置) で返す
+
+    正規表現 opener + r"([^\]]*)\]\(([^)]*)\)"（allow_empty_path が偽ならパスは1文字以上）を
+    re.finditer したのと同じ結果を返す。正規表現のままだと、閉じない [ が大量に続く入力で
+    開始位置ごとに末尾まで走査し直す（入力長の二乗の時間がかかる）ため、同じ ] を
+    共有する開始位置をまとめて読み飛ばし、入力を1回だけ走査する。
+    """
+    pos = 0
+    while True:
+        match = opener.search(content, pos)
+        if match is None:
+            return
+        # テキストは最初の ] まで。この ] より前から始まる候補はすべて同じ ] で終わるので、
+        # 続きが ( でなければそれらも一致しない
+        close = content.find("]", match.end())
+        if close == -1:
+            return
+        if content.startswith("(", close + 1):
+            end = content.find(")", close + 2)
+            if end == -1:
+                # 以降のどの候補にも閉じる ) がない
+                return
+            if allow_empty_path or end > close + 2:
+                yield content[match.end() : close], content[close + 2 : end], match.start()
+                pos = end + 1
+                continue
+        pos = close + 1
+
+
+def _iter_relative_links(content: str) -> Iterator[tuple[str, str, str, str, int]]:
+    """相対パスのリンク・画像参照を (記法, テキスト, 記述されたパス, 解決に使うパス, 位置) で返す
+
+    記法は "link"（[text](path)）か "image"（![alt](path)）。位置は content 上のオフセット。
+    """
+    # Markdownリンク: [text](path) 形式
+    # 外部URL（http://, https://）は除外
+    count_regex_scans()
+    for link_text, link_path, offset in _scan_bracketed(content, _LINK_OPEN, True):
         # アンカーリンク（#で始まる）はスキップ
         if link_path.startswith("#"):
             continue
@@ -83,35 +126,73 @@ def _check_relative_links(file_path: Path, content: str, result: ValidationResul
         if not link_path_without_anchor:
             continue
 
-        # 相対パスを解決
-        target_path = (base_dir / link_path_without_anchor).resolve()
-
-        if not target_path.exists():
-            result.add_error(
-                f"{file_path.name}: リンク切れ [{link_text}]({link_path}) - ファイルが存在しません"
-            )
+        yield "link", link_text, link_path, link_path_without_anchor, offset
 
     # 画像参照: ![alt](path) 形式
-    image_pattern = r"!\[([^\]]*)\]\(([^)]+)\)"
-
-    for match in re.finditer(image_pattern, content):
-        alt_text = match.group(1)
-        image_path = match.group(2)
-
+    count_regex_scans()
+    for alt_text, image_path, offset in _scan_bracketed(content, _IMAGE_OPEN, False):
         # 外部URLはスキップ
         if image_path.startswith(("http://", "https://")):
             continue
 
+        yield "image", alt_text, image_path, image_path, offset
+
+
+def linked_paths(file_path: Path, content: str) -> set[Path]:
+    """READMEが相対パスで参照しているファイルの絶対パスを返す
+
+    リンク切れチェックと同じ規則（コードブロック内は対象外）で抽出するため、
+    ファイルの削除・移動で検証結果が変わるREADMEを探すのに使える。
+    """
+    base_dir = file_path.parent
+    return {
+        (base_dir / target).resolve()
+        for _, _, _, target, _ in _iter_relative_links(_strip_code_blocks(content))
+    }
+
+
+@rule("relative-links")
+def _check_relative_links(file_path: Path, content: str, result: ValidationResult) -> None:
+    """相対パスのリンク切れをチェックする
+
+    content はコードブロックを空行にしたもの（行番号は元の内容と同じ）。
+    """
+    base_dir = file_path.parent
+    # 行番号は直前に数えた位置から差分だけ数える（画像の走査に移ったら先頭から数え直す）
+    line, counted = 1, 0
+
+    for kind, text, raw_path, target, offset in _iter_relative_links(content):
         # 相対パスを解決
-        target_path = (base_dir / image_path).resolve()
+        target_path = (base_dir / target).resolve()
+        count_stat_call()
+        exists = target_path.exists()
+        result.path_checks[str(target_path)] = exists
 
-        if not target_path.exists():
+        if exists:
+            continue
+        if offset < counted:
+            line, counted = 1, 0
+        line += content.count("\n", counted, offset)
+        counted = offset
+        if kind == "link":
+            result.add_error(
+                "リンク切れ [{}]({}) - ファイルが存在しません",
+                text,
+                raw_path,
+                file=file_path,
+                line=line,
+            )
+        else:
             result.add_error(
-                f"{file_path.name}: 画像リンク切れ ![{alt_text}]({image_path}) "
-                f"- ファイルが存在しません"
+                "画像リンク切れ ![{}]({}) - ファイルが存在しません",
+                text,
+                raw_path,
+                file=file_path,
+                line=line,
             )
 
 
+@rule("code-block-language")
 def _check_code_blocks(file_path: Path, content: str, result: ValidationResult) -> None:
     """コードブロックの言語指定をチェックする"""
     # ```のみで言語指定がないコードブロックを検出
@@ -130,7 +211,7 @@ def _check_code_blocks(file_path: Path, content: str, result: ValidationResult)
                 lang_spec = stripped[3:].strip()
                 if not lang_spec:
                     result.add_warning(
-                        f"{file_path.name}: {i}行目のコードブロックに言語指定がありません"
+                        "{}行目のコードブロックに言語指定がありません", i, file=file_path, line=i
                     )
             else:
                 # コードブロック終了
@@ -0,0 +1,294 @@
+"""
+バリデーターの登録とパス判定
+
+各バリデーターは「ファイル名」「拡張子」「ディレクトリ名」の条件を宣言して登録する。
+登録内容はファイル名と拡張子をキーにした辞書にまとめられ、classify() は
+パスごとに辞書を1回引いて、登録順で最初に条件を満たしたバリデーターを返す。
+
+このモジュールはバリデーター本体をimportしない。バリデーターモジュールは
+ValidatorSpec を呼び出した時点で初めて読み込まれる。
+"""
+
+import sys
+from pathlib import PurePath
+
+
+class ValidatorSpec:
+    """バリデーターの登録情報
+
+    filename / suffix / directory のうちNoneでない条件をすべて満たすパスを対象とする。
+    インスタンスはバリデーター関数と同じく (file_path, content) で呼び出せる。
+    """
+
+    __slots__ = ("id", "module", "function", "filename", "suffix", "directory", "priority")
+
+    def __init__(
+        self,
+        id: str,
+        module: str,
+        function: str,
+        *,
+        filename: str | None = None,
+        suffix: str | None = None,
+        directory: str | None = None,
+        priority: int = 0,
+    ):
+        self.id = id
+        self.module = module
+        self.function = function
+        self.filename = filename
+        self.suffix = suffix
+        self.directory = directory
+        self.priority = priority
+
+    def __repr__(self) -> str:
+        return f"ValidatorSpec({self.id!r})"
+
+    def matches(self, path: PurePath) -> bool:
+        """パスがこのバリデーターの条件をすべて満たすか"""
+        if self.filename is not None and path.name != self.filename:
+            return False
+        if self.suffix is not None and path.suffix != self.suffix:
+            return False
+        if self.directory is not None and self.directory not in path.parts:
+            return False
+        return True
+
+    def load(self):
+        """バリデーター関数を返す（未読み込みならここでモジュールをimportする）"""
+        return getattr(sys.modules[__package__], self.function)
+
+    def __call__(self, file_path, content):
+        return self.load()(file_path, content)
+
+
+_specs: list[ValidatorSpec] = []
+_modules_by_function: dict[str, str] = {}
+_by_filename: dict[str, tuple[ValidatorSpec, ...]] = {}
+_by_suffix: dict[str, tuple[ValidatorSpec, ...]] = {}
+_compiled = False
+
+
+def register(
+    id: str,
+    module: str,
+    function: str,
+    *,
+    filename: str | None = None,
+    suffix: str | None = None,
+    directory: str | None = None,
+) -> ValidatorSpec:
+    """バリデーターを登録する
+
+    先に登録したものほど優先される。filenameとsuffixの少なくとも一方が必要。
+
+    Args:
+        id: バリデーターの識別子（出力・キャッシュキー用）
+        module: バリデーター関数を定義するモジュール名（validatorsパッケージ内）
+        function: バリデーター関数名
+        filename: 完全一致させるファイル名
+        suffix: 一致させる拡張子（例: ".md"）
+        directory: パスに含まれている必要があるディレクトリ名
+    """
+    global _compiled
+    if filename is None and suffix is None:
+        raise ValueError(f"{id}: filenameかsuffixのいずれかが必要です")
+    if any(spec.id == id for spec in _specs):
+        raise ValueError(f"{id}: 既に登録されています")
+    spec = ValidatorSpec(
+        id,
+        module,
+        function,
+        filename=filename,
+        suffix=suffix,
+        directory=directory,
+        priority=len(_specs),
+    )
+    _specs.append(spec)
+    _modules_by_function[function] = module
+    _compiled = False
+    return spec
+
+
+def registered_validators() -> tuple[ValidatorSpec, ...]:
+    """登録済みのバリデーターを優先順に返す"""
+    return tuple(_specs)
+
+
+def module_for_function(function: str) -> str | None:
+    """登録済みバリデーター関数の定義元モジュール名を返す（未登録ならNone）"""
+    return _modules_by_function.get(function)
+
+
+def _compile() -> None:
+    """登録内容からファイル名・拡張子の参照テーブルを作る
+
+    ファイル名テーブルの各エントリには、そのファイル名の拡張子に一致する
+    拡張子条件のバリデーターも優先順に含めておく。これにより classify() は
+    ファイル名テーブルで見つかればそれだけ、見つからなければ拡張子テーブルだけを見ればよい。
+    """
+    global _compiled
+    by_suffix: dict[str, list[ValidatorSpec]] = {}
+    for spec in _specs:
+        if spec.filename is None:
+            by_suffix.setdefault(spec.suffix, []).append(spec)
+
+    by_filename: dict[str, list[ValidatorSpec]] = {}
+    for spec in _specs:
+        if spec.filename is not None:
+            by_filename.setdefault(spec.filename, []).append(spec)
+    for filename, candidates in by_filename.items():
+        candidates.extend(by_suffix.get(PurePath(filename).suffix, []))
+        candidates.sort(key=lambda spec: spec.priority)
+
+    _by_filename.clear()
+    _by_filename.update({key: tuple(value) for key, value in by_filename.items()})
+    _by_suffix.clear()
+    _by_suffix.update({key: tuple(value) for key, value in by_suffix.items()})
+    _compiled = True
+
+
+def _suffix_of(name: str) -> str:
+    """PurePath.suffix と同じ規則でファイル名の拡張子を返す"""
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        return name[dot:]
+    return ""
+
+
+def is_candidate_name(name: str) -> bool:
+    """ファイル名だけで検証対象になり得るかを判定する（Pathを作らない事前フィルター）
+
+    Trueでもディレクトリ条件により classify() がNoneを返すことはある。
+    """
+    if not _compiled:
+        _compile()
+    return name in _by_filename or _suffix_of(name) in _by_suffix
+
+
+def classify(path: PurePath) -> ValidatorSpec | None:
+    """パスに対応するバリデーターを返す（対象外ならNone）"""
+    if not _compiled:
+        _compile()
+    candidates = _by_filename.get(path.name)
+    if candidates is None:
+        candidates = _by_suffix.get(path.suffix)
+        if candidates is None:
+            return None
+    for spec in candidates:
+        if spec.matches(path):
+            return spec
+    return None
+
+
+# ---------------------------------------------------------------------------
+# 組み込みバリデーターの登録（登録順 = 優先順）
+# ---------------------------------------------------------------------------
+
+register("skill", "skill", "validate_skill", filename="SKILL.md")
+register(
+    "slash-command", "slash_command", "validate_slash_command", suffix=".md", directory="commands"
+)
+register("agent", "agent", "validate_agent", suffix=".md", directory="agents")
+register("hooks-json", "hooks_json", "validate_hooks_json", filename="hooks.json")
+register("mcp-json", "mcp_json", "validate_mcp_json", filename=".mcp.json")
+register("lsp-json", "lsp_json", "validate_lsp_json", filename=".lsp.json")
+register(
+    "monitors-json",
+    "monitors_json",
+    "validate_monitors_json",
+    filename="monitors.json",
+    directory="monitors",
+)
+register(
+    "plugin-json",
+    "plugin_json",
+    "validate_plugin_json",
+    filename="plugin.json",
+    directory=".claude-plugin",
+)
+register(
+    "marketplace-json",
+    "marketplace_json",
+    "validate_marketplace_json",
+    filename="marketplace.json",
+    directory=".claude-plugin",
+)
+register(
+    "output-style", "output_style", "validate_output_style", suffix=".md", directory="output-styles"
+)
+register("readme", "readme", "validate_readme", filename="README.md", directory="plugins")
+
+
+# ---------------------------------------------------------------------------
+# 検証ルールのID
+# ---------------------------------------------------------------------------
+
+# バリデーターが報告する問題はすべて、ここにあるルールIDのどれかを持つ（@rule("rule-id") の
+# ルールIDか、add_error / add_warning の rule= で指定したルールID）。
+# バリデーターモジュールを読み込まずに設定ファイルのルールIDを確かめるため、別に
+# 列挙している（test_registry.py でバリデーターのルールIDと一致することを確認する）
+RULE_IDS = frozenset(
+    {
+        "agent-value",
+        "argument-hint-value",
+        "background-value",
+        "body-length",
+        "broad-bash-wildcard",
+        "channel-entries",
+        "code-block-language",
+        "context-value",
+        "dangerous-operation",
+        "default-enabled-value",
+        "default-path",
+        "dependency-entries",
+        "description-value",
+        "display-name-value",
+        "effort-value",
+        "empty-body",
+        "empty-config",
+        "experimental-placement",
+        "experimental-value",
+        "extension-format",
+        "frontmatter-hooks",
+        "hardcoded-secrets",
+        "hook-entries",
+        "hook-event",
+        "hook-fields",
+        "hook-matcher",
+        "hook-type",
+        "http-allowed-env-vars",
+        "initial-prompt-value",
+        "isolation-value",
+        "json-syntax",
+        "keep-coding-instructions-value",
+        "lsp-servers",
+        "marketplace-owner",
+        "marketplace-plugins",
+        "marketplace-renames",
+        "mcp-servers",
+        "memory-value",
+        "missing-description",
+        "model-value",
+        "monitor-entries",
+        "name-value",
+        "path-prefix",
+        "permission-mode-value",
+        "relative-links",
+        "required-sections",
+        "reserved-server-name",
+        "root-type",
+        "short-description",
+        "skills-path",
+        "string-or-list",
+        "task-syntax",
+        "tool-name-glob",
+        "unknown-field",
+        "unknown-rule-id",
+        "unquoted-boolean",
+        "user-config",
+        "user-invocable-value",
+        "version-format",
+        "yaml-syntax",
+    }
+)
@@ -0,0 +1,143 @@
+"""
+CLIモードの検証結果の出力形式
+
+どの形式もファイル1件の結果を受け取るたびに書き出し、結果を溜め込まない。
+そのためファイル数が増えてもメモリ使用量は一定のまま。
+
+  text:  人が読むための形式（従来どおりstderrに問題のあったファイルだけ出力）
+  jsonl: ファイル1件につき1行のJSON（問題のないファイルも含む）
+  sarif: SARIF 2.1.0 の1つのドキュメント。先頭を固定で書き、results配列の要素を
+         結果が出るたびに書き足す。ルールの一覧（tool）は出現したルールIDが
+         そろった末尾で書く
+"""
+
+import json
+from pathlib import Path
+from typing import TextIO
+
+from .base import SEVERITY_ERROR, SEVERITY_WARNING, Diagnostic, ValidationResult
+from .registry import registered_validators
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_VERSION = "2.1.0"
+TOOL_NAME = "validate-plugin"
+
+
+class TextReporter:
+    """人が読むための形式で出力する"""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    def start(self) -> None:
+        pass
+
+    def report(self, file_path: Path, validator_id: str | None, result: ValidationResult) -> None:
+        if result.has_errors():
+            print(f"❌ {file_path}", file=self.stream)
+            for error in result.errors:
+                print(f"   エラー: {error}", file=self.stream)
+
+        if result.has_warnings():
+            if not result.has_errors():
+                print(f"⚠️  {file_path}", file=self.stream)
+            for warning in result.warnings:
+                print(f"   警告: {warning}", file=self.stream)
+
+    def finish(self) -> None:
+        pass
+
+
+class JsonlReporter:
+    """ファイル1件につき1行のJSONを出力する"""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    def start(self) -> None:
+        pass
+
+    def report(self, file_path: Path, validator_id: str | None, result: ValidationResult) -> None:
+        record = {
+            "path": str(file_path),
+            "validator": validator_id,
+            "errors": result.errors,
+            "warnings": result.warnings,
+            "diagnostics": [diagnostic.to_dict() for diagnostic in result.diagnostics],
+        }
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        # 下流のツールが実行中から結果を読めるよう、1件ごとに書き出す
+        self.stream.flush()
+
+    def finish(self) -> None:
+        pass
+
+
+class SarifReporter:
+    """SARIF 2.1.0 形式で出力する
+
+    ruleIdには問題のルールID（読み込みエラーのようにルールIDを持たない問題は
+    バリデーターID）を使う。ルールの一覧には登録済みのバリデーターすべてと、
+    出現したルールIDを宣言する。
+    """
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self._first_result = True
+        self._rule_ids: set[str] = set()
+
+    def start(self) -> None:
+        # runのプロパティは順不同なので、resultsを先に書いてtoolはfinish()で書く
+        self.stream.write(
+            f'{{"$schema": "{SARIF_SCHEMA}", "version": "{SARIF_VERSION}", "runs": [{{"results": ['
+        )
+
+    def report(self, file_path: Path, validator_id: str | None, result: ValidationResult) -> None:
+        # SARIFのresultsは重要度ごとに並べる（エラーが先）
+        for severity in (SEVERITY_ERROR, SEVERITY_WARNING):
+            for diagnostic in result.by_severity(severity):
+                self._write_result(file_path, validator_id, diagnostic)
+
+    def _write_result(
+        self, file_path: Path, validator_id: str | None, diagnostic: Diagnostic
+    ) -> None:
+        physical_location: dict = {"artifactLocation": {"uri": _artifact_uri(file_path)}}
+        if diagnostic.line is not None:
+            region = {"startLine": diagnostic.line}
+            if diagnostic.column is not None:
+                region["startColumn"] = diagnostic.column
+            physical_location["region"] = region
+        sarif_result = {
+            "level": diagnostic.severity,
+            "message": {"text": diagnostic.message()},
+            "locations": [{"physicalLocation": physical_location}],
+        }
+        rule_id = diagnostic.rule_id or validator_id
+        if rule_id is not None:
+            self._rule_ids.add(rule_id)
+            sarif_result = {"ruleId": rule_id, **sarif_result}
+        separator = "\n" if self._first_result else ",\n"
+        self._first_result = False
+        self.stream.write(separator + json.dumps(sarif_result, ensure_ascii=False))
+
+    def finish(self) -> None:
+        validator_ids = [spec.id for spec in registered_validators()]
+        rule_ids = validator_ids + sorted(self._rule_ids.difference(validator_ids))
+        rules = [{"id": rule_id} for rule_id in rule_ids]
+        driver = json.dumps({"name": TOOL_NAME, "rules": rules}, ensure_ascii=False)
+        self.stream.write(f'\n], "tool": {{"driver": {driver}}}}}]}}\n')
+        self.stream.flush()
+
+
+def _artifact_uri(file_path: Path) -> str:
+    """SARIFのartifactLocation.uri（相対パスはそのまま、絶対パスはfile URI）"""
+    if file_path.is_absolute():
+        return file_path.as_uri()
+    return file_path.as_posix()
+
+
+REPORTERS = {
+    "text": TextReporter,
+    "jsonl": JsonlReporter,
+    "sarif": SarifReporter,
+}
@@ -8,7 +8,7 @@
 import re
 from pathlib import Path
 
-from .base import ValidationResult
+from .base import ValidationResult, count_regex_scans, rule
 
 # 各パターンは (パターン名, 正規表現) のタプル
 # ${VAR} のような環境変数プレースホルダーには決してマッチしないよう、
@@ -25,6 +25,7 @@ SECRET_PATTERNS: list[tuple[str, re.Pattern]] = [
 ]
 
 
+@rule("hardcoded-secrets")
 def detect_hardcoded_secrets(result: ValidationResult, file_path: Path, content: str) -> None:
     """
     コンテンツ中にハードコードされた機密情報のパターンがないか検出する
@@ -34,9 +35,14 @@ def detect_hardcoded_secrets(result: ValidationResult, file_path: Path, content:
         file_path: エラーメッセージ用のファイルパス
         content: 検査対象のファイル内容全体
     """
+    count_regex_scans(len(SECRET_PATTERNS))
     for pattern_name, pattern in SECRET_PATTERNS:
-        if pattern.search(content):
+        match = pattern.search(content)
+        if match:
             result.add_error(
-                f"{file_path.name}: {pattern_name}のようなハードコードされた機密情報を"
-                "検出しました。${VAR}形式で環境変数から参照してください"
+                "{}のようなハードコードされた機密情報を"
+                "検出しました。${{VAR}}形式で環境変数から参照してください",
+                pattern_name,
+                file=file_path,
+                line=content.count("\n", 0, match.start()) + 1,
             )
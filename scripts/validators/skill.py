@@ -8,9 +8,8 @@ from pathlib import Path
 from .base import (
     ValidationResult,
     add_yaml_warnings,
-    get_disabled_warnings,
     is_valid_boolean_value,
-    parse_frontmatter,
+    parse_document,
     to_str,
     validate_agent_field,
     validate_allow_ask_glob_fields,
@@ -18,80 +17,125 @@ from .base import (
     validate_context_field,
     validate_effort_field,
     validate_string_or_list_field,
+    with_suppressions,
 )
 
 # ブール値フィールドの許可値ヒント（yes/no/on/off/1/0を大文字小文字区別なしで許可）
 _BOOLEAN_HINT = "true/false/yes/no/on/off/1/0のいずれか（大文字小文字区別なし）"
 
 
+@with_suppressions
 def validate_skill(file_path: Path, content: str) -> ValidationResult:
     """スキルを検証する"""
     result = ValidationResult()
-    frontmatter, body, yaml_warnings = parse_frontmatter(content)
-    disabled_warnings = get_disabled_warnings(content)
+    document = parse_document(content)
+    frontmatter = document.frontmatter
+    lines = document.field_lines
 
-    add_yaml_warnings(result, file_path, yaml_warnings)
+    add_yaml_warnings(result, file_path, document.yaml_warnings, document.yaml_warning_lines)
 
     # nameの確認
     name = frontmatter.get("name", "")
     name_str = to_str(name)
+    name_line = lines.get("name")
     if not name_str:
-        result.add_error(f"{file_path.name}: nameが必須です")
+        result.add_error("nameが必須です", file=file_path, rule="name-value", line=name_line)
     else:
         # 形式チェック
         if len(name_str) > 64:
             result.add_error(
-                f"{file_path.name}: nameは64文字以内にしてください: {len(name_str)}文字"
+                "nameは64文字以内にしてください: {}文字",
+                len(name_str),
+                file=file_path,
+                rule="name-value",
+                line=name_line,
             )
         if not re.match(r"^[a-z0-9-]+$", name_str):
-            result.add_error(f"{file_path.name}: nameは小文字、数字、ハイフンのみ使用可能です")
+            result.add_error(
+                "nameは小文字、数字、ハイフンのみ使用可能です",
+                file=file_path,
+                rule="name-value",
+                line=name_line,
+            )
         # 予約語チェック
         if "anthropic" in name_str.lower() or "claude" in name_str.lower():
-            result.add_error(f"{file_path.name}: nameに予約語（anthropic, claude）は使用できません")
+            result.add_error(
+                "nameに予約語（anthropic, claude）は使用できません",
+                file=file_path,
+                rule="name-value",
+                line=name_line,
+            )
 
     # descriptionの確認
     description = frontmatter.get("description", "")
     description_str = to_str(description)
     if not description_str:
-        result.add_error(f"{file_path.name}: descriptionが必須です")
+        result.add_error(
+            "descriptionが必須です",
+            file=file_path,
+            rule="description-value",
+            line=lines.get("description"),
+        )
     elif len(description_str) > 1536:
         result.add_error(
-            f"{file_path.name}: descriptionは1536文字以内にしてください: {len(description_str)}文字"
+            "descriptionは1536文字以内にしてください: {}文字",
+            len(description_str),
+            file=file_path,
+            rule="description-value",
+            line=lines.get("description"),
         )
 
     # contextの確認（forkのみサポート、省略時はメインコンテキスト）
-    validate_context_field(result, file_path, frontmatter)
+    validate_context_field(result, file_path, frontmatter, lines=lines)
 
     # backgroundの確認（context: forkはデフォルトでバックグラウンド実行され、
     # background: falseで個別にオプトアウト可能）
     background = frontmatter.get("background")
     if background is not None and not is_valid_boolean_value(background):
-        result.add_error(f"{file_path.name}: backgroundはブール値が必要です（{_BOOLEAN_HINT}）")
+        result.add_error(
+            "backgroundはブール値が必要です（{}）",
+            _BOOLEAN_HINT,
+            file=file_path,
+            rule="background-value",
+            line=lines.get("background"),
+        )
 
     # modelの値チェック
     model = frontmatter.get("model", "")
     model_str = to_str(model)
     valid_models = ["sonnet", "opus", "haiku", ""]
     if model_str and model_str not in valid_models:
-        result.add_warning(f"{file_path.name}: modelが不正: {model_str}（sonnet/opus/haiku）")
+        result.add_warning(
+            "modelが不正: {}（sonnet/opus/haiku）",
+            model_str,
+            file=file_path,
+            rule="model-value",
+            line=lines.get("model"),
+        )
 
     # user-invocableの確認（boolean型。yes/no/on/off/1/0も許可）
     user_invocable = frontmatter.get("user-invocable")
     if user_invocable is not None and not is_valid_boolean_value(user_invocable):
-        result.add_error(f"{file_path.name}: user-invocableはブール値が必要です（{_BOOLEAN_HINT}）")
+        result.add_error(
+            "user-invocableはブール値が必要です（{}）",
+            _BOOLEAN_HINT,
+            file=file_path,
+            rule="user-invocable-value",
+            line=lines.get("user-invocable"),
+        )
 
     # agentの確認（空でない文字列）
-    validate_agent_field(result, file_path, frontmatter)
+    validate_agent_field(result, file_path, frontmatter, lines=lines)
 
     # allow/askのツール名位置グロブを検証（v2.1.166以降）
-    validate_allow_ask_glob_fields(result, file_path, frontmatter)
+    validate_allow_ask_glob_fields(result, file_path, frontmatter, lines=lines)
 
     # allowed-toolsの確認（リスト形式対応）
-    validate_allowed_tools(result, file_path, frontmatter, disabled_warnings)
+    validate_allowed_tools(result, file_path, frontmatter, lines=lines)
 
     # disallowed-toolsの確認（文字列またはリスト形式、v2.1.152以降）
     validate_string_or_list_field(
-        result, file_path, "disallowed-tools", frontmatter.get("disallowed-tools")
+        result, file_path, "disallowed-tools", frontmatter.get("disallowed-tools"), lines=lines
     )
 
     # effortの確認（v2.1.80以降。v2.1.111でxhigh追加、maxも従来から有効）
@@ -101,6 +145,7 @@ def validate_skill(file_path: Path, content: str) -> ValidationResult:
         frontmatter,
         ["low", "medium", "high", "xhigh", "max"],
         hint="low/medium/high/xhigh/max",
+        lines=lines,
     )
 
     # display-name の確認（v2.1.186以降: kebab-case/snake_case/camelCase対応）
@@ -112,7 +157,13 @@ def validate_skill(file_path: Path, content: str) -> ValidationResult:
     if display_name_variants:
         field_key, display_name_val = display_name_variants[0]
         if not to_str(display_name_val):
-            result.add_error(f"{file_path.name}: {field_key}は空にできません")
+            result.add_error(
+                "{}は空にできません",
+                field_key,
+                file=file_path,
+                rule="display-name-value",
+                line=lines.get(field_key),
+            )
 
     # default-enabled の確認（v2.1.186以降: kebab-case/snake_case/camelCase対応）
     default_enabled_variants = [
@@ -124,7 +175,12 @@ def validate_skill(file_path: Path, content: str) -> ValidationResult:
         field_key, default_enabled_val = default_enabled_variants[0]
         if not is_valid_boolean_value(default_enabled_val):
             result.add_error(
-                f"{file_path.name}: {field_key}はブール値が必要です（{_BOOLEAN_HINT}）"
+                "{}はブール値が必要です（{}）",
+                field_key,
+                _BOOLEAN_HINT,
+                file=file_path,
+                rule="default-enabled-value",
+                line=lines.get(field_key),
             )
 
     # fallback（v2.1.186以降）: 1単語のためkebab-case/snake_case/camelCaseすべて同形。
@@ -143,11 +199,18 @@ def validate_skill(file_path: Path, content: str) -> ValidationResult:
     hooks = frontmatter.get("hooks")
     if hooks is not None:
         # hooksはYAML形式で定義されるため、フロントマターで直接設定されている場合は警告
-        result.add_warning(f"{file_path.name}: hooksはhooks.jsonでの定義を推奨します")
+        result.add_warning(
+            "hooksはhooks.jsonでの定義を推奨します",
+            file=file_path,
+            rule="frontmatter-hooks",
+            line=lines.get("hooks"),
+        )
 
     # 本文の行数チェック
-    body_lines = body.strip().split("\n")
-    if len(body_lines) > 500:
-        result.add_warning(f"{file_path.name}: 本文が500行超（{len(body_lines)}行）。分割を検討")
+    body_line_count = document.body.line_count()
+    if body_line_count > 500:
+        result.add_warning(
+            "本文が500行超（{}行）。分割を検討", body_line_count, file=file_path, rule="body-length"
+        )
 
     return result
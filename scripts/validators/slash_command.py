@@ -7,10 +7,12 @@ from pathlib import Path
 
 from .base import (
     WARNING_DANGEROUS_OPERATION,
+    ParsedDocument,
     ValidationResult,
     add_yaml_warnings,
-    get_disabled_warnings,
-    parse_frontmatter,
+    count_regex_scans,
+    parse_document,
+    rule,
     to_str,
     validate_agent_field,
     validate_allow_ask_glob_fields,
@@ -18,6 +20,7 @@ from .base import (
     validate_context_field,
     validate_effort_field,
     validate_string_or_list_field,
+    with_suppressions,
 )
 
 # 引用符なしのYAMLブール値キーワードを検出するパターン
@@ -53,100 +56,146 @@ for _kw in _DANGEROUS_KEYWORDS:
     _suffixes = ["e?s", "e?d", "ing", *_KEYWORD_EXTRA_SUFFIXES.get(_kw, [])]
     _suffix_group = "|".join(_suffixes)
     _DANGEROUS_KEYWORD_PATTERNS.append(
-        re.compile(rf"(?<![A-Za-z0-9]){re.escape(_kw)}(?:{_suffix_group})?(?![A-Za-z0-9])")
+        re.compile(
+            rf"(?<![A-Za-z0-9]){re.escape(_kw)}(?:{_suffix_group})?(?![A-Za-z0-9])",
+            re.IGNORECASE,
+        )
     )
 
 
-def _find_unquoted_bool_fields(content: str) -> list[tuple[str, str]]:
+def _find_unquoted_bool_fields(document: ParsedDocument) -> list[tuple[str, str]]:
     """frontmatterで引用符なしのYAMLブール値キーワードを持つフィールドを検出する"""
-    if not content.startswith("---"):
-        return []
-    lines = content.split("\n")
-    end_idx = -1
-    for i, line in enumerate(lines[1:], 1):
-        if line.strip() == "---":
-            end_idx = i
-            break
-    if end_idx == -1:
+    if document.frontmatter_span is None:
         return []
-    frontmatter_text = "\n".join(lines[1:end_idx])
-    return _UNQUOTED_BOOL_PATTERN.findall(frontmatter_text)
+    # YAMLの範囲だけを元の文字列の上で検索する（開始位置は行頭なので ^ も一致する）
+    yaml_start, yaml_end = document.frontmatter_span
+    count_regex_scans()
+    return _UNQUOTED_BOOL_PATTERN.findall(document.content, yaml_start, yaml_end)
+
+
+def _dangerous_keyword_line(document: ParsedDocument, description: str) -> int | None:
+    """危険そうなキーワードが最初に現れる行を返す（大文字小文字を区別しない。なければNone）
+
+    descriptionに含まれる場合は、本文より前にあるdescriptionのキーの行を返す。
+    本文は小文字化した複製を作らず、元の文字列の上で検索する。
+    """
+    if description:
+        for pattern in _DANGEROUS_KEYWORD_PATTERNS:
+            count_regex_scans()
+            if pattern.search(description):
+                return document.field_lines["description"]
+    first: int | None = None
+    for pattern in _DANGEROUS_KEYWORD_PATTERNS:
+        count_regex_scans()
+        match = document.body.search(pattern)
+        if match and (first is None or match.start() < first):
+            first = match.start()
+    return None if first is None else document.line_of(first)
+
+
+@rule(WARNING_DANGEROUS_OPERATION)
+def _check_dangerous_operation(
+    result: ValidationResult, file_path: Path, document: ParsedDocument
+) -> None:
+    """危険そうなキーワードがあればdisable-model-invocation: trueの検討を促す
+
+    警告はキーワードが最初に現れる行を指す。
+    """
+    frontmatter = document.frontmatter
+    if frontmatter.get("disable-model-invocation", False) is True:
+        return
+    description_str = to_str(frontmatter.get("description", ""))
+    line = _dangerous_keyword_line(document, description_str)
+    if line is not None:
+        result.add_warning(
+            "危険な操作の可能性。disable-model-invocation: trueを検討",
+            file=file_path,
+            rule=WARNING_DANGEROUS_OPERATION,
+            line=line,
+        )
 
 
+@with_suppressions
 def validate_slash_command(file_path: Path, content: str) -> ValidationResult:
     """スラッシュコマンドを検証する"""
     result = ValidationResult()
-    frontmatter, body, yaml_warnings = parse_frontmatter(content)
-    disabled_warnings = get_disabled_warnings(content)
+    document = parse_document(content)
+    frontmatter, body = document.frontmatter, document.body
+    lines = document.field_lines
 
-    add_yaml_warnings(result, file_path, yaml_warnings)
+    add_yaml_warnings(result, file_path, document.yaml_warnings, document.yaml_warning_lines)
 
     # description / name フィールドに引用符なしのYAMLブール値キーワードが使われていないか確認
-    bool_fields = _find_unquoted_bool_fields(content)
+    bool_fields = _find_unquoted_bool_fields(document)
     bool_field_names = {field for field, _ in bool_fields}
     for field, keyword in bool_fields:
         result.add_warning(
-            f"{file_path.name}: {field}にYAMLブール値キーワードが使用されています。"
-            f'引用符で囲んでください（例: {field}: "{keyword}"）'
+            '{0}にYAMLブール値キーワードが使用されています。引用符で囲んでください（例: {0}: "{1}"）',
+            field,
+            keyword,
+            file=file_path,
+            rule="unquoted-boolean",
+            line=lines.get(field),
         )
 
     # descriptionの確認
     description_raw = frontmatter.get("description")
     if "description" not in bool_field_names and not description_raw:
         # 本文の最初の行がデフォルトになるが、明示的に設定することを推奨
-        if body.strip():
+        if not body.is_blank():
             result.add_warning(
-                f"{file_path.name}: descriptionが未設定（本文の最初の行がデフォルトで使用される）"
+                "descriptionが未設定（本文の最初の行がデフォルトで使用される）",
+                file=file_path,
+                rule="missing-description",
             )
         else:
-            result.add_error(f"{file_path.name}: descriptionが未設定で本文も空")
+            result.add_error(
+                "descriptionが未設定で本文も空", file=file_path, rule="missing-description"
+            )
 
     # argument-hintの確認（文字列型）
     argument_hint = frontmatter.get("argument-hint")
     if argument_hint is not None:
         if not isinstance(argument_hint, str) or not argument_hint.strip():
-            result.add_warning(f"{file_path.name}: argument-hintは空でない文字列が必要です")
+            result.add_warning(
+                "argument-hintは空でない文字列が必要です",
+                file=file_path,
+                rule="argument-hint-value",
+                line=lines.get("argument-hint"),
+            )
 
     # allow/askのツール名位置グロブを検証（v2.1.166以降）
-    validate_allow_ask_glob_fields(result, file_path, frontmatter)
+    validate_allow_ask_glob_fields(result, file_path, frontmatter, lines=lines)
 
     # allowed-toolsの確認（リスト形式対応）
-    validate_allowed_tools(result, file_path, frontmatter, disabled_warnings)
+    validate_allowed_tools(result, file_path, frontmatter, lines=lines)
 
     # disallowed-toolsの確認（文字列またはリスト形式、v2.1.152以降）
     validate_string_or_list_field(
-        result, file_path, "disallowed-tools", frontmatter.get("disallowed-tools")
+        result, file_path, "disallowed-tools", frontmatter.get("disallowed-tools"), lines=lines
     )
 
     # contextの確認（forkのみサポート、省略時はメインコンテキスト）
-    validate_context_field(result, file_path, frontmatter)
+    validate_context_field(result, file_path, frontmatter, lines=lines)
 
     # agentの確認（空でない文字列）
-    validate_agent_field(result, file_path, frontmatter)
-
-    # disable-model-invocationの確認
-    disable_model = frontmatter.get("disable-model-invocation", False)
-    # 危険そうなキーワードが含まれる場合は警告
-    description = frontmatter.get("description", "")
-    description_str = to_str(description)
-    body_lower = body.lower()
-    description_lower = description_str.lower()
-    if any(
-        pattern.search(body_lower) or pattern.search(description_lower)
-        for pattern in _DANGEROUS_KEYWORD_PATTERNS
-    ):
-        if disable_model is not True:
-            if WARNING_DANGEROUS_OPERATION not in disabled_warnings:
-                result.add_warning(
-                    f"{file_path.name}: 危険な操作の可能性。disable-model-invocation: trueを検討"
-                )
+    validate_agent_field(result, file_path, frontmatter, lines=lines)
+
+    # 危険そうなキーワードが含まれるのにdisable-model-invocationがない場合は警告
+    _check_dangerous_operation(result, file_path, document)
 
     # modelの値チェック（短縮形のみ許可、inheritは不可）
     model = frontmatter.get("model")
     model_str = str(model).strip() if model is not None else ""
     valid_models = {"sonnet", "opus", "haiku"}
     if model_str and model_str not in valid_models:
-        result.add_warning(f"{file_path.name}: modelが不正: {model_str}（sonnet/opus/haiku）")
+        result.add_warning(
+            "modelが不正: {}（sonnet/opus/haiku）",
+            model_str,
+            file=file_path,
+            rule="model-value",
+            line=lines.get("model"),
+        )
 
     # effortの確認（v2.1.80以降。v2.1.111でxhigh追加、maxも従来から有効）
     validate_effort_field(
@@ -155,6 +204,7 @@ def validate_slash_command(file_path: Path, content: str) -> ValidationResult:
         frontmatter,
         ["low", "medium", "high", "xhigh", "max"],
         hint="low/medium/high/xhigh/max",
+        lines=lines,
     )
 
     return result
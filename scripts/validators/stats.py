@@ -0,0 +1,65 @@
+"""
+検証コストの集計（--stats）
+
+ファイルごとの ValidationResult.metrics（base.Metrics）を実行全体とバリデーター別に合算する。
+どのルールを最適化・キャッシュすべきかを判断するためのデータで、
+--profile と違いワーカープロセスの結果もそのまま集計できる。
+"""
+
+import json
+from pathlib import Path
+from typing import TextIO
+
+from .base import Metrics
+
+
+class RunStats:
+    """実行全体の検証コストを集計する"""
+
+    def __init__(self):
+        self.files = 0
+        self.total = Metrics()
+        # バリデーターID -> (ファイル数, 合計)
+        self.by_validator: dict[str, tuple[int, Metrics]] = {}
+
+    def add(self, validator_id: str, metrics: Metrics) -> None:
+        """ファイル1件の検証コストを加算する"""
+        self.files += 1
+        self.total.add(metrics)
+        files, total = self.by_validator.get(validator_id, (0, Metrics()))
+        total.add(metrics)
+        self.by_validator[validator_id] = (files + 1, total)
+
+    def summary(self) -> dict:
+        """集計結果をJSONに書き出せる形で返す"""
+        return {
+            "files": self.files,
+            "total": self.total.to_dict(),
+            "validators": {
+                validator_id: {"files": files, **total.to_dict()}
+                for validator_id, (files, total) in sorted(self.by_validator.items())
+            },
+        }
+
+    def write_summary(self, path: Path) -> None:
+        """集計結果をJSONファイルに書き出す"""
+        path.write_text(
+            json.dumps(self.summary(), ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+        )
+
+    def print_report(self, stream: TextIO) -> None:
+        """集計結果を表形式で出力する"""
+        print(f"📊 検証統計: {self.files}ファイル", file=stream)
+        header = (
+            f"   {'validator':<18}{'files':>7}{'KiB':>10}{'parse ms':>10}{'rule ms':>10}"
+            f"{'rules':>8}{'regex':>8}{'stat':>7}"
+        )
+        print(header, file=stream)
+        rows = [*sorted(self.by_validator.items()), ("total", (self.files, self.total))]
+        for validator_id, (files, m) in rows:
+            print(
+                f"   {validator_id:<18}{files:>7}{m.bytes_read / 1024:>10.1f}"
+                f"{m.parse_ns / 1e6:>10.2f}{m.rule_ns / 1e6:>10.2f}"
+                f"{m.rules_evaluated:>8}{m.regex_scans:>8}{m.stat_calls:>7}",
+                file=stream,
+            )
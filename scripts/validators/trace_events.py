@@ -0,0 +1,108 @@
+"""
+検証の実行をChrome/Perfettoのトレースイベント形式で記録する（--trace）
+
+ファイルごとのスパンの下に、フェーズ（read・validate）、解析（parse）、
+@rule を付けた検証ルールのスパンを記録する。並列実行時はワーカープロセスごとに
+トラック（tid）を分け、親プロセスのトラックには結果待ち（wait）と出力（output）を記録する。
+chrome://tracing や https://ui.perfetto.dev でオフラインのまま表示できる。
+
+時刻は time.perf_counter_ns() を親プロセスで決めた原点からの経過時間にしたもの。
+LinuxとmacOSではこの時計はプロセス間で共通なので、ワーカーのイベントも同じ時間軸に並ぶ。
+"""
+
+import json
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from . import base
+
+# すべてのトラックを1つのプロセスとして表示する（トラックはtidで分ける）
+TRACE_PID = 1
+
+
+class TraceRecorder:
+    """トレースイベントを記録する"""
+
+    def __init__(self, origin_ns: int | None = None):
+        self.origin_ns = time.perf_counter_ns() if origin_ns is None else origin_ns
+        self.tid = os.getpid()
+        self.events: list[dict] = []
+
+    def complete(
+        self, name: str, category: str, start_ns: int, duration_ns: int, args: dict | None = None
+    ) -> None:
+        """開始時刻と所要時間が決まったスパン（"X"イベント）を記録する"""
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start_ns - self.origin_ns) / 1000,
+            "dur": duration_ns / 1000,
+            "pid": TRACE_PID,
+            "tid": self.tid,
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    @contextmanager
+    def span(self, name: str, category: str, **args) -> Iterator[None]:
+        """withブロックをスパンとして記録する"""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.complete(name, category, start, time.perf_counter_ns() - start, args)
+
+    def _on_parse(self, elapsed_ns: int) -> None:
+        self.complete("parse", "parse", time.perf_counter_ns() - elapsed_ns, elapsed_ns)
+
+    def _on_rule(self, file_path: Path | None, rule_id: str, duration_ns: int, outcome: str):
+        start = time.perf_counter_ns() - duration_ns
+        self.complete(rule_id, "rule", start, duration_ns, {"outcome": outcome})
+
+    def install(self) -> None:
+        """解析と検証ルールの通知を受け取るようにする"""
+        base.set_parse_observer(self._on_parse)
+        base.set_rule_tracer(self._on_rule)
+
+    def uninstall(self) -> None:
+        base.set_parse_observer(None)
+        base.set_rule_tracer(None)
+
+    def drain(self) -> list[dict]:
+        """記録済みのイベントを取り出す（ワーカーから親プロセスへ返すため）"""
+        events, self.events = self.events, []
+        return events
+
+    def write(self, path: Path) -> None:
+        """トレースイベント形式のJSONを書き出す（トラック名のメタデータを含む）"""
+        worker_tids = sorted({event["tid"] for event in self.events} - {self.tid})
+        names = {self.tid: "main", **{tid: f"worker {tid}" for tid in worker_tids}}
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": TRACE_PID, "args": {"name": "validate"}}
+        ]
+        for order, (tid, name) in enumerate(names.items()):
+            metadata.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": TRACE_PID,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+            )
+            metadata.append(
+                {
+                    "name": "thread_sort_index",
+                    "ph": "M",
+                    "pid": TRACE_PID,
+                    "tid": tid,
+                    "args": {"sort_index": order},
+                }
+            )
+        document = {"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}
+        path.write_text(json.dumps(document, ensure_ascii=False) + "\n", encoding="utf-8")
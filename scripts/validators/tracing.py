@@ -0,0 +1,80 @@
+"""
+ルール単位のトレース（--trace-rules）
+
+base.set_rule_tracer() に渡すトレーサーとして、@rule を付けた検証ルールの評価を
+(バリデーター, ルール) ごとに集計する。所要時間の大きいルールの一覧と、
+flamegraph.pl や speedscope で読み込める folded stacks 形式
+（"バリデーター;ルール 所要時間(ns)"）の出力を作れる。
+"""
+
+from pathlib import Path
+from typing import TextIO
+
+from .base import RULE_OUTCOMES
+from .registry import classify
+
+
+class RuleTraceReport:
+    """ルール評価の通知を集計するトレーサー"""
+
+    def __init__(self):
+        # (バリデーターID, ルールID) -> [評価回数, 合計時間, 最大時間, 結果ごとの回数...]
+        self.rules: dict[tuple[str, str], list[int]] = {}
+        self._last_file: Path | None = None
+        self._last_validator = "-"
+
+    def _validator_id(self, file_path: Path | None) -> str:
+        # 同じファイルのルールは続けて通知されるため、直前の判定結果を使い回す
+        if file_path != self._last_file:
+            spec = classify(file_path) if file_path is not None else None
+            self._last_file = file_path
+            self._last_validator = spec.id if spec is not None else "-"
+        return self._last_validator
+
+    def __call__(self, file_path: Path | None, rule_id: str, duration_ns: int, outcome: str):
+        key = (self._validator_id(file_path), rule_id)
+        stats = self.rules.get(key)
+        if stats is None:
+            stats = self.rules[key] = [0, 0, 0, *(0 for _ in RULE_OUTCOMES)]
+        stats[0] += 1
+        stats[1] += duration_ns
+        stats[2] = max(stats[2], duration_ns)
+        stats[3 + RULE_OUTCOMES.index(outcome)] += 1
+
+    def hot_rules(self) -> list[dict]:
+        """合計時間の大きい順にルールごとの集計を返す"""
+        return [
+            {
+                "validator": validator_id,
+                "rule": rule_id,
+                "calls": stats[0],
+                "total_ns": stats[1],
+                "max_ns": stats[2],
+                "outcomes": dict(zip(RULE_OUTCOMES, stats[3:], strict=True)),
+            }
+            for (validator_id, rule_id), stats in sorted(
+                self.rules.items(), key=lambda item: -item[1][1]
+            )
+        ]
+
+    def folded_lines(self) -> list[str]:
+        """folded stacks 形式の行（"バリデーター;ルール 所要時間(ns)"）を返す"""
+        return [
+            f"{validator_id};{rule_id} {stats[1]}"
+            for (validator_id, rule_id), stats in sorted(self.rules.items())
+        ]
+
+    def write_folded(self, path: Path) -> None:
+        """folded stacks 形式でファイルに書き出す"""
+        path.write_text("".join(f"{line}\n" for line in self.folded_lines()), encoding="utf-8")
+
+    def print_report(self, stream: TextIO, top_n: int = 10) -> None:
+        """所要時間の大きいルールを上位top_n件出力する"""
+        print(f"🔥 ルール別の所要時間（上位{top_n}件）:", file=stream)
+        for entry in self.hot_rules()[:top_n]:
+            issues = entry["outcomes"]["error"] + entry["outcomes"]["warning"]
+            print(
+                f"   {entry['total_ns'] / 1e6:>9.3f}ms  {entry['calls']:>6}回  問題あり{issues:>5}件"
+                f"  {entry['validator']}:{entry['rule']}",
+                file=stream,
+            )
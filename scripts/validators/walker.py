@@ -0,0 +1,69 @@
+"""
+ディレクトリツリーから検証対象ファイルを列挙する
+
+os.scandir の DirEntry が持つファイル種別を使い、ファイルごとのstatを発生させずに
+ツリーを走査する。対象ファイルは見つかった順にイテレーターで返すため、
+全パスのリストを作らずに検証へ流し込める。
+"""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+from .registry import classify, is_candidate_name
+
+# 走査しないディレクトリ名
+IGNORED_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".cache",
+        ".venv",
+        "venv",
+        "node_modules",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".tox",
+        ".nox",
+    }
+)
+
+
+def iter_target_files(root: Path, ignored_dirs: frozenset[str] = IGNORED_DIRS) -> Iterator[Path]:
+    """root以下の検証対象ファイルを返す
+
+    各ディレクトリ内は名前順で、ファイルを返してからサブディレクトリへ降りる
+    （出力を実行ごとに同じ順序にするため）。ディレクトリへのシンボリックリンクは
+    循環を避けるためたどらない。読めないディレクトリは黙ってスキップする。
+
+    Args:
+        root: 走査を開始するディレクトリ
+        ignored_dirs: 走査しないディレクトリ名の集合
+
+    Yields:
+        classify() でバリデーターが決まるファイルのパス（rootを先頭に付けたもの）
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in ignored_dirs:
+                    subdirs.append(entry.path)
+            elif is_candidate_name(entry.name) and entry.is_file():
+                path = Path(entry.path)
+                if classify(path) is not None:
+                    yield path
+
+        # スタックなので逆順に積み、名前順に処理されるようにする
+        stack.extend(reversed(subdirs))